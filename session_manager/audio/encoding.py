@@ -0,0 +1,148 @@
+"""
+Audio encoding for remote uploads
+VCA 1.0 - Phase 3
+
+Compresses PCM16 WAV audio before it is uploaded to a remote STT API.
+Uses libsndfile via the optional `soundfile` package:
+- flac: lossless, ~2x smaller for speech
+- opus: lossy (Ogg/Opus), ~10x smaller at default quality, fine for STT
+
+If soundfile is not installed (or the codec is unsupported by the local
+libsndfile build), the WAV is uploaded unchanged.
+
+encode_pcm16() and codec_available() are shared with response audio
+encoding (audio/output_codec.py).
+"""
+
+import io
+import logging
+import time
+import wave
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import soundfile
+except ImportError:  # Optional dependency
+    soundfile = None
+
+# codec -> (soundfile format, subtype, file extension)
+_CODECS = {
+    'flac': ('FLAC', 'PCM_16', 'flac'),
+    'opus': ('OGG', 'OPUS', 'ogg'),
+}
+
+_warned_unavailable = set()
+
+
+@dataclass
+class EncodedAudio:
+    """Encoded audio ready for upload"""
+    data: bytes
+    format: str  # 'wav', 'flac', 'opus'
+    filename: str  # Filename hint for multipart uploads (extension matters)
+    encode_time: float  # seconds
+    original_size: int  # bytes (WAV input)
+
+    @property
+    def compression_ratio(self) -> float:
+        """Original size divided by encoded size (1.0 = uncompressed)"""
+        return self.original_size / len(self.data) if self.data else 1.0
+
+
+def encode_wav(wav_bytes: bytes, codec: str = 'flac') -> EncodedAudio:
+    """
+    Encode WAV bytes with a compressed codec.
+
+    Blocking (CPU-bound) - call via run_in_executor from async code.
+
+    Args:
+        wav_bytes: PCM16 WAV file bytes
+        codec: 'flac', 'opus' or 'wav' (passthrough)
+
+    Returns:
+        EncodedAudio (falls back to the original WAV if encoding is unavailable)
+    """
+    start = time.perf_counter()
+
+    if codec != 'wav' and codec in _CODECS and codec_available(codec):
+        sf_format, subtype, extension = _CODECS[codec]
+
+        try:
+            with io.BytesIO(wav_bytes) as wav_io:
+                with wave.open(wav_io, 'rb') as wav_file:
+                    sample_rate = wav_file.getframerate()
+                    n_channels = wav_file.getnchannels()
+                    pcm = wav_file.readframes(wav_file.getnframes())
+
+            audio_np = np.frombuffer(pcm, dtype=np.int16).reshape(-1, n_channels)
+
+            encoded = EncodedAudio(
+                data=encode_pcm16(audio_np, sample_rate, codec),
+                format=codec,
+                filename=f"audio.{extension}",
+                encode_time=time.perf_counter() - start,
+                original_size=len(wav_bytes)
+            )
+
+            logger.debug(
+                f"Encoded {len(wav_bytes)} → {len(encoded.data)} bytes as {codec} "
+                f"({encoded.compression_ratio:.1f}x in {encoded.encode_time * 1000:.1f}ms)"
+            )
+
+            return encoded
+
+        except Exception as e:
+            logger.warning(f"Audio encoding to {codec} failed, uploading WAV: {e}")
+
+    elif codec not in _CODECS and codec != 'wav':
+        logger.warning(f"Unknown upload codec '{codec}', uploading WAV")
+
+    return EncodedAudio(
+        data=wav_bytes,
+        format='wav',
+        filename='audio.wav',
+        encode_time=time.perf_counter() - start,
+        original_size=len(wav_bytes)
+    )
+
+
+def encode_pcm16(audio_np: np.ndarray, sample_rate: int, codec: str) -> bytes:
+    """
+    Encode PCM16 samples as a complete compressed file.
+
+    Blocking (CPU-bound) - call via run_in_executor from async code.
+
+    Args:
+        audio_np: int16 samples, shape (frames,) or (frames, channels)
+        sample_rate: Sample rate (Opus accepts 8/12/16/24/48 kHz)
+        codec: 'flac' or 'opus' (must be available, see codec_available)
+
+    Returns:
+        Encoded file bytes (FLAC, or Ogg/Opus)
+    """
+    sf_format, subtype, _ = _CODECS[codec]
+    out = io.BytesIO()
+    soundfile.write(out, audio_np, sample_rate, format=sf_format, subtype=subtype)
+    return out.getvalue()
+
+
+def codec_available(codec: str) -> bool:
+    """Check that soundfile is installed and libsndfile supports the codec"""
+    sf_format, subtype, _ = _CODECS[codec]
+    available = (
+        soundfile is not None
+        and subtype in soundfile.available_subtypes(sf_format)
+    )
+
+    if not available and codec not in _warned_unavailable:
+        _warned_unavailable.add(codec)
+        logger.warning(
+            f"Audio codec '{codec}' unavailable (install soundfile with libsndfile >= 1.0.29); "
+            f"using WAV instead"
+        )
+
+    return available
@@ -0,0 +1,160 @@
+"""
+Inbound audio codec
+VCA 1.0 - Phase 3
+
+Lets clients send compressed microphone audio instead of raw PCM16 frames
+(256 kbps per device):
+- pcm: binary messages are 30ms PCM16 frames, as before
+- opus: each binary message is a self-contained Ogg/Opus segment batching
+  several Opus frames (e.g., 200-500ms of audio). Segments are decoded off
+  the event loop, resampled to the session rate if needed, and re-cut into
+  VAD-sized PCM16 frames, so the session buffer, VAD and STT are unchanged
+
+Opus decoding uses libsndfile via the optional `soundfile` package; without
+it only pcm is offered.
+
+Configuration:
+    audio_input:
+      codecs: ["opus", "pcm"]   # Server preference order
+"""
+
+import asyncio
+import io
+import logging
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .encoding import codec_available, soundfile
+from .resample import resample
+
+logger = logging.getLogger(__name__)
+
+# Codecs clients can send; 'pcm' (raw 30ms frames) is always accepted
+INPUT_CODECS = ('opus', 'pcm')
+
+
+class AudioInputCodecs:
+    """Negotiates the inbound codec and aggregates decoder stats"""
+
+    def __init__(self, config: dict):
+        """
+        Initialize inbound codec negotiation.
+
+        Args:
+            config: audio_input configuration
+        """
+        self.codecs = [
+            codec for codec in config.get('codecs', ['pcm'])
+            if codec in INPUT_CODECS and (codec == 'pcm' or codec_available(codec))
+        ] or ['pcm']
+
+        # Counters
+        self.negotiated: Dict[str, int] = {}
+        self.packets = 0
+        self.decode_errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.decode_time = 0.0
+
+    def negotiate(self, requested: Optional[str]) -> str:
+        """
+        Pick the inbound codec for a session.
+
+        Args:
+            requested: Codec named by the client in session_start
+                (None for clients that predate negotiation)
+
+        Returns:
+            The requested codec if the server accepts it, otherwise 'pcm'
+        """
+        codec = requested if requested in self.codecs else 'pcm'
+        self.negotiated[codec] = self.negotiated.get(codec, 0) + 1
+        return codec
+
+    def create_decoder(self, codec: str, frame_size: int, sample_rate: int = 16000):
+        """
+        Create the per-session decoder for a negotiated codec.
+
+        Args:
+            codec: Negotiated codec
+            frame_size: Bytes per emitted PCM16 frame (the VAD frame size)
+            sample_rate: Session sample rate
+
+        Returns:
+            OpusFrameDecoder, or None for raw PCM sessions
+        """
+        if codec != 'opus':
+            return None
+        return OpusFrameDecoder(self, frame_size, sample_rate)
+
+    def get_stats(self) -> Dict:
+        """Get negotiation counts and decoding totals"""
+        return {
+            'codecs': self.codecs,
+            'negotiated': dict(self.negotiated),
+            'packets': self.packets,
+            'decode_errors': self.decode_errors,
+            'compression_ratio': self.bytes_out / self.bytes_in if self.bytes_in else 1.0,
+            'mean_decode_time': self.decode_time / self.packets if self.packets else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        return f"AudioInputCodecs(codecs={self.codecs})"
+
+
+class OpusFrameDecoder:
+    """Decodes a session's Ogg/Opus segments into fixed-size PCM16 frames"""
+
+    def __init__(self, codecs: AudioInputCodecs, frame_size: int, sample_rate: int = 16000):
+        """
+        Initialize decoder.
+
+        Args:
+            codecs: Owner that aggregates decoder stats
+            frame_size: Bytes per emitted PCM16 frame
+            sample_rate: Rate of the emitted frames
+        """
+        self.codecs = codecs
+        self.frame_size = frame_size
+        self.sample_rate = sample_rate
+        self.remainder = b""  # Decoded PCM not yet filling a whole frame
+
+    async def decode(self, packet: bytes) -> List[bytes]:
+        """
+        Decode one segment off the event loop.
+
+        Args:
+            packet: Self-contained Ogg/Opus segment from the client
+
+        Returns:
+            Complete PCM16 frames, in order (empty if the segment was undecodable)
+        """
+        loop = asyncio.get_event_loop()
+        start = time.perf_counter()
+        try:
+            pcm = await loop.run_in_executor(None, self._decode_sync, packet)
+        except Exception as e:
+            self.codecs.decode_errors += 1
+            logger.warning(f"Dropping undecodable Opus packet ({len(packet)} bytes): {e}")
+            return []
+
+        self.codecs.packets += 1
+        self.codecs.bytes_in += len(packet)
+        self.codecs.bytes_out += len(pcm)
+        self.codecs.decode_time += time.perf_counter() - start
+
+        data = self.remainder + pcm
+        usable = len(data) - len(data) % self.frame_size
+        self.remainder = data[usable:]
+        return [data[offset:offset + self.frame_size] for offset in range(0, usable, self.frame_size)]
+
+    def _decode_sync(self, packet: bytes) -> bytes:
+        """Decode a segment to mono PCM16 at the session rate (blocking)"""
+        audio, sample_rate = soundfile.read(io.BytesIO(packet), dtype='int16')
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1).astype(np.int16)
+        if sample_rate != self.sample_rate:
+            audio = resample(audio, sample_rate, self.sample_rate)
+        return audio.tobytes()
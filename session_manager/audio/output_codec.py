@@ -0,0 +1,156 @@
+"""
+Response audio codec
+VCA 1.0 - Phase 3
+
+Negotiates the codec for TTS audio sent to the client and encodes it off the
+event loop:
+- opus: PCM/WAV audio is cut into segments of segment_duration seconds, each
+  a self-contained Ogg/Opus file the client can decode and play on arrival
+  (~6-10x fewer bytes than PCM16 for speech)
+- wav: audio is sent as synthesized (WAV, PCM chunks, or MP3 from OpenAI)
+
+Already-compressed provider output (MP3) is passed through unchanged, and
+everything falls back to WAV if libsndfile lacks Opus support.
+
+Configuration:
+    audio_output:
+      codecs: ["opus", "wav"]   # Server preference order
+      segment_duration: 1.0
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .encoding import codec_available, encode_pcm16
+from .resample import resample
+from .wav import wav_to_int16
+
+logger = logging.getLogger(__name__)
+
+# Codecs the server can send; 'wav' (as synthesized) is always possible
+OUTPUT_CODECS = ('opus', 'wav')
+
+# Input rates accepted by the Opus encoder
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+def opus_sample_rate(sample_rate: int) -> int:
+    """Lowest Opus-supported rate at or above sample_rate"""
+    for rate in OPUS_SAMPLE_RATES:
+        if rate >= sample_rate:
+            return rate
+    return OPUS_SAMPLE_RATES[-1]
+
+
+class ResponseAudioEncoder:
+    """Negotiates and applies the response audio codec"""
+
+    def __init__(self, config: dict):
+        """
+        Initialize response encoder.
+
+        Args:
+            config: audio_output configuration
+        """
+        self.codecs = [
+            codec for codec in config.get('codecs', ['wav'])
+            if codec in OUTPUT_CODECS and (codec == 'wav' or codec_available(codec))
+        ] or ['wav']
+        self.segment_duration = config.get('segment_duration', 1.0)
+
+        # Counters
+        self.negotiated: Dict[str, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.segments = 0
+        self.encode_time = 0.0
+
+    def negotiate(self, client_codecs: Optional[List[str]]) -> str:
+        """
+        Pick the codec for a session.
+
+        Args:
+            client_codecs: Codecs listed by the client in session_start
+                (None for clients that predate negotiation)
+
+        Returns:
+            First server-preferred codec the client accepts ('wav' if none)
+        """
+        accepted = set(client_codecs or ['wav'])
+        codec = next((codec for codec in self.codecs if codec in accepted), 'wav')
+        self.negotiated[codec] = self.negotiated.get(codec, 0) + 1
+        return codec
+
+    def output_format(self, audio_format: str, codec: str) -> str:
+        """Format the client receives for provider audio in audio_format"""
+        if codec == 'opus' and audio_format in ('wav', 'pcm'):
+            return 'opus'
+        return audio_format
+
+    async def encode(
+        self,
+        audio_bytes: bytes,
+        audio_format: str,
+        sample_rate: Optional[int],
+        codec: str
+    ) -> List[bytes]:
+        """
+        Encode provider audio for the client.
+
+        Args:
+            audio_bytes: WAV file, raw PCM16 mono chunk, or MP3
+            audio_format: 'wav', 'pcm' or 'mp3'
+            sample_rate: Sample rate of PCM input (read from the header for WAV)
+            codec: Negotiated session codec
+
+        Returns:
+            Payloads to send in order (one per Opus segment, or the input unchanged)
+        """
+        if self.output_format(audio_format, codec) == audio_format:
+            return [audio_bytes]
+
+        loop = asyncio.get_event_loop()
+        segments = await loop.run_in_executor(
+            None, self._encode_opus, audio_bytes, audio_format, sample_rate
+        )
+        self.bytes_in += len(audio_bytes)
+        self.bytes_out += sum(len(segment) for segment in segments)
+        self.segments += len(segments)
+        return segments
+
+    def _encode_opus(self, audio_bytes: bytes, audio_format: str, sample_rate: Optional[int]) -> List[bytes]:
+        """Split PCM16 audio into segments and encode each as Ogg/Opus (blocking)"""
+        start = time.perf_counter()
+        if audio_format == 'wav':
+            pcm, sample_rate = wav_to_int16(audio_bytes)
+        else:
+            pcm = np.frombuffer(audio_bytes, dtype=np.int16)
+
+        target_rate = opus_sample_rate(sample_rate)
+        if target_rate != sample_rate:
+            pcm = resample(pcm, sample_rate, target_rate)
+
+        segment_samples = max(1, int(self.segment_duration * target_rate))
+        segments = [
+            encode_pcm16(pcm[offset:offset + segment_samples], target_rate, 'opus')
+            for offset in range(0, len(pcm), segment_samples)
+        ]
+        self.encode_time += time.perf_counter() - start
+        return segments
+
+    def get_stats(self) -> Dict:
+        """Get negotiation counts and compression"""
+        return {
+            'codecs': self.codecs,
+            'negotiated': dict(self.negotiated),
+            'segments': self.segments,
+            'compression_ratio': self.bytes_in / self.bytes_out if self.bytes_out else 1.0,
+            'encode_time': self.encode_time,
+        }
+
+    def __repr__(self) -> str:
+        return f"ResponseAudioEncoder(codecs={self.codecs}, segment_duration={self.segment_duration}s)"
@@ -0,0 +1,190 @@
+"""
+Polyphase resampling
+VCA 1.0 - Phase 3
+
+Converts TTS output from the model's native rate to the VCA rate
+(e.g., Piper 22050 → 16000, XTTS 24000 → 16000) with a polyphase FIR
+filter instead of an FFT over the whole utterance:
+- Cost is linear in length (no slow FFT sizes on odd lengths)
+- No wrap-around ringing at the utterance edges
+- Works chunk by chunk (StreamingResampler), so audio can be resampled
+  while synthesis is still producing it
+
+The anti-aliasing filter for each rate pair is designed once and cached.
+Both paths use the same filter as scipy.signal.resample_poly (Kaiser
+window, beta 5.0), so streaming output matches the one-shot output.
+
+Usage:
+    audio_16k = resample(audio_22k, 22050, 16000)
+
+    resampler = StreamingResampler(22050, 16000)
+    for chunk in chunks:
+        play(resampler.process(chunk))
+    play(resampler.flush())
+"""
+
+from functools import lru_cache
+from math import gcd
+from typing import NamedTuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+
+class PolyphaseFilter(NamedTuple):
+    """Cached filter for one rate pair"""
+    up: int
+    down: int
+    taps: np.ndarray  # Full FIR (length 2 * half_len + 1), unit gain (resample_poly applies `up`)
+    half_len: int
+    phases: np.ndarray  # (up, taps_per_phase) taps * up per phase, oldest input first (float32)
+
+
+@lru_cache(maxsize=32)
+def get_filter(orig_sr: int, target_sr: int) -> PolyphaseFilter:
+    """
+    Design (once) the polyphase anti-aliasing filter for a rate pair.
+
+    Args:
+        orig_sr: Input sample rate in Hz
+        target_sr: Output sample rate in Hz
+
+    Returns:
+        PolyphaseFilter (same design as scipy.signal.resample_poly defaults)
+    """
+    divisor = gcd(orig_sr, target_sr)
+    up, down = target_sr // divisor, orig_sr // divisor
+
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+
+    taps_per_phase = -(-len(taps) // up)
+    padded = np.zeros(taps_per_phase * up)
+    padded[:len(taps)] = taps * up
+    phases = padded.reshape(taps_per_phase, up).T[:, ::-1].astype(np.float32)
+
+    return PolyphaseFilter(up=up, down=down, taps=taps, half_len=half_len, phases=phases)
+
+
+def resample(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """
+    Resample a whole utterance.
+
+    Args:
+        audio: Mono audio (int16 or float)
+        orig_sr: Input sample rate in Hz
+        target_sr: Output sample rate in Hz
+
+    Returns:
+        Resampled audio, int16 if the input was int16, otherwise float32
+    """
+    if orig_sr == target_sr:
+        return audio
+
+    poly = get_filter(orig_sr, target_sr)
+    resampled = signal.resample_poly(
+        np.asarray(audio, dtype=np.float32), poly.up, poly.down, window=poly.taps
+    )
+    return _to_dtype(resampled, np.asarray(audio).dtype)
+
+
+class StreamingResampler:
+    """Chunk-by-chunk polyphase resampler that carries filter state between chunks"""
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        """
+        Args:
+            orig_sr: Input sample rate in Hz
+            target_sr: Output sample rate in Hz
+        """
+        self.orig_sr = orig_sr
+        self.target_sr = target_sr
+        self.filter = get_filter(orig_sr, target_sr)
+
+        taps_per_phase = self.filter.phases.shape[1]
+        # Input history: the last taps_per_phase samples (zeros before the start)
+        self._history = np.zeros(taps_per_phase, dtype=np.float32)
+        self._history_start = -taps_per_phase  # Absolute input index of _history[0]
+        self._samples_in = 0
+        self._samples_out = 0
+        self._dtype = None
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk.
+
+        Outputs are emitted as soon as all input they depend on has arrived,
+        so each call returns roughly len(chunk) * target_sr / orig_sr samples
+        (the first call is shorter by the filter delay, which flush() returns).
+
+        Args:
+            chunk: Next mono audio chunk (int16 or float)
+
+        Returns:
+            Resampled audio, int16 if the input was int16, otherwise float32
+        """
+        chunk = np.asarray(chunk)
+        if self._dtype is None:
+            self._dtype = chunk.dtype
+        if self.orig_sr == self.target_sr:
+            return chunk
+
+        self._history = np.concatenate([self._history, chunk.astype(np.float32)])
+        self._samples_in += len(chunk)
+
+        # Output n needs input up to index (n * down + half_len) // up
+        poly = self.filter
+        last_ready = (self._samples_in * poly.up - 1 - poly.half_len) // poly.down
+        return self._emit(last_ready + 1)
+
+    def flush(self) -> np.ndarray:
+        """
+        Return the remaining output (input past the end is treated as silence).
+
+        Returns:
+            Final resampled samples; total output length matches resample()
+        """
+        if self.orig_sr == self.target_sr:
+            return np.zeros(0, dtype=self._dtype or np.float32)
+
+        poly = self.filter
+        total_out = -(-self._samples_in * poly.up // poly.down)
+        if total_out <= self._samples_out:
+            return self._emit(self._samples_out)
+
+        # Zero tail covering the filter's look-ahead
+        tail = (total_out * poly.down + poly.half_len) // poly.up + 1 - self._samples_in
+        self._history = np.concatenate([self._history, np.zeros(max(0, tail), dtype=np.float32)])
+        return self._emit(total_out)
+
+    def _emit(self, end: int) -> np.ndarray:
+        """Compute outputs [_samples_out, end) and drop history no longer needed"""
+        poly = self.filter
+        taps_per_phase = poly.phases.shape[1]
+        if end <= self._samples_out:
+            return _to_dtype(np.zeros(0), self._dtype)
+
+        # Upsampled-domain position of each output (filter delay compensated)
+        position = np.arange(self._samples_out, end) * poly.down + poly.half_len
+        oldest = position // poly.up - self._history_start - taps_per_phase + 1  # Index into _history
+        windows = sliding_window_view(self._history, taps_per_phase)[oldest]
+        output = np.einsum('ij,ij->i', poly.phases[position % poly.up], windows)
+
+        self._samples_out = end
+
+        # Keep history needed by the next output
+        next_newest = (end * poly.down + poly.half_len) // poly.up
+        keep_from = max(0, next_newest - taps_per_phase + 1 - self._history_start)
+        self._history = self._history[keep_from:]
+        self._history_start += keep_from
+
+        return _to_dtype(output, self._dtype)
+
+
+def _to_dtype(audio: np.ndarray, dtype) -> np.ndarray:
+    """Round/clip to int16 for int16 input, float32 otherwise"""
+    if dtype == np.int16:
+        return np.clip(np.round(audio), -32768, 32767).astype(np.int16)
+    return audio.astype(np.float32)
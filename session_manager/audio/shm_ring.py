@@ -0,0 +1,209 @@
+"""
+Shared-memory audio ring buffer
+VCA 1.0 - Phase 3
+
+Passes PCM (int16 or float32) between the web process and inference worker
+processes without pickling. One side writes an array into the ring and sends
+only a small AudioSlot descriptor over its pipe; the other side gets a
+zero-copy numpy view of the same memory and releases the slot when done.
+
+Single producer / single consumer per ring: use one ring per direction
+(e.g., request audio main.py → worker, TTS PCM worker → main.py).
+
+Layout:
+    [header: write_pos, read_pos, capacity (uint64)] [data: capacity bytes]
+
+write_pos and read_pos are monotonic byte counters; the producer only writes
+write_pos and the consumer only writes read_pos. Slots are 64-byte aligned
+and never wrap: if a slot doesn't fit before the end of the ring, the tail is
+skipped and the slot starts at offset 0.
+
+Usage:
+    ring = SharedAudioRing(capacity=16 * 1024 * 1024)            # owner
+    slot = ring.write(audio_np)                                    # producer
+    conn.send(slot)
+
+    ring = SharedAudioRing(name=ring.name, create=False)           # other process
+    audio_view = ring.view(slot)                                   # consumer, no copy
+    ...
+    del audio_view
+    ring.release(slot)
+"""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+HEADER_SIZE = 64  # Three uint64 counters, padded to a cache line
+ALIGNMENT = 64
+
+_WRITE_POS = 0
+_READ_POS = 1
+_CAPACITY = 2
+
+
+class RingBufferFull(Exception):
+    """Not enough free space in the ring for the requested slot"""
+
+
+@dataclass(frozen=True)
+class AudioSlot:
+    """Location of one array in a SharedAudioRing (small, cheap to pickle)"""
+    offset: int  # Byte offset into the data region
+    nbytes: int
+    dtype: str  # numpy dtype string, e.g. '<f4', '<i2'
+    shape: Tuple[int, ...]
+    end: int  # Ring position just past this slot (consumer's read_pos after release)
+
+
+def _align(nbytes: int) -> int:
+    """Round up to the slot alignment"""
+    return (nbytes + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class SharedAudioRing:
+    """Fixed-size shared-memory ring of numpy arrays"""
+
+    def __init__(self, capacity: int = 16 * 1024 * 1024, name: Optional[str] = None, create: bool = True):
+        """
+        Create a new ring or attach to an existing one.
+
+        Args:
+            capacity: Data region size in bytes (create only)
+            name: Shared memory name (attach only)
+            create: True to allocate a new segment, False to attach to `name`
+        """
+        if create:
+            capacity = _align(capacity)
+            self._shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        self._owner = create
+        self._header = np.ndarray((3,), dtype=np.uint64, buffer=self._shm.buf)
+        if create:
+            self._header[:] = (0, 0, capacity)
+
+        self.capacity = int(self._header[_CAPACITY])
+        self._data = self._shm.buf[HEADER_SIZE:HEADER_SIZE + self.capacity]
+
+    @property
+    def name(self) -> str:
+        """Shared memory name to attach from another process"""
+        return self._shm.name
+
+    @property
+    def used_bytes(self) -> int:
+        """Bytes written but not yet released"""
+        return int(self._header[_WRITE_POS]) - int(self._header[_READ_POS])
+
+    @property
+    def free_bytes(self) -> int:
+        return self.capacity - self.used_bytes
+
+    def reserve(self, shape, dtype) -> Tuple[AudioSlot, np.ndarray]:
+        """
+        Reserve a slot and return a writable view of it (producer).
+
+        Filling the view directly (e.g., np.multiply(..., out=view)) avoids an
+        intermediate array.
+
+        Args:
+            shape: Array shape
+            dtype: numpy dtype (int16, float32, ...)
+
+        Returns:
+            Tuple of (slot descriptor to send to the consumer, writable view)
+
+        Raises:
+            RingBufferFull: If the consumer hasn't released enough space
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(n) for n in np.atleast_1d(shape))
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        size = max(_align(nbytes), ALIGNMENT)
+
+        if size > self.capacity:
+            raise RingBufferFull(f"{nbytes} bytes exceeds ring capacity {self.capacity}")
+
+        write_pos = int(self._header[_WRITE_POS])
+        read_pos = int(self._header[_READ_POS])
+
+        # Slots never wrap - skip the tail if the slot doesn't fit there
+        position = write_pos % self.capacity
+        padding = self.capacity - position if position + size > self.capacity else 0
+
+        end = write_pos + padding + size
+        if end - read_pos > self.capacity:
+            raise RingBufferFull(
+                f"{nbytes} bytes requested, {self.capacity - (write_pos - read_pos)} free"
+            )
+
+        offset = (write_pos + padding) % self.capacity
+        self._header[_WRITE_POS] = end
+
+        slot = AudioSlot(offset=offset, nbytes=nbytes, dtype=dtype.str, shape=shape, end=end)
+        return slot, self.view(slot)
+
+    def write(self, array: np.ndarray) -> AudioSlot:
+        """
+        Copy an array into the ring (producer).
+
+        Args:
+            array: Array to share
+
+        Returns:
+            Slot descriptor for the consumer
+
+        Raises:
+            RingBufferFull: If the consumer hasn't released enough space
+        """
+        slot, view = self.reserve(array.shape, array.dtype)
+        view[...] = array
+        return slot
+
+    def view(self, slot: AudioSlot) -> np.ndarray:
+        """
+        Zero-copy view of a slot (valid until the slot is released).
+
+        Args:
+            slot: Descriptor from reserve()/write()
+
+        Returns:
+            numpy array backed by shared memory
+        """
+        return np.ndarray(slot.shape, dtype=np.dtype(slot.dtype), buffer=self._data, offset=slot.offset)
+
+    def release(self, slot: AudioSlot):
+        """
+        Free a slot and everything written before it (consumer, FIFO order).
+
+        Drop any views of the slot first - the producer may overwrite it.
+
+        Args:
+            slot: Descriptor of the slot to free
+        """
+        if slot.end > int(self._header[_READ_POS]):
+            self._header[_READ_POS] = slot.end
+
+    def reset(self):
+        """Discard all slots (only when no consumer is using the ring, e.g. after a worker restart)"""
+        self._header[_READ_POS] = self._header[_WRITE_POS]
+
+    def close(self, unlink: Optional[bool] = None):
+        """
+        Detach from the segment.
+
+        Args:
+            unlink: Also destroy the segment (default: True for the creating side)
+        """
+        self._header = None
+        self._data.release()
+        self._shm.close()
+        if self._owner if unlink is None else unlink:
+            self._shm.unlink()
+
+    def __repr__(self) -> str:
+        return f"SharedAudioRing(name='{self.name}', capacity={self.capacity}, used={self.used_bytes})"
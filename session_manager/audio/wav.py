@@ -0,0 +1,126 @@
+"""
+WAV <-> numpy conversion helpers
+VCA 1.0 - Phase 3
+
+Shared by STT providers (decode uploaded WAV to float32) and the chunked
+transcription path (re-wrap float32 chunks as WAV for providers that take bytes).
+"""
+
+import io
+import wave
+from typing import List, Tuple
+
+import numpy as np
+
+
+def wav_to_int16(wav_bytes: bytes) -> Tuple[np.ndarray, int]:
+    """
+    Read the PCM16 samples of WAV bytes without converting them.
+
+    Args:
+        wav_bytes: WAV file bytes (PCM16, mono or stereo)
+
+    Returns:
+        Tuple of (int16 array - shape (frames,) or (frames, channels), sample rate)
+    """
+    with io.BytesIO(wav_bytes) as wav_io:
+        with wave.open(wav_io, 'rb') as wav_file:
+            sample_rate = wav_file.getframerate()
+            n_channels = wav_file.getnchannels()
+            audio_data = wav_file.readframes(wav_file.getnframes())
+
+    audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
+    if n_channels > 1:
+        audio_int16 = audio_int16.reshape(-1, n_channels)
+
+    return audio_int16, sample_rate
+
+
+def wav_to_float32(wav_bytes: bytes) -> Tuple[np.ndarray, int]:
+    """
+    Decode PCM16 WAV bytes to a mono float32 array.
+
+    Args:
+        wav_bytes: WAV file bytes (PCM16, mono or stereo)
+
+    Returns:
+        Tuple of (audio array in [-1.0, 1.0], sample rate)
+    """
+    audio_int16, sample_rate = wav_to_int16(wav_bytes)
+    audio_np = audio_int16.astype(np.float32) / 32768.0
+
+    # Convert stereo to mono by averaging channels
+    if audio_np.ndim == 2:
+        audio_np = audio_np.mean(axis=1)
+
+    return audio_np, sample_rate
+
+
+def float32_to_wav(audio_np: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode a mono float32 array as PCM16 WAV bytes.
+
+    Args:
+        audio_np: Audio array in [-1.0, 1.0]
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        WAV file bytes
+    """
+    audio_int16 = (np.clip(audio_np, -1.0, 1.0) * 32767).astype(np.int16)
+    return pcm16_to_wav(audio_int16.tobytes(), sample_rate)
+
+
+def pcm16_to_wav(pcm_bytes: bytes, sample_rate: int) -> bytes:
+    """
+    Wrap raw mono PCM16 bytes in a WAV header.
+
+    Args:
+        pcm_bytes: PCM16 little-endian samples
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        WAV file bytes
+    """
+    wav_io = io.BytesIO()
+    with wave.open(wav_io, 'wb') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 16-bit
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm_bytes)
+
+    return wav_io.getvalue()
+
+
+def concat_wav(wav_parts: List[bytes]) -> bytes:
+    """
+    Join WAV files with identical parameters into one WAV.
+
+    Args:
+        wav_parts: WAV file bytes, in order
+
+    Returns:
+        WAV file bytes containing all frames
+
+    Raises:
+        ValueError: If the parts differ in channels, sample width or rate
+    """
+    params = None
+    frames = []
+    for part in wav_parts:
+        with io.BytesIO(part) as wav_io:
+            with wave.open(wav_io, 'rb') as wav_file:
+                part_params = (wav_file.getnchannels(), wav_file.getsampwidth(), wav_file.getframerate())
+                if params is not None and part_params != params:
+                    raise ValueError(f"Cannot join WAV {part_params} to {params}")
+                params = part_params
+                frames.append(wav_file.readframes(wav_file.getnframes()))
+
+    wav_io = io.BytesIO()
+    with wave.open(wav_io, 'wb') as wav_file:
+        wav_file.setnchannels(params[0])
+        wav_file.setsampwidth(params[1])
+        wav_file.setframerate(params[2])
+        wav_file.writeframes(b"".join(frames))
+
+    return wav_io.getvalue()
@@ -8,6 +8,7 @@ import uuid
 import io
 import wave
 import time
+from collections import deque
 from pathlib import Path
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
@@ -15,14 +16,33 @@ from fastapi.responses import JSONResponse
 # Import modules
 from config.settings import get_settings
 from utils.logger import setup_logger
+from utils.circuit_breaker import CircuitBreaker
+from utils.openai_clients import configure_connection_pool
+from stt.base import TranscriptionResult
 from stt.factory import STTProviderFactory
+from stt.providers.hedged_stt import HedgedSTTProvider
+from stt.providers.fallback_stt import FallbackSTTProvider
+from stt.providers.chunked_stt import ChunkedSTTProvider
+from stt.providers.process_pool_stt import ProcessPoolSTTProvider
+from tts.base import TTSResult
 from tts.factory import TTSProviderFactory
+from tts.providers.fallback_tts import FallbackTTSProvider
+from tts.providers.cached_tts import CachedTTSProvider
+from tts.providers.parallel_tts import ParallelSentenceTTSProvider
+from tts.cache import TTSCache
+from tts.phrases import PhraseBank, predict_llm_latency
+from audio.input_codec import AudioInputCodecs
+from audio.output_codec import ResponseAudioEncoder, opus_sample_rate
 from session.vad import VoiceActivityDetector
 from session.stop_phrases import StopPhraseDetector
-from session.manager import SessionManager, SessionState
+from session.intents import create_intent_router
+from session.manager import Session, SessionManager, SessionState
+from session.provider_router import ProviderRouter, ProviderArm
+from session.protocol import IncomingMessage, ProtocolChannel
 
 # Import latency monitoring
 from monitoring.latency_tracker import LatencyMetrics, LatencyTracker
+from monitoring.end_to_end import ClockSync, EndToEndLatency
 from monitoring.optimization_advisor import OptimizationAdvisor
 
 # Initialize FastAPI app
@@ -35,18 +55,28 @@ stt_provider = None
 stt_provider_name = None
 tts_provider = None
 tts_provider_name = None
+tts_cache = None
+response_encoder = None
+input_codecs = None
 vad = None
 stop_phrase_detector = None
+intent_router = None
 session_manager = None
 latency_tracker = None
 optimization_advisor = None
+provider_router = None
+openai_pool = None
+provider_cache = {}
+phrase_banks = {}  # Experiment arm name -> PhraseBank (pre-rendered in the arm's voice)
+circuit_breakers = {}  # (kind, provider_name) -> CircuitBreaker
 
 
 @app.on_event("startup")
 async def startup():
     """Initialize components on startup"""
     global settings, logger, stt_provider, stt_provider_name, tts_provider, tts_provider_name
-    global vad, stop_phrase_detector, session_manager, latency_tracker, optimization_advisor
+    global vad, stop_phrase_detector, intent_router, session_manager, latency_tracker, optimization_advisor
+    global provider_router, tts_cache, response_encoder, input_codecs, openai_pool
 
     # Load settings
     settings = get_settings()
@@ -61,94 +91,48 @@ async def startup():
 
     logger.info("Starting VCA Session Manager (Phase 2 with Latency Monitoring)...")
 
-    # Initialize STT provider (using factory pattern)
-    stt_provider_name = settings.get('stt_provider', 'openai_whisper')
+    # Shared HTTP connection pool for OpenAI-backed providers (before creating them)
+    openai_pool = configure_connection_pool(settings.get('openai.http', {}) or {})
+    logger.info(f"Initialized OpenAI connection pool: {openai_pool}")
 
-    # Load provider-specific config
-    if stt_provider_name == 'openai_whisper':
-        stt_config = {
-            'api_key': settings.get('openai.api_key'),
-            'model': settings.get('openai.stt.model', 'whisper-1'),
-            'language': settings.get('openai.stt.language', 'en'),
-            'temperature': settings.get('openai.stt.temperature', 0.0)
-        }
-    elif stt_provider_name == 'mock_stt':
-        stt_config = {
-            'mock_latency': settings.get('mock_stt.mock_latency', 0.5),
-            'mock_text': settings.get('mock_stt.mock_text', 'Test transcription'),
-            'mock_confidence': settings.get('mock_stt.mock_confidence', 0.98)
-        }
-    elif stt_provider_name == 'local_whisper':
-        stt_config = {
-            'model_size': settings.get('local_whisper.model_size', 'small'),
-            'device': settings.get('local_whisper.device', 'cuda'),
-            'compute_type': settings.get('local_whisper.compute_type', 'float16'),
-            'language': settings.get('local_whisper.language', 'en'),
-            'beam_size': settings.get('local_whisper.beam_size', 5),
-            'vad_filter': settings.get('local_whisper.vad_filter', True)
-        }
-    elif stt_provider_name == 'pytorch_whisper':
-        stt_config = {
-            'model_size': settings.get('pytorch_whisper.model_size', 'small'),
-            'device': settings.get('pytorch_whisper.device', 'cuda'),
-            'fp16': settings.get('pytorch_whisper.fp16', False),
-            'language': settings.get('pytorch_whisper.language', 'en'),
-            'temperature': settings.get('pytorch_whisper.temperature', 0.0),
-            'beam_size': settings.get('pytorch_whisper.beam_size', 5),
-            'initial_prompt': settings.get('pytorch_whisper.initial_prompt', None),
-            'condition_on_previous_text': settings.get('pytorch_whisper.condition_on_previous_text', True)
-        }
-    else:
-        # Default empty config for other providers
-        stt_config = {}
-        logger.warning(f"No specific config found for STT provider '{stt_provider_name}', using defaults")
-
-    stt_provider = STTProviderFactory.create(stt_provider_name, stt_config)
+    # Initialize default STT/TTS providers (using factory pattern)
+    stt_provider_name = settings.get('stt_provider', 'openai_whisper')
+    stt_provider = build_stt_pipeline(stt_provider_name)
     logger.info(f"Initialized STT provider '{stt_provider_name}': {stt_provider}")
 
-    # Initialize TTS provider (using factory pattern)
+    # Initialize TTS phrase cache (before TTS providers, which are wrapped with it)
+    if settings.get('tts_cache.enabled', False):
+        tts_cache = TTSCache(
+            memory_max_bytes=int(settings.get('tts_cache.memory_max_mb', 32) * 1024 * 1024),
+            disk_dir=settings.get('tts_cache.disk_dir', None),
+            disk_max_bytes=int(settings.get('tts_cache.disk_max_mb', 512) * 1024 * 1024)
+        )
+        logger.info(f"Initialized TTS cache: {tts_cache}")
+
     tts_provider_name = settings.get('tts_provider', 'openai_tts')
+    tts_provider = create_tts_provider(tts_provider_name)
+    logger.info(f"Initialized TTS provider '{tts_provider_name}': {tts_provider}")
 
-    # Load provider-specific config
-    if tts_provider_name == 'openai_tts':
-        tts_config = {
-            'api_key': settings.get('openai.api_key'),
-            'model': settings.get('openai.tts.model', 'tts-1'),
-            'voice': settings.get('openai.tts.voice', 'nova'),
-            'speed': settings.get('openai.tts.speed', 1.0)
-        }
-    elif tts_provider_name == 'mock_tts':
-        tts_config = {
-            'mock_latency': settings.get('mock_tts.mock_latency', 0.3),
-            'audio_format': settings.get('mock_tts.audio_format', 'mp3'),
-            'sample_rate': settings.get('mock_tts.sample_rate', 24000)
-        }
-    elif tts_provider_name == 'coqui_tts':
-        tts_config = {
-            'model_name': settings.get('coqui_tts.model_name', 'tts_models/multilingual/multi-dataset/xtts_v2'),
-            'use_gpu': settings.get('coqui_tts.use_gpu', True),
-            'language': settings.get('coqui_tts.language', 'en'),
-            'speed': settings.get('coqui_tts.speed', 1.0),
-            'sample_rate': settings.get('coqui_tts.sample_rate', 16000),
-            'reference_audio': settings.get('coqui_tts.reference_audio', None)
-        }
-    elif tts_provider_name == 'piper_tts':
-        tts_config = {
-            'model_path': settings.get('piper_tts.model_path', 'models/piper/en_US-lessac-medium.onnx'),
-            'config_path': settings.get('piper_tts.config_path', None),
-            'speaker_id': settings.get('piper_tts.speaker_id', None),
-            'length_scale': settings.get('piper_tts.length_scale', 1.0),
-            'noise_scale': settings.get('piper_tts.noise_scale', 0.667),
-            'noise_w': settings.get('piper_tts.noise_w', 0.8),
-            'sample_rate': settings.get('piper_tts.sample_rate', 16000)
-        }
-    else:
-        # Default empty config for other providers
-        tts_config = {}
-        logger.warning(f"No specific config found for TTS provider '{tts_provider_name}', using defaults")
+    # Initialize provider routing (A/B experiments)
+    provider_router = create_provider_router()
+    logger.info(f"Initialized provider router: {provider_router}")
 
-    tts_provider = TTSProviderFactory.create(tts_provider_name, tts_config)
-    logger.info(f"Initialized TTS provider '{tts_provider_name}': {tts_provider}")
+    # Open API connections now so the first request doesn't pay DNS + TLS setup
+    if openai_pool.base_urls:
+        await openai_pool.warm()
+        openai_pool.start_keep_warm()
+
+    # Pre-render system phrases (fillers, errors, goodbyes) in each arm's voice
+    if settings.get('phrases.enabled', False):
+        await render_phrase_banks()
+
+    # Initialize response audio codec negotiation (Opus or WAV to the client)
+    response_encoder = ResponseAudioEncoder(settings.get('audio_output', {}) or {})
+    logger.info(f"Initialized response audio encoder: {response_encoder}")
+
+    # Initialize inbound audio codec negotiation (Opus or raw PCM from the client)
+    input_codecs = AudioInputCodecs(settings.get('audio_input', {}) or {})
+    logger.info(f"Initialized inbound audio codecs: {input_codecs}")
 
     # Initialize VAD
     vad_config = settings.get('session.vad', {})
@@ -165,6 +149,14 @@ async def startup():
     stop_phrase_detector = StopPhraseDetector(stop_phrases)
     logger.info(f"Initialized stop phrase detector: {stop_phrase_detector}")
 
+    # Initialize local intent fast-path (answers simple commands without the LLM)
+    if settings.get('intents.enabled', False):
+        intent_router = create_intent_router(
+            settings.get('intents.disabled', []),
+            greeting=settings.get('intents.greeting')
+        )
+        logger.info(f"Initialized intent router: {intent_router}")
+
     # Initialize session manager
     max_duration = settings.get('session.max_session_duration', 300)
     session_manager = SessionManager(max_session_duration=max_duration)
@@ -187,6 +179,16 @@ async def startup():
     logger.info("Session Manager ready!")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop STT worker processes and close pooled API connections"""
+    for provider in provider_cache.values():
+        if isinstance(provider, ProcessPoolSTTProvider):
+            provider.close()
+    if openai_pool:
+        await openai_pool.aclose()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -208,54 +210,138 @@ async def health():
             "vad": vad is not None,
             "session_manager": session_manager is not None
         },
-        "active_sessions": session_manager.get_active_sessions_count() if session_manager else 0
+        "active_sessions": session_manager.get_active_sessions_count() if session_manager else 0,
+        "stt_stats": stt_provider.get_stats() if stt_provider else {},
+        "tts_stats": tts_provider.get_stats() if tts_provider else {},
+        "intents": intent_router.get_stats() if intent_router else {},
+        "tts_cache": tts_cache.get_stats() if tts_cache else {},
+        "audio_output": response_encoder.get_stats() if response_encoder else {},
+        "audio_input": input_codecs.get_stats() if input_codecs else {},
+        "openai_http": openai_pool.get_stats() if openai_pool else {},
+        "phrases": {name: bank.get_stats() for name, bank in phrase_banks.items()},
+        "circuit_breakers": {
+            f"{kind}:{name}": breaker.get_stats()
+            for (kind, name), breaker in circuit_breakers.items()
+        }
     }
 
 
+@app.get("/experiments")
+async def experiments():
+    """Experiment arms, assignments and per-arm latency comparison"""
+    if not provider_router:
+        return {"arms": {}}
+
+    summary = provider_router.describe()
+    if latency_tracker:
+        summary["latency"] = latency_tracker.get_arm_comparison()
+        summary["fastest_arm"] = latency_tracker.get_fastest_arm()
+    return summary
+
+
 @app.websocket("/audio-stream")
 async def audio_stream(websocket: WebSocket):
     """
     WebSocket endpoint for audio streaming.
 
     Protocol:
-        Client → Server (JSON): {"type": "session_start", "device_id": "..."}
-        Client → Server (Binary): Audio chunks (PCM16, 16kHz, mono, 30ms frames)
+        Client → Server (JSON): {"type": "session_start", "device_id": "...", "audio_codecs": ["opus", "wav"],
+                                 "input_codec": "opus"}
+        Server → Client (JSON): {"type": "session_started", "session_id": "...", "audio_output": {"codec": "opus"},
+                                 "audio_input": {"codec": "opus"}}
+        Client → Server (Binary): Audio chunks (PCM16, 16kHz, mono, 30ms frames), or one
+            self-contained Ogg/Opus segment per message if "audio_input" is "opus"
         Server → Client (JSON): {"type": "transcript", "text": "..."}
         Server → Client (JSON): {"type": "response_text", "text": "..."}
-        Server → Client (Binary): Audio response (MP3)
+        Server → Client (JSON): {"type": "phrase", "kind": "filler", "text": "..."}
+        Server → Client (Binary): Audio response (MP3), or the phrase announced just before
+            (phrases use the same codec and framing as responses)
+        Server → Client (JSON): {"type": "audio_stream_start", "format": "pcm", "sample_rate": 16000}
+            (sent again mid-stream if the format or sample rate of the following chunks changes)
+        Server → Client (Binary): Streamed audio chunks (tts_streaming enabled), or one
+            self-contained Ogg/Opus segment per binary message ("format": "opus")
+        Server → Client (JSON): {"type": "audio_stream_end", "chunks": N, "duration": seconds}
+        Server → Client (JSON): {"type": "clock_ping", "server_time": t}   ("clock_sync": true clients)
+        Client → Server (JSON): {"type": "clock_pong", "server_time": t, "client_time": now}
+        Client → Server (JSON): {"type": "playback_started", "client_time": now}
+        Server → Client (JSON): {"type": "end_to_end_latency", "end_to_end": seconds, ...}
         Client → Server (JSON): {"type": "session_end", "reason": "..."}
+
+    Clients that send "clock_sync": true in session_start (echoed in session_started),
+    answer clock_ping and ack the start of response playback get
+    end-to-end latency (user stopped talking -> user hears audio) measured on
+    their own clock, see monitoring/end_to_end.py.
+
+    Clients that send "protocols": ["binary"] (and optionally "control_encodings":
+    ["msgpack", "json"]) in session_start get "protocol": {"name": "binary", ...}
+    in session_started; every later message in both directions is then a binary
+    frame (header + audio or encoded control message, see session/protocol.py).
     """
     await websocket.accept()
     logger.info(f"WebSocket connection accepted from {websocket.client}")
 
     session_id = str(uuid.uuid4())
     session = None
+    channel = ProtocolChannel(websocket, settings.get('protocol', {}) or {})
+    input_decoder = None  # Set for sessions that send Opus
+    end_to_end_config = settings.get('latency_monitoring.end_to_end', {}) or {}
+    clock_sync = ClockSync(
+        samples=end_to_end_config.get('clock_sync_samples', 5),
+        max_rtt=end_to_end_config.get('max_clock_rtt', 1.0)
+    )
+    end_to_end = EndToEndLatency(clock_sync)
 
     try:
-        # Wait for session start message
-        data = await websocket.receive()
-        logger.debug(f"Received data: {data}")
-
-        if "text" in data:
-            import json
-            logger.debug(f"Received text: {data['text']}")
-            message = json.loads(data["text"])
+        # Wait for session start message (always JSON text)
+        incoming = await channel.receive()
+
+        if incoming.message is not None:
+            message = incoming.message
             logger.debug(f"Parsed message: {message}")
 
             if message.get("type") == "session_start":
                 device_id = message.get("device_id", "unknown")
                 session = session_manager.create_session(session_id, device_id)
                 session.state = SessionState.LISTENING
+                openai_pool.session_started()
 
-                logger.info(f"Session started: {session}")
+                # Route session to an experiment arm (default arm if experiments disabled)
+                arm = provider_router.assign(device_id)
+                session.experiment_arm = arm.name
 
-                # Send acknowledgment
-                await websocket.send_json({
+                # Negotiate response audio codec (clients without "audio_codecs" get WAV)
+                session.output_codec = response_encoder.negotiate(message.get("audio_codecs"))
+                session.input_codec = input_codecs.negotiate(message.get("input_codec"))
+                input_decoder = input_codecs.create_decoder(session.input_codec, vad.frame_size, vad.sample_rate)
+
+                # Negotiate framing (clients without "protocols" keep JSON text + raw binary)
+                protocol = channel.negotiate(message)
+
+                # Clock sync pings only for clients that ask for them
+                clock_sync_enabled = clock_sync.negotiate(message.get("clock_sync"))
+
+                logger.info(
+                    f"Session started: {session} (arm: {arm.name}, audio in/out: "
+                    f"{session.input_codec}/{session.output_codec}, protocol: {protocol['name']})"
+                )
+
+                # Send acknowledgment, then switch to the negotiated framing
+                await channel.send_control({
                     "type": "session_started",
-                    "session_id": session_id
+                    "session_id": session_id,
+                    "audio_output": {"codec": session.output_codec},
+                    "audio_input": {"codec": session.input_codec},
+                    "protocol": protocol,
+                    "clock_sync": clock_sync_enabled
                 })
+                channel.activate(protocol)
+
+                # Estimate the client clock offset (one ping in flight, next on each pong)
+                clock_ping = clock_sync.ping()
+                if clock_ping:
+                    await channel.send_control(clock_ping)
         else:
-            logger.warning(f"Received non-text data: {data}")
+            logger.warning(f"Received audio before session_start ({len(incoming.audio)} bytes)")
 
         if not session:
             logger.error("No session_start message received")
@@ -264,18 +350,42 @@ async def audio_stream(websocket: WebSocket):
 
         # Audio processing loop
         vad.reset()
+        pending_frames = deque()  # Decoded PCM16 frames not yet run through VAD
 
         while True:
-            data = await websocket.receive()
+            if pending_frames:
+                incoming = pending_frames.popleft()
+            else:
+                incoming = await channel.receive()
+                received_at = time.time()
+
+                # Decode compressed client audio off the event loop into 30ms PCM16 frames
+                if incoming.audio is not None and input_decoder is not None:
+                    frames = await input_decoder.decode(incoming.audio)
+                    # The segment timestamp marks its end; step back one frame duration per frame
+                    frame_duration = vad.frame_duration_ms / 1000
+                    pending_frames.extend(
+                        IncomingMessage(
+                            audio=frame,
+                            timestamp=(
+                                incoming.timestamp - (len(frames) - 1 - index) * frame_duration
+                                if incoming.timestamp is not None else None
+                            )
+                        )
+                        for index, frame in enumerate(frames)
+                    )
+                    continue
 
             # Handle binary audio data
-            if "bytes" in data:
-                audio_chunk = data["bytes"]
+            if incoming.audio is not None:
+                audio_chunk = incoming.audio
                 session.append_audio(audio_chunk)
 
                 # Process with VAD (30ms frames = 960 bytes @ 16kHz PCM16)
                 if len(audio_chunk) == vad.frame_size:
                     is_speech, is_end_of_speech = vad.process_frame(audio_chunk)
+                    if is_speech:
+                        end_to_end.speech_frame(incoming.timestamp, received_at)
 
                     if is_end_of_speech:
                         # End of speech detected - process accumulated audio
@@ -284,13 +394,14 @@ async def audio_stream(websocket: WebSocket):
                         # Initialize latency metrics for this request
                         metrics = LatencyMetrics()
                         metrics.session_id = session_id
+                        metrics.experiment_arm = arm.name
                         pipeline_start = time.time()
 
-                        # Track silence detection time (from VAD)
-                        metrics.silence_detection = vad.silence_threshold_sec
+                        # Last speech frame -> detection; end to end completes on the playback ack
+                        end_to_end.end_of_speech(metrics)
 
                         session.state = SessionState.PROCESSING
-                        await websocket.send_json({
+                        await channel.send_control({
                             "type": "status",
                             "state": "processing"
                         })
@@ -302,10 +413,38 @@ async def audio_stream(websocket: WebSocket):
                         try:
                             # === STT TIMING ===
                             stt_start = time.time()
-                            result = await stt_provider.transcribe(wav_buffer)
+                            stream = arm.stt_provider.transcribe_stream(wav_buffer)
+                            stop_matcher = stop_phrase_detector.stream()
+                            partial_text = ""
+                            async for segment in stream:
+                                if not partial_text:
+                                    metrics.stt_first_segment = time.time() - stt_start
+                                partial_text = f"{partial_text} {segment.text}".strip()
+
+                                # Act on early segments: a stop phrase ends the session
+                                # without waiting for the rest of the decode
+                                if stop_matcher.feed(segment.text):
+                                    logger.info(f"Stop phrase in partial transcript after {time.time() - stt_start:.2f}s")
+                                    break
+                            await stream.aclose()
+                            result = stream.result or TranscriptionResult(text=partial_text)
                             metrics.stt_total = time.time() - stt_start
-                            metrics.stt_processing = metrics.stt_total  # Network upload time included
-                            metrics.stt_provider = stt_provider_name  # Track which provider was used
+
+                            # Remote providers report encode/upload separately from processing
+                            metrics.stt_encoding = result.encode_time or 0.0
+                            metrics.stt_network_upload = result.upload_time or 0.0
+                            metrics.stt_compression_ratio = result.compression_ratio or 1.0
+                            metrics.stt_processing = max(
+                                0.0,
+                                metrics.stt_total - metrics.stt_encoding - metrics.stt_network_upload
+                            )
+                            metrics.stt_provider = arm.stt_provider_name  # Track which provider was used
+                            metrics.stt_served_by = result.provider or arm.stt_provider_name
+                            metrics.stt_hedged = result.hedged
+                            metrics.stt_chunks = result.chunks
+                            metrics.stt_model = result.model or ""
+                            metrics.stt_passes = result.passes
+                            metrics.stt_breaker_state = get_breaker_state('stt', arm.stt_provider_name)
 
                             transcript = result.text
                             metrics.transcript_length = len(transcript)
@@ -314,28 +453,48 @@ async def audio_stream(websocket: WebSocket):
                             session.transcript = transcript
 
                             # Send transcript to client
-                            await websocket.send_json({
+                            await channel.send_control({
                                 "type": "transcript",
                                 "text": transcript
                             })
 
-                            # Check for stop phrase
-                            if stop_phrase_detector.is_stop_phrase(transcript):
-                                matched = stop_phrase_detector.get_matched_phrase(transcript)
+                            # Check for stop phrase (already matched while streaming segments)
+                            matched = stop_matcher.matched
+                            if matched:
                                 logger.info(f"Stop phrase detected: '{matched}'")
 
-                                await websocket.send_json({
+                                await channel.send_control({
                                     "type": "session_ending",
                                     "reason": "stop_phrase",
                                     "matched_phrase": matched
                                 })
+                                await send_phrase(channel, session, arm, 'goodbye')
 
                                 break
 
-                            # === LLM / RESPONSE GENERATION ===
+                            # === LOCAL INTENTS / LLM / RESPONSE GENERATION ===
                             llm_enabled = settings.get('llm.enabled', False)
+                            intent_result = (
+                                intent_router.route(transcript, previous_response=session.response)
+                                if intent_router else None
+                            )
+
+                            if intent_result:
+                                # Simple command answered locally - no LLM round trip
+                                response_text = intent_result.response_text
+                                metrics.intent = intent_result.intent
+                                metrics.intent_routing = intent_result.latency
+                                metrics.llm_total = 0.0
+                                metrics.llm_model_variant = "intent"
+                            elif llm_enabled:
+                                # Mask a predicted slow LLM response with a pre-rendered filler
+                                if should_play_filler(settings.get('llm.current_model', 'none')):
+                                    filler = await send_phrase(channel, session, arm, 'filler')
+                                    if filler:
+                                        metrics.filler = filler.text
+                                        metrics.time_to_filler = time.time() - pipeline_start
+                                        metrics.time_to_first_audio = metrics.time_to_filler
 
-                            if llm_enabled:
                                 # LLM mode (Phase 2 - to be implemented)
                                 llm_start = time.time()
                                 # TODO: Add LLM call here
@@ -353,25 +512,32 @@ async def audio_stream(websocket: WebSocket):
                             session.response = response_text
                             metrics.response_length = len(response_text)
 
-                            await websocket.send_json({
+                            await channel.send_control({
                                 "type": "response_text",
                                 "text": response_text
                             })
 
                             # === TTS TIMING ===
                             session.state = SessionState.RESPONDING
-                            tts_start = time.time()
-                            tts_result = await tts_provider.synthesize(response_text)
-                            metrics.tts_total = time.time() - tts_start
-                            metrics.tts_processing = metrics.tts_total
-                            metrics.tts_provider = tts_provider_name  # Track which provider was used
+                            metrics.tts_provider = arm.tts_provider_name  # Track which provider was used
+                            if settings.get('tts_streaming.enabled', False) and arm.tts_provider.supports_streaming:
+                                # Forward audio chunks while synthesis is still running
+                                await stream_tts_response(channel, session, arm, response_text, metrics)
+                            else:
+                                tts_start = time.time()
+                                tts_result = await arm.tts_provider.synthesize(response_text)
+                                metrics.tts_total = time.time() - tts_start
+                                metrics.tts_network = tts_result.network_time or 0.0
+                                metrics.tts_processing = metrics.tts_total - metrics.tts_network
+                                metrics.tts_served_by = tts_result.provider or arm.tts_provider_name
+                                metrics.tts_breaker_state = get_breaker_state('tts', arm.tts_provider_name)
+                                metrics.tts_cache_hits = tts_result.cache_hits
+                                metrics.tts_cache_misses = tts_result.cache_misses
 
-                            logger.info(f"TTS generated ({len(tts_result.audio_bytes)} bytes, took {metrics.tts_total:.2f}s)")
+                                logger.info(f"TTS generated ({len(tts_result.audio_bytes)} bytes, took {metrics.tts_total:.2f}s)")
 
-                            # Send audio response
-                            ws_send_start = time.time()
-                            await websocket.send_bytes(tts_result.audio_bytes)
-                            metrics.websocket_transmission = time.time() - ws_send_start
+                                # Send audio response (Opus segments if negotiated)
+                                await send_tts_result(channel, session, tts_result, metrics)
 
                             # Calculate total pipeline time
                             metrics.total_pipeline = time.time() - pipeline_start
@@ -394,9 +560,9 @@ async def audio_stream(websocket: WebSocket):
 
                                 # Send metrics to client if enabled
                                 if settings.get('latency_monitoring.send_to_client', True):
-                                    await websocket.send_json({
+                                    await channel.send_control({
                                         "type": "latency_report",
-                                        "metrics": metrics.to_dict()
+                                        "metrics": metrics.to_compact_dict() if channel.binary else metrics.to_dict()
                                     })
 
                             # Back to listening state
@@ -404,28 +570,50 @@ async def audio_stream(websocket: WebSocket):
                             session.clear_audio_buffer()
                             vad.reset()
 
-                            await websocket.send_json({
+                            await channel.send_control({
                                 "type": "status",
                                 "state": "listening"
                             })
 
                         except Exception as e:
                             logger.error(f"Error processing audio: {e}", exc_info=True)
-                            await websocket.send_json({
+                            await channel.send_control({
                                 "type": "error",
                                 "message": str(e)
                             })
+                            await send_phrase(channel, session, arm, 'error')
 
-            # Handle text messages (session control)
-            elif "text" in data:
-                import json
-                message = json.loads(data["text"])
+            # Handle control messages (session control)
+            elif incoming.message is not None:
+                message = incoming.message
 
                 if message.get("type") == "session_end":
                     reason = message.get("reason", "client_request")
                     logger.info(f"Session ending (reason: {reason})")
                     break
 
+                elif message.get("type") == "clock_pong":
+                    clock_ping = clock_sync.handle_pong(message, received_at)
+                    if clock_ping:
+                        await channel.send_control(clock_ping)
+
+                elif message.get("type") == "playback_started":
+                    acked = end_to_end.playback_started(message, received_at, incoming.timestamp)
+                    if acked:
+                        logger.info(
+                            f"End-to-end latency: {acked.end_to_end:.3f}s (silence detection "
+                            f"{acked.silence_detection:.3f}s, pipeline {acked.total_pipeline:.3f}s, "
+                            f"playback delay {acked.playback_delay:.3f}s)"
+                        )
+                        if settings.get('latency_monitoring.send_to_client', True):
+                            await channel.send_control({
+                                "type": "end_to_end_latency",
+                                "end_to_end": acked.end_to_end,
+                                "silence_detection": acked.silence_detection,
+                                "playback_delay": acked.playback_delay,
+                                "clock_sync_rtt": acked.clock_sync_rtt
+                            })
+
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected (session {session_id})")
 
@@ -435,6 +623,7 @@ async def audio_stream(websocket: WebSocket):
     finally:
         if session:
             session_manager.end_session(session_id)
+            openai_pool.session_ended()
             logger.info(f"Session ended: {session_id}")
 
         try:
@@ -443,6 +632,550 @@ async def audio_stream(websocket: WebSocket):
             pass
 
 
+def build_stt_config(provider_name: str) -> dict:
+    """
+    Build provider-specific STT config from settings.
+
+    Args:
+        provider_name: Name of the STT provider (e.g., 'local_whisper')
+
+    Returns:
+        Configuration dictionary for STTProviderFactory
+    """
+    if provider_name == 'openai_whisper':
+        return {
+            'api_key': settings.get('openai.api_key'),
+            'model': settings.get('openai.stt.model', 'whisper-1'),
+            'language': settings.get('openai.stt.language', 'en'),
+            'temperature': settings.get('openai.stt.temperature', 0.0),
+            'upload_format': settings.get('openai.stt.upload_format', 'flac'),
+            'timeout': settings.get('openai.stt.timeout', 30.0),
+            'max_retries': settings.get('openai.stt.max_retries', 1)
+        }
+    elif provider_name == 'mock_stt':
+        return {
+            'mock_latency': settings.get('mock_stt.mock_latency', 0.5),
+            'mock_text': settings.get('mock_stt.mock_text', 'Test transcription'),
+            'mock_confidence': settings.get('mock_stt.mock_confidence', 0.98)
+        }
+    elif provider_name == 'local_whisper':
+        return {
+            'model_size': settings.get('local_whisper.model_size', 'small'),
+            'device': settings.get('local_whisper.device', 'cuda'),
+            'compute_type': settings.get('local_whisper.compute_type', 'float16'),
+            'language': settings.get('local_whisper.language', 'en'),
+            'beam_size': settings.get('local_whisper.beam_size', 5),
+            'vad_filter': settings.get('local_whisper.vad_filter', True),
+            'num_workers': settings.get('local_whisper.num_workers', 1),
+            'batch_size': settings.get('local_whisper.batch_size', 8),
+            'model_ladder': settings.get('local_whisper.model_ladder', None),
+            'ladder_max_queue_depth': settings.get('local_whisper.ladder_max_queue_depth', None),
+            'two_pass': settings.get('local_whisper.two_pass', None)
+        }
+    elif provider_name == 'pytorch_whisper':
+        return {
+            'model_size': settings.get('pytorch_whisper.model_size', 'small'),
+            'device': settings.get('pytorch_whisper.device', 'cuda'),
+            'fp16': settings.get('pytorch_whisper.fp16', False),
+            'language': settings.get('pytorch_whisper.language', 'en'),
+            'temperature': settings.get('pytorch_whisper.temperature', 0.0),
+            'beam_size': settings.get('pytorch_whisper.beam_size', 5),
+            'initial_prompt': settings.get('pytorch_whisper.initial_prompt', None),
+            'condition_on_previous_text': settings.get('pytorch_whisper.condition_on_previous_text', True),
+            'model_ladder': settings.get('pytorch_whisper.model_ladder', None),
+            'ladder_max_queue_depth': settings.get('pytorch_whisper.ladder_max_queue_depth', None),
+            'two_pass': settings.get('pytorch_whisper.two_pass', None)
+        }
+
+    # Default empty config for other providers
+    logger.warning(f"No specific config found for STT provider '{provider_name}', using defaults")
+    return {}
+
+
+def build_tts_config(provider_name: str) -> dict:
+    """
+    Build provider-specific TTS config from settings.
+
+    Args:
+        provider_name: Name of the TTS provider (e.g., 'piper_tts')
+
+    Returns:
+        Configuration dictionary for TTSProviderFactory
+    """
+    if provider_name == 'openai_tts':
+        return {
+            'api_key': settings.get('openai.api_key'),
+            'model': settings.get('openai.tts.model', 'tts-1'),
+            'voice': settings.get('openai.tts.voice', 'nova'),
+            'speed': settings.get('openai.tts.speed', 1.0),
+            'timeout': settings.get('openai.tts.timeout', 30.0),
+            'max_retries': settings.get('openai.tts.max_retries', 1),
+            'stream': settings.get('openai.tts.stream', False),
+            'stream_chunk_size': settings.get('openai.tts.stream_chunk_size', 9600)
+        }
+    elif provider_name == 'mock_tts':
+        return {
+            'mock_latency': settings.get('mock_tts.mock_latency', 0.3),
+            'audio_format': settings.get('mock_tts.audio_format', 'mp3'),
+            'sample_rate': settings.get('mock_tts.sample_rate', 24000)
+        }
+    elif provider_name == 'coqui_tts':
+        return {
+            'model_name': settings.get('coqui_tts.model_name', 'tts_models/multilingual/multi-dataset/xtts_v2'),
+            'use_gpu': settings.get('coqui_tts.use_gpu', True),
+            'language': settings.get('coqui_tts.language', 'en'),
+            'speed': settings.get('coqui_tts.speed', 1.0),
+            'sample_rate': settings.get('coqui_tts.sample_rate', 16000),
+            'reference_audio': settings.get('coqui_tts.reference_audio', None),
+            'latent_cache_dir': settings.get('coqui_tts.latent_cache_dir', 'data/xtts_latents'),
+            'stream_chunk_size': settings.get('coqui_tts.stream_chunk_size', 20)
+        }
+    elif provider_name == 'piper_tts':
+        return {
+            'model_path': settings.get('piper_tts.model_path', 'models/piper/en_US-lessac-medium.onnx'),
+            'config_path': settings.get('piper_tts.config_path', None),
+            'speaker_id': settings.get('piper_tts.speaker_id', None),
+            'length_scale': settings.get('piper_tts.length_scale', 1.0),
+            'noise_scale': settings.get('piper_tts.noise_scale', 0.667),
+            'noise_w': settings.get('piper_tts.noise_w', 0.8),
+            'sample_rate': settings.get('piper_tts.sample_rate', 16000),
+            'pool_size': settings.get('piper_tts.pool_size', 1),
+            'intra_op_threads': settings.get('piper_tts.intra_op_threads', None),
+            'inter_op_threads': settings.get('piper_tts.inter_op_threads', 1)
+        }
+
+    # Default empty config for other providers
+    logger.warning(f"No specific config found for TTS provider '{provider_name}', using defaults")
+    return {}
+
+
+def create_stt_provider(provider_name: str, overrides: dict = None):
+    """
+    Create (or reuse) an STT provider.
+
+    Providers are cached by name and config overrides so experiment arms
+    that share a provider also share the loaded model.
+
+    Args:
+        provider_name: Name of the STT provider
+        overrides: Optional config values merged over the settings config
+
+    Returns:
+        STTProvider instance
+    """
+    cache_key = ('stt', provider_name, repr(sorted((overrides or {}).items())))
+    if cache_key not in provider_cache:
+        stt_config = build_stt_config(provider_name)
+        stt_config.update(overrides or {})
+
+        # Optionally run local models in worker processes (off the event loop's GIL)
+        pool_config = settings.get('stt_worker_pool', {}) or {}
+        if (
+            pool_config.get('enabled', False)
+            and provider_name in pool_config.get('providers', ['local_whisper', 'pytorch_whisper'])
+        ):
+            provider = ProcessPoolSTTProvider(provider_name, stt_config, pool_config)
+        else:
+            provider = STTProviderFactory.create(provider_name, stt_config)
+
+        # Guard remote providers with a deadline, circuit breaker and local fallback
+        resilience_config = settings.get('resilience.stt', {}) or {}
+        if (
+            provider.is_remote
+            and settings.get('resilience.enabled', False)
+            and resilience_config.get('fallback_provider')
+        ):
+            fallback_name = resilience_config['fallback_provider']
+            provider = FallbackSTTProvider(
+                provider,
+                create_stt_provider(fallback_name),
+                create_circuit_breaker('stt', provider_name, resilience_config),
+                resilience_config,
+                primary_name=provider_name,
+                fallback_name=fallback_name
+            )
+
+        provider_cache[cache_key] = provider
+    return provider_cache[cache_key]
+
+
+def build_stt_pipeline(provider_name: str, overrides: dict = None):
+    """
+    Build the STT provider used by sessions, with optional wrappers.
+
+    Order: provider (+ fallback) → chunking of long utterances → hedging.
+
+    Args:
+        provider_name: Name of the primary STT provider
+        overrides: Optional config values merged over the settings config
+
+    Returns:
+        STTProvider instance
+    """
+    provider = create_stt_provider(provider_name, overrides)
+
+    # Optionally split long utterances and transcribe the chunks in parallel
+    chunking_config = settings.get('stt_chunking', {}) or {}
+    if chunking_config.get('enabled', False):
+        provider = ChunkedSTTProvider(provider, chunking_config)
+
+    # Optionally hedge slow primary requests with a secondary provider
+    hedging_config = settings.get('stt_hedging', {}) or {}
+    if hedging_config.get('enabled', False):
+        secondary_name = hedging_config.get('secondary_provider', 'openai_whisper')
+        provider = HedgedSTTProvider(
+            provider,
+            create_stt_provider(secondary_name),
+            hedging_config,
+            primary_name=provider_name,
+            secondary_name=secondary_name
+        )
+
+    return provider
+
+
+# TTS config keys that change the rendered audio (part of the phrase cache key)
+TTS_VOICE_PARAMS = (
+    'model', 'model_name', 'model_path', 'voice', 'speed', 'language', 'reference_audio',
+    'speaker_id', 'length_scale', 'noise_scale', 'noise_w', 'sample_rate', 'audio_format'
+)
+
+
+def create_tts_provider(provider_name: str, overrides: dict = None):
+    """
+    Create (or reuse) a TTS provider.
+
+    Args:
+        provider_name: Name of the TTS provider
+        overrides: Optional config values merged over the settings config
+
+    Returns:
+        TTSProvider instance
+    """
+    cache_key = ('tts', provider_name, repr(sorted((overrides or {}).items())))
+    if cache_key not in provider_cache:
+        tts_config = build_tts_config(provider_name)
+        tts_config.update(overrides or {})
+        provider = TTSProviderFactory.create(provider_name, tts_config)
+
+        # Guard remote providers with a deadline, circuit breaker and local fallback
+        resilience_config = settings.get('resilience.tts', {}) or {}
+        if (
+            provider.is_remote
+            and settings.get('resilience.enabled', False)
+            and resilience_config.get('fallback_provider')
+        ):
+            fallback_name = resilience_config['fallback_provider']
+            provider = FallbackTTSProvider(
+                provider,
+                create_tts_provider(fallback_name),
+                create_circuit_breaker('tts', provider_name, resilience_config),
+                resilience_config,
+                primary_name=provider_name,
+                fallback_name=fallback_name
+            )
+
+        # Serve repeated phrases from the phrase cache (keyed on voice settings)
+        if tts_cache is not None:
+            provider = CachedTTSProvider(
+                provider,
+                tts_cache,
+                settings.get('tts_cache', {}) or {},
+                provider_name=provider_name,
+                voice_params={
+                    key: value for key, value in tts_config.items()
+                    if key in TTS_VOICE_PARAMS
+                }
+            )
+
+        # Synthesize the sentences of long responses concurrently, delivered in order
+        parallel_config = settings.get('tts_parallel', {}) or {}
+        if parallel_config.get('enabled', False):
+            provider = ParallelSentenceTTSProvider(provider, parallel_config)
+
+        provider_cache[cache_key] = provider
+    return provider_cache[cache_key]
+
+
+def create_circuit_breaker(kind: str, provider_name: str, resilience_config: dict) -> CircuitBreaker:
+    """
+    Create (or reuse) the circuit breaker for a remote provider.
+
+    Args:
+        kind: 'stt' or 'tts'
+        provider_name: Name of the protected provider
+        resilience_config: resilience.stt / resilience.tts settings
+
+    Returns:
+        CircuitBreaker shared by every instance of that provider
+    """
+    key = (kind, provider_name)
+    if key not in circuit_breakers:
+        circuit_breakers[key] = CircuitBreaker(
+            name=f"{kind}:{provider_name}",
+            failure_threshold=resilience_config.get('failure_threshold', 3),
+            slow_call_threshold=resilience_config.get('slow_call_threshold'),
+            reset_timeout=resilience_config.get('reset_timeout', 30.0),
+            half_open_max_calls=resilience_config.get('half_open_max_calls', 1)
+        )
+    return circuit_breakers[key]
+
+
+def get_breaker_state(kind: str, provider_name: str) -> str:
+    """Get circuit breaker state for a provider ('' if it has no breaker)"""
+    breaker = circuit_breakers.get((kind, provider_name))
+    return breaker.state.value if breaker else ""
+
+
+def create_provider_router() -> ProviderRouter:
+    """
+    Create the provider router from the experiments config.
+
+    With experiments disabled, every session uses the default providers.
+
+    Returns:
+        ProviderRouter instance
+    """
+    experiments = settings.get('experiments', {}) or {}
+
+    if not experiments.get('enabled', False) or not experiments.get('arms'):
+        return ProviderRouter.single(
+            stt_provider, stt_provider_name, tts_provider, tts_provider_name
+        )
+
+    arms = []
+    for arm_name, arm_config in experiments['arms'].items():
+        arm_stt_name = arm_config.get('stt_provider', stt_provider_name)
+        arm_tts_name = arm_config.get('tts_provider', tts_provider_name)
+
+        arms.append(ProviderArm(
+            name=arm_name,
+            stt_provider=build_stt_pipeline(arm_stt_name, arm_config.get('stt_config')),
+            stt_provider_name=arm_stt_name,
+            tts_provider=create_tts_provider(arm_tts_name, arm_config.get('tts_config')),
+            tts_provider_name=arm_tts_name,
+            weight=arm_config.get('weight', 0.0)
+        ))
+        logger.info(f"Experiment arm loaded: {arms[-1]}")
+
+    return ProviderRouter(
+        arms,
+        device_overrides=experiments.get('device_overrides', {}),
+        salt=experiments.get('salt', '')
+    )
+
+
+async def send_tts_result(channel: ProtocolChannel, session: Session, tts_result: TTSResult, metrics: LatencyMetrics):
+    """
+    Send a complete TTS result in the session's negotiated codec.
+
+    Audio that keeps its format goes out as one binary message; Opus-encoded
+    audio is framed like a stream (audio_stream_start, segments, audio_stream_end)
+    so the client can start playback after the first segment.
+
+    Args:
+        channel: Client connection
+        session: Client session (output_codec)
+        tts_result: Synthesized audio
+        metrics: Latency metrics for this request
+    """
+    output_format = response_encoder.output_format(tts_result.format, session.output_codec)
+
+    encode_start = time.time()
+    payloads = await response_encoder.encode(
+        tts_result.audio_bytes, tts_result.format, tts_result.sample_rate, session.output_codec
+    )
+    metrics.tts_encoding = time.time() - encode_start
+    metrics.tts_codec = output_format
+    metrics.tts_compression_ratio = len(tts_result.audio_bytes) / max(1, sum(len(payload) for payload in payloads))
+
+    ws_send_start = time.time()
+    metrics.time_to_first_audio = metrics.time_to_first_audio or ws_send_start - metrics.timestamp
+    await send_encoded_audio(channel, tts_result, output_format, payloads)
+    metrics.websocket_transmission = time.time() - ws_send_start
+
+
+async def send_encoded_audio(channel: ProtocolChannel, tts_result: TTSResult, output_format: str, payloads: list):
+    """
+    Send encoded audio: one binary message if the format is unchanged, else framed segments.
+
+    Args:
+        channel: Client connection
+        tts_result: Synthesized audio (format, sample rate, duration)
+        output_format: Format the payloads are in
+        payloads: Output of response_encoder.encode()
+    """
+    if output_format == tts_result.format:
+        await channel.send_audio(tts_result.audio_bytes)
+        return
+
+    await channel.send_control({
+        "type": "audio_stream_start",
+        "format": output_format,
+        "sample_rate": opus_sample_rate(tts_result.sample_rate)
+    })
+    for payload in payloads:
+        await channel.send_audio(payload)
+    await channel.send_control({
+        "type": "audio_stream_end",
+        "chunks": len(payloads),
+        "duration": tts_result.duration
+    })
+
+
+async def stream_tts_response(
+    channel: ProtocolChannel,
+    session: Session,
+    arm: ProviderArm,
+    text: str,
+    metrics: LatencyMetrics
+):
+    """
+    Synthesize with the arm's streaming TTS provider and forward chunks as they arrive.
+
+    Records time to first chunk as tts_processing and the full synthesis as tts_total.
+    PCM chunks are Opus-encoded when the session negotiated Opus. If the format or
+    sample rate changes mid-stream (e.g., a fallback provider served one sentence),
+    another audio_stream_start announces it before the first chunk in the new format.
+
+    Args:
+        channel: Client connection
+        session: Client session (output_codec)
+        arm: Session's experiment arm
+        text: Response text
+        metrics: Latency metrics for this request
+    """
+    tts_start = time.time()
+    audio_bytes = 0
+    sent_bytes = 0
+    duration = 0.0
+    announced = None  # (format, sample_rate) of the last audio_stream_start
+    stream = arm.tts_provider.synthesize_stream(text)
+    try:
+        async for chunk in stream:
+            output_format = response_encoder.output_format(chunk.format, session.output_codec)
+            if metrics.tts_chunks == 0:
+                metrics.tts_processing = time.time() - tts_start
+                metrics.tts_network = chunk.network_time or 0.0
+
+            stream_format = (
+                output_format,
+                opus_sample_rate(chunk.sample_rate) if output_format == 'opus' else chunk.sample_rate
+            )
+            if stream_format != announced:
+                if announced is not None:
+                    logger.info(f"TTS stream format changed mid-response: {announced} → {stream_format}")
+                await channel.send_control({
+                    "type": "audio_stream_start",
+                    "format": stream_format[0],
+                    "sample_rate": stream_format[1]
+                })
+                announced = stream_format
+
+            encode_start = time.time()
+            payloads = await response_encoder.encode(
+                chunk.audio_bytes, chunk.format, chunk.sample_rate, session.output_codec
+            )
+            metrics.tts_encoding += time.time() - encode_start
+
+            ws_send_start = time.time()
+            metrics.time_to_first_audio = metrics.time_to_first_audio or ws_send_start - metrics.timestamp
+            for payload in payloads:
+                await channel.send_audio(payload)
+                metrics.tts_chunks += 1
+                sent_bytes += len(payload)
+            metrics.websocket_transmission += time.time() - ws_send_start
+
+            audio_bytes += len(chunk.audio_bytes)
+            if chunk.format == 'pcm' and chunk.sample_rate:
+                duration += len(chunk.audio_bytes) / 2 / chunk.sample_rate
+    finally:
+        await stream.aclose()
+
+    metrics.tts_total = time.time() - tts_start
+    metrics.tts_served_by = arm.tts_provider_name
+    metrics.tts_breaker_state = get_breaker_state('tts', arm.tts_provider_name)
+    metrics.tts_codec = session.output_codec
+    metrics.tts_compression_ratio = audio_bytes / sent_bytes if sent_bytes else 1.0
+
+    await channel.send_control({
+        "type": "audio_stream_end",
+        "chunks": metrics.tts_chunks,
+        "duration": duration or None
+    })
+    logger.info(
+        f"TTS streamed {metrics.tts_chunks} chunks ({sent_bytes} bytes as {session.output_codec}), first after "
+        f"{metrics.tts_processing:.2f}s, total {metrics.tts_total:.2f}s"
+    )
+
+
+async def render_phrase_banks():
+    """Pre-render the configured phrase sets once per distinct arm TTS provider"""
+    phrase_sets = settings.get('phrases.sets', {}) or {}
+    render_concurrency = settings.get('phrases.render_concurrency', 2)
+
+    banks_by_provider = {}
+    for arm in provider_router.arms.values():
+        bank = banks_by_provider.get(id(arm.tts_provider))
+        if bank is None:
+            bank = PhraseBank(phrase_sets, render_concurrency=render_concurrency)
+            await bank.render(arm.tts_provider)
+            banks_by_provider[id(arm.tts_provider)] = bank
+        phrase_banks[arm.name] = bank
+        logger.info(f"Phrases for arm '{arm.name}' ({arm.tts_provider_name}): {bank}")
+
+
+async def send_phrase(channel: ProtocolChannel, session: Session, arm: ProviderArm, kind: str):
+    """
+    Send a pre-rendered phrase (announced by a "phrase" message, then its audio).
+
+    Audio goes out in the session's negotiated codec, framed like a response;
+    each phrase is encoded once per codec and reused.
+
+    Args:
+        channel: Client connection
+        session: Client session (output_codec)
+        arm: Session's experiment arm (selects the voice)
+        kind: Phrase set name ('filler', 'error', 'goodbye', ...)
+
+    Returns:
+        RenderedPhrase that was sent, or None if none is available
+    """
+    bank = phrase_banks.get(arm.name)
+    phrase = bank.get(kind) if bank else None
+    if phrase is None:
+        return None
+
+    try:
+        audio = phrase.audio
+        output_format = response_encoder.output_format(audio.format, session.output_codec)
+        if session.output_codec not in phrase.encoded:
+            phrase.encoded[session.output_codec] = await response_encoder.encode(
+                audio.audio_bytes, audio.format, audio.sample_rate, session.output_codec
+            )
+
+        await channel.send_control({"type": "phrase", "kind": kind, "text": phrase.text})
+        await send_encoded_audio(channel, audio, output_format, phrase.encoded[session.output_codec])
+    except Exception as e:
+        logger.warning(f"Could not send '{kind}' phrase: {e}")
+        return None
+    return phrase
+
+
+def should_play_filler(llm_model: str) -> bool:
+    """Check whether the LLM call is predicted to be slower than the filler threshold"""
+    if not settings.get('phrases.filler.enabled', True):
+        return False
+
+    predicted = predict_llm_latency(
+        llm_model,
+        latency_tracker.get_model_comparison() if latency_tracker else {},
+        settings.get('latency_monitoring.model_latencies', {}) or {},
+        min_samples=settings.get('phrases.filler.min_samples', 5)
+    )
+    return predicted is not None and predicted > settings.get('phrases.filler.threshold', 2.0)
+
+
 def create_wav(pcm_data: bytes, sample_rate: int = 16000, channels: int = 1, sample_width: int = 2) -> bytes:
     """
     Create WAV file bytes from raw PCM data.
@@ -3,14 +3,18 @@ Monitoring and analytics modules for VCA Session Manager.
 
 This package includes:
 - Latency tracking and measurement
+- End-to-end latency from client timestamps
 - Performance optimization suggestions
 - Historical analytics
 """
 
 from .latency_tracker import LatencyMetrics, LatencyTracker
+from .end_to_end import ClockSync, EndToEndLatency
 from .optimization_advisor import OptimizationAdvisor
 
 __all__ = [
+    'ClockSync',
+    'EndToEndLatency',
     'LatencyMetrics',
     'LatencyTracker',
     'OptimizationAdvisor',
@@ -0,0 +1,244 @@
+"""
+End-to-end latency from client timestamps and playback acks
+VCA 1.0 - Phase 3
+
+Server-side component times miss what the user actually waits for. This
+measures "user stopped talking -> user hears audio" per request:
+- ClockSync estimates the client clock offset with server-initiated
+  clock_ping / clock_pong round trips after session_started (NTP-style:
+  the sample with the shortest round trip wins, error bound ±rtt/2),
+  only for clients that send "clock_sync": true in session_start
+- EndToEndLatency keeps the client timestamp of the last speech frame
+  (binary protocol frame header, mapped to the server clock) and, when
+  the client acks playback, fills in end_to_end, playback_delay and the
+  real silence_detection of that request's LatencyMetrics
+
+Without clock sync or frame timestamps it falls back to server receive
+times, which adds uplink transit (and any time the ack waited while the
+pipeline was busy), so those values are upper bounds.
+
+Protocol:
+    Client → Server: {"type": "session_start", ..., "clock_sync": true}
+    Server → Client: {"type": "session_started", ..., "clock_sync": true}
+    Server → Client: {"type": "clock_ping", "server_time": t}
+    Client → Server: {"type": "clock_pong", "server_time": t, "client_time": now}
+    Client → Server: {"type": "playback_started", "client_time": now}   # First response audio audible
+
+Configuration:
+    latency_monitoring:
+      end_to_end:
+        clock_sync_samples: 5   # Ping/pong round trips per session (0 = no clock sync)
+        max_clock_rtt: 1.0      # Discard slower samples (seconds)
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+from .latency_tracker import LatencyMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class ClockSync:
+    """Client clock offset estimate from clock_ping / clock_pong round trips"""
+
+    def __init__(self, samples: int = 5, max_rtt: float = 1.0):
+        """
+        Initialize clock sync.
+
+        Args:
+            samples: Round trips to run (one ping in flight at a time)
+            max_rtt: Samples with a longer round trip are discarded (seconds)
+        """
+        self.samples = samples
+        self.max_rtt = max_rtt
+        self.offset: Optional[float] = None  # Client clock - server clock (seconds)
+        self.rtt: Optional[float] = None  # Round trip of the sample behind offset
+
+        # Counters
+        self.pings_sent = 0
+        self.pongs_received = 0
+        self.samples_rejected = 0
+
+    def negotiate(self, requested) -> bool:
+        """
+        Enable pings only if the client asked for clock sync.
+
+        Args:
+            requested: "clock_sync" value from session_start (missing for older clients)
+
+        Returns:
+            True if clock_ping messages will be sent
+        """
+        if not requested:
+            self.samples = 0
+        return self.samples > 0
+
+    @property
+    def synced(self) -> bool:
+        """True once at least one usable sample was taken"""
+        return self.offset is not None
+
+    def ping(self) -> Optional[Dict]:
+        """
+        Build the next clock_ping.
+
+        Returns:
+            clock_ping message, or None once all samples were sent
+        """
+        if self.pings_sent >= self.samples:
+            return None
+        self.pings_sent += 1
+        return {"type": "clock_ping", "server_time": time.time()}
+
+    def handle_pong(self, message: Dict, received_at: Optional[float] = None) -> Optional[Dict]:
+        """
+        Add a clock_pong sample.
+
+        Args:
+            message: clock_pong echoing server_time, with the client's client_time
+            received_at: When the pong arrived (default: now)
+
+        Returns:
+            Next clock_ping to send, or None when done
+        """
+        if received_at is None:
+            received_at = time.time()
+        self.pongs_received += 1
+
+        try:
+            sent_at = float(message["server_time"])
+            client_time = float(message["client_time"])
+        except (KeyError, TypeError, ValueError):
+            self.samples_rejected += 1
+            logger.warning(f"Malformed clock_pong: {message}")
+            return self.ping()
+
+        rtt = received_at - sent_at
+        if not 0 <= rtt <= self.max_rtt:
+            self.samples_rejected += 1
+        elif self.rtt is None or rtt < self.rtt:
+            # Symmetric paths assumed: the client read its clock half-way through the round trip
+            self.offset = client_time - (sent_at + received_at) / 2
+            self.rtt = rtt
+
+        next_ping = self.ping()
+        if next_ping is None and self.synced:
+            logger.info(f"Client clock offset {self.offset * 1000:+.1f}ms (±{self.rtt * 500:.1f}ms)")
+        return next_ping
+
+    def to_server_time(self, client_time: Optional[float]) -> Optional[float]:
+        """Map a client timestamp to the server clock (None if unknown or not synced)"""
+        if client_time is None or self.offset is None:
+            return None
+        return client_time - self.offset
+
+    def get_stats(self) -> Dict:
+        """Get offset estimate and sample counters"""
+        return {
+            'synced': self.synced,
+            'offset': self.offset,
+            'rtt': self.rtt,
+            'pings_sent': self.pings_sent,
+            'pongs_received': self.pongs_received,
+            'samples_rejected': self.samples_rejected,
+        }
+
+    def __repr__(self) -> str:
+        if not self.synced:
+            return f"ClockSync(not synced, {self.pongs_received}/{self.samples} samples)"
+        return f"ClockSync(offset={self.offset * 1000:+.1f}ms, rtt={self.rtt * 1000:.1f}ms)"
+
+
+class EndToEndLatency:
+    """Per-session 'user stopped talking -> user hears audio' measurement"""
+
+    def __init__(self, clock: ClockSync):
+        """
+        Initialize end-to-end measurement.
+
+        Args:
+            clock: The session's client clock estimate
+        """
+        self.clock = clock
+        self.last_speech: Optional[float] = None  # Last speech frame (server clock)
+        self.pending: Optional[LatencyMetrics] = None  # Request waiting for its playback ack
+        self.speech_end: Optional[float] = None  # Last speech frame of the pending request
+
+    def server_time(self, client_time: Optional[float], received_at: Optional[float] = None) -> float:
+        """
+        Place a client event on the server clock.
+
+        Args:
+            client_time: Client timestamp (seconds since epoch), if any
+            received_at: When the server received it (default: now)
+
+        Returns:
+            Server-clock time; the receive time if the client time can't be mapped
+        """
+        if received_at is None:
+            received_at = time.time()
+        mapped = self.clock.to_server_time(client_time)
+        # An event can't happen after the server received it (offset error)
+        return received_at if mapped is None else min(mapped, received_at)
+
+    def speech_frame(self, client_time: Optional[float] = None, received_at: Optional[float] = None):
+        """
+        Record a frame VAD classified as speech.
+
+        Args:
+            client_time: Frame timestamp from the client, if any
+            received_at: When the frame arrived (default: now)
+        """
+        self.last_speech = self.server_time(client_time, received_at)
+
+    def end_of_speech(self, metrics: LatencyMetrics):
+        """
+        Start measuring a request once VAD detected the end of speech.
+
+        Sets the real silence_detection (last speech frame -> detection) and
+        keeps metrics until the client acks playback.
+
+        Args:
+            metrics: Latency metrics of the new request (timestamp = detection time)
+        """
+        self.speech_end = self.last_speech if self.last_speech is not None else metrics.timestamp
+        self.last_speech = None
+        self.pending = metrics
+
+        metrics.silence_detection = max(0.0, metrics.timestamp - self.speech_end)
+        metrics.clock_sync_rtt = self.clock.rtt or 0.0
+
+    def playback_started(
+        self,
+        message: Dict,
+        received_at: Optional[float] = None,
+        frame_time: Optional[float] = None
+    ) -> Optional[LatencyMetrics]:
+        """
+        Complete the pending request from a playback_started ack.
+
+        Args:
+            message: playback_started message (client_time optional)
+            received_at: When the ack arrived (default: now)
+            frame_time: Binary frame timestamp of the ack, used if client_time is missing
+
+        Returns:
+            The completed LatencyMetrics, or None if no request was waiting
+        """
+        if self.pending is None:
+            logger.debug("playback_started without a pending request")
+            return None
+
+        metrics, self.pending = self.pending, None
+        played_at = self.server_time(message.get("client_time", frame_time), received_at)
+
+        metrics.end_to_end = max(0.0, played_at - self.speech_end)
+        if metrics.time_to_first_audio:
+            first_audio_sent = metrics.timestamp + metrics.time_to_first_audio
+            metrics.playback_delay = max(0.0, played_at - first_audio_sent)
+        return metrics
+
+    def __repr__(self) -> str:
+        return f"EndToEndLatency({self.clock!r}, pending={self.pending is not None})"
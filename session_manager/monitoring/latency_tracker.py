@@ -8,6 +8,7 @@ Provides detailed timing for each component of the audio processing pipeline:
 - LLM (Language Model)
 - TTS (Text-to-Speech)
 - Network transmission
+- End to end (client timestamps + playback acks, see end_to_end.py)
 
 Usage:
     metrics = LatencyMetrics()
@@ -20,7 +21,7 @@ Usage:
 """
 
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict
 from typing import Dict, List, Optional
 import logging
 
@@ -33,10 +34,14 @@ class LatencyMetrics:
 
     # Timing for each component (in seconds)
     vad_processing: float = 0.0
-    silence_detection: float = 0.0  # Time waiting for silence
+    silence_detection: float = 0.0  # Last speech frame -> end of speech detected
+    stt_encoding: float = 0.0  # Compressing audio before upload (remote STT)
     stt_network_upload: float = 0.0
     stt_processing: float = 0.0
+    stt_first_segment: float = 0.0  # Time until the first decoded segment was available
     stt_total: float = 0.0
+    intent_routing: float = 0.0  # Local intent matching + handler
+    time_to_filler: float = 0.0  # End of speech -> filler audio sent (0 = no filler)
     llm_network: float = 0.0
     llm_processing: float = 0.0
     llm_total: float = 0.0
@@ -44,12 +49,34 @@ class LatencyMetrics:
     tts_network: float = 0.0
     tts_processing: float = 0.0
     tts_total: float = 0.0
+    tts_encoding: float = 0.0  # Encoding response audio for the client (Opus)
     websocket_transmission: float = 0.0
+    time_to_first_audio: float = 0.0  # End of speech detected -> first response audio sent
+    playback_delay: float = 0.0  # First response audio sent -> client started playback (ack)
     total_pipeline: float = 0.0
+    end_to_end: float = 0.0  # User stopped talking -> client started playback (0 = no ack)
 
     # Provider tracking (NEW - for experimentation)
     stt_provider: str = "unknown"
     tts_provider: str = "unknown"
+    experiment_arm: str = "default"
+    stt_compression_ratio: float = 1.0  # Original WAV size / uploaded size
+    stt_chunks: int = 1  # Parallel chunks for long utterances
+    stt_model: str = ""  # Local model size used (model ladder), "" for remote providers
+    stt_passes: int = 1  # 2 if two-pass mode re-ran a low-confidence fast pass
+    intent: str = ""  # Local intent that answered the utterance ("" = LLM/echo)
+    filler: str = ""  # Pre-rendered filler played while waiting for the LLM
+    stt_served_by: str = ""  # Provider that actually produced the transcript
+    stt_hedged: bool = False  # True if a hedge request was launched
+    stt_breaker_state: str = ""  # Circuit breaker state ("" if provider has no breaker)
+    tts_served_by: str = ""  # Provider that actually produced the audio
+    tts_breaker_state: str = ""
+    tts_cache_hits: int = 0  # Sentences served from the TTS phrase cache
+    tts_cache_misses: int = 0  # Sentences synthesized (cache enabled)
+    tts_chunks: int = 0  # Streamed audio chunks (0 = sent as one response)
+    tts_codec: str = ""  # Codec negotiated for response audio ("" = as synthesized)
+    tts_compression_ratio: float = 1.0  # Synthesized size / bytes sent
+    clock_sync_rtt: float = 0.0  # Round trip behind the client clock offset (0 = receive times used)
 
     # Metadata
     timestamp: float = field(default_factory=time.time)
@@ -63,29 +90,78 @@ class LatencyMetrics:
 ╔══════════════════════════════════════════════════════════════╗
 ║               LATENCY BREAKDOWN - Session {self.session_id[:8]}
 ╠══════════════════════════════════════════════════════════════╣
+║ Experiment Arm: {self.experiment_arm:<15}
 ║ VAD Processing:           {self.vad_processing:>6.3f}s
-║ Silence Detection:        {self.silence_detection:>6.3f}s (waiting)
+║ Silence Detection:        {self.silence_detection:>6.3f}s (last speech -> detected)
 ║ ───────────────────────────────────────────────────────────
-║ STT Provider: {self.stt_provider:<15}
+║ STT Provider: {self.stt_provider:<15} {self._stt_served_by_note()}
+║ STT Encoding:             {self.stt_encoding:>6.3f}s ({self.stt_compression_ratio:.1f}x smaller)
 ║ STT Network Upload:       {self.stt_network_upload:>6.3f}s
-║ STT Processing:           {self.stt_processing:>6.3f}s
+║ STT Processing:           {self.stt_processing:>6.3f}s ({self.stt_chunks} chunk(s){self._stt_decode_note()})
+║ STT First Segment:        {self.stt_first_segment:>6.3f}s
 ║ STT TOTAL:                {self.stt_total:>6.3f}s
 ║ ───────────────────────────────────────────────────────────
+║ Local Intent: {self.intent or '-':<15} {self.intent_routing * 1e6:>8.0f}µs
+║ Filler Audio:             {self.time_to_filler:>6.3f}s {self.filler}
 ║ LLM Network:              {self.llm_network:>6.3f}s
 ║ LLM Processing ({self.llm_model_variant:>10}): {self.llm_processing:>6.3f}s
 ║ LLM TOTAL:                {self.llm_total:>6.3f}s
 ║ ───────────────────────────────────────────────────────────
-║ TTS Provider: {self.tts_provider:<15}
+║ TTS Provider: {self.tts_provider:<15} {self._tts_served_by_note()}
 ║ TTS Network:              {self.tts_network:>6.3f}s
-║ TTS Processing:           {self.tts_processing:>6.3f}s
+║ TTS Processing:           {self.tts_processing:>6.3f}s{self._tts_cache_note()}{self._tts_stream_note()}
 ║ TTS TOTAL:                {self.tts_total:>6.3f}s
+║ TTS Encoding:             {self.tts_encoding:>6.3f}s ({self.tts_codec or 'as synthesized'}, {self.tts_compression_ratio:.1f}x smaller)
 ║ ───────────────────────────────────────────────────────────
 ║ WebSocket Transmission:   {self.websocket_transmission:>6.3f}s
+║ Time To First Audio:      {self.time_to_first_audio:>6.3f}s
+║ Playback Delay (client):  {self.playback_delay:>6.3f}s
 ╠══════════════════════════════════════════════════════════════╣
 ║ TOTAL PIPELINE:           {self.total_pipeline:>6.3f}s
+║ END TO END (heard):       {self._end_to_end_note()}
 ╚══════════════════════════════════════════════════════════════╝
         """
 
+    def _stt_served_by_note(self) -> str:
+        """Describe hedging/fallback outcome for the breakdown"""
+        if self.stt_hedged:
+            return f"(hedged, won by {self.stt_served_by})"
+        if self.stt_served_by and self.stt_served_by != self.stt_provider:
+            return f"(served by {self.stt_served_by}, breaker {self.stt_breaker_state or 'n/a'})"
+        return ""
+
+    def _stt_decode_note(self) -> str:
+        """Show the local model size and two-pass re-run when known"""
+        note = f", {self.stt_model}" if self.stt_model else ""
+        if self.stt_passes > 1:
+            note += ", 2 passes"
+        return note
+
+    def _tts_served_by_note(self) -> str:
+        """Describe fallback outcome for the breakdown"""
+        if self.tts_served_by and self.tts_served_by != self.tts_provider:
+            return f"(served by {self.tts_served_by}, breaker {self.tts_breaker_state or 'n/a'})"
+        return ""
+
+    def _tts_cache_note(self) -> str:
+        """Show phrase cache hits when the cache is enabled"""
+        lookups = self.tts_cache_hits + self.tts_cache_misses
+        if not lookups:
+            return ""
+        return f" (cache {self.tts_cache_hits}/{lookups} sentences)"
+
+    def _tts_stream_note(self) -> str:
+        """Mark time-to-first-chunk when the response was streamed"""
+        return f" (first chunk, {self.tts_chunks} streamed)" if self.tts_chunks else ""
+
+    def _end_to_end_note(self) -> str:
+        """Show end-to-end latency and its clock error bound once playback was acked"""
+        if not self.end_to_end:
+            return "  n/a (no playback ack yet)"
+        if not self.clock_sync_rtt:
+            return f"{self.end_to_end:>6.3f}s (receive times, upper bound)"
+        return f"{self.end_to_end:>6.3f}s (±{self.clock_sync_rtt * 500:.0f}ms clock)"
+
     def get_summary(self) -> str:
         """Return concise one-line summary."""
         return (f"Total: {self.total_pipeline:.2f}s "
@@ -97,6 +173,13 @@ class LatencyMetrics:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
 
+    def to_compact_dict(self) -> Dict:
+        """Convert to dictionary with only the fields that differ from their defaults."""
+        return {
+            f.name: getattr(self, f.name) for f in fields(self)
+            if getattr(self, f.name) != f.default
+        }
+
     def is_over_target(self, target: float) -> bool:
         """Check if total latency exceeds target."""
         return self.total_pipeline > target
@@ -164,6 +247,9 @@ class LatencyTracker:
         stt_times = [m.stt_total for m in self.history]
         llm_times = [m.llm_total for m in self.history]
         tts_times = [m.tts_total for m in self.history]
+        end_to_end = [m.end_to_end for m in self.history if m.end_to_end]  # Acked requests only
+        tts_cache_hits = sum(m.tts_cache_hits for m in self.history)
+        tts_cache_lookups = tts_cache_hits + sum(m.tts_cache_misses for m in self.history)
 
         return {
             'total': {
@@ -178,7 +264,9 @@ class LatencyTracker:
             'stt': {
                 'mean': float(np.mean(stt_times)),
                 'p90': float(np.percentile(stt_times, 90)),
+                'pass2_rate': sum(1 for m in self.history if m.stt_passes > 1) / len(self.history),
             },
+            'intent_hit_rate': sum(1 for m in self.history if m.intent) / len(self.history),
             'llm': {
                 'mean': float(np.mean(llm_times)),
                 'p90': float(np.percentile(llm_times, 90)),
@@ -186,6 +274,12 @@ class LatencyTracker:
             'tts': {
                 'mean': float(np.mean(tts_times)),
                 'p90': float(np.percentile(tts_times, 90)),
+                'cache_hit_rate': tts_cache_hits / tts_cache_lookups if tts_cache_lookups else 0.0,
+            },
+            'end_to_end': {
+                'mean': float(np.mean(end_to_end)) if end_to_end else 0.0,
+                'p90': float(np.percentile(end_to_end, 90)) if end_to_end else 0.0,
+                'sample_count': len(end_to_end),
             },
             'sample_count': len(self.history)
         }
@@ -282,6 +376,97 @@ class LatencyTracker:
 
         return comparison
 
+    def get_stt_model_comparison(self) -> Dict[str, Dict]:
+        """
+        Compare STT latencies across local model sizes (model ladder).
+
+        Returns:
+            Dictionary mapping model sizes to their statistics
+        """
+        if not self.history:
+            return {}
+
+        import numpy as np
+        from collections import defaultdict
+
+        model_samples = defaultdict(list)
+
+        for metrics in self.history:
+            if metrics.stt_model:
+                model_samples[metrics.stt_model].append(metrics)
+
+        comparison = {}
+        for model, samples in model_samples.items():
+            stt_times = [m.stt_total for m in samples]
+            comparison[model] = {
+                'mean': float(np.mean(stt_times)),
+                'median': float(np.median(stt_times)),
+                'max': float(np.max(stt_times)),
+                'mean_transcript_length': float(np.mean([m.transcript_length for m in samples])),
+                'sample_count': len(samples)
+            }
+
+        return comparison
+
+    def get_arm_comparison(self) -> Dict[str, Dict]:
+        """
+        Compare latencies across experiment arms (provider combinations).
+
+        Returns:
+            Dictionary mapping arm names to their statistics
+        """
+        if not self.history:
+            return {}
+
+        import numpy as np
+        from collections import defaultdict
+
+        arm_metrics = defaultdict(list)
+
+        for metrics in self.history:
+            arm_metrics[metrics.experiment_arm].append(metrics)
+
+        comparison = {}
+        for arm, samples in arm_metrics.items():
+            totals = [m.total_pipeline for m in samples]
+            stt_times = [m.stt_total for m in samples]
+            tts_times = [m.tts_total for m in samples]
+
+            comparison[arm] = {
+                'stt_provider': samples[-1].stt_provider,
+                'tts_provider': samples[-1].tts_provider,
+                'total_mean': float(np.mean(totals)),
+                'total_median': float(np.median(totals)),
+                'total_p90': float(np.percentile(totals, 90)),
+                'stt_mean': float(np.mean(stt_times)),
+                'stt_p90': float(np.percentile(stt_times, 90)),
+                'tts_mean': float(np.mean(tts_times)),
+                'tts_p90': float(np.percentile(tts_times, 90)),
+                'sample_count': len(samples)
+            }
+
+        return comparison
+
+    def get_fastest_arm(self, min_samples: int = 5) -> Optional[str]:
+        """
+        Get the arm with the lowest median total latency.
+
+        Args:
+            min_samples: Arms with fewer samples are not considered
+
+        Returns:
+            Arm name, or None if no arm has enough samples
+        """
+        candidates = {
+            arm: stats for arm, stats in self.get_arm_comparison().items()
+            if stats['sample_count'] >= min_samples
+        }
+
+        if not candidates:
+            return None
+
+        return min(candidates, key=lambda arm: candidates[arm]['total_median'])
+
     def print_statistics(self) -> None:
         """Print formatted statistics to console."""
         stats = self.get_statistics()
@@ -303,8 +488,14 @@ class LatencyTracker:
 
         print("\nComponent Averages:")
         print(f"  STT: {stats['stt']['mean']:.2f}s (P90: {stats['stt']['p90']:.2f}s)")
+        if stats['stt']['pass2_rate'] > 0:
+            print(f"       two-pass re-run rate: {stats['stt']['pass2_rate']:.0%}")
         print(f"  LLM: {stats['llm']['mean']:.2f}s (P90: {stats['llm']['p90']:.2f}s)")
+        if stats['intent_hit_rate'] > 0:
+            print(f"       answered by local intents: {stats['intent_hit_rate']:.0%}")
         print(f"  TTS: {stats['tts']['mean']:.2f}s (P90: {stats['tts']['p90']:.2f}s)")
+        if stats['tts']['cache_hit_rate'] > 0:
+            print(f"       phrase cache hit rate: {stats['tts']['cache_hit_rate']:.0%}")
 
         print("\nBottlenecks:")
         for bottleneck in self.get_bottlenecks():
@@ -319,4 +510,25 @@ class LatencyTracker:
                 print(f"    Mean: {stats['mean']:.2f}s (n={stats['sample_count']})")
                 print(f"    Range: {stats['min']:.2f}s - {stats['max']:.2f}s")
 
+        # STT model ladder usage if more than one model served requests
+        stt_model_comparison = self.get_stt_model_comparison()
+        if len(stt_model_comparison) > 1:
+            print("\nSTT Models:")
+            for model, stats in stt_model_comparison.items():
+                print(f"  {model}: median {stats['median']:.2f}s, max {stats['max']:.2f}s (n={stats['sample_count']})")
+
+        # Experiment arm comparison if more than one arm has data
+        arm_comparison = self.get_arm_comparison()
+        if len(arm_comparison) > 1:
+            print("\nExperiment Arms:")
+            for arm, stats in arm_comparison.items():
+                print(f"  {arm} (STT: {stats['stt_provider']}, TTS: {stats['tts_provider']}):")
+                print(f"    Total median: {stats['total_median']:.2f}s "
+                      f"(P90: {stats['total_p90']:.2f}s, n={stats['sample_count']})")
+                print(f"    STT mean: {stats['stt_mean']:.2f}s, TTS mean: {stats['tts_mean']:.2f}s")
+
+            fastest = self.get_fastest_arm()
+            if fastest:
+                print(f"  Fastest arm: {fastest}")
+
         print("="*70 + "\n")
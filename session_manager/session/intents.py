@@ -0,0 +1,245 @@
+"""
+Local intent fast-path
+VCA 1.0 - Phase 3
+
+Answers simple commands ("what time is it", "repeat that", "never mind")
+locally between STT and the LLM, skipping the cloud round trip. Each intent
+is a set of regex patterns (precompiled, case-insensitive, matched against
+the whole normalized transcript) and a handler that returns the response
+text, or None to let the utterance fall through to the LLM.
+
+Handlers are pluggable:
+
+    router = IntentRouter()
+
+    @router.intent("lights_on", [r"turn on the (?P<room>\\w+) lights?"])
+    def lights_on(match, context):
+        return f"Turning on the {match.group('room')} lights."
+
+Configuration:
+    intents:
+      enabled: false
+      disabled: ["smalltalk_thanks"]   # Built-in intents to skip
+      greeting: "Hi, how can I help?"  # Reply of the built-in greeting intent
+"""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GREETING = "Hi, how can I help?"
+
+# Punctuation STT adds to short commands ("Okay, thanks.") is treated as a space
+_SEPARATOR_PATTERN = re.compile(r"[\s.,!?;:]+")
+
+
+@dataclass
+class IntentContext:
+    """What a handler may need besides the transcript"""
+    transcript: str
+    previous_response: str = ""  # Last assistant response in this session
+    now: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class IntentResult:
+    """A locally answered utterance"""
+    intent: str
+    response_text: str
+    latency: float  # seconds spent routing + handling
+
+
+IntentHandler = Callable[[re.Match, IntentContext], Optional[str]]
+
+
+@dataclass
+class _Intent:
+    name: str
+    patterns: List[re.Pattern]
+    handler: IntentHandler
+    hits: int = 0
+    total_latency: float = 0.0
+
+
+class IntentRouter:
+    """Match transcripts against registered intents and answer them locally"""
+
+    def __init__(self):
+        self._intents: Dict[str, _Intent] = {}
+
+        # Counters
+        self.routed = 0  # Transcripts checked
+        self.misses = 0
+        self.miss_latency = 0.0
+
+    def register(self, name: str, patterns: List[str], handler: IntentHandler):
+        """
+        Register (or replace) an intent.
+
+        Args:
+            name: Intent name (used in metrics)
+            patterns: Regexes that must match the whole normalized transcript
+            handler: Callable(match, context) -> response text, or None to fall through
+
+        Raises:
+            re.error: If a pattern doesn't compile
+        """
+        compiled = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self._intents[name] = _Intent(name=name, patterns=compiled, handler=handler)
+        logger.debug(f"Registered intent '{name}' ({len(compiled)} patterns)")
+
+    def intent(self, name: str, patterns: List[str]):
+        """Decorator form of register()"""
+        def decorator(handler: IntentHandler) -> IntentHandler:
+            self.register(name, patterns, handler)
+            return handler
+        return decorator
+
+    def unregister(self, name: str):
+        """Remove an intent (no-op if unknown)"""
+        self._intents.pop(name, None)
+
+    @property
+    def intent_names(self) -> List[str]:
+        return list(self._intents)
+
+    def route(self, transcript: str, previous_response: str = "") -> Optional[IntentResult]:
+        """
+        Answer the transcript locally if it matches an intent.
+
+        Args:
+            transcript: Final STT transcript
+            previous_response: Last response in the session (for "repeat that")
+
+        Returns:
+            IntentResult, or None if the utterance should go to the LLM
+        """
+        start = time.perf_counter()
+        self.routed += 1
+        text = _SEPARATOR_PATTERN.sub(" ", transcript).strip().replace("’", "'")
+
+        if text:
+            context = IntentContext(transcript=transcript, previous_response=previous_response)
+            for intent in self._intents.values():
+                for pattern in intent.patterns:
+                    match = pattern.fullmatch(text)
+                    if match is None:
+                        continue
+
+                    try:
+                        response = intent.handler(match, context)
+                    except Exception as e:
+                        logger.error(f"Intent handler '{intent.name}' failed: {e}", exc_info=True)
+                        response = None
+
+                    if response:
+                        latency = time.perf_counter() - start
+                        intent.hits += 1
+                        intent.total_latency += latency
+                        logger.info(f"Intent '{intent.name}' answered locally in {latency * 1e6:.0f}µs")
+                        return IntentResult(intent=intent.name, response_text=response, latency=latency)
+
+        self.misses += 1
+        self.miss_latency += time.perf_counter() - start
+        return None
+
+    def get_stats(self) -> Dict:
+        """Get per-intent hit rate and latency"""
+        return {
+            'routed': self.routed,
+            'hit_rate': (self.routed - self.misses) / self.routed if self.routed else 0.0,
+            'mean_miss_latency_us': self.miss_latency / self.misses * 1e6 if self.misses else 0.0,
+            'intents': {
+                intent.name: {
+                    'hits': intent.hits,
+                    'hit_rate': intent.hits / self.routed if self.routed else 0.0,
+                    'mean_latency_us': intent.total_latency / intent.hits * 1e6 if intent.hits else 0.0,
+                }
+                for intent in self._intents.values()
+            },
+        }
+
+    def __repr__(self) -> str:
+        return f"IntentRouter(intents={self.intent_names})"
+
+
+# === Built-in intents ===
+
+def _answer_time(match: re.Match, context: IntentContext) -> str:
+    now = context.now
+    return f"It's {now.hour % 12 or 12}:{now.minute:02d} {'AM' if now.hour < 12 else 'PM'}."
+
+
+def _answer_date(match: re.Match, context: IntentContext) -> str:
+    now = context.now
+    return f"Today is {now.strftime('%A')}, {now.strftime('%B')} {now.day}."
+
+
+def _repeat(match: re.Match, context: IntentContext) -> Optional[str]:
+    # Nothing said yet - let the LLM handle it
+    return context.previous_response or None
+
+
+def _cancel(match: re.Match, context: IntentContext) -> str:
+    return "Okay."
+
+
+def _thanks(match: re.Match, context: IntentContext) -> str:
+    return "You're welcome."
+
+
+def _greeting(match: re.Match, context: IntentContext) -> str:
+    return DEFAULT_GREETING
+
+
+BUILTIN_INTENTS = {
+    'time': (
+        [r"(?:what(?:'s| is) the time|what time is it)(?: (?:now|right now))?"],
+        _answer_time
+    ),
+    'date': (
+        [r"what(?:'s| is) (?:the date|today(?:'s date)?)(?: today)?", r"what day is (?:it|today)"],
+        _answer_date
+    ),
+    'repeat': (
+        [r"(?:can you |could you |please )?(?:repeat that|say that again|what did you say)(?: please)?"],
+        _repeat
+    ),
+    'cancel': (
+        [r"(?:never ?mind|cancel|forget it|stop)(?: that| it)?"],
+        _cancel
+    ),
+    'smalltalk_thanks': (
+        [r"(?:ok(?:ay)? )?(?:thanks|thank you)(?: (?:very much|so much))?"],
+        _thanks
+    ),
+    'greeting': (
+        [r"(?:hi|hello|hey)(?: there| nabu)?"],
+        _greeting
+    ),
+}
+
+
+def create_intent_router(disabled: Optional[List[str]] = None, greeting: Optional[str] = None) -> IntentRouter:
+    """
+    Create a router with the built-in intents.
+
+    Args:
+        disabled: Built-in intent names to leave out
+        greeting: Reply of the greeting intent (default: DEFAULT_GREETING)
+
+    Returns:
+        IntentRouter ready for additional register() calls
+    """
+    router = IntentRouter()
+    for name, (patterns, handler) in BUILTIN_INTENTS.items():
+        if name not in (disabled or []):
+            if name == 'greeting' and greeting:
+                handler = lambda match, context: greeting
+            router.register(name, patterns, handler)
+    return router
@@ -28,6 +28,9 @@ class Session:
     audio_buffer: bytes = b""
     transcript: str = ""
     response: str = ""
+    experiment_arm: str = "default"
+    input_codec: str = "pcm"  # Client audio codec negotiated at session_start
+    output_codec: str = "wav"  # Response audio codec negotiated at session_start
 
     def update_activity(self):
         """Update last activity timestamp"""
@@ -0,0 +1,251 @@
+"""
+WebSocket wire protocol
+VCA 1.0 - Phase 3
+
+Wraps the WebSocket so the session handler sends and receives messages
+without caring about framing:
+- legacy: JSON text messages for control, untagged binary messages for audio
+- binary (v1): every message is a binary frame
+
+Binary frame layout (network byte order, 16-byte header):
+    version   u8    PROTOCOL_VERSION
+    type      u8    FRAME_AUDIO or FRAME_CONTROL
+    encoding  u8    Control payload encoding (ENCODING_JSON / ENCODING_MSGPACK)
+    reserved  u8
+    sequence  u32   Per-direction counter, starting at 0
+    timestamp u64   Sender wall clock, microseconds since the epoch
+    payload         Audio bytes, or the encoded control message
+
+Negotiation stays backward compatible: session_start and session_started
+are always JSON text. A client that lists "binary" in "protocols" gets
+{"protocol": {"name": "binary", "version": 1, "encoding": ...}} back and
+both sides switch to frames; other clients keep the legacy protocol.
+
+Control payloads use msgpack or orjson when installed (optional), falling
+back to the standard json module.
+
+Configuration:
+    protocol:
+      binary: true
+      control_encodings: ["msgpack", "json"]   # Server preference order
+"""
+
+import json
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency
+    msgpack = None
+
+PROTOCOL_VERSION = 1
+
+FRAME_AUDIO = 1
+FRAME_CONTROL = 2
+
+ENCODING_JSON = 0
+ENCODING_MSGPACK = 1
+
+HEADER = struct.Struct('!BBBxIQ')
+
+_ENCODING_IDS = {'json': ENCODING_JSON, 'msgpack': ENCODING_MSGPACK}
+
+
+def dumps_json(message: Dict) -> bytes:
+    """Encode a control message as compact JSON (orjson if available)"""
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message, separators=(',', ':')).encode()
+
+
+def loads_json(data) -> Dict:
+    """Decode a JSON control message (str or bytes)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_control(message: Dict, encoding: int) -> bytes:
+    """Encode a control message payload"""
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.packb(message, use_bin_type=True)
+    return dumps_json(message)
+
+
+def decode_control(payload: bytes, encoding: int) -> Dict:
+    """Decode a control message payload"""
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.unpackb(payload, raw=False)
+    return loads_json(payload)
+
+
+def pack_frame(frame_type: int, sequence: int, payload: bytes, encoding: int = ENCODING_JSON,
+               timestamp_us: Optional[int] = None) -> bytes:
+    """
+    Build a binary frame.
+
+    Args:
+        frame_type: FRAME_AUDIO or FRAME_CONTROL
+        sequence: Sender's sequence number
+        payload: Frame payload
+        encoding: Control payload encoding (ignored for audio)
+        timestamp_us: Send time (default: now)
+
+    Returns:
+        Header + payload bytes
+    """
+    if timestamp_us is None:
+        timestamp_us = time.time_ns() // 1000
+    return HEADER.pack(PROTOCOL_VERSION, frame_type, encoding, sequence & 0xFFFFFFFF, timestamp_us) + payload
+
+
+@dataclass
+class IncomingMessage:
+    """Message received from the client"""
+    audio: Optional[bytes] = None  # Audio payload (binary message / audio frame)
+    message: Optional[Dict] = None  # Control message
+    sequence: Optional[int] = None  # Binary protocol only
+    timestamp: Optional[float] = None  # Client send time (seconds since epoch), binary protocol only
+
+
+class ProtocolChannel:
+    """Per-connection message framing (legacy JSON/binary or framed binary)"""
+
+    def __init__(self, websocket: WebSocket, config: dict):
+        """
+        Initialize channel in legacy mode.
+
+        Args:
+            websocket: Accepted client connection
+            config: protocol configuration (see module docstring)
+        """
+        self.websocket = websocket
+        self.binary_enabled = config.get('binary', True)
+        self.control_encodings: List[str] = [
+            encoding for encoding in config.get('control_encodings', ['msgpack', 'json'])
+            if encoding == 'json' or (encoding == 'msgpack' and msgpack is not None)
+        ] or ['json']
+
+        self.binary = False
+        self.encoding = ENCODING_JSON
+        self.send_sequence = 0
+        self.expected_sequence = 0
+
+        # Counters
+        self.messages_sent = 0
+        self.messages_received = 0
+        self.sequence_gaps = 0
+
+    def negotiate(self, session_start: Dict) -> Dict:
+        """
+        Choose the protocol from the client's session_start.
+
+        Call before sending session_started (still JSON text), then activate().
+
+        Args:
+            session_start: Parsed session_start message
+
+        Returns:
+            "protocol" entry for session_started
+        """
+        protocols = session_start.get('protocols') or []
+        if not (self.binary_enabled and 'binary' in protocols):
+            return {'name': 'json', 'version': PROTOCOL_VERSION}
+
+        requested = session_start.get('control_encodings') or ['json']
+        encoding = next((name for name in self.control_encodings if name in requested), 'json')
+        return {'name': 'binary', 'version': PROTOCOL_VERSION, 'encoding': encoding}
+
+    def activate(self, protocol: Dict):
+        """Switch to the negotiated protocol (after session_started was sent)"""
+        if protocol['name'] == 'binary':
+            self.binary = True
+            self.encoding = _ENCODING_IDS[protocol['encoding']]
+
+    async def receive(self) -> IncomingMessage:
+        """
+        Receive the next client message.
+
+        Returns:
+            IncomingMessage with either audio or a control message
+
+        Raises:
+            WebSocketDisconnect: If the client disconnected
+        """
+        data = await self.websocket.receive()
+        if data.get("type") == "websocket.disconnect":
+            raise WebSocketDisconnect(data.get("code", 1000))
+
+        self.messages_received += 1
+        raw = data.get("bytes")
+
+        if raw is None:
+            # JSON text (negotiation, or a legacy client)
+            return IncomingMessage(message=loads_json(data["text"]))
+
+        if not self.binary:
+            return IncomingMessage(audio=raw)
+
+        version, frame_type, encoding, sequence, timestamp_us = HEADER.unpack_from(raw)
+        if version != PROTOCOL_VERSION:
+            raise ValueError(f"Unsupported protocol version {version}")
+
+        if sequence != self.expected_sequence:
+            self.sequence_gaps += 1
+            logger.warning(f"Client frame sequence {sequence}, expected {self.expected_sequence}")
+        self.expected_sequence = (sequence + 1) & 0xFFFFFFFF
+
+        payload = raw[HEADER.size:]
+        incoming = IncomingMessage(sequence=sequence, timestamp=timestamp_us / 1e6)
+        if frame_type == FRAME_AUDIO:
+            incoming.audio = payload
+        else:
+            incoming.message = decode_control(payload, encoding)
+        return incoming
+
+    async def send_control(self, message: Dict):
+        """Send a control message (JSON text, or a control frame)"""
+        if self.binary:
+            await self.websocket.send_bytes(self._next_frame(FRAME_CONTROL, encode_control(message, self.encoding)))
+        else:
+            await self.websocket.send_text(dumps_json(message).decode())
+        self.messages_sent += 1
+
+    async def send_audio(self, audio_bytes: bytes):
+        """Send audio (untagged binary message, or an audio frame)"""
+        if self.binary:
+            await self.websocket.send_bytes(self._next_frame(FRAME_AUDIO, audio_bytes))
+        else:
+            await self.websocket.send_bytes(audio_bytes)
+        self.messages_sent += 1
+
+    def _next_frame(self, frame_type: int, payload: bytes) -> bytes:
+        frame = pack_frame(frame_type, self.send_sequence, payload, self.encoding)
+        self.send_sequence = (self.send_sequence + 1) & 0xFFFFFFFF
+        return frame
+
+    def get_stats(self) -> Dict:
+        """Get protocol and message counters"""
+        return {
+            'protocol': 'binary' if self.binary else 'json',
+            'encoding': 'msgpack' if self.encoding == ENCODING_MSGPACK else 'json',
+            'messages_sent': self.messages_sent,
+            'messages_received': self.messages_received,
+            'sequence_gaps': self.sequence_gaps,
+        }
+
+    def __repr__(self) -> str:
+        return f"ProtocolChannel({'binary' if self.binary else 'json'})"
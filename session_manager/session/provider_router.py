@@ -0,0 +1,179 @@
+"""
+Per-device provider routing and A/B experiment assignment
+VCA 1.0 - Phase 3
+
+Routes each session to an experiment "arm" (a preloaded STT/TTS provider pair)
+so latency can be compared across setups on real traffic.
+
+Assignment order:
+1. Explicit device override (device_overrides in config)
+2. Sticky percentage split keyed on a hash of device_id
+3. Random weighted pick when the device is unknown
+
+Configuration:
+    experiments:
+      enabled: true
+      salt: "exp-2025-11"
+      device_overrides:
+        pixel-7: local
+      arms:
+        local:
+          weight: 50
+          stt_provider: local_whisper
+          tts_provider: piper_tts
+        cloud:
+          weight: 50
+          stt_provider: openai_whisper
+          tts_provider: openai_tts
+"""
+
+import hashlib
+import logging
+import random
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from stt.base import STTProvider
+from tts.base import TTSProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARM = "default"
+
+
+@dataclass
+class ProviderArm:
+    """A named STT/TTS provider combination that sessions can be routed to"""
+    name: str
+    stt_provider: STTProvider
+    stt_provider_name: str
+    tts_provider: TTSProvider
+    tts_provider_name: str
+    weight: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ProviderArm(name='{self.name}', stt='{self.stt_provider_name}', "
+            f"tts='{self.tts_provider_name}', weight={self.weight})"
+        )
+
+
+class ProviderRouter:
+    """Assign sessions to provider arms by device or percentage split"""
+
+    def __init__(
+        self,
+        arms: List[ProviderArm],
+        device_overrides: Optional[Dict[str, str]] = None,
+        salt: str = ""
+    ):
+        """
+        Initialize provider router.
+
+        Args:
+            arms: Available arms (first arm is the fallback)
+            device_overrides: Map of device_id -> arm name (pinned devices)
+            salt: Mixed into the device hash so a new experiment reshuffles devices
+
+        Raises:
+            ValueError: If no arms are given or an override names an unknown arm
+        """
+        if not arms:
+            raise ValueError("ProviderRouter requires at least one arm")
+
+        self.arms: Dict[str, ProviderArm] = {arm.name: arm for arm in arms}
+        self.default_arm = arms[0]
+        self.device_overrides = dict(device_overrides or {})
+        self.salt = salt
+
+        for device_id, arm_name in self.device_overrides.items():
+            if arm_name not in self.arms:
+                raise ValueError(
+                    f"Device override for '{device_id}' references unknown arm '{arm_name}'. "
+                    f"Available arms: {', '.join(self.arms)}"
+                )
+
+        self.total_weight = sum(max(arm.weight, 0.0) for arm in arms)
+        self.assignment_counts: Counter = Counter()
+
+    @classmethod
+    def single(
+        cls,
+        stt_provider: STTProvider,
+        stt_provider_name: str,
+        tts_provider: TTSProvider,
+        tts_provider_name: str
+    ) -> "ProviderRouter":
+        """Create a router with one default arm (experiments disabled)"""
+        arm = ProviderArm(
+            name=DEFAULT_ARM,
+            stt_provider=stt_provider,
+            stt_provider_name=stt_provider_name,
+            tts_provider=tts_provider,
+            tts_provider_name=tts_provider_name,
+            weight=1.0
+        )
+        return cls([arm])
+
+    def assign(self, device_id: str) -> ProviderArm:
+        """
+        Pick the arm for a new session.
+
+        Args:
+            device_id: Device identifier from session_start
+
+        Returns:
+            ProviderArm to use for the whole session
+        """
+        if device_id in self.device_overrides:
+            arm = self.arms[self.device_overrides[device_id]]
+        elif len(self.arms) == 1 or self.total_weight <= 0:
+            arm = self.default_arm
+        elif device_id and device_id != "unknown":
+            arm = self._pick(self._device_bucket(device_id))
+        else:
+            arm = self._pick(random.random())
+
+        self.assignment_counts[arm.name] += 1
+        logger.debug(f"Device '{device_id}' assigned to arm '{arm.name}'")
+        return arm
+
+    def _device_bucket(self, device_id: str) -> float:
+        """Map a device_id to a stable point in [0, 1)"""
+        digest = hashlib.sha256(f"{self.salt}:{device_id}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64
+
+    def _pick(self, point: float) -> ProviderArm:
+        """Select an arm by walking the cumulative weight distribution"""
+        threshold = point * self.total_weight
+        cumulative = 0.0
+
+        for arm in self.arms.values():
+            cumulative += max(arm.weight, 0.0)
+            if threshold < cumulative:
+                return arm
+
+        return self.default_arm
+
+    def get_arm(self, name: str) -> Optional[ProviderArm]:
+        """Get arm by name"""
+        return self.arms.get(name)
+
+    def describe(self) -> Dict:
+        """Summarize arms and assignments for the /experiments endpoint"""
+        return {
+            "arms": {
+                name: {
+                    "stt_provider": arm.stt_provider_name,
+                    "tts_provider": arm.tts_provider_name,
+                    "weight": arm.weight,
+                    "sessions_assigned": self.assignment_counts.get(name, 0)
+                }
+                for name, arm in self.arms.items()
+            },
+            "device_overrides": self.device_overrides,
+        }
+
+    def __repr__(self) -> str:
+        return f"ProviderRouter(arms={list(self.arms)})"
@@ -1,9 +1,19 @@
 """
 Stop phrase detection
 VCA 1.0 - Phase 1
+
+All phrases are compiled into a single case-insensitive regex with word
+boundaries, so one scan finds the matched phrase ("goodbye" matches
+"Okay, goodbye!" but not "goodbyes"). Whitespace/punctuation between words
+and straight/curly apostrophes are matched loosely, since STT output varies.
+
+Streaming: StopPhraseStream takes partial transcripts (e.g., STT segments)
+as they arrive and only rescans the new text plus a short carry-over, so a
+phrase split across two segments is still found.
 """
 
-from typing import List
+import re
+from typing import List, Optional
 
 
 class StopPhraseDetector:
@@ -16,7 +26,46 @@ class StopPhraseDetector:
         Args:
             stop_phrases: List of phrases that end the session
         """
-        self.stop_phrases = [phrase.lower() for phrase in stop_phrases]
+        self.stop_phrases = [phrase.lower().strip() for phrase in stop_phrases if phrase.strip()]
+
+        # Longest first so "that's all for now" wins over "that's all"
+        phrases = sorted(self.stop_phrases, key=len, reverse=True)
+        self._pattern = re.compile(
+            "|".join(f"(?P<p{i}>{self._phrase_regex(phrase)})" for i, phrase in enumerate(phrases)),
+            re.IGNORECASE
+        ) if phrases else None
+        self._group_phrases = {f"p{i}": phrase for i, phrase in enumerate(phrases)}
+
+        # Characters to keep from the previous partial so split phrases match
+        self.max_phrase_length = max((len(phrase) for phrase in phrases), default=0)
+
+    @staticmethod
+    def _phrase_regex(phrase: str) -> str:
+        """Regex for one phrase: word boundaries, loose separators and apostrophes"""
+        words = [
+            re.escape(word).replace("'", "['’]")
+            for word in re.split(r"[\s,.!?;:]+", phrase) if word
+        ]
+        body = r"[\s,.!?;:]+".join(words)
+        start = r"\b" if re.match(r"\w", phrase) else ""
+        end = r"\b" if re.search(r"\w$", phrase) else ""
+        return f"{start}{body}{end}"
+
+    def match(self, text: str) -> Optional[str]:
+        """
+        Find the first stop phrase in text (single pass).
+
+        Args:
+            text: Transcribed text
+
+        Returns:
+            Matched stop phrase (as configured) or None
+        """
+        if self._pattern is None or not text:
+            return None
+
+        found = self._pattern.search(text)
+        return self._group_phrases[found.lastgroup] if found else None
 
     def is_stop_phrase(self, text: str) -> bool:
         """
@@ -28,13 +77,7 @@ class StopPhraseDetector:
         Returns:
             True if stop phrase detected
         """
-        text_lower = text.lower().strip()
-
-        for phrase in self.stop_phrases:
-            if phrase in text_lower:
-                return True
-
-        return False
+        return self.match(text) is not None
 
     def get_matched_phrase(self, text: str) -> str:
         """
@@ -46,13 +89,42 @@ class StopPhraseDetector:
         Returns:
             Matched stop phrase or empty string
         """
-        text_lower = text.lower().strip()
-
-        for phrase in self.stop_phrases:
-            if phrase in text_lower:
-                return phrase
+        return self.match(text) or ""
 
-        return ""
+    def stream(self) -> "StopPhraseStream":
+        """Create a matcher for one utterance's partial transcripts"""
+        return StopPhraseStream(self)
 
     def __repr__(self) -> str:
         return f"StopPhraseDetector(phrases={self.stop_phrases})"
+
+
+class StopPhraseStream:
+    """Incremental stop phrase matching over streaming partial transcripts"""
+
+    def __init__(self, detector: StopPhraseDetector):
+        """
+        Args:
+            detector: Detector holding the compiled phrases
+        """
+        self.detector = detector
+        self.matched: Optional[str] = None
+        self._tail = ""
+
+    def feed(self, text: str) -> Optional[str]:
+        """
+        Add the next piece of transcript (e.g., one STT segment).
+
+        Args:
+            text: New text since the previous feed
+
+        Returns:
+            Matched stop phrase (once found, returned on every later feed) or None
+        """
+        if self.matched is None and text:
+            window = f"{self._tail} {text.strip()}"
+            self.matched = self.detector.match(window)
+            # Keep one extra character so a cut mid-word can't fake a word boundary
+            self._tail = window[-(self.detector.max_phrase_length + 1):]
+
+        return self.matched
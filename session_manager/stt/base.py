@@ -3,9 +3,10 @@ Base class for Speech-to-Text providers
 VCA 1.0 - Phase 1
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional, Union
 
 
 @dataclass
@@ -15,11 +16,84 @@ class TranscriptionResult:
     confidence: Optional[float] = None
     language: Optional[str] = None
     duration: Optional[float] = None  # seconds
+    provider: Optional[str] = None  # Provider that produced the result (set by wrappers)
+    model: Optional[str] = None  # Model size used (local providers with a model ladder)
+    hedged: bool = False  # True if a hedge (secondary) request was launched
+    # Remote providers only: upload phase breakdown
+    encode_time: Optional[float] = None  # seconds spent compressing audio
+    upload_time: Optional[float] = None  # seconds spent sending the request
+    compression_ratio: Optional[float] = None  # original / uploaded size
+    chunks: int = 1  # Number of chunks transcribed in parallel (long utterances)
+    passes: int = 1  # 2 if a low-confidence fast pass was re-run (two-pass mode)
+
+
+@dataclass
+class TranscriptionSegment:
+    """One decoded segment, emitted while transcription is still running"""
+    text: str
+    start: float = 0.0  # seconds into the audio
+    end: float = 0.0
+    confidence: Optional[float] = None  # Running confidence over segments so far
+
+
+class SegmentStream:
+    """
+    Async iterator over TranscriptionSegments; `result` holds the full
+    TranscriptionResult once iteration completes.
+
+    Usage:
+        stream = provider.transcribe_stream(audio_bytes)
+        async for segment in stream:
+            ...  # act on early segments; break to stop decoding
+        await stream.aclose()
+        result = stream.result  # None if iteration stopped early
+    """
+
+    def __init__(self, generator: AsyncIterator[Union[TranscriptionSegment, TranscriptionResult]]):
+        """
+        Args:
+            generator: Async generator yielding segments, then the final TranscriptionResult
+        """
+        self._generator = generator
+        self.result: Optional[TranscriptionResult] = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> TranscriptionSegment:
+        item = await self._generator.__anext__()
+        if isinstance(item, TranscriptionResult):
+            self.result = item
+            await self.aclose()
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self):
+        """Stop the underlying decode (if still running)"""
+        await self._generator.aclose()
+
+
+async def relay_segments(stream: SegmentStream):
+    """
+    Yield a SegmentStream's segments, then its TranscriptionResult.
+
+    For wrappers that forward an inner provider's stream from their own
+    _stream_segments(); closing the relay closes the inner stream.
+    """
+    try:
+        async for segment in stream:
+            yield segment
+    finally:
+        await stream.aclose()
+    yield stream.result
 
 
 class STTProvider(ABC):
     """Abstract base class for STT providers"""
 
+    # True for providers that call a network API (eligible for circuit breaking)
+    is_remote = False
+
     def __init__(self, config: dict):
         """
         Initialize STT provider.
@@ -45,5 +119,63 @@ class STTProvider(ABC):
         """
         pass
 
+    async def transcribe_chunks(self, chunks: List["np.ndarray"], sample_rate: int) -> List[TranscriptionResult]:
+        """
+        Transcribe consecutive chunks of one long utterance concurrently.
+
+        The default sends every chunk through transcribe() at once (concurrent
+        API requests for remote providers). Local providers override this to
+        control how chunks share the loaded model.
+
+        Args:
+            chunks: Mono float32 audio chunks, in order
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            One TranscriptionResult per chunk, in the same order
+        """
+        from audio.wav import float32_to_wav
+
+        return list(await asyncio.gather(*(
+            self.transcribe(float32_to_wav(chunk, sample_rate)) for chunk in chunks
+        )))
+
+    def transcribe_stream(self, audio_bytes: bytes) -> SegmentStream:
+        """
+        Transcribe audio, yielding segments as soon as they are decoded.
+
+        Args:
+            audio_bytes: Audio data (format depends on provider)
+
+        Returns:
+            SegmentStream of TranscriptionSegments (full result in stream.result)
+        """
+        return SegmentStream(self._stream_segments(audio_bytes))
+
+    async def _stream_segments(self, audio_bytes: bytes):
+        """
+        Yield TranscriptionSegments, then the final TranscriptionResult.
+
+        The default waits for transcribe() and emits its text as one segment;
+        providers that decode incrementally override this.
+        """
+        result = await self.transcribe(audio_bytes)
+        if result.text:
+            yield TranscriptionSegment(
+                text=result.text,
+                end=result.duration or 0.0,
+                confidence=result.confidence
+            )
+        yield result
+
+    def get_stats(self) -> Dict:
+        """
+        Get provider runtime statistics (for /health and latency reports).
+
+        Returns:
+            Dictionary of statistics (empty for providers without any)
+        """
+        return {}
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -0,0 +1,126 @@
+"""
+Silence-aligned chunking for long utterances
+VCA 1.0 - Phase 3
+
+Splits long audio at VAD silence boundaries so chunks can be transcribed
+concurrently without cutting words in half. Falls back to a hard cut when no
+pause is found within max_chunk_sec.
+"""
+
+import logging
+from typing import List, Tuple
+
+import numpy as np
+import webrtcvad
+
+logger = logging.getLogger(__name__)
+
+FRAME_MS = 30
+
+
+def find_silences(
+    audio_np: np.ndarray,
+    sample_rate: int,
+    min_silence_ms: int = 300,
+    aggressiveness: int = 2
+) -> List[Tuple[int, int]]:
+    """
+    Find silent regions using webrtcvad.
+
+    Args:
+        audio_np: Mono float32 audio
+        sample_rate: Sample rate (8000, 16000, 32000 or 48000 Hz)
+        min_silence_ms: Minimum pause length to report
+        aggressiveness: webrtcvad aggressiveness (0-3)
+
+    Returns:
+        List of (start_sample, end_sample) silent regions
+    """
+    vad = webrtcvad.Vad(aggressiveness)
+    frame_len = int(sample_rate * FRAME_MS / 1000)
+    n_frames = len(audio_np) // frame_len
+    pcm = (np.clip(audio_np[:n_frames * frame_len], -1.0, 1.0) * 32767).astype(np.int16)
+    frames = pcm.reshape(n_frames, frame_len)
+
+    min_frames = max(1, min_silence_ms // FRAME_MS)
+    silences = []
+    run_start = None
+
+    for i in range(n_frames):
+        if not vad.is_speech(frames[i].tobytes(), sample_rate):
+            if run_start is None:
+                run_start = i
+        elif run_start is not None:
+            if i - run_start >= min_frames:
+                silences.append((run_start * frame_len, i * frame_len))
+            run_start = None
+
+    if run_start is not None and n_frames - run_start >= min_frames:
+        silences.append((run_start * frame_len, n_frames * frame_len))
+
+    return silences
+
+
+def split_at_silence(
+    audio_np: np.ndarray,
+    sample_rate: int,
+    max_chunk_sec: float = 20.0,
+    min_chunk_sec: float = 5.0,
+    min_silence_ms: int = 300,
+    aggressiveness: int = 2
+) -> List[np.ndarray]:
+    """
+    Split audio into chunks no longer than max_chunk_sec, cutting in pauses.
+
+    Each cut is placed in the middle of the latest pause that falls between
+    min_chunk_sec and max_chunk_sec after the chunk start.
+
+    Args:
+        audio_np: Mono float32 audio
+        sample_rate: Sample rate in Hz
+        max_chunk_sec: Maximum chunk length
+        min_chunk_sec: Minimum chunk length (avoids tiny chunks at short pauses)
+        min_silence_ms: Minimum pause length considered a boundary
+        aggressiveness: webrtcvad aggressiveness (0-3)
+
+    Returns:
+        List of audio chunks (views into audio_np), in order
+    """
+    max_len = int(max_chunk_sec * sample_rate)
+    min_len = int(min_chunk_sec * sample_rate)
+
+    if len(audio_np) <= max_len:
+        return [audio_np]
+
+    cut_candidates = [
+        (start + end) // 2
+        for start, end in find_silences(audio_np, sample_rate, min_silence_ms, aggressiveness)
+    ]
+
+    chunks = []
+    chunk_start = 0
+    hard_cuts = 0
+
+    while len(audio_np) - chunk_start > max_len:
+        window = [
+            cut for cut in cut_candidates
+            if chunk_start + min_len <= cut <= chunk_start + max_len
+        ]
+
+        if window:
+            cut = window[-1]
+        else:
+            cut = chunk_start + max_len
+            hard_cuts += 1
+
+        chunks.append(audio_np[chunk_start:cut])
+        chunk_start = cut
+
+    chunks.append(audio_np[chunk_start:])
+
+    logger.debug(
+        f"Split {len(audio_np) / sample_rate:.1f}s audio into {len(chunks)} chunks "
+        f"({hard_cuts} hard cuts)"
+    )
+
+    return chunks
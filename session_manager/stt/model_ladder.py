@@ -0,0 +1,99 @@
+"""
+Utterance-length model ladder for local Whisper providers
+VCA 1.0 - Phase 3
+
+Short commands ("what time is it") don't need the same model as long
+dictation. A ladder lists preloaded model sizes from fastest to most accurate,
+each serving utterances up to max_duration; anything longer uses the
+provider's main model_size. When more requests are waiting than
+max_queue_depth, requests step down to the next faster model so a burst
+drains faster. Rungs may repeat a model size or reuse model_size; each
+model is loaded once.
+
+Configuration (inside local_whisper / pytorch_whisper):
+    model_size: "small"          # Top rung (longest utterances)
+    model_ladder:
+      - model_size: "tiny.en"
+        max_duration: 2.0        # seconds
+      - model_size: "base.en"
+        max_duration: 6.0
+    ladder_max_queue_depth: 2    # Step down a rung above this many pending requests
+"""
+
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ModelLadder:
+    """Pick a model size from utterance duration and queue depth"""
+
+    def __init__(self, default_model: str, rungs: Optional[List[dict]] = None, max_queue_depth: Optional[int] = None):
+        """
+        Initialize model ladder.
+
+        Args:
+            default_model: Model used above the last rung's max_duration
+            rungs: List of {'model_size', 'max_duration'} (any order)
+            max_queue_depth: Pending requests above which to step down a rung (None = off)
+
+        Raises:
+            ValueError: If a rung is missing model_size or max_duration
+        """
+        self.default_model = default_model
+        self.max_queue_depth = max_queue_depth
+
+        self.rungs = []
+        for rung in rungs or []:
+            if 'model_size' not in rung or 'max_duration' not in rung:
+                raise ValueError(f"Model ladder rung needs model_size and max_duration: {rung}")
+            self.rungs.append((float(rung['max_duration']), rung['model_size']))
+        self.rungs.sort()
+
+        # One entry per rung, then default_model for longer/unknown durations,
+        # so rung i always selects model_sizes[i] (sizes may repeat)
+        self.model_sizes = [size for _, size in self.rungs] + [default_model]
+
+    @property
+    def distinct_model_sizes(self) -> List[str]:
+        """Model sizes to preload, fastest → most accurate, each once"""
+        return list(dict.fromkeys(self.model_sizes))
+
+    @property
+    def enabled(self) -> bool:
+        return len(self.distinct_model_sizes) > 1
+
+    def select(self, duration: Optional[float], queue_depth: int = 0) -> str:
+        """
+        Choose the model for one request.
+
+        Args:
+            duration: Utterance length in seconds (None = unknown, use default)
+            queue_depth: Requests currently waiting for or running on this provider
+
+        Returns:
+            Model size to use
+        """
+        default_index = len(self.model_sizes) - 1
+        if duration is None:
+            index = default_index
+        else:
+            index = next(
+                (i for i, (max_duration, _) in enumerate(self.rungs) if duration <= max_duration),
+                default_index
+            )
+        model_size = self.model_sizes[index]
+
+        if self.max_queue_depth is not None and queue_depth > self.max_queue_depth:
+            # Nearest faster rung with a different model (repeated sizes don't help)
+            faster = [size for size in self.model_sizes[:index] if size != model_size]
+            if faster:
+                logger.debug(f"Queue depth {queue_depth} > {self.max_queue_depth}: stepping down from {model_size}")
+                model_size = faster[-1]
+
+        return model_size
+
+    def __repr__(self) -> str:
+        rungs = ", ".join(f"{size}≤{max_duration:g}s" for max_duration, size in self.rungs)
+        return f"ModelLadder([{rungs}], default='{self.default_model}')"
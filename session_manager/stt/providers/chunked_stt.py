@@ -0,0 +1,187 @@
+"""
+Chunked STT Provider
+
+Wraps an STT provider so long utterances (e.g., a tech-support monologue) are
+split at VAD silence boundaries and the chunks are transcribed concurrently via
+the inner provider's transcribe_chunks(), then stitched back in order.
+Utterances shorter than min_duration pass straight through, including
+transcribe_stream(), which forwards the inner provider's segment stream. Long
+utterances decode as parallel chunks, so their stream has no incremental
+segments: the stitched text arrives as one segment at the end.
+
+How chunks run depends on the inner provider:
+- local_whisper (CPU): parallel decodes across CTranslate2 workers (num_workers)
+- local_whisper (GPU): one batched decode (BatchedInferencePipeline, batch_size)
+- openai_whisper: concurrent API requests
+- pytorch_whisper: sequential (the model is not safe for concurrent decoding)
+
+Not registered in STTProviderFactory (it wraps a provider instance); main.py
+builds it from the stt_chunking config section.
+
+Configuration:
+    stt_chunking:
+      enabled: true
+      min_duration: 30.0        # Only chunk utterances longer than this (seconds)
+      max_chunk_duration: 20.0  # Upper bound per chunk (seconds)
+      min_chunk_duration: 5.0   # Avoid tiny chunks at short pauses (seconds)
+      min_silence_ms: 300       # Pause length treated as a boundary
+"""
+
+import asyncio
+import io
+import logging
+import wave
+from typing import Dict
+
+from ..base import SegmentStream, STTProvider, TranscriptionResult
+from ..chunking import split_at_silence
+from audio.wav import wav_to_float32
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedSTTProvider(STTProvider):
+    """STT provider that transcribes long utterances as parallel chunks"""
+
+    def __init__(self, inner: STTProvider, config: dict):
+        """
+        Initialize chunked STT provider.
+
+        Args:
+            inner: Provider used for each chunk
+            config: Chunking configuration (see module docstring)
+        """
+        super().__init__(config)
+        self.inner = inner
+        self.min_duration = config.get('min_duration', 30.0)
+        self.max_chunk_duration = config.get('max_chunk_duration', 20.0)
+        self.min_chunk_duration = config.get('min_chunk_duration', 5.0)
+        self.min_silence_ms = config.get('min_silence_ms', 300)
+        self.aggressiveness = config.get('aggressiveness', 2)
+
+        # Counters
+        self.chunked_requests = 0
+        self.total_chunks = 0
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        """
+        Transcribe audio, chunking it first if it is long.
+
+        Args:
+            audio_bytes: WAV audio bytes (PCM16)
+
+        Returns:
+            TranscriptionResult with the stitched text of all chunks
+        """
+        duration = self._duration(audio_bytes)
+        if duration < self.min_duration:
+            return await self.inner.transcribe(audio_bytes)
+
+        loop = asyncio.get_event_loop()
+        audio_np, sample_rate = await loop.run_in_executor(None, wav_to_float32, audio_bytes)
+
+        # VAD scan of a long utterance is CPU work - keep it off the event loop
+        chunks = await loop.run_in_executor(
+            None,
+            lambda: split_at_silence(
+                audio_np,
+                sample_rate,
+                max_chunk_sec=self.max_chunk_duration,
+                min_chunk_sec=self.min_chunk_duration,
+                min_silence_ms=self.min_silence_ms,
+                aggressiveness=self.aggressiveness
+            )
+        )
+
+        if len(chunks) == 1:
+            return await self.inner.transcribe(audio_bytes)
+
+        self.chunked_requests += 1
+        self.total_chunks += len(chunks)
+        logger.info(f"Transcribing {duration:.1f}s utterance as {len(chunks)} parallel chunks")
+
+        results = await self.inner.transcribe_chunks(chunks, sample_rate)
+        return self._stitch(results, duration)
+
+    def transcribe_stream(self, audio_bytes: bytes) -> SegmentStream:
+        """
+        Stream segments straight from the inner provider for short utterances.
+
+        Args:
+            audio_bytes: WAV audio bytes (PCM16)
+
+        Returns:
+            The inner provider's SegmentStream, or one stitched segment for long audio
+        """
+        if self._duration(audio_bytes) < self.min_duration:
+            return self.inner.transcribe_stream(audio_bytes)
+        return super().transcribe_stream(audio_bytes)
+
+    @staticmethod
+    def _duration(audio_bytes: bytes) -> float:
+        """Cheap duration check from the WAV header before decoding anything"""
+        with io.BytesIO(audio_bytes) as wav_io:
+            with wave.open(wav_io, 'rb') as wav_file:
+                return wav_file.getnframes() / wav_file.getframerate()
+
+    @staticmethod
+    def _stitch(results, duration: float) -> TranscriptionResult:
+        """
+        Join chunk results in order.
+
+        Confidence is weighted by chunk duration. Remote upload timings are
+        summed across chunks; the compression ratio is weighted by chunk size
+        (total original / total uploaded, original size ∝ chunk duration).
+        """
+        text = " ".join(r.text.strip() for r in results if r.text.strip())
+
+        weighted = [
+            (r.confidence, r.duration or 0.0) for r in results
+            if r.confidence is not None
+        ]
+        total_weight = sum(weight for _, weight in weighted)
+        if weighted and total_weight > 0:
+            confidence = sum(conf * weight for conf, weight in weighted) / total_weight
+        elif weighted:
+            confidence = sum(conf for conf, _ in weighted) / len(weighted)
+        else:
+            confidence = None
+
+        def total(values):
+            values = [value for value in values if value is not None]
+            return sum(values) if values else None
+
+        sized = [
+            (r.duration or 0.0, r.compression_ratio) for r in results
+            if r.compression_ratio
+        ]
+        uploaded = sum(size / ratio for size, ratio in sized)
+        compression_ratio = sum(size for size, _ in sized) / uploaded if uploaded > 0 else None
+
+        return TranscriptionResult(
+            text=text,
+            confidence=confidence,
+            language=results[0].language,
+            duration=duration,
+            provider=results[0].provider,
+            model="+".join(dict.fromkeys(r.model for r in results if r.model)) or None,
+            encode_time=total(r.encode_time for r in results),
+            upload_time=total(r.upload_time for r in results),
+            compression_ratio=compression_ratio,
+            chunks=len(results),
+            passes=max(r.passes for r in results)
+        )
+
+    def get_stats(self) -> Dict:
+        """Get chunking statistics"""
+        return {
+            'chunked_requests': self.chunked_requests,
+            'total_chunks': self.total_chunks,
+            'inner_stats': self.inner.get_stats(),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ChunkedSTTProvider(inner={self.inner}, min_duration={self.min_duration}s, "
+            f"max_chunk={self.max_chunk_duration}s)"
+        )
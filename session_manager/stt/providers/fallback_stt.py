@@ -0,0 +1,180 @@
+"""
+Fallback STT Provider (circuit breaker)
+
+Wraps a remote STT provider (e.g., openai_whisper) with a per-call deadline and
+a circuit breaker. Failed, timed-out or rejected calls are served by a local
+fallback provider (e.g., pytorch_whisper). While the breaker is open, requests
+go straight to the fallback; after reset_timeout a half-open probe checks if
+the remote provider recovered.
+
+transcribe_stream() forwards the primary's segment stream under the same
+deadline (covering the whole stream) and breaker. A primary that fails before
+its first segment is replaced by the fallback's stream; segments already
+emitted can't be taken back, so a later failure is raised to the caller.
+
+Not registered in STTProviderFactory (it wraps provider instances); main.py
+builds it for remote providers from the resilience.stt config section.
+
+Configuration:
+    resilience:
+      enabled: true
+      stt:
+        fallback_provider: "pytorch_whisper"
+        timeout: 8.0              # Per-call deadline (seconds)
+        failure_threshold: 3      # Consecutive bad calls before opening
+        slow_call_threshold: 6.0  # Successful calls slower than this count as bad
+        reset_timeout: 30.0       # Seconds open before a half-open probe
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict
+
+from ..base import STTProvider, TranscriptionResult, relay_segments
+from utils.circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackSTTProvider(STTProvider):
+    """Remote STT provider guarded by a deadline, circuit breaker and local fallback"""
+
+    def __init__(
+        self,
+        primary: STTProvider,
+        fallback: STTProvider,
+        breaker: CircuitBreaker,
+        config: dict,
+        primary_name: str = "primary",
+        fallback_name: str = "fallback"
+    ):
+        """
+        Initialize fallback STT provider.
+
+        Args:
+            primary: Remote provider to protect
+            fallback: Local provider used when the primary is unavailable
+            breaker: Circuit breaker tracking the primary
+            config: Resilience configuration (see module docstring)
+            primary_name: Name reported when the primary serves the request
+            fallback_name: Name reported when the fallback serves the request
+        """
+        super().__init__(config)
+        self.primary = primary
+        self.fallback = fallback
+        self.breaker = breaker
+        self.primary_name = primary_name
+        self.fallback_name = fallback_name
+        self.timeout = config.get('timeout', 8.0)
+        self.fallback_calls = 0
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        """
+        Transcribe with the primary if the breaker allows it, else the fallback.
+
+        Args:
+            audio_bytes: Audio data passed unchanged to the provider
+
+        Returns:
+            TranscriptionResult tagged with the provider that served it
+
+        Raises:
+            Exception: If the fallback also fails
+        """
+        if self.breaker.allow_request():
+            start = time.monotonic()
+            try:
+                result = await asyncio.wait_for(
+                    self.primary.transcribe(audio_bytes),
+                    timeout=self.timeout
+                )
+                self.breaker.record_success(time.monotonic() - start)
+                result.provider = result.provider or self.primary_name
+                return result
+
+            except asyncio.CancelledError:
+                # Caller cancelled (e.g., lost a hedge) - not the provider's fault
+                self.breaker.release()
+                raise
+
+            except Exception as e:
+                self.breaker.record_failure(e)
+                logger.warning(
+                    f"STT provider '{self.primary_name}' failed ({e!r}), "
+                    f"falling back to '{self.fallback_name}'"
+                )
+
+        self.fallback_calls += 1
+        result = await self.fallback.transcribe(audio_bytes)
+        result.provider = self.fallback_name
+        return result
+
+    async def _stream_segments(self, audio_bytes: bytes):
+        """
+        Stream from the primary if the breaker allows it, else the fallback.
+
+        Args:
+            audio_bytes: Audio data passed unchanged to the provider
+        """
+        if self.breaker.allow_request():
+            start = time.monotonic()
+            primary = relay_segments(self.primary.transcribe_stream(audio_bytes))
+            result = None
+            emitted = False
+            try:
+                while result is None:
+                    remaining = max(0.0, start + self.timeout - time.monotonic())
+                    item = await asyncio.wait_for(primary.__anext__(), timeout=remaining)
+                    if isinstance(item, TranscriptionResult):
+                        result = item
+                    else:
+                        emitted = True
+                        yield item
+                self.breaker.record_success(time.monotonic() - start)
+
+            except (asyncio.CancelledError, GeneratorExit):
+                # Caller cancelled or stopped reading early - no verdict on the provider
+                self.breaker.release()
+                raise
+
+            except Exception as e:
+                self.breaker.record_failure(e)
+                if emitted:
+                    raise
+                logger.warning(
+                    f"STT provider '{self.primary_name}' failed ({e!r}), "
+                    f"falling back to '{self.fallback_name}'"
+                )
+
+            finally:
+                await primary.aclose()
+
+            if result is not None:
+                result.provider = result.provider or self.primary_name
+                yield result
+                return
+
+        self.fallback_calls += 1
+        fallback = relay_segments(self.fallback.transcribe_stream(audio_bytes))
+        try:
+            async for item in fallback:
+                if isinstance(item, TranscriptionResult):
+                    item.provider = self.fallback_name
+                yield item
+        finally:
+            await fallback.aclose()
+
+    def get_stats(self) -> Dict:
+        """Get breaker state and fallback counters"""
+        return {
+            'breaker_state': self.breaker.state.value,
+            'breaker': self.breaker.get_stats(),
+            'fallback_calls': self.fallback_calls,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"FallbackSTTProvider(primary={self.primary}, fallback={self.fallback}, "
+            f"timeout={self.timeout}s)"
+        )
@@ -0,0 +1,308 @@
+"""
+Hedged STT Provider
+
+Wraps a primary and a secondary STT provider to cut tail latency. The primary
+request starts immediately; if it has not finished by a deadline derived from
+the primary's observed latency percentile (p90 by default), the same audio is
+sent to the secondary. Whichever finishes first wins and the other is cancelled.
+
+A primary cancelled because the hedge won is recorded as a right-censored
+sample (at least the deadline), not its cut-short time, so losing races
+doesn't drag the deadline down and make hedges ever more frequent.
+
+transcribe_stream() forwards the primary's segment stream when its first
+segment arrives before the deadline (or beats the secondary). If the secondary
+wins, its result is emitted as a single segment: the hedge trades the
+primary's incremental segments for the faster answer.
+
+Note: cancelling a thread-pool provider (local_whisper, pytorch_whisper) stops
+the caller from waiting on it, but the decode already running in the executor
+thread completes in the background.
+
+Not registered in STTProviderFactory (it wraps provider instances); main.py
+builds it from the stt_hedging config section.
+
+Configuration:
+    stt_hedging:
+      enabled: true
+      secondary_provider: "openai_whisper"
+      percentile: 90        # Primary latency percentile used as hedge deadline
+      min_samples: 10       # Use initial_delay until this many samples exist
+      initial_delay: 2.0    # Hedge deadline (s) before enough samples
+      min_delay: 0.3        # Clamp for the derived deadline (s)
+      max_delay: 10.0
+      window: 200           # Number of recent primary latencies to keep
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from ..base import STTProvider, TranscriptionResult, TranscriptionSegment, relay_segments
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedSTTProvider(STTProvider):
+    """STT provider that hedges a slow primary with a secondary provider"""
+
+    def __init__(
+        self,
+        primary: STTProvider,
+        secondary: STTProvider,
+        config: dict,
+        primary_name: str = "primary",
+        secondary_name: str = "secondary"
+    ):
+        """
+        Initialize hedged STT provider.
+
+        Args:
+            primary: Provider tried first (e.g., local_whisper)
+            secondary: Provider launched when the primary is late (e.g., openai_whisper)
+            config: Hedging configuration (see module docstring)
+            primary_name: Name reported when the primary wins
+            secondary_name: Name reported when the secondary wins
+        """
+        super().__init__(config)
+        self.primary = primary
+        self.secondary = secondary
+        self.primary_name = primary_name
+        self.secondary_name = secondary_name
+
+        self.percentile = config.get('percentile', 90)
+        self.min_samples = config.get('min_samples', 10)
+        self.initial_delay = config.get('initial_delay', 2.0)
+        self.min_delay = config.get('min_delay', 0.3)
+        self.max_delay = config.get('max_delay', 10.0)
+
+        # Recent primary latencies (seconds)
+        self.primary_latencies = deque(maxlen=config.get('window', 200))
+
+        # Counters
+        self.requests = 0
+        self.hedges = 0
+        self.primary_wins = 0
+        self.secondary_wins = 0
+        self.censored_samples = 0  # Cancelled primaries recorded at >= the deadline
+
+        logger.info(
+            f"Initialized HedgedSTTProvider: primary={primary_name}, "
+            f"secondary={secondary_name}, p{self.percentile} deadline"
+        )
+
+    def get_hedge_delay(self) -> float:
+        """
+        Get the current hedge deadline.
+
+        Returns:
+            Seconds to wait for the primary before launching the secondary
+        """
+        if len(self.primary_latencies) < self.min_samples:
+            return self.initial_delay
+
+        # quantiles(n=100) returns the 1st..99th percentile cut points
+        cut_points = statistics.quantiles(self.primary_latencies, n=100)
+        delay = cut_points[min(max(int(self.percentile), 1), 99) - 1]
+
+        return max(self.min_delay, min(self.max_delay, delay))
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        """
+        Transcribe audio, hedging with the secondary if the primary is late.
+
+        Args:
+            audio_bytes: Audio data passed unchanged to both providers
+
+        Returns:
+            TranscriptionResult from whichever provider finished first
+
+        Raises:
+            Exception: If every launched provider fails
+        """
+        self.requests += 1
+        delay = self.get_hedge_delay()
+
+        start = time.monotonic()
+        hedge_launched = []  # Non-empty once the secondary starts (censors a cancelled primary)
+        primary_task = asyncio.ensure_future(self.primary.transcribe(audio_bytes))
+        primary_task.add_done_callback(
+            lambda task: self._record_primary(task, start, delay if hedge_launched else None)
+        )
+
+        tasks = {primary_task}
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+
+            if done and primary_task.exception() is None:
+                self.primary_wins += 1
+                return self._tag(primary_task.result(), self.primary_name, hedged=False)
+
+            # Primary is late (or failed) - launch the hedge request
+            self.hedges += 1
+            hedge_launched.append(True)
+            reason = "failed" if done else f"exceeded {delay:.2f}s deadline"
+            logger.info(f"Hedging STT request: primary {reason}, launching {self.secondary_name}")
+
+            secondary_task = asyncio.ensure_future(self.secondary.transcribe(audio_bytes))
+            names = {primary_task: self.primary_name, secondary_task: self.secondary_name}
+            tasks = {secondary_task} if done else {primary_task, secondary_task}
+
+            while tasks:
+                finished, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in finished:
+                    if task.exception() is not None:
+                        logger.warning(f"Hedged STT: {names[task]} failed: {task.exception()}")
+                        continue
+
+                    if task is secondary_task:
+                        self.secondary_wins += 1
+                    else:
+                        self.primary_wins += 1
+
+                    return self._tag(task.result(), names[task], hedged=True)
+
+            # Both providers failed - surface the secondary's error
+            raise secondary_task.exception()
+
+        finally:
+            # Cancel the loser (or everything, if we were cancelled ourselves)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _stream_segments(self, audio_bytes: bytes):
+        """
+        Stream the primary's segments, hedging if its first segment is late.
+
+        Args:
+            audio_bytes: Audio data passed unchanged to both providers
+        """
+        self.requests += 1
+        delay = self.get_hedge_delay()
+
+        start = time.monotonic()
+        primary = relay_segments(self.primary.transcribe_stream(audio_bytes))
+        first = asyncio.ensure_future(primary.__anext__())
+        secondary_task = None
+        primary_done = False
+
+        try:
+            done, _ = await asyncio.wait({first}, timeout=delay)
+
+            if not done or first.exception() is not None:
+                # Primary is late (or failed) - launch the hedge request
+                self.hedges += 1
+                reason = "failed" if done else f"exceeded {delay:.2f}s deadline"
+                logger.info(f"Hedging STT stream: primary {reason}, launching {self.secondary_name}")
+
+                secondary_task = asyncio.ensure_future(self.secondary.transcribe(audio_bytes))
+                names = {first: self.primary_name, secondary_task: self.secondary_name}
+                tasks = {secondary_task} if done else {first, secondary_task}
+                winner = None
+
+                while tasks and winner is None:
+                    finished, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in finished:
+                        if task.exception() is not None:
+                            logger.warning(f"Hedged STT: {names[task]} failed: {task.exception()}")
+                        elif winner is None:
+                            winner = task
+
+                if winner is None:
+                    # Both providers failed - surface the secondary's error
+                    raise secondary_task.exception()
+
+                if winner is secondary_task:
+                    self.secondary_wins += 1
+                    result = self._tag(secondary_task.result(), self.secondary_name, hedged=True)
+                    if result.text:
+                        yield TranscriptionSegment(
+                            text=result.text,
+                            end=result.duration or 0.0,
+                            confidence=result.confidence
+                        )
+                    yield result
+                    return
+
+            # The primary is producing in time (or beat the secondary): forward its stream
+            self.primary_wins += 1
+            item = first.result()
+            while not isinstance(item, TranscriptionResult):
+                yield item
+                item = await primary.__anext__()
+
+            primary_done = True
+            self.primary_latencies.append(time.monotonic() - start)
+            yield self._tag(item, self.primary_name, hedged=secondary_task is not None)
+
+        finally:
+            if secondary_task is not None and not secondary_task.done():
+                secondary_task.cancel()
+            if not first.done():
+                first.cancel()
+                await asyncio.wait({first})
+
+            # A primary cut short by the hedge would have taken at least the deadline
+            if not primary_done and secondary_task is not None and first.cancelled():
+                self.primary_latencies.append(max(time.monotonic() - start, delay))
+                self.censored_samples += 1
+            await primary.aclose()
+
+    def _record_primary(self, task: asyncio.Future, start: float, censor_at: Optional[float] = None):
+        """
+        Record primary latency.
+
+        Completed requests record their latency. A primary cancelled after the
+        hedge launched would have taken at least max(elapsed, deadline), so it
+        is recorded there; cancellations before the hedge (the caller gave up)
+        and failures say nothing about latency and are skipped.
+
+        Args:
+            task: Finished primary task
+            start: When the primary was launched (monotonic)
+            censor_at: Hedge deadline if the secondary was launched, else None
+        """
+        elapsed = time.monotonic() - start
+        if task.cancelled():
+            if censor_at is not None:
+                self.primary_latencies.append(max(elapsed, censor_at))
+                self.censored_samples += 1
+        elif task.exception() is None:
+            self.primary_latencies.append(elapsed)
+
+    @staticmethod
+    def _tag(result: TranscriptionResult, provider: str, hedged: bool) -> TranscriptionResult:
+        """Record which provider served the result"""
+        result.provider = provider
+        result.hedged = hedged
+        return result
+
+    def get_stats(self) -> Dict:
+        """Get hedging statistics"""
+        return {
+            'requests': self.requests,
+            'hedges': self.hedges,
+            'hedge_rate': self.hedges / self.requests if self.requests else 0.0,
+            'primary_wins': self.primary_wins,
+            'secondary_wins': self.secondary_wins,
+            'censored_samples': self.censored_samples,
+            'hedge_delay': self.get_hedge_delay(),
+            'primary_stats': self.primary.get_stats(),
+            'secondary_stats': self.secondary.get_stats(),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"HedgedSTTProvider(primary={self.primary}, secondary={self.secondary}, "
+            f"p{self.percentile})"
+        )
@@ -5,18 +5,47 @@ VCA 1.0 - Phase 3 (Session 10)
 """
 
 import asyncio
-import io
 import logging
-import wave
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from faster_whisper import WhisperModel
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 
-from ..base import STTProvider, TranscriptionResult
+from ..base import STTProvider, TranscriptionResult, TranscriptionSegment
+from ..model_ladder import ModelLadder
+from ..two_pass import TwoPassGate
+from audio.wav import wav_to_float32
 
 logger = logging.getLogger(__name__)
 
 
+class ConfidenceAccumulator:
+    """Running confidence from segment avg_logprob values"""
+
+    def __init__(self):
+        self.total_logprob = 0.0
+        self.count = 0
+
+    def add(self, avg_logprob: Optional[float]):
+        """Add one segment's average log probability"""
+        if avg_logprob is not None:
+            self.total_logprob += avg_logprob
+            self.count += 1
+
+    @property
+    def confidence(self) -> float:
+        """
+        Convert the mean log probability to confidence (approximate).
+
+        avg_logprob ranges from ~-1 (high conf) to -10+ (low conf)
+        """
+        if not self.count:
+            return 0.0
+        return max(0.0, min(1.0, 1.0 + (self.total_logprob / self.count / 10.0)))
+
+
 class LocalWhisperProvider(STTProvider):
     """Local Whisper STT provider using GPU acceleration via faster-whisper"""
 
@@ -30,6 +59,23 @@ class LocalWhisperProvider(STTProvider):
         self.language = config.get('language', 'en')
         self.beam_size = config.get('beam_size', 5)
         self.vad_filter = config.get('vad_filter', True)
+        self.num_workers = config.get('num_workers', 1)  # Parallel decodes (CPU chunking)
+        self.batch_size = config.get('batch_size', 8)  # Batched decode of chunks (GPU)
+
+        # Smaller models for short utterances (see stt/model_ladder.py)
+        self.ladder = ModelLadder(
+            self.model_size,
+            config.get('model_ladder'),
+            config.get('ladder_max_queue_depth')
+        )
+        self.pending = 0  # Requests waiting for or running a decode
+        self.model_usage = Counter()
+
+        # Fast greedy pass first, full decode only when unsure (see stt/two_pass.py)
+        self.two_pass = TwoPassGate(config.get('two_pass'))
+        model_sizes = self.ladder.distinct_model_sizes
+        if self.two_pass.enabled and self.two_pass.fast_model_size not in (None, *model_sizes):
+            model_sizes.insert(0, self.two_pass.fast_model_size)
 
         # Log initialization
         logger.info(
@@ -39,18 +85,39 @@ class LocalWhisperProvider(STTProvider):
 
         # Load Whisper model (this will download on first run)
         try:
-            self.model = WhisperModel(
-                self.model_size,
-                device=self.device,
-                compute_type=self.compute_type
-            )
-            logger.info(
-                f"✓ Whisper model '{self.model_size}' loaded successfully on {self.device}"
-            )
+            # num_workers > 1 lets concurrent transcribe() calls from different
+            # threads decode in parallel (CTranslate2 releases the GIL)
+            self.models: Dict[str, WhisperModel] = {}
+            for model_size in model_sizes:
+                self.models[model_size] = WhisperModel(
+                    model_size,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    num_workers=self.num_workers
+                )
+                logger.info(
+                    f"✓ Whisper model '{model_size}' loaded successfully on {self.device}"
+                )
+            self.model = self.models[self.model_size]
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
 
+        # Dedicated threads for chunk decodes (one per CTranslate2 worker)
+        self.chunk_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.num_workers),
+            thread_name_prefix="whisper-chunk"
+        )
+
+        # GPU: decode all chunks of an utterance as one batch (faster-whisper >= 1.1)
+        self.batched_pipeline = None
+        if self.device == 'cuda' and self.batch_size > 1:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                self.batched_pipeline = BatchedInferencePipeline(model=self.model)
+            except ImportError:
+                logger.info("faster-whisper < 1.1: batched chunk decoding unavailable")
+
     async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
         """
         Transcribe audio using local Whisper model.
@@ -66,11 +133,15 @@ class LocalWhisperProvider(STTProvider):
         """
         # Run transcription in thread pool (Whisper is CPU/GPU intensive)
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            self._transcribe_sync,
-            audio_bytes
-        )
+        self.pending += 1
+        try:
+            result = await loop.run_in_executor(
+                None,
+                self._transcribe_sync,
+                audio_bytes
+            )
+        finally:
+            self.pending -= 1
 
         return result
 
@@ -84,50 +155,100 @@ class LocalWhisperProvider(STTProvider):
         Returns:
             TranscriptionResult with text and metadata
         """
+        audio_np, sample_rate = wav_to_float32(audio_bytes)
+        return self._transcribe_array(audio_np, sample_rate)
+
+    def _transcribe_array(self, audio_np: np.ndarray, sample_rate: int) -> TranscriptionResult:
+        """
+        Transcribe a decoded float32 array (runs in thread pool).
+
+        Args:
+            audio_np: Mono float32 audio
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            TranscriptionResult with text and metadata
+        """
+        # Calculate duration
+        duration = len(audio_np) / sample_rate if sample_rate > 0 else None
+
+        # Pick the model for this utterance length / load
+        model_size = self.ladder.select(duration, self.pending)
+
+        if self.two_pass.enabled:
+            return self.two_pass.transcribe(
+                duration,
+                lambda: self._decode(
+                    audio_np, duration,
+                    self.two_pass.fast_model_size or model_size,
+                    self.two_pass.fast_beam_size
+                ),
+                lambda: self._decode(audio_np, duration, model_size, self.beam_size)
+            )
+
+        return self._decode(audio_np, duration, model_size, self.beam_size)
+
+    def _decode(
+        self,
+        audio_np: np.ndarray,
+        duration: float,
+        model_size: str,
+        beam_size: int,
+        on_segment: Optional[Callable[[TranscriptionSegment], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> TranscriptionResult:
+        """
+        Run one faster-whisper decode (runs in thread pool).
+
+        Args:
+            audio_np: Mono float32 audio
+            duration: Audio length in seconds
+            model_size: Loaded model to use
+            beam_size: Beam search size
+            on_segment: Called with each segment as soon as it is decoded
+            stop: Set to abandon the decode after the current segment
+
+        Returns:
+            TranscriptionResult with text and metadata
+        """
+        self.model_usage[model_size] += 1
+
         try:
-            # Convert WAV bytes to numpy array
-            with io.BytesIO(audio_bytes) as wav_io:
-                with wave.open(wav_io, 'rb') as wav_file:
-                    sample_rate = wav_file.getframerate()
-                    n_channels = wav_file.getnchannels()
-                    audio_data = wav_file.readframes(wav_file.getnframes())
-
-            # Convert to float32 array (faster-whisper expects this)
-            audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-
-            # If stereo, convert to mono by averaging channels
-            if n_channels == 2:
-                audio_np = audio_np.reshape(-1, 2).mean(axis=1)
-
-            # Transcribe using faster-whisper
-            segments, info = self.model.transcribe(
+            # Transcribe using faster-whisper (segments decode lazily as we iterate)
+            segments, info = self.models[model_size].transcribe(
                 audio_np,
                 language=self.language,
-                beam_size=self.beam_size,
+                beam_size=beam_size,
                 vad_filter=self.vad_filter,
                 # No temperature parameter in faster-whisper
             )
 
+            # Consume the segment generator exactly once, building text and
+            # confidence incrementally
+            texts = []
+            accumulator = ConfidenceAccumulator()
+            for segment in segments:
+                texts.append(segment.text)
+                accumulator.add(getattr(segment, 'avg_logprob', None))
+
+                if on_segment is not None:
+                    on_segment(TranscriptionSegment(
+                        text=segment.text.strip(),
+                        start=segment.start,
+                        end=segment.end,
+                        confidence=accumulator.confidence
+                    ))
+
+                if stop is not None and stop.is_set():
+                    logger.debug(f"Decode stopped early after {segment.end:.2f}s")
+                    break
+
             # Combine all segments into single text
-            text = " ".join([segment.text for segment in segments])
-
-            # Calculate average confidence if available
-            segments_list = list(segments)
-            if segments_list:
-                avg_confidence = sum(
-                    getattr(seg, 'avg_logprob', 0.0) for seg in segments_list
-                ) / len(segments_list)
-                # Convert log probability to confidence (approximate)
-                # avg_logprob ranges from ~-1 (high conf) to -10+ (low conf)
-                confidence = max(0.0, min(1.0, 1.0 + (avg_confidence / 10.0)))
-            else:
-                confidence = 0.0
-
-            # Calculate duration
-            duration = len(audio_np) / sample_rate if sample_rate > 0 else None
+            text = " ".join(texts)
+            confidence = accumulator.confidence
 
             logger.debug(
-                f"Transcribed {duration:.2f}s audio → '{text[:50]}...' "
+                f"Transcribed {duration:.2f}s audio with '{model_size}' → '{text[:50]}...' "
                 f"(confidence={confidence:.2f})"
             )
 
@@ -135,15 +256,141 @@ class LocalWhisperProvider(STTProvider):
                 text=text.strip(),
                 confidence=confidence,
                 language=info.language,
-                duration=duration
+                duration=duration,
+                model=model_size
             )
 
         except Exception as e:
             logger.error(f"Local Whisper transcription failed: {e}")
             raise
 
+    async def _stream_segments(self, audio_bytes: bytes):
+        """
+        Yield segments from the decoding thread as faster-whisper produces them.
+
+        Closing the stream early (e.g., a stop phrase was heard) stops the
+        decode after its current segment.
+        """
+        if self.two_pass.enabled:
+            # Pass 1 must finish before we know which result to emit
+            async for item in super()._stream_segments(audio_bytes):
+                yield item
+            return
+
+        loop = asyncio.get_event_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def emit(item):
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+        def decode():
+            try:
+                audio_np, sample_rate = wav_to_float32(audio_bytes)
+                duration = len(audio_np) / sample_rate if sample_rate > 0 else None
+                model_size = self.ladder.select(duration, self.pending)
+                emit(self._decode(audio_np, duration, model_size, self.beam_size, emit, stop))
+            except Exception as e:
+                emit(e)
+
+        self.pending += 1
+        loop.run_in_executor(None, decode)
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+                if isinstance(item, TranscriptionResult):
+                    return
+        finally:
+            stop.set()
+            self.pending -= 1
+
+    async def transcribe_chunks(self, chunks: List[np.ndarray], sample_rate: int) -> List[TranscriptionResult]:
+        """
+        Transcribe chunks of a long utterance in parallel.
+
+        GPU: one batched decode when BatchedInferencePipeline is available.
+        CPU: chunks decode concurrently across num_workers CTranslate2 workers.
+
+        Args:
+            chunks: Mono float32 audio chunks, in order
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            One TranscriptionResult per chunk, in order
+        """
+        loop = asyncio.get_event_loop()
+
+        if self.batched_pipeline is not None:
+            return await loop.run_in_executor(
+                self.chunk_executor,
+                self._transcribe_batched_sync,
+                chunks,
+                sample_rate
+            )
+
+        self.pending += len(chunks)
+        try:
+            return list(await asyncio.gather(*(
+                loop.run_in_executor(self.chunk_executor, self._transcribe_array, chunk, sample_rate)
+                for chunk in chunks
+            )))
+        finally:
+            self.pending -= len(chunks)
+
+    def _transcribe_batched_sync(self, chunks: List[np.ndarray], sample_rate: int) -> List[TranscriptionResult]:
+        """
+        Decode all chunks in one GPU batch (runs in thread pool).
+
+        Args:
+            chunks: Mono float32 audio chunks, in order
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            One TranscriptionResult per chunk, in order
+        """
+        audio_np = np.concatenate(chunks)
+
+        # Chunk boundaries in samples - used instead of the pipeline's own VAD
+        bounds = np.cumsum([0] + [len(chunk) for chunk in chunks])
+        clip_timestamps = [
+            {'start': int(start), 'end': int(end)}
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+        segments, info = self.batched_pipeline.transcribe(
+            audio_np,
+            language=self.language,
+            beam_size=self.beam_size,
+            batch_size=self.batch_size,
+            clip_timestamps=clip_timestamps
+        )
+
+        # Assign each segment back to the chunk it starts in
+        texts = [[] for _ in chunks]
+        for segment in segments:
+            index = int(np.searchsorted(bounds, segment.start * sample_rate, side='right')) - 1
+            texts[min(max(index, 0), len(chunks) - 1)].append(segment.text)
+
+        return [
+            TranscriptionResult(
+                text=" ".join(chunk_texts).strip(),
+                language=info.language,
+                duration=len(chunk) / sample_rate,
+                model=self.model_size
+            )
+            for chunk, chunk_texts in zip(chunks, texts)
+        ]
+
+    def get_stats(self) -> Dict:
+        """Get per-model decode counts and two-pass statistics"""
+        return {'model_usage': dict(self.model_usage), 'two_pass': self.two_pass.get_stats()}
+
     def __repr__(self) -> str:
+        ladder = f", ladder={self.ladder.distinct_model_sizes}" if self.ladder.enabled else ""
         return (
             f"LocalWhisperProvider(model='{self.model_size}', "
-            f"device='{self.device}', compute='{self.compute_type}')"
+            f"device='{self.device}', compute='{self.compute_type}'{ladder})"
         )
@@ -13,12 +13,14 @@ Useful for:
 Configuration:
     mock_stt:
       mock_latency: 2.5  # Simulated processing time in seconds
+      mock_latency_jitter: 0.0  # Extra random latency (0 to jitter seconds)
       mock_text: "This is a mock transcription"  # Fixed response (optional)
       mock_confidence: 0.95  # Simulated confidence score
 """
 
 import asyncio
 import logging
+import random
 from typing import Optional
 
 from ..base import STTProvider, TranscriptionResult
@@ -36,12 +38,14 @@ class MockSTTProvider(STTProvider):
         Args:
             config: Configuration dictionary with:
                 - mock_latency: Simulated processing time (default: 1.0s)
+                - mock_latency_jitter: Extra uniform random latency (default: 0.0s)
                 - mock_text: Fixed response text (default: "Mock transcription")
                 - mock_confidence: Confidence score (default: 0.95)
                 - mock_language: Language code (default: "en")
         """
         super().__init__(config)
         self.latency = config.get('mock_latency', 1.0)
+        self.latency_jitter = config.get('mock_latency_jitter', 0.0)
         self.mock_text = config.get('mock_text', "Mock transcription")
         self.confidence = config.get('mock_confidence', 0.95)
         self.language = config.get('mock_language', 'en')
@@ -62,7 +66,8 @@ class MockSTTProvider(STTProvider):
             TranscriptionResult with mock data
         """
         # Simulate processing time
-        await asyncio.sleep(self.latency)
+        latency = self.latency + random.uniform(0.0, self.latency_jitter)
+        await asyncio.sleep(latency)
 
         # Calculate mock duration based on audio size
         # Assuming 16kHz, mono, 16-bit PCM
@@ -70,7 +75,7 @@ class MockSTTProvider(STTProvider):
 
         logger.debug(
             f"Mock STT: Processed {len(audio_bytes)} bytes "
-            f"({audio_duration:.2f}s audio) in {self.latency:.2f}s"
+            f"({audio_duration:.2f}s audio) in {latency:.2f}s"
         )
 
         return TranscriptionResult(
@@ -3,14 +3,23 @@ OpenAI Whisper API STT Provider
 VCA 1.0 - Phase 1
 """
 
+import asyncio
 import io
-from openai import AsyncOpenAI
+import logging
+
 from ..base import STTProvider, TranscriptionResult
+from audio.encoding import encode_wav
+from utils.http_timing import track_request_timing
+from utils.openai_clients import create_openai_client
+
+logger = logging.getLogger(__name__)
 
 
 class OpenAIWhisperProvider(STTProvider):
     """OpenAI Whisper API speech-to-text provider"""
 
+    is_remote = True
+
     def __init__(self, config: dict):
         super().__init__(config)
 
@@ -18,36 +27,61 @@ class OpenAIWhisperProvider(STTProvider):
         if not api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Bound each request so a degraded API fails fast instead of hanging
+        # Shared pool (TimingTransport) splits upload time from server processing time
+        self.client = create_openai_client(
+            api_key,
+            base_url=config.get('base_url'),
+            timeout=config.get('timeout', 30.0),
+            max_retries=config.get('max_retries', 1)
+        )
         self.model = config.get('model', 'whisper-1')
         self.language = config.get('language', 'en')
         self.temperature = config.get('temperature', 0.0)
         self.response_format = config.get('response_format', 'text')
+        self.upload_format = config.get('upload_format', 'flac')  # flac, opus or wav
 
     async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
         """
         Transcribe audio using OpenAI Whisper API.
 
+        Audio is compressed (upload_format) in a worker thread before upload.
+
         Args:
-            audio_bytes: Raw audio bytes (PCM16, 16kHz recommended)
+            audio_bytes: WAV audio bytes (PCM16, 16kHz recommended)
 
         Returns:
-            TranscriptionResult with transcribed text
+            TranscriptionResult with transcribed text and upload breakdown
 
         Raises:
             Exception: If API call fails
         """
+        # Compress off the event loop (FLAC/Opus encoding is CPU-bound)
+        loop = asyncio.get_event_loop()
+        encoded = await loop.run_in_executor(
+            None,
+            encode_wav,
+            audio_bytes,
+            self.upload_format
+        )
+
         # Create file-like object from bytes
-        audio_file = io.BytesIO(audio_bytes)
-        audio_file.name = "audio.wav"  # Whisper needs a filename
+        audio_file = io.BytesIO(encoded.data)
+        audio_file.name = encoded.filename  # Whisper detects format from the filename
 
         # Call OpenAI Whisper API
-        response = await self.client.audio.transcriptions.create(
-            model=self.model,
-            file=audio_file,
-            language=self.language,
-            temperature=self.temperature,
-            response_format=self.response_format
+        with track_request_timing() as timing:
+            response = await self.client.audio.transcriptions.create(
+                model=self.model,
+                file=audio_file,
+                language=self.language,
+                temperature=self.temperature,
+                response_format=self.response_format
+            )
+
+        logger.debug(
+            f"Uploaded {len(encoded.data)} bytes ({encoded.format}, "
+            f"{encoded.compression_ratio:.1f}x) in {timing.upload_time or 0.0:.3f}s"
         )
 
         # Extract text from response
@@ -58,8 +92,14 @@ class OpenAIWhisperProvider(STTProvider):
 
         return TranscriptionResult(
             text=text.strip(),
-            language=self.language
+            language=self.language,
+            encode_time=encoded.encode_time,
+            upload_time=timing.upload_time,
+            compression_ratio=encoded.compression_ratio
         )
 
     def __repr__(self) -> str:
-        return f"OpenAIWhisperProvider(model='{self.model}', language='{self.language}')"
+        return (
+            f"OpenAIWhisperProvider(model='{self.model}', language='{self.language}', "
+            f"upload_format='{self.upload_format}')"
+        )
@@ -0,0 +1,574 @@
+"""
+Process-Pool STT Provider
+VCA 1.0 - Phase 3
+
+Runs a local STT provider (local_whisper, pytorch_whisper) in separate worker
+processes so model inference and Python-side decoding don't contend for the
+GIL with the FastAPI event loop.
+
+- Each worker loads the model once at startup (spawn context, CUDA-safe)
+- Audio is converted to float32 straight into a per-worker shared-memory ring
+  (audio/shm_ring.py); only a small slot descriptor crosses the pipe and the
+  worker transcribes a zero-copy view of it
+- transcribe_stream() runs the provider's own stream in the worker, which sends
+  each segment over the pipe as it is decoded; closing the stream early sends
+  ('cancel',) and the worker stops after its current segment. Streams send
+  the WAV bytes over the pipe (the provider's stream decodes WAV itself)
+  instead of using the ring
+- Idle workers are pinged every health_check_interval; a worker that crashes,
+  hangs past request_timeout or fails a ping is restarted
+
+Not registered in STTProviderFactory (it wraps a provider by name); main.py
+builds it when stt_worker_pool is enabled.
+
+Configuration:
+    stt_worker_pool:
+      enabled: true
+      num_workers: 2              # Worker processes (each holds its own model)
+      request_timeout: 60.0       # Seconds before a busy worker is considered hung
+      startup_timeout: 300.0      # Seconds to wait for a worker to load its model
+      health_check_interval: 30.0 # Seconds between pings of idle workers (0 = off)
+      ring_size_mb: 16            # Shared audio ring per worker (16 MB ≈ 260s of 16kHz float32)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from ..base import STTProvider, TranscriptionResult
+from audio.shm_ring import RingBufferFull, SharedAudioRing
+from audio.wav import float32_to_wav, wav_to_int16
+
+logger = logging.getLogger(__name__)
+
+
+def create_worker_provider(provider_name: str, provider_config: dict) -> STTProvider:
+    """Default worker loader: build the provider via STTProviderFactory"""
+    from stt.factory import STTProviderFactory
+
+    return STTProviderFactory.create(provider_name, provider_config)
+
+
+def _worker_main(conn, loader: Callable, provider_name: str, provider_config: dict, ring_name: str):
+    """
+    Worker process entry point.
+
+    Loads the provider once, then serves requests from the pipe:
+    ('transcribe', slot, sample_rate), ('transcribe_array', audio_np, sample_rate),
+    ('transcribe_stream', wav_bytes), ('ping',) or ('stop',).
+    """
+    try:
+        provider = loader(provider_name, provider_config)
+    except Exception as e:
+        conn.send(('error', f"Failed to load {provider_name}: {e!r}"))
+        return
+
+    ring = SharedAudioRing(name=ring_name, create=False)
+    conn.send(('ready', None))
+
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, KeyboardInterrupt):
+                return
+
+            command = message[0]
+            if command == 'stop':
+                return
+            if command == 'ping':
+                conn.send(('pong', None))
+                continue
+            if command == 'cancel':
+                # The stream finished before the cancel arrived
+                continue
+
+            try:
+                if command == 'transcribe_stream':
+                    result = asyncio.run(_stream_in_worker(provider, message[1], conn))
+                    conn.send(('cancelled', None) if result is None else ('result', result))
+                    continue
+
+                if command == 'transcribe':
+                    _, slot, sample_rate = message
+                    audio_np = ring.view(slot)
+                    try:
+                        result = _transcribe_in_worker(provider, audio_np, sample_rate)
+                    finally:
+                        del audio_np  # Drop the view before the slot can be reused
+                        ring.release(slot)
+                else:
+                    _, audio_np, sample_rate = message
+                    result = _transcribe_in_worker(provider, audio_np, sample_rate)
+                conn.send(('result', result))
+            except Exception as e:
+                conn.send(('error', repr(e)))
+    finally:
+        ring.close()
+
+
+def _transcribe_in_worker(provider: STTProvider, audio_np: np.ndarray, sample_rate: int) -> TranscriptionResult:
+    """Transcribe a float32 array with the worker's provider"""
+    if hasattr(provider, '_transcribe_array'):
+        return provider._transcribe_array(audio_np, sample_rate)
+
+    # Providers without an array entry point get a WAV round trip
+    return asyncio.run(provider.transcribe(float32_to_wav(audio_np, sample_rate)))
+
+
+async def _stream_in_worker(provider: STTProvider, audio_bytes: bytes, conn) -> Optional[TranscriptionResult]:
+    """
+    Send each segment over the pipe as it is decoded.
+
+    Returns:
+        The full result, or None if the parent sent ('cancel',) first
+    """
+    stream = provider.transcribe_stream(audio_bytes)
+    try:
+        async for segment in stream:
+            conn.send(('segment', segment))
+            if conn.poll() and conn.recv()[0] == 'cancel':
+                return None
+    finally:
+        await stream.aclose()
+    return stream.result
+
+
+class WorkerCrashed(RuntimeError):
+    """Worker process died, hung or stopped answering"""
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe"""
+
+    def __init__(self, index: int, process, conn, ring: SharedAudioRing):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.ring = ring  # Request audio, parent → worker
+        self.requests = 0
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def call(self, message: tuple, timeout: float):
+        """
+        Send a request and wait for the reply (blocking, runs in io_executor).
+
+        Raises:
+            WorkerCrashed: If the process exits or doesn't reply within timeout
+        """
+        self.send(message)
+        return self.receive(timeout)
+
+    def send(self, message: tuple):
+        """
+        Send a message without waiting for a reply.
+
+        Raises:
+            WorkerCrashed: If the process exited
+        """
+        try:
+            self.conn.send(message)
+        except (BrokenPipeError, ConnectionResetError, OSError) as e:
+            raise WorkerCrashed(f"worker {self.index} exited ({e!r})") from e
+
+    def receive(self, timeout: float):
+        """
+        Wait for the next message from the worker (blocking, runs in io_executor).
+
+        Raises:
+            WorkerCrashed: If the process exits or doesn't reply within timeout
+        """
+        try:
+            if not self.conn.poll(timeout):
+                raise WorkerCrashed(f"worker {self.index} did not reply within {timeout:.0f}s")
+            return self.conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError, OSError) as e:
+            raise WorkerCrashed(f"worker {self.index} exited ({e!r})") from e
+
+
+class ProcessPoolSTTProvider(STTProvider):
+    """STT provider that runs a local model in a pool of worker processes"""
+
+    def __init__(
+        self,
+        provider_name: str,
+        provider_config: dict,
+        config: dict,
+        loader: Optional[Callable] = None
+    ):
+        """
+        Initialize the worker pool (blocks until every worker loaded its model).
+
+        Args:
+            provider_name: Provider each worker creates (e.g., 'local_whisper')
+            provider_config: Config passed to that provider
+            config: Pool configuration (see module docstring)
+            loader: Picklable callable (provider_name, provider_config) -> STTProvider
+                    (default: create_worker_provider)
+
+        Raises:
+            RuntimeError: If a worker fails to load the provider
+        """
+        super().__init__(config)
+        self.provider_name = provider_name
+        self.provider_config = provider_config
+        self.loader = loader or create_worker_provider
+
+        self.num_workers = max(1, config.get('num_workers', 2))
+        self.request_timeout = config.get('request_timeout', 60.0)
+        self.startup_timeout = config.get('startup_timeout', 300.0)
+        self.health_check_interval = config.get('health_check_interval', 30.0)
+        self.ring_size = int(config.get('ring_size_mb', 16) * 1024 * 1024)
+
+        self._context = multiprocessing.get_context('spawn')
+        # Threads that block on worker pipes (one per worker + health checks)
+        self.io_executor = ThreadPoolExecutor(
+            max_workers=self.num_workers + 1,
+            thread_name_prefix="stt-pool"
+        )
+
+        # Counters
+        self.requests = 0
+        self.failures = 0
+        self.restarts = 0
+        self.ring_fallbacks = 0
+
+        logger.info(
+            f"Starting ProcessPoolSTTProvider: {self.num_workers} x {provider_name}"
+        )
+
+        self.workers: List[_Worker] = [self._spawn_worker(i) for i in range(self.num_workers)]
+        for worker in self.workers:
+            self._wait_ready(worker)
+
+        self._idle: Optional[asyncio.Queue] = None
+        self._health_task: Optional[asyncio.Task] = None
+
+        logger.info(f"✓ {self.num_workers} STT worker processes ready")
+
+    def _spawn_worker(self, index: int, ring: Optional[SharedAudioRing] = None) -> _Worker:
+        """Start a worker process (does not wait for the model to load)"""
+        ring = ring or SharedAudioRing(capacity=self.ring_size)
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.loader, self.provider_name, self.provider_config, ring.name),
+            name=f"stt-worker-{index}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(index, process, parent_conn, ring)
+
+    def _wait_ready(self, worker: _Worker):
+        """Block until the worker reports its model is loaded"""
+        if not worker.conn.poll(self.startup_timeout):
+            worker.process.kill()
+            raise RuntimeError(
+                f"STT worker {worker.index} did not start within {self.startup_timeout:.0f}s"
+            )
+
+        try:
+            status, detail = worker.conn.recv()
+        except EOFError:
+            raise RuntimeError(f"STT worker {worker.index} exited during startup")
+
+        if status != 'ready':
+            worker.process.join(timeout=5)
+            raise RuntimeError(f"STT worker {worker.index}: {detail}")
+
+    def _restart_worker(self, worker: _Worker) -> _Worker:
+        """Kill a broken worker and start a replacement (blocking)"""
+        logger.warning(f"Restarting STT worker {worker.index}")
+        if worker.is_alive():
+            worker.process.kill()
+        worker.process.join(timeout=5)
+        worker.conn.close()
+
+        # The crashed worker may have left its slot unreleased
+        worker.ring.reset()
+        replacement = self._spawn_worker(worker.index, worker.ring)
+        self._wait_ready(replacement)
+        self.workers[worker.index] = replacement
+        self.restarts += 1
+        return replacement
+
+    def _ensure_started(self):
+        """Create the idle queue and health check task on the running loop"""
+        if self._idle is not None:
+            return
+
+        self._idle = asyncio.Queue()
+        for worker in self.workers:
+            self._idle.put_nowait(worker)
+
+        if self.health_check_interval > 0:
+            self._health_task = asyncio.ensure_future(self._health_check_loop())
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        """
+        Transcribe audio in the next free worker process.
+
+        Args:
+            audio_bytes: Raw audio bytes (WAV format)
+
+        Returns:
+            TranscriptionResult from the worker
+
+        Raises:
+            RuntimeError: If the worker fails or crashes during the request
+        """
+        # int16 view of the WAV data - converted to float32 directly into shared memory
+        audio_int16, sample_rate = wav_to_int16(audio_bytes)
+        return await self._submit(audio_int16, sample_rate)
+
+    async def transcribe_chunks(self, chunks: List[np.ndarray], sample_rate: int) -> List[TranscriptionResult]:
+        """
+        Transcribe chunks across worker processes in parallel.
+
+        Args:
+            chunks: Mono float32 audio chunks, in order
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            One TranscriptionResult per chunk, in order
+        """
+        return list(await asyncio.gather(*(
+            self._submit(chunk, sample_rate) for chunk in chunks
+        )))
+
+    async def _submit(self, audio_np: np.ndarray, sample_rate: int) -> TranscriptionResult:
+        """Run one transcription on a free worker"""
+        self._ensure_started()
+        self.requests += 1
+
+        worker = await self._idle.get()
+        loop = asyncio.get_event_loop()
+
+        # The worker stays checked out until its reply arrives, even if the
+        # caller is cancelled (e.g., lost a hedge race)
+        future = loop.run_in_executor(
+            self.io_executor, self._transcribe_on_worker, worker, audio_np, sample_rate
+        )
+        future.add_done_callback(lambda f: self._on_request_done(f, worker))
+
+        status, payload = await asyncio.shield(future)
+        if status != 'result':
+            self.failures += 1
+            raise RuntimeError(f"STT worker {worker.index} failed: {payload}")
+
+        return payload
+
+    async def _stream_segments(self, audio_bytes: bytes):
+        """
+        Stream segments from the next free worker as it decodes them.
+
+        The worker stays checked out until the stream ends; if the caller
+        stops early it is told to cancel and returns to the pool once it has
+        acknowledged.
+        """
+        self._ensure_started()
+        self.requests += 1
+
+        worker = await self._idle.get()
+        loop = asyncio.get_event_loop()
+        reply = loop.run_in_executor(
+            self.io_executor, self._worker_io, worker, ('transcribe_stream', audio_bytes)
+        )
+        finished = False
+        try:
+            while True:
+                status, payload = await asyncio.shield(reply)
+                if status != 'segment':
+                    break
+                yield payload
+                reply = loop.run_in_executor(self.io_executor, self._worker_io, worker, None)
+
+            finished = True
+            if status != 'result':
+                self.failures += 1
+                raise RuntimeError(f"STT worker {worker.index} failed: {payload}")
+            yield payload
+
+        finally:
+            if finished:
+                self._on_request_done(reply, worker)
+            else:
+                asyncio.ensure_future(self._abandon_stream(worker, reply))
+
+    async def _abandon_stream(self, worker: _Worker, reply: asyncio.Future):
+        """Cancel a stream the caller stopped reading, then return the worker"""
+        try:
+            status = (await reply)[0]
+        except Exception:
+            status = 'crashed'
+
+        if status == 'segment':
+            loop = asyncio.get_event_loop()
+            reply = loop.run_in_executor(self.io_executor, self._cancel_stream_on_worker, worker)
+        reply.add_done_callback(lambda f: self._on_request_done(f, worker))
+
+    def _worker_io(self, worker: _Worker, message: Optional[tuple]):
+        """Send a stream request (if any) and wait for the next reply (blocking)"""
+        try:
+            if message is not None:
+                worker.requests += 1
+                worker.send(message)
+            return worker.receive(self.request_timeout)
+        except WorkerCrashed as e:
+            logger.error(f"STT {e}")
+            return ('crashed', str(e))
+
+    def _cancel_stream_on_worker(self, worker: _Worker):
+        """Ask the worker to stop its stream and drain it to the final reply (blocking)"""
+        try:
+            worker.send(('cancel',))
+            while True:
+                reply = worker.receive(self.request_timeout)
+                if reply[0] != 'segment':
+                    return reply
+        except WorkerCrashed as e:
+            logger.error(f"STT {e}")
+            return ('crashed', str(e))
+
+    def _transcribe_on_worker(self, worker: _Worker, audio: np.ndarray, sample_rate: int):
+        """Put audio in the worker's ring and wait for the result (blocking)"""
+        try:
+            message = ('transcribe', self._write_audio(worker.ring, audio), sample_rate)
+        except RingBufferFull:
+            # Longer than the ring - send it pickled instead
+            self.ring_fallbacks += 1
+            logger.warning(
+                f"Audio ({audio.nbytes / 1e6:.1f} MB) exceeds STT worker ring; sending pickled"
+            )
+            message = ('transcribe_array', self._to_float32(audio), sample_rate)
+
+        worker.requests += 1
+        try:
+            return worker.call(message, self.request_timeout)
+        except WorkerCrashed as e:
+            logger.error(f"STT {e}")
+            return ('crashed', str(e))
+
+    @staticmethod
+    def _write_audio(ring: SharedAudioRing, audio: np.ndarray):
+        """Write mono float32 audio into the ring, converting int16 in place"""
+        slot, view = ring.reserve((audio.shape[0],), np.float32)
+
+        if audio.dtype == np.int16:
+            if audio.ndim == 2:
+                np.mean(audio, axis=1, dtype=np.float32, out=view)
+                view /= 32768.0
+            else:
+                np.multiply(audio, 1.0 / 32768.0, out=view, casting='unsafe')
+        else:
+            view[...] = audio
+
+        return slot
+
+    @staticmethod
+    def _to_float32(audio: np.ndarray) -> np.ndarray:
+        """Convert int16 (mono or multi-channel) or float audio to mono float32"""
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) / 32768.0
+        if audio.ndim == 2:
+            audio = audio.mean(axis=1)
+        return np.asarray(audio, dtype=np.float32)
+
+    def _on_request_done(self, future: asyncio.Future, worker: _Worker):
+        """Return the worker to the pool, restarting it first if it crashed"""
+        crashed = (
+            future.cancelled()
+            or future.exception() is not None
+            or future.result()[0] == 'crashed'
+        )
+        if crashed or not worker.is_alive():
+            asyncio.ensure_future(self._replace(worker))
+        else:
+            self._idle.put_nowait(worker)
+
+    async def _replace(self, worker: _Worker):
+        """Restart a worker off the event loop and return it to the pool"""
+        loop = asyncio.get_event_loop()
+        try:
+            replacement = await loop.run_in_executor(self.io_executor, self._restart_worker, worker)
+        except Exception as e:
+            logger.error(f"Failed to restart STT worker {worker.index}: {e}")
+            # Retry on the next health check
+            replacement = worker
+        self._idle.put_nowait(replacement)
+
+    async def _health_check_loop(self):
+        """Periodically ping idle workers and restart unhealthy ones"""
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+
+            # Only check workers that are idle right now, one at a time: the
+            # others stay in the pool and keep serving requests meanwhile
+            for _ in range(self._idle.qsize()):
+                if self._idle.empty():
+                    break
+                worker = self._idle.get_nowait()
+
+                healthy = worker.is_alive()
+                if healthy:
+                    try:
+                        reply = await loop.run_in_executor(
+                            self.io_executor, worker.call, ('ping',), 5.0
+                        )
+                        healthy = reply[0] == 'pong'
+                    except WorkerCrashed:
+                        healthy = False
+
+                if healthy:
+                    self._idle.put_nowait(worker)
+                else:
+                    logger.warning(f"STT worker {worker.index} failed health check")
+                    await self._replace(worker)
+
+    def close(self):
+        """Stop all worker processes"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+
+        for worker in self.workers:
+            try:
+                worker.conn.send(('stop',))
+            except (BrokenPipeError, OSError):
+                pass
+
+        for worker in self.workers:
+            worker.process.join(timeout=5)
+            if worker.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+            worker.ring.close()
+
+        self.io_executor.shutdown(wait=False)
+
+    def get_stats(self) -> Dict:
+        """Get worker pool statistics"""
+        return {
+            'provider': self.provider_name,
+            'num_workers': self.num_workers,
+            'alive_workers': sum(1 for worker in self.workers if worker.is_alive()),
+            'idle_workers': self._idle.qsize() if self._idle is not None else self.num_workers,
+            'requests': self.requests,
+            'failures': self.failures,
+            'restarts': self.restarts,
+            'ring_fallbacks': self.ring_fallbacks,
+            'requests_per_worker': [worker.requests for worker in self.workers],
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ProcessPoolSTTProvider(provider='{self.provider_name}', "
+            f"workers={self.num_workers})"
+        )
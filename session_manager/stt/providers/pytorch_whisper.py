@@ -6,15 +6,18 @@ VCA 1.0 - Session 10
 """
 
 import asyncio
-import io
 import logging
-import wave
+import threading
+from collections import Counter
 import numpy as np
 import whisper
 import torch
-from typing import Optional
+from typing import Dict, Optional
 
 from ..base import STTProvider, TranscriptionResult
+from ..model_ladder import ModelLadder
+from ..two_pass import TwoPassGate
+from audio.wav import wav_to_float32
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,21 @@ class PyTorchWhisperProvider(STTProvider):
         self.initial_prompt = config.get('initial_prompt', None)
         self.condition_on_previous_text = config.get('condition_on_previous_text', True)
 
+        # Smaller models for short utterances (see stt/model_ladder.py)
+        self.ladder = ModelLadder(
+            self.model_size,
+            config.get('model_ladder'),
+            config.get('ladder_max_queue_depth')
+        )
+        self.pending = 0  # Requests waiting for or running a decode
+        self.model_usage = Counter()
+
+        # Fast greedy pass first, full decode only when unsure (see stt/two_pass.py)
+        self.two_pass = TwoPassGate(config.get('two_pass'))
+        model_sizes = self.ladder.distinct_model_sizes
+        if self.two_pass.enabled and self.two_pass.fast_model_size not in (None, *model_sizes):
+            model_sizes.insert(0, self.two_pass.fast_model_size)
+
         logger.info(
             f"Initializing PyTorchWhisperProvider: model={self.model_size}, "
             f"device={self.device}, fp16={self.fp16}"
@@ -49,8 +67,11 @@ class PyTorchWhisperProvider(STTProvider):
 
         # Load Whisper model
         try:
-            logger.info(f"Loading Whisper model '{self.model_size}' on {self.device}...")
-            self.model = whisper.load_model(self.model_size, device=self.device)
+            self.models = {}
+            for model_size in model_sizes:
+                logger.info(f"Loading Whisper model '{model_size}' on {self.device}...")
+                self.models[model_size] = whisper.load_model(model_size, device=self.device)
+            self.model = self.models[self.model_size]
 
             # Log device info
             if self.device == 'cuda':
@@ -67,6 +88,11 @@ class PyTorchWhisperProvider(STTProvider):
             logger.error(f"Failed to load Whisper model: {e}")
             raise
 
+        # Whisper installs kv-cache hooks on the shared model per decode, so
+        # concurrent decodes (chunks, hedging, sessions) must be serialized
+        # per model (different ladder rungs can decode at the same time)
+        self._model_locks = {model_size: threading.Lock() for model_size in self.models}
+
     async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
         """
         Transcribe audio using PyTorch Whisper.
@@ -82,11 +108,15 @@ class PyTorchWhisperProvider(STTProvider):
         """
         # Run transcription in thread pool (Whisper is CPU/GPU intensive)
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            self._transcribe_sync,
-            audio_bytes
-        )
+        self.pending += 1
+        try:
+            result = await loop.run_in_executor(
+                None,
+                self._transcribe_sync,
+                audio_bytes
+            )
+        finally:
+            self.pending -= 1
 
         return result
 
@@ -100,32 +130,67 @@ class PyTorchWhisperProvider(STTProvider):
         Returns:
             TranscriptionResult with text and metadata
         """
-        try:
-            # Convert WAV bytes to numpy array
-            with io.BytesIO(audio_bytes) as wav_io:
-                with wave.open(wav_io, 'rb') as wav_file:
-                    sample_rate = wav_file.getframerate()
-                    n_channels = wav_file.getnchannels()
-                    audio_data = wav_file.readframes(wav_file.getnframes())
+        audio_np, sample_rate = wav_to_float32(audio_bytes)
+        return self._transcribe_array(audio_np, sample_rate)
 
-            # Convert to float32 array (Whisper expects this)
-            audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+    def _transcribe_array(self, audio_np: np.ndarray, sample_rate: int) -> TranscriptionResult:
+        """
+        Transcribe a decoded float32 array (runs in thread pool).
 
-            # Convert stereo to mono by averaging channels
-            if n_channels == 2:
-                audio_np = audio_np.reshape(-1, 2).mean(axis=1)
+        Args:
+            audio_np: Mono float32 audio
+            sample_rate: Sample rate in Hz
 
-            # Transcribe using PyTorch Whisper
-            result = self.model.transcribe(
-                audio_np,
-                language=self.language,
-                fp16=self.fp16,  # CRITICAL: False for Maxwell (FP32 mode)
-                temperature=self.temperature,
-                beam_size=self.beam_size,
-                initial_prompt=self.initial_prompt,
-                condition_on_previous_text=self.condition_on_previous_text,
+        Returns:
+            TranscriptionResult with text and metadata
+        """
+        # Calculate duration
+        duration = len(audio_np) / sample_rate if sample_rate > 0 else None
+
+        # Pick the model for this utterance length / load
+        model_size = self.ladder.select(duration, self.pending)
+
+        if self.two_pass.enabled:
+            return self.two_pass.transcribe(
+                duration,
+                lambda: self._decode(
+                    audio_np, duration,
+                    self.two_pass.fast_model_size or model_size,
+                    self.two_pass.fast_beam_size
+                ),
+                lambda: self._decode(audio_np, duration, model_size, self.beam_size)
             )
 
+        return self._decode(audio_np, duration, model_size, self.beam_size)
+
+    def _decode(self, audio_np: np.ndarray, duration: float, model_size: str, beam_size: int) -> TranscriptionResult:
+        """
+        Run one Whisper decode (runs in thread pool).
+
+        Args:
+            audio_np: Mono float32 audio
+            duration: Audio length in seconds
+            model_size: Loaded model to use
+            beam_size: Beam search size (1 = greedy)
+
+        Returns:
+            TranscriptionResult with text and metadata
+        """
+        self.model_usage[model_size] += 1
+
+        try:
+            # Transcribe using PyTorch Whisper
+            with self._model_locks[model_size]:
+                result = self.models[model_size].transcribe(
+                    audio_np,
+                    language=self.language,
+                    fp16=self.fp16,  # CRITICAL: False for Maxwell (FP32 mode)
+                    temperature=self.temperature,
+                    beam_size=beam_size if beam_size > 1 else None,  # None = greedy decoder
+                    initial_prompt=self.initial_prompt,
+                    condition_on_previous_text=self.condition_on_previous_text,
+                )
+
             # Extract text and metadata
             text = result.get('text', '')
             detected_language = result.get('language', self.language)
@@ -141,11 +206,8 @@ class PyTorchWhisperProvider(STTProvider):
             else:
                 confidence = 0.5  # Unknown
 
-            # Calculate duration
-            duration = len(audio_np) / sample_rate if sample_rate > 0 else None
-
             logger.debug(
-                f"Transcribed {duration:.2f}s audio → '{text[:50]}...' "
+                f"Transcribed {duration:.2f}s audio with '{model_size}' → '{text[:50]}...' "
                 f"(confidence={confidence:.2f}, language={detected_language})"
             )
 
@@ -153,15 +215,21 @@ class PyTorchWhisperProvider(STTProvider):
                 text=text.strip(),
                 confidence=confidence,
                 language=detected_language,
-                duration=duration
+                duration=duration,
+                model=model_size
             )
 
         except Exception as e:
             logger.error(f"PyTorch Whisper transcription failed: {e}")
             raise
 
+    def get_stats(self) -> Dict:
+        """Get per-model decode counts and two-pass statistics"""
+        return {'model_usage': dict(self.model_usage), 'two_pass': self.two_pass.get_stats()}
+
     def __repr__(self) -> str:
+        ladder = f", ladder={self.ladder.distinct_model_sizes}" if self.ladder.enabled else ""
         return (
             f"PyTorchWhisperProvider(model='{self.model_size}', "
-            f"device='{self.device}', fp16={self.fp16})"
+            f"device='{self.device}', fp16={self.fp16}{ladder})"
         )
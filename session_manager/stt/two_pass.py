@@ -0,0 +1,135 @@
+"""
+Confidence-gated two-pass transcription for local Whisper providers
+VCA 1.0 - Phase 3
+
+Pass 1 decodes with a fast setup (small model and/or greedy beam_size=1).
+If its confidence reaches confidence_threshold the result is used as-is;
+otherwise pass 2 re-runs the utterance with the provider's normal (expensive)
+model and beam size. Most short commands are served by pass 1.
+
+Savings are estimated from the real-time factor (decode seconds per audio
+second) of the pass-2 decodes that did run: for each request served by
+pass 1, saved = estimated pass-2 time - pass-1 time. Pass-1 time spent on
+requests that were re-run anyway is reported as overhead.
+
+Configuration (inside local_whisper / pytorch_whisper):
+    two_pass:
+      enabled: true
+      fast_model_size: "base.en"   # null = same model as pass 2
+      fast_beam_size: 1            # Greedy decode
+      confidence_threshold: 0.6    # Provider confidence scale (0-1)
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .base import TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+
+class TwoPassGate:
+    """Run a fast decode first and re-run with the full decode below a confidence threshold"""
+
+    def __init__(self, config: Optional[dict] = None):
+        """
+        Initialize two-pass gate.
+
+        Args:
+            config: two_pass configuration (see module docstring); None = disabled
+        """
+        config = config or {}
+        self.enabled = config.get('enabled', False)
+        self.fast_model_size = config.get('fast_model_size')
+        self.fast_beam_size = config.get('fast_beam_size', 1)
+        self.confidence_threshold = config.get('confidence_threshold', 0.6)
+
+        self._lock = threading.Lock()  # Decodes run in executor threads
+
+        # Counters
+        self.requests = 0
+        self.pass2_requests = 0
+        self.audio_seconds_pass2 = 0.0
+        self.decode_seconds_pass2 = 0.0
+        self.fast_served_audio_seconds = 0.0
+        self.fast_served_decode_seconds = 0.0
+        self.pass1_overhead = 0.0  # Pass-1 time on requests that needed pass 2
+
+    def transcribe(
+        self,
+        duration: float,
+        fast_decode: Callable[[], TranscriptionResult],
+        full_decode: Callable[[], TranscriptionResult]
+    ) -> TranscriptionResult:
+        """
+        Transcribe one utterance with the gate (runs in thread pool).
+
+        Args:
+            duration: Utterance length in seconds
+            fast_decode: Pass 1 (fast model / greedy)
+            full_decode: Pass 2 (normal model and beam size)
+
+        Returns:
+            Pass-1 result if confident enough, else the pass-2 result
+        """
+        start = time.monotonic()
+        first = fast_decode()
+        pass1_time = time.monotonic() - start
+
+        if first.confidence is not None and first.confidence >= self.confidence_threshold:
+            with self._lock:
+                self.requests += 1
+                self.fast_served_audio_seconds += duration
+                self.fast_served_decode_seconds += pass1_time
+            return first
+
+        logger.debug(
+            f"Pass 1 confidence {first.confidence} < {self.confidence_threshold}: re-running"
+        )
+        start = time.monotonic()
+        second = full_decode()
+        pass2_time = time.monotonic() - start
+        second.passes = 2
+
+        with self._lock:
+            self.requests += 1
+            self.pass2_requests += 1
+            self.audio_seconds_pass2 += duration
+            self.decode_seconds_pass2 += pass2_time
+            self.pass1_overhead += pass1_time
+
+        return second
+
+    def get_stats(self) -> Dict:
+        """Get pass-2 rate and estimated latency savings"""
+        if not self.enabled:
+            return {}
+
+        pass2_rtf = (
+            self.decode_seconds_pass2 / self.audio_seconds_pass2
+            if self.audio_seconds_pass2 > 0 else None
+        )
+        estimated_saved = (
+            pass2_rtf * self.fast_served_audio_seconds - self.fast_served_decode_seconds
+            if pass2_rtf is not None else None
+        )
+
+        return {
+            'requests': self.requests,
+            'pass2_requests': self.pass2_requests,
+            'pass2_rate': self.pass2_requests / self.requests if self.requests else 0.0,
+            'pass2_real_time_factor': pass2_rtf,
+            'estimated_time_saved': estimated_saved,
+            'pass1_overhead': self.pass1_overhead,
+            'estimated_net_saved': (
+                estimated_saved - self.pass1_overhead if estimated_saved is not None else None
+            ),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"TwoPassGate(enabled={self.enabled}, fast_model={self.fast_model_size}, "
+            f"fast_beam={self.fast_beam_size}, threshold={self.confidence_threshold})"
+        )
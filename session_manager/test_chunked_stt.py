@@ -0,0 +1,111 @@
+"""
+Test script for parallel chunked transcription
+Builds a ~80s utterance from the test speech clip separated by pauses and
+checks that it is split at silences and the chunks are transcribed concurrently,
+and that stitching keeps confidence, upload timings and compression ratio
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from audio.wav import wav_to_float32, float32_to_wav
+from stt.base import STTProvider, TranscriptionResult
+from stt.chunking import split_at_silence
+from stt.providers.chunked_stt import ChunkedSTTProvider
+
+
+class RecordingSTTProvider(STTProvider):
+    """Mock provider that reports each chunk's length and tracks concurrency"""
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        audio_np, sample_rate = wav_to_float32(audio_bytes)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.2)
+        self.in_flight -= 1
+        duration = len(audio_np) / sample_rate
+        return TranscriptionResult(text=f"[{duration:.1f}s]", confidence=0.9, duration=duration)
+
+
+def build_long_utterance():
+    """Repeat the speech clip with 1s pauses (about 80s total)"""
+    speech, sample_rate = wav_to_float32((Path(__file__).parent / 'test_audio_16k.wav').read_bytes())
+    pause = np.zeros(sample_rate, dtype=np.float32)
+    parts = []
+    for _ in range(30):
+        parts.extend([speech, pause])
+    return np.concatenate(parts), sample_rate, len(speech) + len(pause)
+
+
+def test_chunked_stt():
+    """Test silence splitting and concurrent chunk transcription"""
+    audio_np, sample_rate, period = build_long_utterance()
+    print(f"Utterance: {len(audio_np) / sample_rate:.1f}s")
+
+    chunks = split_at_silence(audio_np, sample_rate, max_chunk_sec=20.0, min_chunk_sec=5.0)
+    print(f"Chunks: {[round(len(c) / sample_rate, 1) for c in chunks]}")
+    assert len(chunks) >= 4
+    assert sum(len(c) for c in chunks) == len(audio_np)
+    assert all(len(c) <= 20 * sample_rate for c in chunks)
+
+    # Every cut lands inside a pause (the last second of each period)
+    offset = 0
+    for chunk in chunks[:-1]:
+        offset += len(chunk)
+        assert offset % period >= period - sample_rate, f"cut at {offset} is inside speech"
+
+    inner = RecordingSTTProvider({})
+    provider = ChunkedSTTProvider(inner, {'min_duration': 30.0, 'max_chunk_duration': 20.0})
+
+    start = time.monotonic()
+    result = asyncio.run(provider.transcribe(float32_to_wav(audio_np, sample_rate)))
+    elapsed = time.monotonic() - start
+
+    print(f"Stitched: '{result.text}' ({result.chunks} chunks in {elapsed:.2f}s)")
+    assert result.chunks == len(chunks)
+    assert inner.max_in_flight == len(chunks)
+    assert elapsed < 0.2 * len(chunks)
+
+    # Short utterances pass straight through
+    short = asyncio.run(provider.transcribe(float32_to_wav(audio_np[:5 * sample_rate], sample_rate)))
+    assert short.chunks == 1
+
+
+def test_stitch_upload_fields():
+    """Test that remote upload timings add up and the compression ratio is size-weighted"""
+    results = [
+        TranscriptionResult(text="first part", confidence=0.9, duration=20.0,
+                            encode_time=0.05, upload_time=0.30, compression_ratio=4.0),
+        TranscriptionResult(text="second part", confidence=0.6, duration=10.0,
+                            encode_time=0.03, upload_time=0.10, compression_ratio=2.0),
+    ]
+    stitched = ChunkedSTTProvider._stitch(results, 30.0)
+
+    assert stitched.text == "first part second part" and stitched.chunks == 2
+    assert abs(stitched.confidence - 0.8) < 1e-9
+    assert abs(stitched.encode_time - 0.08) < 1e-9
+    assert abs(stitched.upload_time - 0.40) < 1e-9
+    # 30s of audio uploaded as 20/4 + 10/2 = 10s worth of bytes
+    assert abs(stitched.compression_ratio - 3.0) < 1e-9
+
+    # Local providers report none of them
+    local = ChunkedSTTProvider._stitch([TranscriptionResult(text="a", duration=1.0)] * 2, 2.0)
+    assert local.encode_time is None and local.upload_time is None and local.compression_ratio is None
+
+
+if __name__ == "__main__":
+    test_chunked_stt()
+    test_stitch_upload_fields()
+    print("✓ Chunked STT test passed")
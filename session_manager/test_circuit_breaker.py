@@ -0,0 +1,84 @@
+"""
+Test script for circuit breaker and automatic provider fallback
+Simulates a degraded remote provider with mock providers and verifies
+deadlines, breaker transitions, half-open probing and fallback routing
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stt.providers.mock_stt import MockSTTProvider
+from stt.providers.fallback_stt import FallbackSTTProvider
+from tts.providers.mock_tts import MockTTSProvider
+from tts.providers.fallback_tts import FallbackTTSProvider
+from utils.circuit_breaker import CircuitBreaker, BreakerState
+
+
+async def run_stt_fallback():
+    """Remote STT hangs, then recovers"""
+    remote = MockSTTProvider({'mock_latency': 1.0, 'mock_text': 'remote'})
+    local = MockSTTProvider({'mock_latency': 0.01, 'mock_text': 'local'})
+    breaker = CircuitBreaker('stt:remote', failure_threshold=2, reset_timeout=0.2)
+    provider = FallbackSTTProvider(
+        remote, local, breaker, {'timeout': 0.05},
+        primary_name='remote', fallback_name='local'
+    )
+    audio = b'\x00' * 3200
+
+    # Two deadline misses trip the breaker
+    for _ in range(2):
+        start = time.monotonic()
+        result = await provider.transcribe(audio)
+        assert result.provider == 'local'
+        assert time.monotonic() - start < 0.5
+    assert breaker.state == BreakerState.OPEN
+
+    # While open, requests skip the remote provider entirely
+    start = time.monotonic()
+    result = await provider.transcribe(audio)
+    assert result.provider == 'local' and time.monotonic() - start < 0.04
+    assert breaker.rejected_calls == 1
+
+    # After reset_timeout a half-open probe succeeds and closes the breaker
+    remote.latency = 0.01
+    await asyncio.sleep(0.25)
+    result = await provider.transcribe(audio)
+    assert result.provider == 'remote'
+    assert breaker.state == BreakerState.CLOSED
+    print(f"STT fallback stats: {provider.get_stats()}")
+
+
+async def run_tts_slow_calls():
+    """Remote TTS succeeds but too slowly"""
+    remote = MockTTSProvider({'mock_latency': 0.05})
+    local = MockTTSProvider({'mock_latency': 0.0, 'audio_format': 'pcm'})
+    breaker = CircuitBreaker('tts:remote', failure_threshold=2, slow_call_threshold=0.02)
+    provider = FallbackTTSProvider(
+        remote, local, breaker, {'timeout': 1.0},
+        primary_name='remote', fallback_name='local'
+    )
+
+    for _ in range(2):
+        result = await provider.synthesize("Hello Warren")
+        assert result.provider == 'remote'  # Slow calls still return their audio
+    assert breaker.state == BreakerState.OPEN
+
+    result = await provider.synthesize("Hello Warren")
+    assert result.provider == 'local'
+    print(f"TTS fallback stats: {provider.get_stats()}")
+
+
+def test_circuit_breaker():
+    """Test circuit breaker and fallback providers"""
+    asyncio.run(run_stt_fallback())
+    asyncio.run(run_tts_slow_calls())
+
+
+if __name__ == "__main__":
+    test_circuit_breaker()
+    print("✓ Circuit breaker test passed")
@@ -5,6 +5,7 @@ Tests audio streaming without wake-word
 
 import asyncio
 import json
+import time
 import wave
 import sys
 from pathlib import Path
@@ -27,7 +28,8 @@ async def test_session_manager(audio_file_path: str):
         # Send session_start message
         session_start_msg = {
             "type": "session_start",
-            "device_id": "test_client"
+            "device_id": "test_client",
+            "clock_sync": True
         }
         await websocket.send(json.dumps(session_start_msg))
         print(f"Sent: {session_start_msg}")
@@ -87,6 +89,7 @@ async def test_session_manager(audio_file_path: str):
         # Wait for transcript and response
         print("\nWaiting for responses...")
         timeout_seconds = 30
+        playback_acked = False
 
         try:
             while True:
@@ -96,6 +99,11 @@ async def test_session_manager(audio_file_path: str):
                 if isinstance(response, bytes):
                     print(f"\n[AUDIO RESPONSE] Received {len(response)} bytes")
 
+                    # Ack playback so the server can measure end-to-end latency
+                    if not playback_acked:
+                        await websocket.send(json.dumps({"type": "playback_started", "client_time": time.time()}))
+                        playback_acked = True
+
                     # Save audio response to file
                     output_file = "test_response.mp3"
                     with open(output_file, "wb") as f:
@@ -107,7 +115,14 @@ async def test_session_manager(audio_file_path: str):
                     msg = json.loads(response)
                     msg_type = msg.get("type")
 
-                    if msg_type == "transcript":
+                    if msg_type == "clock_ping":
+                        await websocket.send(json.dumps({
+                            "type": "clock_pong",
+                            "server_time": msg["server_time"],
+                            "client_time": time.time()
+                        }))
+
+                    elif msg_type == "transcript":
                         print(f"\n[TRANSCRIPT] {msg.get('text')}")
 
                     elif msg_type == "response_text":
@@ -0,0 +1,142 @@
+"""
+Test script for end-to-end latency measurement
+Simulates a client whose clock is several seconds off, with asymmetric
+network delays, and checks the clock offset estimate and the "user stopped
+talking -> user hears audio" latency computed from frame timestamps and a
+playback ack, plus the receive-time fallback for clients without clock sync
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from monitoring.end_to_end import ClockSync, EndToEndLatency
+from monitoring.latency_tracker import LatencyMetrics, LatencyTracker
+
+CLIENT_SKEW = 3.7  # Client clock ahead of the server (seconds)
+
+
+class SimulatedClient:
+    """Client with a skewed clock; delays are one-way network transit times"""
+
+    def __init__(self, skew: float):
+        self.skew = skew
+
+    def clock(self, server_now: float) -> float:
+        return server_now + self.skew
+
+    def exchange(self, clock_sync: ClockSync, ping: dict, server_now: float, uplink: float, downlink: float):
+        """Deliver a ping, answer immediately; returns (next ping, server time the pong arrived)"""
+        pong = {"type": "clock_pong", "server_time": ping["server_time"],
+                "client_time": self.clock(server_now + downlink)}
+        received_at = server_now + downlink + uplink
+        return clock_sync.handle_pong(pong, received_at), received_at
+
+
+def sync_clock(client: SimulatedClient, delays) -> ClockSync:
+    clock_sync = ClockSync(samples=len(delays), max_rtt=1.0)
+    ping = clock_sync.ping()
+    for downlink, uplink in delays:
+        ping["server_time"] = now = time.time()
+        ping, _ = client.exchange(clock_sync, ping, now, uplink, downlink)
+    assert ping is None
+    return clock_sync
+
+
+def test_clock_offset_estimate():
+    """Test that the shortest round trip wins and stale samples are rejected"""
+    client = SimulatedClient(CLIENT_SKEW)
+    # (downlink, uplink): jittery, one stale pong, then a fast symmetric sample
+    clock_sync = sync_clock(client, [(0.120, 0.030), (2.0, 0.5), (0.021, 0.019), (0.060, 0.090)])
+
+    print(f"\n{clock_sync} stats={clock_sync.get_stats()}")
+    assert clock_sync.synced
+    assert abs(clock_sync.rtt - 0.040) < 1e-6
+    assert abs(clock_sync.offset - CLIENT_SKEW) <= clock_sync.rtt / 2
+    assert clock_sync.samples_rejected == 1
+    assert clock_sync.pongs_received == 4
+
+    # Malformed pongs are counted and don't stop the exchange
+    partial = ClockSync(samples=2)
+    partial.ping()
+    assert partial.handle_pong({"type": "clock_pong"}) is not None
+    assert not partial.synced and partial.samples_rejected == 1
+
+    # Disabled, or a client that didn't ask for clock sync
+    assert ClockSync(samples=0).ping() is None
+    older_client = ClockSync(samples=5)
+    assert not older_client.negotiate(None) and older_client.ping() is None
+    assert ClockSync(samples=5).negotiate(True)
+    assert not ClockSync(samples=0).negotiate(True)
+
+
+def test_end_to_end_with_client_timestamps():
+    """Test end-to-end latency from frame timestamps and a playback ack"""
+    client = SimulatedClient(CLIENT_SKEW)
+    clock_sync = sync_clock(client, [(0.020, 0.020)] * 3)
+    end_to_end = EndToEndLatency(clock_sync)
+
+    uplink = 0.080  # Frame transit (binary frame timestamp = client send time)
+    stopped_talking = time.time()
+    for frame_index in range(5):
+        frame_end = stopped_talking - (4 - frame_index) * 0.030
+        end_to_end.speech_frame(client.clock(frame_end), frame_end + uplink)
+
+    # Silence threshold (1.5s) elapses, then the pipeline runs
+    metrics = LatencyMetrics(timestamp=stopped_talking + 1.5 + uplink, total_pipeline=1.2)
+    end_to_end.end_of_speech(metrics)
+    metrics.time_to_first_audio = 0.9
+
+    # Audio reaches the client after 60ms, the player starts 50ms later; the ack itself is slow
+    played_at = metrics.timestamp + metrics.time_to_first_audio + 0.060 + 0.050
+    acked = end_to_end.playback_started(
+        {"type": "playback_started", "client_time": client.clock(played_at)}, received_at=played_at + 0.7
+    )
+
+    print(metrics.get_breakdown())
+    tolerance = clock_sync.rtt / 2 + 1e-6
+    assert acked is metrics
+    assert abs(metrics.silence_detection - (1.5 + uplink)) <= tolerance
+    assert abs(metrics.playback_delay - 0.110) <= tolerance
+    assert abs(metrics.end_to_end - (played_at - stopped_talking)) <= tolerance
+    assert metrics.clock_sync_rtt == clock_sync.rtt
+    assert "±20ms clock" in metrics.get_breakdown()
+
+    # Only one ack per request
+    assert end_to_end.playback_started({"type": "playback_started"}) is None
+
+
+def test_receive_time_fallback():
+    """Test clients without clock sync: receive times give an upper bound"""
+    end_to_end = EndToEndLatency(ClockSync(samples=0))
+
+    stopped_talking = time.time()
+    end_to_end.speech_frame(client_time=stopped_talking + CLIENT_SKEW, received_at=stopped_talking + 0.05)
+    metrics = LatencyMetrics(timestamp=stopped_talking + 2.05)
+    end_to_end.end_of_speech(metrics)
+    assert "no playback ack yet" in metrics.get_breakdown()
+
+    # The skewed client_time can't be mapped, so the ack's receive time is used
+    end_to_end.playback_started({"client_time": stopped_talking + 10}, received_at=stopped_talking + 3.05)
+
+    assert abs(metrics.silence_detection - 2.0) < 1e-6
+    assert abs(metrics.end_to_end - 3.0) < 1e-6
+    assert metrics.playback_delay == 0.0  # No audio was sent
+    assert "upper bound" in metrics.get_breakdown()
+
+    # Tracker statistics only include acked requests
+    tracker = LatencyTracker()
+    tracker.record(metrics)
+    tracker.record(LatencyMetrics(total_pipeline=1.0))
+    stats = tracker.get_statistics()['end_to_end']
+    assert stats['sample_count'] == 1 and abs(stats['mean'] - 3.0) < 1e-6
+
+
+if __name__ == "__main__":
+    test_clock_offset_estimate()
+    test_end_to_end_with_client_timestamps()
+    test_receive_time_fallback()
+    print("✓ End-to-end latency test passed")
@@ -0,0 +1,110 @@
+"""
+Test script for hedged STT requests
+Uses two mock providers with different latency distributions to verify that
+the hedge fires at the percentile deadline, the faster result wins, the
+loser is cancelled and lost races don't pull the deadline down
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stt.base import STTProvider, TranscriptionResult
+from stt.providers.mock_stt import MockSTTProvider
+from stt.providers.hedged_stt import HedgedSTTProvider
+
+
+class FailingSTTProvider(STTProvider):
+    """Provider that always raises"""
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        raise RuntimeError("primary unavailable")
+
+
+async def run_hedged_requests():
+    """Run a batch of requests through a hedged provider"""
+    # Primary: usually fast (50-80ms) but with occasional slow outliers
+    fast_primary = MockSTTProvider({'mock_latency': 0.05, 'mock_latency_jitter': 0.03, 'mock_text': 'primary'})
+    slow_primary = MockSTTProvider({'mock_latency': 0.5, 'mock_text': 'primary'})
+    secondary = MockSTTProvider({'mock_latency': 0.1, 'mock_latency_jitter': 0.02, 'mock_text': 'secondary'})
+
+    hedged = HedgedSTTProvider(
+        fast_primary, secondary,
+        {'percentile': 90, 'min_samples': 10, 'initial_delay': 1.0, 'min_delay': 0.01},
+        primary_name='fast_primary', secondary_name='secondary'
+    )
+    audio = b'\x00' * 32000
+
+    # Warm up the latency window with the fast primary
+    for _ in range(20):
+        result = await hedged.transcribe(audio)
+        assert result.text == 'primary'
+
+    delay = hedged.get_hedge_delay()
+    print(f"Derived p90 hedge deadline: {delay * 1000:.0f}ms")
+    assert 0.05 <= delay <= 0.09
+
+    # Primary degrades: the secondary should win shortly after the deadline
+    hedged.primary = slow_primary
+    start = time.monotonic()
+    result = await hedged.transcribe(audio)
+    elapsed = time.monotonic() - start
+    print(f"Degraded primary: winner={result.provider}, hedged={result.hedged}, {elapsed * 1000:.0f}ms")
+    assert result.provider == 'secondary' and result.hedged
+    assert elapsed < 0.3
+
+    # A failing primary hedges immediately
+    hedged.primary = FailingSTTProvider({})
+    result = await hedged.transcribe(audio)
+    assert result.provider == 'secondary'
+
+    stats = hedged.get_stats()
+    print(f"Stats: {stats}")
+    assert stats['requests'] == 22
+    assert stats['secondary_wins'] == 2
+
+
+async def run_censored_samples():
+    """Cancelled primaries must not drag the deadline toward the hedge winner's time"""
+    slow_primary = MockSTTProvider({'mock_latency': 0.3, 'mock_text': 'primary'})
+    secondary = MockSTTProvider({'mock_latency': 0.02, 'mock_text': 'secondary'})
+    hedged = HedgedSTTProvider(
+        slow_primary, secondary,
+        {'percentile': 90, 'min_samples': 5, 'initial_delay': 0.1, 'min_delay': 0.01}
+    )
+    audio = b'\x00' * 32000
+
+    # Every race is lost by the primary; each sample is censored at >= the deadline
+    for _ in range(10):
+        delay = hedged.get_hedge_delay()
+        result = await hedged.transcribe(audio)
+        assert result.provider == 'secondary'
+        await asyncio.sleep(0.01)  # Let the cancelled primary finish
+        assert hedged.primary_latencies[-1] >= delay
+
+    print(f"Deadline after 10 lost races: {hedged.get_hedge_delay() * 1000:.0f}ms")
+    assert hedged.get_hedge_delay() >= 0.1
+    assert hedged.get_stats()['censored_samples'] == 10
+
+    # A caller cancelling before the deadline adds no sample
+    task = asyncio.ensure_future(hedged.transcribe(audio))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await asyncio.sleep(0.01)
+    assert len(hedged.primary_latencies) == 10
+
+
+def test_hedged_stt():
+    """Test hedged STT provider"""
+    asyncio.run(run_hedged_requests())
+    asyncio.run(run_censored_samples())
+
+
+if __name__ == "__main__":
+    test_hedged_stt()
+    print("✓ Hedged STT test passed")
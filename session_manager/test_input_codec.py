@@ -0,0 +1,107 @@
+"""
+Test script for Opus inbound audio
+Encodes the test WAV into the Ogg/Opus segments a client would send, then
+checks negotiation, decoding into 30ms VAD frames, bandwidth vs raw PCM16,
+resampling of 48kHz stereo input and dropping of corrupt packets
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio.encoding import encode_pcm16, soundfile
+from audio.input_codec import AudioInputCodecs
+from audio.wav import wav_to_int16
+from session.vad import VoiceActivityDetector
+
+TEST_AUDIO = Path(__file__).parent / "test_audio_16k.wav"
+SEGMENT_SECONDS = 0.3
+
+
+def client_segments(pcm: np.ndarray, sample_rate: int):
+    """Cut audio into self-contained Ogg/Opus segments, as the app sends them"""
+    size = int(SEGMENT_SECONDS * sample_rate)
+    return [encode_pcm16(pcm[offset:offset + size], sample_rate, 'opus') for offset in range(0, len(pcm), size)]
+
+
+def test_negotiation():
+    """Test that only configured, available codecs are accepted"""
+    codecs = AudioInputCodecs({'codecs': ['opus', 'pcm']})
+    opus = 'opus' if soundfile is not None else 'pcm'
+
+    assert codecs.negotiate('opus') == opus
+    assert codecs.negotiate(None) == 'pcm'  # No "input_codec" in session_start
+    assert codecs.negotiate('aac') == 'pcm'
+    assert AudioInputCodecs({'codecs': ['pcm']}).negotiate('opus') == 'pcm'
+    assert codecs.create_decoder('pcm', 960) is None
+
+
+def test_opus_to_vad_frames():
+    """Test that decoded segments become 30ms frames the VAD accepts"""
+    if soundfile is None:
+        print("soundfile not installed - skipping Opus decoding")
+        return
+
+    pcm, sample_rate = wav_to_int16(TEST_AUDIO.read_bytes())
+    segments = client_segments(pcm, sample_rate)
+    codecs = AudioInputCodecs({'codecs': ['opus', 'pcm']})
+    vad = VoiceActivityDetector(sample_rate=16000, frame_duration_ms=30)
+    decoder = codecs.create_decoder(codecs.negotiate('opus'), vad.frame_size, vad.sample_rate)
+
+    async def run():
+        frames = []
+        for segment in segments:
+            frames.extend(await decoder.decode(segment))
+        return frames
+
+    frames = asyncio.run(run())
+    sent = sum(len(segment) for segment in segments)
+    print(
+        f"Opus upstream: {len(pcm) * 2} PCM bytes → {sent} bytes "
+        f"({len(pcm) * 2 / sent:.1f}x) in {len(segments)} segments"
+    )
+
+    assert all(len(frame) == vad.frame_size for frame in frames)
+    assert abs(len(frames) * vad.frame_size - len(pcm) * 2) < vad.frame_size * len(segments)
+    assert len(pcm) * 2 / sent > 4
+
+    speech = [vad.process_frame(frame)[0] for frame in frames]
+    assert any(speech)
+
+    stats = codecs.get_stats()
+    print(f"Inbound codec stats: {stats}")
+    assert stats['packets'] == len(segments) and stats['decode_errors'] == 0
+
+
+def test_resampling_and_corrupt_packets():
+    """Test 48kHz stereo segments and that bad packets are dropped, not fatal"""
+    if soundfile is None:
+        return
+
+    codecs = AudioInputCodecs({'codecs': ['opus']})
+    decoder = codecs.create_decoder('opus', 960, 16000)
+    t = np.arange(int(48000 * 0.6)) / 48000
+    tone = (np.sin(2 * np.pi * 300 * t) * 8000).astype(np.int16)
+    stereo = client_segments(np.stack([tone, tone], axis=1), 48000)
+
+    async def run():
+        frames = await decoder.decode(b"not an ogg stream")
+        for segment in stereo:
+            frames.extend(await decoder.decode(segment))
+        return frames
+
+    frames = asyncio.run(run())
+    assert codecs.get_stats()['decode_errors'] == 1
+    assert abs(len(frames) - 20) <= 1  # 0.6s of 30ms frames at 16kHz
+
+
+if __name__ == "__main__":
+    test_negotiation()
+    test_opus_to_vad_frames()
+    test_resampling_and_corrupt_packets()
+    print("✓ Inbound audio codec test passed")
@@ -0,0 +1,74 @@
+"""
+Test script for the local intent fast-path
+Checks built-in intents, fall-through to the LLM, custom handlers and
+per-intent hit-rate/latency stats
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from session.intents import BUILTIN_INTENTS, IntentContext, create_intent_router
+
+
+def test_builtin_intents():
+    """Test built-in intents and fall-through"""
+    router = create_intent_router()
+
+    result = router.route("What time is it?")
+    assert result is not None and result.intent == "time"
+    assert result.response_text.startswith("It's ")
+
+    assert router.route("Okay, thanks.").intent == "smalltalk_thanks"
+    assert router.route("Never mind").intent == "cancel"
+    assert router.route("What’s the date today?").intent == "date"
+
+    # "repeat that" needs a previous response, otherwise it goes to the LLM
+    assert router.route("Can you repeat that?", previous_response="") is None
+    assert router.route("Can you repeat that?", previous_response="It's sunny.").response_text == "It's sunny."
+
+    # Anything longer goes to the LLM
+    assert router.route("What time is it in Tokyo and should I call my brother") is None
+    assert router.route("") is None
+
+    # Disabled built-ins are skipped
+    assert create_intent_router(disabled=["greeting"]).route("hello") is None
+
+    # Greeting text comes from config
+    assert router.route("Hello.").response_text == "Hi, how can I help?"
+    assert create_intent_router(greeting="Hi Sam.").route("hey there").response_text == "Hi Sam."
+
+
+def test_custom_intent_and_stats():
+    """Test a registered handler and the stats it produces"""
+    router = create_intent_router()
+
+    @router.intent("lights_on", [r"turn on the (?P<room>\w+) lights?"])
+    def lights_on(match, context: IntentContext):
+        return f"Turning on the {match.group('room')} lights."
+
+    assert router.route("Turn on the kitchen lights").response_text == "Turning on the kitchen lights."
+
+    for text in ["what time is it", "tell me a story", "hello"]:
+        router.route(text)
+
+    stats = router.get_stats()
+    print(f"Intent stats: {stats}")
+    assert stats['routed'] == 4
+    assert stats['hit_rate'] == 0.75
+    assert stats['intents']['lights_on']['hits'] == 1
+    # Local answers take microseconds, not an LLM round trip
+    assert stats['intents']['time']['mean_latency_us'] < 5000
+
+    # Handlers can use the context clock
+    context = IntentContext(transcript="", now=datetime(2025, 1, 6, 15, 5))
+    assert BUILTIN_INTENTS['time'][1](None, context) == "It's 3:05 PM."
+
+
+if __name__ == "__main__":
+    test_builtin_intents()
+    test_custom_intent_and_stats()
+    print("✓ Intent router test passed")
@@ -0,0 +1,108 @@
+"""
+Test script for the STT model ladder
+Checks model selection by utterance duration and queue depth, including
+rungs that repeat a model size or reuse the default model
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stt.model_ladder import ModelLadder
+from monitoring.latency_tracker import LatencyMetrics, LatencyTracker
+
+
+def test_model_ladder():
+    """Test duration rungs, default model and queue-depth step-down"""
+    ladder = ModelLadder(
+        'small',
+        [
+            {'model_size': 'base.en', 'max_duration': 6.0},
+            {'model_size': 'tiny.en', 'max_duration': 2.0},
+        ],
+        max_queue_depth=2
+    )
+    print(f"Ladder: {ladder} → {ladder.model_sizes}")
+    assert ladder.enabled
+    assert ladder.model_sizes == ['tiny.en', 'base.en', 'small']
+
+    assert ladder.select(1.2) == 'tiny.en'
+    assert ladder.select(2.0) == 'tiny.en'
+    assert ladder.select(4.5) == 'base.en'
+    assert ladder.select(12.0) == 'small'
+    assert ladder.select(None) == 'small'
+
+    # Under load, step down one rung (never below the fastest model)
+    assert ladder.select(12.0, queue_depth=3) == 'base.en'
+    assert ladder.select(1.2, queue_depth=3) == 'tiny.en'
+    assert ladder.select(12.0, queue_depth=2) == 'small'
+
+    # No rungs: always the default model
+    single = ModelLadder('small')
+    assert not single.enabled
+    assert single.select(1.0, queue_depth=10) == 'small'
+
+
+def test_model_ladder_repeated_sizes():
+    """Test rungs that reuse the default model or each other's model size"""
+    # default_model as a rung: longer/unknown utterances still get it
+    ladder = ModelLadder(
+        'small',
+        [
+            {'model_size': 'tiny.en', 'max_duration': 2.0},
+            {'model_size': 'small', 'max_duration': 6.0},
+        ],
+        max_queue_depth=2
+    )
+    assert ladder.model_sizes == ['tiny.en', 'small', 'small']
+    assert ladder.distinct_model_sizes == ['tiny.en', 'small']
+    assert ladder.select(1.0) == 'tiny.en'
+    assert ladder.select(4.0) == 'small'
+    assert ladder.select(12.0) == 'small'
+    assert ladder.select(None) == 'small'
+    assert ladder.select(12.0, queue_depth=3) == 'tiny.en'
+
+    # Repeated rungs: each duration maps to its own rung's model
+    ladder = ModelLadder(
+        'small',
+        [
+            {'model_size': 'tiny.en', 'max_duration': 2.0},
+            {'model_size': 'tiny.en', 'max_duration': 4.0},
+            {'model_size': 'base.en', 'max_duration': 8.0},
+        ],
+        max_queue_depth=2
+    )
+    print(f"Ladder: {ladder} → {ladder.distinct_model_sizes}")
+    assert ladder.distinct_model_sizes == ['tiny.en', 'base.en', 'small']
+    assert ladder.select(3.0) == 'tiny.en'
+    assert ladder.select(6.0) == 'base.en'
+    assert ladder.select(20.0) == 'small'
+    assert ladder.select(6.0, queue_depth=3) == 'tiny.en'
+    assert ladder.select(3.0, queue_depth=3) == 'tiny.en'
+
+    # Only the default model, listed as a rung: nothing to step between
+    single = ModelLadder('small', [{'model_size': 'small', 'max_duration': 5.0}], max_queue_depth=0)
+    assert not single.enabled
+    assert single.select(1.0, queue_depth=5) == 'small'
+
+
+def test_stt_model_metrics():
+    """Test per-model latency comparison in the tracker"""
+    tracker = LatencyTracker()
+    for model, stt_total in [('tiny.en', 0.4), ('tiny.en', 0.5), ('small', 2.1)]:
+        tracker.record(LatencyMetrics(stt_total=stt_total, stt_model=model, session_id="ladder"))
+
+    comparison = tracker.get_stt_model_comparison()
+    print(f"STT model comparison: {comparison}")
+    assert comparison['tiny.en']['sample_count'] == 2
+    assert abs(comparison['tiny.en']['median'] - 0.45) < 1e-9
+    assert "small" in tracker.history[-1].get_breakdown()
+
+
+if __name__ == "__main__":
+    test_model_ladder()
+    test_model_ladder_repeated_sizes()
+    test_stt_model_metrics()
+    print("✓ Model ladder test passed")
@@ -0,0 +1,145 @@
+"""
+Test script for the shared OpenAI connection pool
+Runs the Whisper and TTS providers against a local HTTPS stand-in for the
+OpenAI API (self-signed certificate via openssl) to check that they share
+one kept-alive connection, that an idle pool re-pays TCP + TLS setup, and
+that keep-warm pings during a session avoid it
+"""
+
+import asyncio
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stt.providers.openai_whisper import OpenAIWhisperProvider
+from tts.providers.openai_tts import OpenAITTSProvider
+from utils.openai_clients import configure_connection_pool
+
+TEST_AUDIO = Path(__file__).parent / "test_audio_16k.wav"
+KEEPALIVE_EXPIRY = 0.4
+KEEP_WARM_INTERVAL = 0.15
+
+
+class APIHandler(BaseHTTPRequestHandler):
+    """Stand-in for the OpenAI endpoints used by the providers"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    connections = 0
+
+    def setup(self):
+        APIHandler.connections += 1
+        super().setup()
+
+    def _reply(self, status: int, body: bytes = b"", content_type: str = "application/octet-stream"):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        if self.path.endswith("/audio/speech"):
+            self._reply(200, b"ID3" + b"\x00" * 2000)
+        else:
+            self._reply(200, b"turn on the kitchen lights", "text/plain")
+
+    def do_HEAD(self):
+        self._reply(404)  # Keep-warm pings only need the connection
+
+    def log_message(self, *args):
+        pass
+
+
+def start_https_server(tmp: str):
+    """Start the stand-in with a throwaway self-signed certificate"""
+    cert, key = f"{tmp}/cert.pem", f"{tmp}/key.pem"
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", key, "-out", cert, "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=IP:127.0.0.1"],
+        check=True, capture_output=True
+    )
+    server = ThreadingHTTPServer(('127.0.0.1', 0), APIHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, cert
+
+
+async def run_scenario(base_url: str, cert: str):
+    pool = configure_connection_pool({
+        'verify': cert,
+        'keepalive_expiry': KEEPALIVE_EXPIRY,
+        'keep_warm_interval': KEEP_WARM_INTERVAL,
+    })
+    common = {'api_key': 'test-key', 'base_url': base_url, 'max_retries': 0}
+    stt = OpenAIWhisperProvider(dict(common, upload_format='wav'))
+    tts = OpenAITTSProvider(common)
+    audio = TEST_AUDIO.read_bytes()
+
+    async def timed(call):
+        start = time.perf_counter()
+        await call
+        return time.perf_counter() - start
+
+    # Both providers share one connection
+    cold = await timed(tts.synthesize("Hello."))
+    warm = [await timed(stt.transcribe(audio)), await timed(tts.synthesize("Hello."))]
+    shared = dict(pool.get_stats())
+
+    # Idle past keepalive_expiry with no session: the connection is dropped
+    await asyncio.sleep(KEEPALIVE_EXPIRY * 2)
+    after_idle = await timed(tts.synthesize("Hello."))
+    idle = dict(pool.get_stats())
+
+    # Same idle gap during a session: keep-warm pings hold the connection open
+    pool.start_keep_warm()
+    pool.session_started()
+    await asyncio.sleep(KEEPALIVE_EXPIRY * 2)
+    after_warm_idle = await timed(tts.synthesize("Hello."))
+    pool.session_ended()
+    kept = dict(pool.get_stats())
+
+    await pool.aclose()
+    return cold, warm, shared, after_idle, idle, after_warm_idle, kept
+
+
+def test_shared_keep_warm_pool():
+    """Test connection sharing, idle expiry and keep-warm pings"""
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            server, cert = start_https_server(tmp)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"openssl unavailable ({e}) - skipping")
+            return
+
+        base_url = f"https://127.0.0.1:{server.server_address[1]}/v1"
+        cold, warm, shared, after_idle, idle, after_warm_idle, kept = asyncio.run(run_scenario(base_url, cert))
+        server.shutdown()
+
+    print(f"Cold request {cold * 1000:.1f}ms, reused {min(warm) * 1000:.1f}ms")
+    print(f"After idle: {after_idle * 1000:.1f}ms without keep-warm, {after_warm_idle * 1000:.1f}ms with keep-warm")
+    print(f"Pool stats: {kept}")
+
+    assert shared['requests'] == 3 and shared['new_connections'] == 1 and shared['tls_handshakes'] == 1
+    assert idle['new_connections'] == 2  # Expired while idle
+    assert kept['pings'] >= 3
+    assert kept['new_connections'] == 2  # Pings kept the connection alive
+    assert APIHandler.connections == 2
+    assert kept['reuse_rate'] > 0.5
+    assert cold > min(warm)
+
+
+if __name__ == "__main__":
+    test_shared_keep_warm_pool()
+    print("✓ OpenAI connection pool test passed")
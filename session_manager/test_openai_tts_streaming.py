@@ -0,0 +1,158 @@
+"""
+Test script for streaming OpenAI TTS
+Runs OpenAITTSProvider against a local HTTP stand-in for /v1/audio/speech
+that answers after a short "server" delay and then trickles 24kHz PCM, to
+check time to first chunk vs full download, network_time (response
+headers), PCM16 alignment and fallback when the stream fails to start
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tts.base import TTSProvider, TTSResult
+from tts.providers.fallback_tts import FallbackTTSProvider
+from tts.providers.openai_tts import OpenAITTSProvider
+from utils.circuit_breaker import CircuitBreaker
+
+SERVER_DELAY = 0.1  # Before response headers
+PCM_BYTES = 24000 * 2  # One second of audio
+PIECES = 8
+PIECE_DELAY = 0.05
+
+
+class SpeechHandler(BaseHTTPRequestHandler):
+    """Stand-in for POST /v1/audio/speech"""
+
+    requests = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        SpeechHandler.requests.append(body)
+
+        if body['input'] == "fail":
+            self.send_response(500)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        time.sleep(SERVER_DELAY)
+        audio = (bytes(range(256)) * (PCM_BYTES // 256 + 1))[:PCM_BYTES] if body['response_format'] == 'pcm' else b"ID3" + b"\x00" * 5000
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(len(audio)))
+        self.end_headers()
+
+        # Trickle the body, in odd-sized pieces for PCM
+        piece = len(audio) // PIECES + 1
+        for offset in range(0, len(audio), piece):
+            self.wfile.write(audio[offset:offset + piece])
+            self.wfile.flush()
+            time.sleep(PIECE_DELAY)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SpeechHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_provider(server, **overrides):
+    config = {
+        'api_key': 'test-key',
+        'base_url': f"http://127.0.0.1:{server.server_address[1]}/v1",
+        'max_retries': 0,
+        'stream': True,
+        'stream_chunk_size': 4801,
+    }
+    config.update(overrides)
+    return OpenAITTSProvider(config)
+
+
+def test_stream_forwards_before_download_completes():
+    """Test first chunk timing, network_time and PCM16 alignment"""
+    server = start_server()
+    provider = make_provider(server)
+
+    async def run():
+        start = time.monotonic()
+        first_at = None
+        chunks = []
+        async for chunk in provider.synthesize_stream("Good evening."):
+            if first_at is None:
+                first_at = time.monotonic() - start
+            chunks.append(chunk)
+        return chunks, first_at, time.monotonic() - start
+
+    chunks, first_at, total = asyncio.run(run())
+    server.shutdown()
+    print(f"OpenAI stream: network {chunks[0].network_time * 1000:.0f}ms, "
+          f"first chunk {first_at * 1000:.0f}ms, total {total * 1000:.0f}ms ({len(chunks)} chunks)")
+
+    assert provider.supports_streaming
+    assert SpeechHandler.requests[-1]['response_format'] == 'pcm'
+    assert SERVER_DELAY <= chunks[0].network_time < SERVER_DELAY + 0.1
+    assert all(chunk.network_time is None for chunk in chunks[1:])
+    assert first_at < total / 2
+    assert all(len(chunk.audio_bytes) % 2 == 0 and chunk.sample_rate == 24000 for chunk in chunks)
+    assert sum(len(chunk.audio_bytes) for chunk in chunks) == PCM_BYTES
+
+
+def test_non_streaming_network_time():
+    """Test that synthesize() still returns MP3 and reports time to headers"""
+    server = start_server()
+    provider = make_provider(server, stream=False)
+    result = asyncio.run(provider.synthesize("Good evening."))
+    server.shutdown()
+
+    assert not provider.supports_streaming
+    assert result.format == 'mp3' and result.audio_bytes.startswith(b"ID3")
+    assert SERVER_DELAY <= result.network_time < SERVER_DELAY + 0.1
+
+
+class LocalTTSProvider(TTSProvider):
+    """Fallback stand-in"""
+
+    async def synthesize(self, text: str) -> TTSResult:
+        return TTSResult(audio_bytes=b"\x00\x00" * 160, format='pcm', sample_rate=16000)
+
+
+def test_fallback_when_stream_fails_to_start():
+    """Test that a failed stream falls back and counts against the breaker"""
+    server = start_server()
+    breaker = CircuitBreaker(name="openai_tts", failure_threshold=3)
+    provider = FallbackTTSProvider(
+        make_provider(server), LocalTTSProvider({}), breaker, {'timeout': 2.0},
+        primary_name="openai_tts", fallback_name="piper_tts"
+    )
+
+    async def run():
+        failed = [chunk async for chunk in provider.synthesize_stream("fail")]
+        ok = [chunk async for chunk in provider.synthesize_stream("Good evening.")]
+        return failed, ok
+
+    failed, ok = asyncio.run(run())
+    server.shutdown()
+
+    assert provider.supports_streaming
+    assert len(failed) == 1 and failed[0].sample_rate == 16000
+    assert ok[0].sample_rate == 24000
+    assert provider.get_stats()['fallback_calls'] == 1
+    assert breaker.get_stats()['total_failures'] == 1
+
+
+if __name__ == "__main__":
+    test_stream_forwards_before_download_completes()
+    test_non_streaming_network_time()
+    test_fallback_when_stream_fails_to_start()
+    print("✓ OpenAI TTS streaming test passed")
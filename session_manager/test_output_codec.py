@@ -0,0 +1,157 @@
+"""
+Test script for response audio codec negotiation
+Checks codec negotiation (including clients that predate it), Opus
+segmenting of the test WAV and of streamed PCM chunks, bytes saved vs
+PCM16, passthrough of MP3 / WAV sessions, and that pre-rendered phrases
+follow the session's codec
+"""
+
+import asyncio
+import io
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio.encoding import soundfile
+from audio.output_codec import ResponseAudioEncoder, opus_sample_rate
+from audio.wav import wav_to_int16
+from session.manager import Session, SessionState
+from tts.base import TTSProvider, TTSResult
+from tts.phrases import PhraseBank
+
+TEST_AUDIO = Path(__file__).parent / "test_audio_16k.wav"
+
+
+def test_negotiation():
+    """Test server preference, old clients and unknown codecs"""
+    encoder = ResponseAudioEncoder({'codecs': ['opus', 'wav']})
+    opus = 'opus' if soundfile is not None else 'wav'
+
+    assert encoder.negotiate(['wav', 'opus']) == opus
+    assert encoder.negotiate(['wav']) == 'wav'
+    assert encoder.negotiate(None) == 'wav'  # No "audio_codecs" in session_start
+    assert encoder.negotiate(['aac']) == 'wav'
+    assert ResponseAudioEncoder({'codecs': ['wav']}).negotiate(['opus']) == 'wav'
+    assert ResponseAudioEncoder({'codecs': ['speex']}).codecs == ['wav']
+    print(f"Negotiation stats: {encoder.get_stats()['negotiated']}")
+
+
+def test_opus_segments():
+    """Test that a WAV response becomes decodable, much smaller Opus segments"""
+    if soundfile is None:
+        print("soundfile not installed - skipping Opus encoding")
+        return
+
+    wav_bytes = TEST_AUDIO.read_bytes()
+    pcm, sample_rate = wav_to_int16(wav_bytes)
+    encoder = ResponseAudioEncoder({'codecs': ['opus', 'wav'], 'segment_duration': 1.0})
+
+    segments = asyncio.run(encoder.encode(wav_bytes, 'wav', sample_rate, 'opus'))
+    sent = sum(len(segment) for segment in segments)
+    print(f"Opus: {len(wav_bytes)} → {sent} bytes ({len(wav_bytes) / sent:.1f}x) in {len(segments)} segments")
+
+    assert encoder.output_format('wav', 'opus') == 'opus'
+    assert len(segments) == int(np.ceil(len(pcm) / sample_rate))
+    assert len(wav_bytes) / sent > 4
+
+    # Every segment plays on its own; together they cover the utterance
+    decoded = [soundfile.read(io.BytesIO(segment), dtype='int16') for segment in segments]
+    assert all(rate == sample_rate for _, rate in decoded)
+    assert abs(sum(len(audio) for audio, _ in decoded) - len(pcm)) < sample_rate * 0.05
+
+    stats = encoder.get_stats()
+    print(f"Encoder stats: {stats}")
+    assert stats['segments'] == len(segments) and stats['compression_ratio'] > 4
+
+
+def test_stream_chunks_and_passthrough():
+    """Test PCM chunks at non-Opus rates, MP3 passthrough and WAV sessions"""
+    encoder = ResponseAudioEncoder({'codecs': ['opus', 'wav'], 'segment_duration': 0.5})
+
+    async def run():
+        pcm_22k = (np.sin(np.arange(22050) / 10) * 8000).astype(np.int16).tobytes()
+        chunk_segments = await encoder.encode(pcm_22k, 'pcm', 22050, 'opus')
+        mp3 = await encoder.encode(b"ID3fake-mp3", 'mp3', 24000, 'opus')
+        wav_session = await encoder.encode(pcm_22k, 'pcm', 22050, 'wav')
+        return pcm_22k, chunk_segments, mp3, wav_session
+
+    pcm_22k, chunk_segments, mp3, wav_session = asyncio.run(run())
+    assert mp3 == [b"ID3fake-mp3"] and encoder.output_format('mp3', 'opus') == 'mp3'
+    assert wav_session == [pcm_22k]
+    assert opus_sample_rate(22050) == 24000 and opus_sample_rate(16000) == 16000
+
+    if soundfile is not None:
+        assert len(chunk_segments) == 2
+        audio, rate = soundfile.read(io.BytesIO(chunk_segments[0]), dtype='int16')
+        assert rate == 24000 and abs(len(audio) - 12000) < 1200
+
+
+class RecordingChannel:
+    """Stand-in for ProtocolChannel that records what was sent"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_control(self, message):
+        self.sent.append(message)
+
+    async def send_audio(self, audio_bytes):
+        self.sent.append(audio_bytes)
+
+
+def test_phrases_use_session_codec():
+    """Test that a WAV phrase reaches an Opus session as framed Opus segments"""
+    if soundfile is None:
+        print("soundfile not installed - skipping phrase encoding")
+        return
+    try:
+        import main
+    except ImportError as e:
+        print(f"main.py dependencies unavailable ({e}) - skipping")
+        return
+
+    wav_bytes = TEST_AUDIO.read_bytes()
+    _, sample_rate = wav_to_int16(wav_bytes)
+
+    class WavTTSProvider(TTSProvider):
+        async def synthesize(self, text):
+            return TTSResult(audio_bytes=wav_bytes, format='wav', sample_rate=sample_rate)
+
+    async def send(codec):
+        session = Session("s1", "pixel", SessionState.LISTENING, time.time(), time.time())
+        session.output_codec = codec
+        channel = RecordingChannel()
+        await main.send_phrase(channel, session, arm, 'goodbye')
+        return channel.sent
+
+    bank = PhraseBank({'goodbye': ["Goodbye."]})
+    asyncio.run(bank.render(WavTTSProvider({})))
+    encoder = ResponseAudioEncoder({'codecs': ['opus', 'wav'], 'segment_duration': 1.0})
+    arm = type("Arm", (), {'name': 'default'})()
+
+    with mock.patch.object(main, 'response_encoder', encoder), \
+            mock.patch.object(main, 'phrase_banks', {'default': bank}):
+        opus = asyncio.run(send('opus'))
+        wav = asyncio.run(send('wav'))
+
+    assert opus[0] == {"type": "phrase", "kind": "goodbye", "text": "Goodbye."}
+    assert opus[1]['type'] == 'audio_stream_start' and opus[1]['format'] == 'opus'
+    assert opus[-1] == {"type": "audio_stream_end", "chunks": len(opus) - 3, "duration": None}
+    assert all(segment[:4] == b"OggS" for segment in opus[2:-1])
+
+    assert wav[1:] == [wav_bytes]
+    assert set(bank.get('goodbye').encoded) == {'opus', 'wav'}  # Encoded once per codec
+
+
+if __name__ == "__main__":
+    test_negotiation()
+    test_opus_segments()
+    test_stream_chunks_and_passthrough()
+    test_phrases_use_session_codec()
+    print("✓ Response audio codec test passed")
@@ -0,0 +1,202 @@
+"""
+Test script for parallel sentence synthesis
+Uses a stand-in provider whose synthesis time grows with sentence length
+(like Piper/XTTS) to check ordered delivery, the max_in_flight bound, time
+to first audio vs sequential synthesis, short-response passthrough,
+cancellation on early close, and that sentences rendered at different
+sample rates are never byte-joined (synthesize() falls back to the whole
+text; a streamed response re-announces the format)
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio.output_codec import ResponseAudioEncoder
+from audio.wav import float32_to_wav, wav_to_int16
+from monitoring.latency_tracker import LatencyMetrics
+from session.manager import Session, SessionState
+from tts.base import TTSProvider, TTSResult
+from tts.providers.parallel_tts import ParallelSentenceTTSProvider
+
+SECONDS_PER_CHAR = 0.002
+TEXT = (
+    "The living room lights are now off. "
+    "I also turned down the thermostat to nineteen degrees for the night. "
+    "Your alarm is set for seven. "
+    "Sleep well."
+)
+
+
+class SlowTTSProvider(TTSProvider):
+    """Stand-in provider: audio encodes the sentence index, delay scales with length"""
+
+    def __init__(self):
+        super().__init__({})
+        self.texts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def synthesize(self, text: str) -> TTSResult:
+        self.texts.append(text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(len(text) * SECONDS_PER_CHAR)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        audio = np.full(160, len(text) / 1000, dtype=np.float32)
+        return TTSResult(audio_bytes=float32_to_wav(audio, 16000), format='wav', sample_rate=16000, duration=0.01)
+
+
+class FallbackMidResponseTTSProvider(SlowTTSProvider):
+    """Stand-in whose fallback renders the "alarm" sentence as 22.05kHz WAV"""
+
+    async def synthesize(self, text: str) -> TTSResult:
+        result = await super().synthesize(text)
+        if text.startswith("Your alarm"):
+            audio = np.zeros(220, dtype=np.float32)
+            return TTSResult(audio_bytes=float32_to_wav(audio, 22050), format='wav', sample_rate=22050, duration=0.01)
+        return result
+
+
+class RecordingChannel:
+    """Protocol channel stand-in: records control messages and audio in send order"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_control(self, message):
+        self.sent.append(message)
+
+    async def send_audio(self, audio_bytes):
+        self.sent.append(audio_bytes)
+
+
+def test_ordered_parallel_stream():
+    """Test in-order chunks, concurrency bound and earlier first audio"""
+    async def run():
+        inner = SlowTTSProvider()
+        provider = ParallelSentenceTTSProvider(inner, {'max_in_flight': 2})
+
+        start = time.monotonic()
+        first_at = None
+        chunks = []
+        async for chunk in provider.synthesize_stream(TEXT):
+            if first_at is None:
+                first_at = time.monotonic() - start
+            chunks.append(chunk)
+        total = time.monotonic() - start
+        return inner, provider, chunks, first_at, total
+
+    inner, provider, chunks, first_at, total = asyncio.run(run())
+    sequential = len(TEXT) * SECONDS_PER_CHAR
+    print(f"Parallel: first audio {first_at * 1000:.0f}ms, total {total * 1000:.0f}ms "
+          f"(sequential whole text {sequential * 1000:.0f}ms)")
+
+    assert len(chunks) == 4
+    assert inner.max_in_flight == 2
+    assert first_at < sequential / 2
+    assert total < sequential
+
+    # Chunks arrive in sentence order, as PCM16
+    expected = [len(sentence) for sentence in inner.texts]
+    levels = [round(np.frombuffer(chunk.audio_bytes, dtype=np.int16)[0] / 32767 * 1000) for chunk in chunks]
+    assert levels == expected
+    assert all(chunk.format == 'pcm' and chunk.sample_rate == 16000 for chunk in chunks)
+
+    stats = provider.get_stats()
+    print(f"Parallel stats: {stats}")
+    assert stats['split_responses'] == 1 and stats['mean_sentences'] == 4
+    assert stats['order_wait'] > 0  # "Sleep well." finished before the sentence ahead of it
+
+
+def test_joined_result_and_short_passthrough():
+    """Test non-streaming synthesize() and that short responses are not split"""
+    async def run():
+        inner = SlowTTSProvider()
+        provider = ParallelSentenceTTSProvider(inner, {'max_in_flight': 4, 'min_sentences': 2})
+        joined = await provider.synthesize(TEXT)
+        short = await provider.synthesize("Done.")
+        return inner, provider, joined, short
+
+    inner, provider, joined, short = asyncio.run(run())
+    pcm, sample_rate = wav_to_int16(joined.audio_bytes)
+    assert joined.format == 'wav' and sample_rate == 16000
+    assert len(pcm) == 160 * 4
+    assert joined.duration == 0.04
+    assert inner.texts[-1] == "Done." and short.duration == 0.01
+    assert provider.get_stats()['split_responses'] == 1
+
+
+def test_early_close_cancels_pending():
+    """Test that closing the stream (barge-in) cancels sentences still synthesizing"""
+    async def run():
+        inner = SlowTTSProvider()
+        provider = ParallelSentenceTTSProvider(inner, {'max_in_flight': 3})
+        stream = provider.synthesize_stream(TEXT)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        await asyncio.sleep(0)
+        return inner
+
+    inner = asyncio.run(run())
+    assert inner.cancelled >= 1
+    assert inner.in_flight == 0
+    assert len(inner.texts) < 4 or inner.cancelled >= 2
+
+
+def test_mixed_sample_rates():
+    """Test that unjoinable sentences fall back to the whole text, and streams re-announce"""
+    async def run():
+        inner = FallbackMidResponseTTSProvider()
+        provider = ParallelSentenceTTSProvider(inner, {'max_in_flight': 4})
+        return inner, provider, await provider.synthesize(TEXT)
+
+    inner, provider, result = asyncio.run(run())
+    assert inner.texts[-1] == TEXT  # Not concat_wav's ValueError or a corrupt join
+    assert result.sample_rate == 16000 and provider.get_stats()['unjoinable_responses'] == 1
+
+    try:
+        import main
+    except ImportError as e:
+        print(f"main.py dependencies unavailable ({e}) - skipping stream announcement")
+        return
+
+    async def stream():
+        session = Session("s1", "pixel", SessionState.PROCESSING, time.time(), time.time())
+        session.output_codec = 'wav'
+        arm = type("Arm", (), {'tts_provider': provider, 'tts_provider_name': 'piper_tts'})()
+        channel = RecordingChannel()
+        await main.stream_tts_response(channel, session, arm, TEXT, LatencyMetrics())
+        return channel.sent
+
+    with mock.patch.object(main, 'response_encoder', ResponseAudioEncoder({'codecs': ['wav']})), \
+            mock.patch.object(main, 'logger', logging.getLogger("main")):
+        sent = asyncio.run(stream())
+
+    starts = [(i, m) for i, m in enumerate(sent) if isinstance(m, dict) and m['type'] == 'audio_stream_start']
+    assert [m['sample_rate'] for _, m in starts] == [16000, 22050, 16000]
+    assert [i for i, _ in starts] == [0, 3, 5]  # Each right before the first chunk at its rate
+    assert sent[-1]['type'] == 'audio_stream_end' and sent[-1]['chunks'] == 4
+
+
+if __name__ == "__main__":
+    test_ordered_parallel_stream()
+    test_joined_result_and_short_passthrough()
+    test_early_close_cancels_pending()
+    test_mixed_sample_rates()
+    print("✓ Parallel sentence TTS test passed")
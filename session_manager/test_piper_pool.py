@@ -0,0 +1,204 @@
+"""
+Test script for the Piper voice pool
+Checks with a stand-in voice (no model or onnxruntime needed) that the pool
+holds exactly pool_size sessions, that every synthesis takes a voice from
+the pool and returns it, and that concurrency never exceeds pool_size.
+
+Run directly, it also benchmarks aggregate synthesis throughput at 1/2/4/8
+concurrent requests for several pool sizes (ONNX sessions), each session
+pinned to cores / pool_size intra-op threads; the benchmark requires the
+Piper model from config.yaml (piper_tts.model_path)
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tts.providers.piper_tts import PiperTTSProvider
+from config.settings import get_settings
+
+TEXT = "Hello Warren, I'm your voice assistant Nabu. How can I help you today?"
+CONCURRENCY_LEVELS = [1, 2, 4, 8]
+ROUNDS = 4  # Batches of concurrent requests per measurement
+
+
+async def measure(provider, concurrency: int):
+    """Run ROUNDS batches of `concurrency` simultaneous requests"""
+    audio_seconds = 0.0
+    latencies = []
+
+    async def one_request():
+        start = time.perf_counter()
+        result = await provider.synthesize(TEXT)
+        latencies.append(time.perf_counter() - start)
+        return result.duration
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        durations = await asyncio.gather(*(one_request() for _ in range(concurrency)))
+        audio_seconds += sum(durations)
+    wall = time.perf_counter() - start
+
+    return {
+        'requests_per_sec': concurrency * ROUNDS / wall,
+        'audio_per_sec': audio_seconds / wall,  # Seconds of speech synthesized per wall second
+        'mean_latency': sum(latencies) / len(latencies),
+    }
+
+
+class StandInSession:
+    """Stand-in ONNX session: counts creation and detects concurrent use"""
+
+    created = []
+    busy = 0  # Sessions synthesizing right now, and the peak
+    peak_busy = 0
+    lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        self.active = 0
+        self.overlapped = False
+        StandInSession.created.append(self)
+
+
+class StandInVoice:
+    """Stand-in PiperVoice: 22.05kHz silence, len(text) * 10ms, 20ms per synthesis"""
+
+    session = None
+
+    @classmethod
+    def load(cls, model_path, config_path=None, use_cuda=False):
+        voice = cls()
+        voice.session = object()  # PiperVoice.load's default session
+        return voice
+
+    def synthesize(self, text, syn_config=None):
+        session = self.session
+        with StandInSession.lock:
+            session.active += 1
+            session.overlapped |= session.active > 1
+            StandInSession.busy += 1
+            StandInSession.peak_busy = max(StandInSession.peak_busy, StandInSession.busy)
+        try:
+            time.sleep(0.02)
+            yield types.SimpleNamespace(audio_int16_array=np.zeros(len(text) * 220, dtype=np.int16))
+        finally:
+            with StandInSession.lock:
+                session.active -= 1
+                StandInSession.busy -= 1
+
+
+def stand_in_modules():
+    """sys.modules entries for piper and onnxruntime backed by the stand-ins"""
+    piper = types.ModuleType("piper")
+    piper.PiperVoice = StandInVoice
+    piper_config = types.ModuleType("piper.config")
+    piper_config.SynthesisConfig = lambda **kwargs: types.SimpleNamespace(**kwargs)
+    onnxruntime = types.ModuleType("onnxruntime")
+    onnxruntime.SessionOptions = types.SimpleNamespace
+    onnxruntime.ExecutionMode = types.SimpleNamespace(ORT_SEQUENTIAL=0)
+    onnxruntime.GraphOptimizationLevel = types.SimpleNamespace(ORT_ENABLE_ALL=99)
+    onnxruntime.InferenceSession = StandInSession
+    return {"piper": piper, "piper.config": piper_config, "onnxruntime": onnxruntime}
+
+
+def test_voice_pool():
+    """Test pool size, acquire/release per synthesis and max_in_flight <= pool_size"""
+    with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(sys.modules, stand_in_modules()):
+        model_path = Path(tmp) / "voice.onnx"
+        model_path.write_bytes(b"")
+        Path(f"{model_path}.json").write_text(json.dumps({"audio": {"sample_rate": 22050}}))
+        StandInSession.created.clear()
+        StandInSession.peak_busy = 0
+
+        provider = PiperTTSProvider({'model_path': str(model_path), 'pool_size': 2, 'sample_rate': 16000})
+
+        # The loaded voice's default session is replaced: pool_size sessions in total
+        assert len(StandInSession.created) == 2
+        assert provider.voice.session is StandInSession.created[0]
+
+        async def run():
+            return await asyncio.gather(*(provider.synthesize("Hello there.") for _ in range(6)))
+
+        results = asyncio.run(run())
+        provider.executor.shutdown()
+
+    stats = provider.get_stats()
+    print(f"Pool stats: {stats}")
+    assert all(result.sample_rate == 16000 and abs(result.duration - 0.12) < 0.01 for result in results)
+    assert stats['syntheses'] == 6 and stats['in_flight'] == 0
+    assert stats['max_in_flight'] >= stats['pool_size']  # Requests queue behind the pool...
+    assert provider.voices.qsize() == 2  # ...every voice was returned
+    assert not any(session.overlapped for session in StandInSession.created)
+    assert StandInSession.peak_busy == stats['pool_size']  # Concurrency capped at pool_size
+    assert stats['mean_pool_wait'] > 0
+
+
+async def benchmark_piper_pool():
+    """Benchmark aggregate throughput per pool size and concurrency"""
+    settings = get_settings()
+    model_path = settings.get('piper_tts.model_path', 'models/piper/en_US-lessac-medium.onnx')
+    if not Path(model_path).exists():
+        print(f"Piper model not found ({model_path}) - skipping benchmark")
+        return
+
+    cores = os.cpu_count() or 1
+    pool_sizes = sorted({1, 2, 4, min(8, cores)})
+
+    print("=" * 70)
+    print(f"PIPER VOICE POOL THROUGHPUT ({cores} CPU cores)")
+    print("=" * 70)
+
+    results = {}
+    for pool_size in pool_sizes:
+        tts_config = {
+            'model_path': model_path,
+            'config_path': settings.get('piper_tts.config_path', None),
+            'sample_rate': settings.get('piper_tts.sample_rate', 16000),
+            'pool_size': pool_size,
+            'inter_op_threads': 1,
+        }
+        provider = PiperTTSProvider(tts_config)
+
+        # Warm up every session
+        await asyncio.gather(*(provider.synthesize(TEXT) for _ in range(pool_size)))
+
+        print(f"\n{provider} ({provider.intra_op_threads} intra-op threads per session)")
+        print(f"   {'Concurrent':<12} {'Requests/s':<12} {'Audio s/s':<12} {'Mean latency'}")
+        for concurrency in CONCURRENCY_LEVELS:
+            stats = await measure(provider, concurrency)
+            results[(pool_size, concurrency)] = stats
+            print(
+                f"   {concurrency:<12} {stats['requests_per_sec']:<12.2f} "
+                f"{stats['audio_per_sec']:<12.1f} {stats['mean_latency']:.3f}s"
+            )
+
+        provider.executor.shutdown()
+
+    # Best pool size per concurrency level
+    print(f"\n📊 BEST POOL SIZE PER CONCURRENCY:")
+    for concurrency in CONCURRENCY_LEVELS:
+        best = max(pool_sizes, key=lambda size: results[(size, concurrency)]['requests_per_sec'])
+        single = results[(1, concurrency)]['requests_per_sec']
+        print(
+            f"   {concurrency} concurrent: pool_size={best} "
+            f"({results[(best, concurrency)]['requests_per_sec'] / single:.2f}x vs single session)"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    test_voice_pool()
+    print("✓ Piper voice pool test passed")
+    asyncio.run(benchmark_piper_pool())
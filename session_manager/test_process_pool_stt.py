@@ -0,0 +1,165 @@
+"""
+Test script for the process-pool STT provider
+Uses a CPU-bound pure-Python stand-in model so it runs without Whisper:
+checks that workers decode in parallel without blocking the event loop,
+that audio arrives intact through shared memory, that a crashed worker
+is restarted, and that segment streams cross the worker pipe and can be
+closed early
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from audio.wav import float32_to_wav, wav_to_float32
+from stt.base import STTProvider, TranscriptionResult, TranscriptionSegment
+from stt.providers.process_pool_stt import ProcessPoolSTTProvider
+
+CRASH_SAMPLE = 0.75  # First sample value that makes the stand-in model crash
+STREAM_SEGMENTS = ["first words", "more words", "last words"]
+
+
+class BusyLoopSTTProvider(STTProvider):
+    """Stand-in model: holds the GIL for `work` seconds and reports the audio it saw"""
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.work = config.get('work', 0.3)
+        self.pid = os.getpid()
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        raise NotImplementedError
+
+    def _transcribe_array(self, audio_np: np.ndarray, sample_rate: int) -> TranscriptionResult:
+        if len(audio_np) and abs(audio_np[0] - CRASH_SAMPLE) < 1e-3:
+            os._exit(1)
+
+        deadline = time.monotonic() + self.work
+        while time.monotonic() < deadline:
+            pass
+
+        return TranscriptionResult(
+            text=f"pid={self.pid} sum={float(np.sum(audio_np)):.1f}",
+            duration=len(audio_np) / sample_rate
+        )
+
+
+    async def _stream_segments(self, audio_bytes: bytes):
+        for i, text in enumerate(STREAM_SEGMENTS):
+            await asyncio.sleep(0.1)
+            yield TranscriptionSegment(text=f"{text} pid={self.pid}", start=i, end=i + 1)
+        yield TranscriptionResult(text=" ".join(STREAM_SEGMENTS), duration=len(STREAM_SEGMENTS))
+
+
+def load_stand_in(provider_name: str, provider_config: dict) -> STTProvider:
+    """Worker loader (module-level so it can be pickled for spawn)"""
+    return BusyLoopSTTProvider(provider_config)
+
+
+async def run_pool(pool: ProcessPoolSTTProvider):
+    """Exercise the pool: parallel requests, loop responsiveness, crash restart"""
+    sample_rate = 16000
+    wav = float32_to_wav(np.full(sample_rate, 0.5, dtype=np.float32), sample_rate)
+    expected = f"sum={float(np.sum(wav_to_float32(wav)[0])):.1f}"
+
+    # Event loop ticker - measures the worst stall while workers are busy
+    stalls = []
+
+    async def ticker():
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.monotonic()
+            stalls.append(now - last - 0.01)
+            last = now
+
+    ticker_task = asyncio.ensure_future(ticker())
+
+    start = time.monotonic()
+    results = await asyncio.gather(*(pool.transcribe(wav) for _ in range(4)))
+    elapsed = time.monotonic() - start
+    ticker_task.cancel()
+
+    pids = {r.text.split()[0] for r in results}
+    print(f"4 requests on 2 workers: {elapsed:.2f}s, pids={sorted(pids)}, max loop stall={max(stalls) * 1000:.1f}ms")
+    assert all(r.text.endswith(expected) for r in results)  # shared memory intact
+    assert len(pids) == 2
+    assert elapsed < 4 * 0.3  # parallel, not serialized
+    assert max(stalls) < 0.1
+
+    # Crash a worker: the request fails, the worker is replaced
+    crash = np.full(sample_rate, CRASH_SAMPLE, dtype=np.float32)
+    try:
+        await pool.transcribe(float32_to_wav(crash, sample_rate))
+        assert False, "crash should raise"
+    except RuntimeError as e:
+        print(f"Crash surfaced as: {e}")
+
+    # Pool recovers: both workers serve again after the restart
+    results = await asyncio.gather(*(pool.transcribe(wav) for _ in range(4)))
+    assert all(r.text.endswith(expected) for r in results)
+    assert pool.restarts == 1
+
+    # Health check keeps healthy workers in the pool (a worker being pinged
+    # is briefly out of it, so wait for the stats to settle)
+    deadline = time.monotonic() + 5.0
+    while True:
+        await asyncio.sleep(0.05)
+        stats = pool.get_stats()
+        if stats['idle_workers'] == 2 or time.monotonic() > deadline:
+            break
+    print(f"Stats: {stats}")
+    assert stats['alive_workers'] == 2
+    assert stats['idle_workers'] == 2
+
+    # Health checks never take every idle worker out of the pool at once
+    idle_seen = []
+    for _ in range(60):
+        await asyncio.sleep(0.005)
+        idle_seen.append(pool.get_stats()['idle_workers'])
+    assert min(idle_seen) >= 1
+
+    # Segment streams: each segment arrives while the worker is still decoding
+    stream = pool.transcribe_stream(wav)
+    start = time.monotonic()
+    arrivals = [time.monotonic() - start async for _ in stream]
+    assert len(arrivals) == 3 and arrivals[0] < arrivals[-1] - 0.15
+    assert stream.result.text == " ".join(STREAM_SEGMENTS)
+
+    # Closing early cancels the worker's stream; it returns to the pool, not restarted
+    stream = pool.transcribe_stream(wav)
+    async for segment in stream:
+        break
+    await stream.aclose()
+    assert segment.text.startswith("first words") and stream.result is None
+    deadline = time.monotonic() + 5.0
+    while pool.get_stats()['idle_workers'] < 2 and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    assert pool.get_stats()['idle_workers'] == 2 and pool.restarts == 1
+    results = await asyncio.gather(*(pool.transcribe(wav) for _ in range(2)))
+    assert all(r.text.endswith(expected) for r in results)
+
+
+def test_process_pool_stt():
+    """Test parallel decode, shared-memory transfer and restart-on-crash"""
+    pool = ProcessPoolSTTProvider(
+        'busy_loop', {'work': 0.3},
+        {'num_workers': 2, 'request_timeout': 10.0, 'health_check_interval': 0.1},
+        loader=load_stand_in
+    )
+    try:
+        asyncio.run(run_pool(pool))
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    test_process_pool_stt()
+    print("✓ Process pool STT test passed")
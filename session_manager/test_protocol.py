@@ -0,0 +1,187 @@
+"""
+Test script for the WebSocket wire protocol
+Checks legacy compatibility, binary frame round trips (sequence numbers,
+timestamps, control encodings) and benchmarks per-message server CPU cost of
+the legacy JSON path vs binary frames for typical control and audio messages
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi import WebSocketDisconnect
+
+from monitoring.latency_tracker import LatencyMetrics
+from session.protocol import (
+    FRAME_AUDIO, FRAME_CONTROL, HEADER, ProtocolChannel, decode_control, msgpack, pack_frame
+)
+
+ITERATIONS = 20000
+
+
+class FakeWebSocket:
+    """Records sends and replays queued Starlette receive messages"""
+
+    def __init__(self, incoming=None):
+        self.incoming = list(incoming or [])
+        self.sent = []
+
+    async def receive(self):
+        return self.incoming.pop(0) if self.incoming else {"type": "websocket.disconnect", "code": 1000}
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def send_json(self, data):
+        # Starlette's implementation
+        self.sent.append(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+def binary_session_start(encodings=("msgpack", "json")):
+    return {"type": "session_start", "device_id": "pixel", "protocols": ["binary", "json"],
+            "control_encodings": list(encodings)}
+
+
+def test_legacy_client_unchanged():
+    """Test that clients without "protocols" keep JSON text + raw binary"""
+    async def run():
+        ws = FakeWebSocket([{"type": "websocket.receive", "bytes": b"\x00" * 960}])
+        channel = ProtocolChannel(ws, {})
+        protocol = channel.negotiate({"type": "session_start", "device_id": "old_app"})
+        channel.activate(protocol)
+        await channel.send_control({"type": "status", "state": "processing"})
+        await channel.send_audio(b"ID3mp3")
+        incoming = await channel.receive()
+        return ws, protocol, incoming
+
+    ws, protocol, incoming = asyncio.run(run())
+    assert protocol['name'] == 'json'
+    assert json.loads(ws.sent[0]) == {"type": "status", "state": "processing"}
+    assert ws.sent[1] == b"ID3mp3"
+    assert incoming.audio == b"\x00" * 960 and incoming.sequence is None
+
+
+def test_binary_frames_round_trip():
+    """Test framing, sequence numbers, timestamps and gap detection"""
+    expected_encoding = 'msgpack' if msgpack is not None else 'json'
+    encoding_id = 1 if msgpack is not None else 0
+    sent_at = time.time_ns() // 1000
+
+    async def run():
+        ws = FakeWebSocket([
+            {"type": "websocket.receive", "bytes": pack_frame(FRAME_AUDIO, 0, b"\x01\x02" * 480)},
+            {"type": "websocket.receive", "bytes": pack_frame(
+                FRAME_CONTROL, 2, json.dumps({"type": "session_end"}).encode(), 0, timestamp_us=sent_at)},
+        ])
+        channel = ProtocolChannel(ws, {'binary': True})
+        protocol = channel.negotiate(binary_session_start())
+        await channel.send_control({"type": "session_started", "protocol": protocol})
+        channel.activate(protocol)
+
+        await channel.send_control({"type": "transcript", "text": "turn on the lights"})
+        await channel.send_audio(b"OggS...")
+        audio = await channel.receive()
+        control = await channel.receive()
+        try:
+            await channel.receive()
+        except WebSocketDisconnect:
+            disconnected = True
+        return ws, channel, protocol, audio, control, disconnected
+
+    ws, channel, protocol, audio, control, disconnected = asyncio.run(run())
+
+    assert protocol == {'name': 'binary', 'version': 1, 'encoding': expected_encoding}
+    assert isinstance(ws.sent[0], str)  # session_started is still JSON text
+
+    version, frame_type, encoding, sequence, timestamp_us = HEADER.unpack_from(ws.sent[1])
+    assert (version, frame_type, encoding, sequence) == (1, FRAME_CONTROL, encoding_id, 0)
+    assert abs(timestamp_us / 1e6 - time.time()) < 5
+    assert decode_control(ws.sent[1][HEADER.size:], encoding) == {"type": "transcript", "text": "turn on the lights"}
+    assert HEADER.unpack_from(ws.sent[2])[1:4] == (FRAME_AUDIO, encoding_id, 1)
+    assert ws.sent[2][HEADER.size:] == b"OggS..."
+
+    assert audio.audio == b"\x01\x02" * 480 and audio.sequence == 0
+    assert control.message == {"type": "session_end"} and control.timestamp == sent_at / 1e6
+    assert channel.get_stats()['sequence_gaps'] == 1  # Frame 1 never arrived
+    assert disconnected
+
+    # Binary disabled on the server, or json-only client
+    assert ProtocolChannel(FakeWebSocket(), {'binary': False}).negotiate(binary_session_start())['name'] == 'json'
+    assert ProtocolChannel(FakeWebSocket(), {}).negotiate(binary_session_start(["json"]))['encoding'] == 'json'
+
+
+def _per_message_us(run_once) -> float:
+    """Server CPU microseconds per message"""
+    start = time.process_time()
+    asyncio.run(run_once())
+    return (time.process_time() - start) / ITERATIONS * 1e6
+
+
+def test_benchmark_message_cost():
+    """Benchmark per-message CPU: legacy JSON vs binary frames"""
+    metrics = LatencyMetrics(stt_total=0.41, llm_total=0.9, tts_total=0.35, total_pipeline=3.2,
+                             stt_provider="local_whisper", tts_provider="piper_tts")
+    messages = {
+        'status': {"type": "status", "state": "processing"},
+        'transcript': {"type": "transcript", "text": "What's the weather like in Dublin tomorrow morning?"},
+        'latency_report': {"type": "latency_report", "metrics": metrics.to_dict()},
+    }
+    frame = b"\x10\x00" * 480  # 30ms PCM16
+
+    print(f"\n{'Message':<16} {'Legacy µs':>10} {'Binary µs':>10} {'Legacy B':>9} {'Binary B':>9}")
+    for name, message in messages.items():
+        legacy_ws = FakeWebSocket()
+        binary_ws = FakeWebSocket()
+        legacy_text = json.dumps(message, separators=(",", ":"))
+        binary = ProtocolChannel(binary_ws, {})
+        binary.activate(binary.negotiate(binary_session_start()))
+        compact = dict(message, metrics=metrics.to_compact_dict()) if name == 'latency_report' else message
+
+        async def legacy_round():
+            for _ in range(ITERATIONS):
+                await legacy_ws.send_json(message)
+                json.loads(legacy_text)  # Inline parse as the handler used to
+            legacy_ws.sent.clear()
+
+        async def binary_round():
+            for _ in range(ITERATIONS):
+                await binary.send_control(compact)
+            binary_ws.sent.clear()
+
+        legacy_us = _per_message_us(legacy_round)
+        binary_us = _per_message_us(binary_round)
+        asyncio.run(binary.send_control(compact))
+        print(f"{name:<16} {legacy_us:>10.2f} {binary_us:>10.2f} {len(legacy_text):>9} {len(binary_ws.sent[-1]):>9}")
+
+    # Audio frames: raw passthrough vs header + payload
+    legacy_ws = FakeWebSocket()
+    binary_ws = FakeWebSocket()
+    legacy = ProtocolChannel(legacy_ws, {})
+    binary = ProtocolChannel(binary_ws, {})
+    binary.activate(binary.negotiate(binary_session_start()))
+
+    async def audio_round(channel, ws):
+        for _ in range(ITERATIONS):
+            await channel.send_audio(frame)
+        ws.sent.clear()
+
+    legacy_us = _per_message_us(lambda: audio_round(legacy, legacy_ws))
+    binary_us = _per_message_us(lambda: audio_round(binary, binary_ws))
+    print(f"{'audio (30ms)':<16} {legacy_us:>10.2f} {binary_us:>10.2f} {len(frame):>9} {len(frame) + HEADER.size:>9}")
+
+    assert len(metrics.to_compact_dict()) < len(metrics.to_dict()) / 2
+
+
+if __name__ == "__main__":
+    test_legacy_client_unchanged()
+    test_binary_frames_round_trip()
+    test_benchmark_message_cost()
+    print("✓ Protocol test passed")
@@ -0,0 +1,129 @@
+"""
+Test script for per-device provider routing (A/B experiments)
+Verifies sticky assignment, overrides, weight split and per-arm latency stats,
+and that main.py builds experiment arms with the TTS phrase cache enabled
+"""
+
+import logging
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stt.providers.mock_stt import MockSTTProvider
+from tts.providers.mock_tts import MockTTSProvider
+from session.provider_router import ProviderRouter, ProviderArm
+from monitoring.latency_tracker import LatencyMetrics, LatencyTracker
+from config.settings import Settings
+from tts.cache import TTSCache
+from tts.providers.cached_tts import CachedTTSProvider
+
+ROUTER_CONFIG = """
+stt_provider: mock_stt
+tts_provider: mock_tts
+tts_cache:
+  enabled: true
+experiments:
+  enabled: true
+  arms:
+    fast:
+      weight: 50
+      stt_config: {mock_latency: 0.0}
+    slow:
+      weight: 50
+      tts_config: {mock_latency: 0.0}
+"""
+
+
+def make_arm(name: str, weight: float) -> ProviderArm:
+    """Create an arm backed by mock providers"""
+    return ProviderArm(
+        name=name,
+        stt_provider=MockSTTProvider({'mock_latency': 0.0}),
+        stt_provider_name=f"{name}_stt",
+        tts_provider=MockTTSProvider({'mock_latency': 0.0}),
+        tts_provider_name=f"{name}_tts",
+        weight=weight
+    )
+
+
+def test_provider_router():
+    """Test arm assignment and per-arm aggregation"""
+    router = ProviderRouter(
+        [make_arm('local', 75), make_arm('cloud', 25)],
+        device_overrides={'pinned-device': 'cloud'},
+        salt='test'
+    )
+
+    # Sticky: same device always lands on the same arm
+    first = router.assign('device-42').name
+    assert all(router.assign('device-42').name == first for _ in range(20))
+
+    # Overrides win over the split
+    assert router.assign('pinned-device').name == 'cloud'
+
+    # Split roughly follows weights across many devices
+    counts = Counter(router.assign(f"device-{i}").name for i in range(4000))
+    local_share = counts['local'] / 4000
+    print(f"Arm split over 4000 devices: {dict(counts)} (local={local_share:.2%})")
+    assert 0.70 < local_share < 0.80
+
+    # Unknown override arm is rejected
+    try:
+        ProviderRouter([make_arm('local', 1)], device_overrides={'x': 'missing'})
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+
+    # Tracker aggregates latency per arm
+    tracker = LatencyTracker()
+    for i in range(10):
+        for arm, total in (('local', 2.0 + i * 0.01), ('cloud', 4.0 + i * 0.01)):
+            metrics = LatencyMetrics(session_id=f"s{i}", experiment_arm=arm)
+            metrics.stt_provider = f"{arm}_stt"
+            metrics.total_pipeline = total
+            tracker.record(metrics)
+
+    comparison = tracker.get_arm_comparison()
+    assert comparison['local']['sample_count'] == 10
+    assert comparison['local']['total_median'] < comparison['cloud']['total_median']
+    assert tracker.get_fastest_arm() == 'local'
+    print(f"Fastest arm: {tracker.get_fastest_arm()}")
+
+
+def test_router_with_tts_cache():
+    """Test building arms with STT/TTS overrides while the TTS phrase cache is enabled"""
+    try:
+        import main
+    except ImportError as e:
+        print(f"main.py dependencies unavailable ({e}) - skipping")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "config.yaml"
+        config_path.write_text(ROUTER_CONFIG)
+        main.settings = Settings(str(config_path))
+        main.logger = logging.getLogger(__name__)
+        main.provider_cache.clear()
+        main.tts_cache = TTSCache(memory_max_bytes=1024 * 1024)
+
+        main.stt_provider_name = 'mock_stt'
+        main.stt_provider = main.build_stt_pipeline('mock_stt')
+        main.tts_provider_name = 'mock_tts'
+        main.tts_provider = main.create_tts_provider('mock_tts')
+        router = main.create_provider_router()
+
+    assert set(router.arms) == {'fast', 'slow'}
+    for arm in router.arms.values():
+        assert isinstance(arm.stt_provider, MockSTTProvider)  # Never wrapped in the TTS cache
+        assert isinstance(arm.tts_provider, CachedTTSProvider)
+    print(f"Router with TTS cache: {router}")
+
+
+if __name__ == "__main__":
+    test_provider_router()
+    test_router_with_tts_cache()
+    print("✓ Provider router test passed")
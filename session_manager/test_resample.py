@@ -0,0 +1,145 @@
+"""
+Test script for polyphase resampling
+Checks one-shot vs streaming output, dtype handling and edge behaviour, and
+benchmarks against the previous FFT-based scipy.signal.resample
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy import signal
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio.resample import StreamingResampler, get_filter, resample
+
+# (native TTS rate, VCA rate): Piper and XTTS
+RATE_PAIRS = [(22050, 16000), (24000, 16000)]
+
+
+def _tone(sample_rate: int, seconds: float, frequency: float = 440.0) -> np.ndarray:
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def test_streaming_matches_one_shot():
+    """Test that chunked resampling reproduces the whole-utterance output"""
+    rng = np.random.default_rng(0)
+
+    for orig_sr, target_sr in RATE_PAIRS:
+        audio = rng.uniform(-0.5, 0.5, orig_sr * 2 + 7).astype(np.float32)
+        expected = resample(audio, orig_sr, target_sr)
+        assert len(expected) == -(-len(audio) * target_sr // orig_sr)
+
+        resampler = StreamingResampler(orig_sr, target_sr)
+        parts, position = [], 0
+        while position < len(audio):
+            size = int(rng.integers(1, 4000))  # Irregular chunks, including tiny ones
+            parts.append(resampler.process(audio[position:position + size]))
+            position += size
+        parts.append(resampler.flush())
+        streamed = np.concatenate(parts)
+
+        assert len(streamed) == len(expected)
+        assert np.max(np.abs(streamed - expected)) < 1e-5, (orig_sr, target_sr)
+
+    # The filter is designed once per rate pair
+    assert get_filter(22050, 16000) is get_filter(22050, 16000)
+
+
+def test_dtypes_and_quality():
+    """Test int16 passthrough for Piper and accuracy on a pure tone"""
+    for orig_sr, target_sr in RATE_PAIRS:
+        tone = _tone(orig_sr, 1.0)
+        reference = _tone(target_sr, 1.0)
+
+        resampled = resample(tone, orig_sr, target_sr)
+        assert resampled.dtype == np.float32
+
+        # Interior matches the tone sampled directly at the target rate
+        interior = slice(target_sr // 10, -target_sr // 10)
+        assert np.max(np.abs(resampled[interior] - reference[interior])) < 1e-3
+
+        pcm = (tone * 32767).astype(np.int16)
+        resampled_pcm = StreamingResampler(orig_sr, target_sr)
+        out = np.concatenate([
+            resampled_pcm.process(pcm[:5000]), resampled_pcm.process(pcm[5000:]), resampled_pcm.flush()
+        ])
+        assert out.dtype == np.int16
+        assert np.max(np.abs(out[interior].astype(np.int32) - (reference[interior] * 32767).astype(np.int32))) < 40
+
+    # Same rate: untouched
+    audio = _tone(16000, 0.1)
+    assert resample(audio, 16000, 16000) is audio
+
+
+def benchmark(orig_sr: int, target_sr: int, seconds: float, iterations: int = 10):
+    """Per-utterance time: FFT resample (previous implementation) vs polyphase"""
+    # Odd length, as produced by TTS (prime-ish sizes are the FFT's worst case)
+    audio = np.random.uniform(-0.5, 0.5, int(orig_sr * seconds) + 1).astype(np.float32)
+    num_samples = int(len(audio) * target_sr / orig_sr)
+
+    def fft():
+        return signal.resample(audio, num_samples)
+
+    def poly():
+        return resample(audio, orig_sr, target_sr)
+
+    def streaming():
+        resampler = StreamingResampler(orig_sr, target_sr)
+        chunk = orig_sr // 10  # 100ms chunks
+        parts = [resampler.process(audio[i:i + chunk]) for i in range(0, len(audio), chunk)]
+        parts.append(resampler.flush())
+        return np.concatenate(parts)
+
+    timings = {}
+    for name, run in (('fft', fft), ('poly', poly), ('streaming', streaming)):
+        run()  # Warm-up (filter design is cached)
+        elapsed = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            run()
+            elapsed.append(time.perf_counter() - start)
+        timings[name] = float(np.median(elapsed))
+
+    # Edge ringing: FFT resampling treats the utterance as periodic, so a tone
+    # that doesn't end on a whole cycle wraps its end into the start
+    tone = _tone(orig_sr, seconds, frequency=437.37)
+    reference = _tone(target_sr, seconds, frequency=437.37)
+    start = slice(0, target_sr // 100)  # First 10ms
+    fft_edge = np.max(np.abs(signal.resample(tone, len(reference))[start] - reference[start]))
+    poly_edge = np.max(np.abs(resample(tone, orig_sr, target_sr)[start] - reference[start]))
+
+    print(
+        f"  {orig_sr}→{target_sr} {seconds:5.1f}s: "
+        f"fft {timings['fft'] * 1000:7.2f}ms  poly {timings['poly'] * 1000:6.2f}ms  "
+        f"streaming {timings['streaming'] * 1000:6.2f}ms  "
+        f"(first 10ms error fft {fft_edge:.4f} / poly {poly_edge:.4f})"
+    )
+    timings['fft_edge'], timings['poly_edge'] = fft_edge, poly_edge
+    return timings
+
+
+def test_benchmark_vs_fft():
+    """Benchmark polyphase against the FFT resample it replaces"""
+    print("Resampling time per utterance, median:")
+    results = [
+        benchmark(orig_sr, target_sr, seconds)
+        for orig_sr, target_sr in RATE_PAIRS
+        for seconds in (2.0, 10.0, 30.0)
+    ]
+    for timings in results:
+        assert timings['poly'] < timings['fft']
+        assert timings['poly_edge'] < timings['fft_edge']
+        # Streaming pays per-chunk overhead but must stay well within real time
+        assert timings['streaming'] < max(timings['poly'] * 10, 0.05)
+
+
+if __name__ == "__main__":
+    test_streaming_matches_one_shot()
+    test_dtypes_and_quality()
+    test_benchmark_vs_fft()
+    print("✓ Resampling test passed")
@@ -0,0 +1,57 @@
+"""
+Test script for the compiled stop phrase matcher
+Checks word-boundary matching, STT punctuation/apostrophe variants and
+streaming partial transcripts split across segments
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from session.stop_phrases import StopPhraseDetector
+
+
+def test_stop_phrase_matching():
+    """Test single-pass matching on full transcripts"""
+    detector = StopPhraseDetector(["that's all", "goodbye", "that's all for now", "stop listening"])
+
+    assert detector.match("Okay, goodbye!") == "goodbye"
+    assert detector.match("GOODBYE") == "goodbye"
+    assert detector.match("That’s all.") == "that's all"  # curly apostrophe from STT
+    assert detector.match("that's, all") == "that's all"
+    assert detector.match("Thanks, that's all for now") == "that's all for now"
+    assert detector.match("Stop  listening please") == "stop listening"
+
+    # Word boundaries: no match inside other words
+    assert detector.match("I sent the goodbyes") is None
+    assert detector.match("what's all this") is None
+    assert detector.match("") is None
+
+    # Backward-compatible helpers
+    assert detector.is_stop_phrase("ok goodbye")
+    assert detector.get_matched_phrase("hello") == ""
+    assert StopPhraseDetector([]).match("goodbye") is None
+
+
+def test_stop_phrase_streaming():
+    """Test phrases split across streamed segments"""
+    detector = StopPhraseDetector(["that's all", "goodbye"])
+
+    stream = detector.stream()
+    assert stream.feed("Remind me to call mum, and") is None
+    assert stream.feed("that's") is None
+    assert stream.feed("all thanks") == "that's all"
+    assert stream.feed("more text") == "that's all"  # sticky once matched
+
+    # Carry-over cut mid-word must not create a false boundary
+    stream = detector.stream()
+    assert stream.feed("xxxxxxxxxxxxxxxxxxxxregoodbye") is None
+    assert stream.feed("next") is None
+
+
+if __name__ == "__main__":
+    test_stop_phrase_matching()
+    test_stop_phrase_streaming()
+    print("✓ Stop phrase test passed")
@@ -0,0 +1,266 @@
+"""
+Test script for streaming STT segments
+Checks the default whole-result stream, that a provider decoding
+segment by segment delivers early segments and stops when the caller
+closes the stream, that the chunked, fallback and hedged wrappers
+forward the inner provider's segments instead of waiting for the result,
+and that LocalWhisperProvider (driven through a stand-in faster_whisper
+module) reports confidence and streams segments as they are decoded
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+
+from audio.wav import float32_to_wav
+from stt.base import STTProvider, TranscriptionResult, TranscriptionSegment
+from stt.providers.chunked_stt import ChunkedSTTProvider
+from stt.providers.fallback_stt import FallbackSTTProvider
+from stt.providers.hedged_stt import HedgedSTTProvider
+from stt.providers.mock_stt import MockSTTProvider
+from utils.circuit_breaker import CircuitBreaker
+
+
+class SlowSegmentsSTTProvider(STTProvider):
+    """Stand-in incremental decoder: one segment every `delay` seconds (default 0.1)"""
+
+    SEGMENTS = ["hello there", "that's all", "and some more words", "until the end"]
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.delay = config.get('delay', 0.1)
+        self.fail = config.get('fail', False)  # Raise before the first segment
+        self.decoded = 0
+
+    async def transcribe(self, audio_bytes: bytes) -> TranscriptionResult:
+        stream = self.transcribe_stream(audio_bytes)
+        async for _ in stream:
+            pass
+        return stream.result
+
+    async def _stream_segments(self, audio_bytes: bytes):
+        for i, text in enumerate(self.SEGMENTS):
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise ConnectionError("stand-in provider unavailable")
+            self.decoded += 1
+            yield TranscriptionSegment(text=text, start=i, end=i + 1, confidence=0.9)
+        yield TranscriptionResult(text=" ".join(self.SEGMENTS), confidence=0.9, duration=4.0)
+
+
+async def run_streams():
+    """Consume a default stream and an incremental one with an early stop"""
+    # Default: transcribe() result as a single segment
+    mock = MockSTTProvider({'mock_latency': 0.01, 'mock_text': 'what time is it'})
+    stream = mock.transcribe_stream(b'\x00' * 3200)
+    segments = [segment async for segment in stream]
+    assert [s.text for s in segments] == ['what time is it']
+    assert stream.result.text == 'what time is it'
+
+    # Incremental: full iteration yields every segment then the result
+    provider = SlowSegmentsSTTProvider({})
+    stream = provider.transcribe_stream(b'')
+    texts = [segment.text async for segment in stream]
+    assert texts == SlowSegmentsSTTProvider.SEGMENTS
+    assert stream.result.duration == 4.0
+
+    # Early stop: act on the second segment, rest of the decode is skipped
+    provider = SlowSegmentsSTTProvider({})
+    stream = provider.transcribe_stream(b'')
+    start = time.monotonic()
+    partial = ""
+    async for segment in stream:
+        partial = f"{partial} {segment.text}".strip()
+        if "that's all" in partial:
+            break
+    await stream.aclose()
+    elapsed = time.monotonic() - start
+
+    print(f"Stop phrase seen after {elapsed:.2f}s: '{partial}' ({provider.decoded}/4 segments decoded)")
+    assert provider.decoded == 2
+    assert stream.result is None
+    assert elapsed < 0.3
+
+
+async def consume(stream, stop_after: int = None):
+    """Read a stream (closing it after stop_after segments); returns (texts, seconds to first segment)"""
+    start = time.monotonic()
+    texts, first = [], None
+    async for segment in stream:
+        first = first if first is not None else time.monotonic() - start
+        texts.append(segment.text)
+        if len(texts) == stop_after:
+            break
+    await stream.aclose()
+    return texts, first
+
+
+async def run_wrapper_streams():
+    """Stream through the chunked, fallback and hedged wrappers"""
+    short_wav = float32_to_wav(np.zeros(16000, dtype=np.float32), 16000)
+
+    # Chunked: short utterances stream straight from the inner provider
+    inner = SlowSegmentsSTTProvider({})
+    chunked = ChunkedSTTProvider(inner, {'min_duration': 30.0})
+    texts, first = await consume(chunked.transcribe_stream(short_wav), stop_after=2)
+    assert texts == SlowSegmentsSTTProvider.SEGMENTS[:2] and first < 0.2
+    assert inner.decoded == 2
+
+    # Fallback: the primary's stream is forwarded under the breaker...
+    breaker = CircuitBreaker('stt:test', failure_threshold=1)
+    primary = SlowSegmentsSTTProvider({})
+    fallback = FallbackSTTProvider(
+        primary, MockSTTProvider({'mock_latency': 0.01, 'mock_text': 'fallback text'}),
+        breaker, {'timeout': 5.0}, primary_name='remote', fallback_name='local'
+    )
+    stream = fallback.transcribe_stream(b'')
+    texts, first = await consume(stream)
+    assert texts == SlowSegmentsSTTProvider.SEGMENTS and first < 0.2
+    assert stream.result.provider == 'remote' and breaker.total_calls == 1
+
+    # ...stopping early releases the call without a verdict...
+    texts, _ = await consume(fallback.transcribe_stream(b''), stop_after=1)
+    assert texts == SlowSegmentsSTTProvider.SEGMENTS[:1] and breaker.total_failures == 0
+
+    # ...and a primary failing before its first segment is replaced by the fallback
+    primary.fail = True
+    stream = fallback.transcribe_stream(b'')
+    texts, _ = await consume(stream)
+    assert texts == ['fallback text'] and stream.result.provider == 'local'
+    assert breaker.total_failures == 1 and fallback.fallback_calls == 1
+
+    # Hedged: a primary streaming before the deadline is forwarded, not hedged
+    primary = SlowSegmentsSTTProvider({})
+    hedged = HedgedSTTProvider(
+        primary, MockSTTProvider({'mock_latency': 0.05, 'mock_text': 'secondary text'}),
+        {'initial_delay': 0.3}, primary_name='local', secondary_name='remote'
+    )
+    stream = hedged.transcribe_stream(b'')
+    texts, first = await consume(stream)
+    assert texts == SlowSegmentsSTTProvider.SEGMENTS and first < 0.2
+    assert stream.result.provider == 'local' and not stream.result.hedged
+    assert hedged.hedges == 0 and len(hedged.primary_latencies) == 1
+
+    # A primary whose first segment is late loses to the secondary (censored sample)
+    primary.delay = 1.0
+    stream = hedged.transcribe_stream(b'')
+    texts, _ = await consume(stream)
+    assert texts == ['secondary text'] and stream.result.provider == 'remote' and stream.result.hedged
+    assert hedged.secondary_wins == 1 and hedged.censored_samples == 1
+    assert hedged.primary_latencies[-1] >= 0.3
+
+
+class StandInWhisperModel:
+    """Stand-in faster_whisper.WhisperModel: lazily decodes one segment per 0.1s"""
+
+    SEGMENTS = [(" Hello there.", -1.0), (" That's all.", -3.0), (" And more.", -2.0), (" The end.", -2.0)]
+
+    @classmethod
+    def text(cls) -> str:
+        """Transcript the provider should build from all segments"""
+        return " ".join(text for text, _ in cls.SEGMENTS).strip()
+
+    def __init__(self, model_size, **kwargs):
+        self.model_size = model_size
+        self.decoded = 0
+        self.finished = threading.Event()
+
+    def transcribe(self, audio, language=None, beam_size=5, vad_filter=True):
+        def segments():
+            try:
+                for i, (text, avg_logprob) in enumerate(self.SEGMENTS):
+                    time.sleep(0.1)
+                    self.decoded += 1
+                    yield types.SimpleNamespace(text=text, start=float(i), end=i + 1.0, avg_logprob=avg_logprob)
+            finally:
+                self.finished.set()
+
+        return segments(), types.SimpleNamespace(language=language or 'en')
+
+
+def local_whisper_provider():
+    """Real LocalWhisperProvider on the stand-in model (call inside the sys.modules patch)"""
+    from stt.providers.local_whisper import LocalWhisperProvider
+
+    return LocalWhisperProvider({'model_size': 'tiny', 'device': 'cpu', 'compute_type': 'int8'})
+
+
+async def run_local_whisper_stream(provider):
+    """Stream the stand-in decode in full, then stop one early"""
+    model = provider.models['tiny']
+    wav = float32_to_wav(np.zeros(16000, dtype=np.float32), 16000)
+
+    # Segments arrive one at a time while the decode is still running
+    stream = provider.transcribe_stream(wav)
+    start = time.monotonic()
+    arrivals, confidences = [], []
+    async for segment in stream:
+        arrivals.append(time.monotonic() - start)
+        confidences.append(segment.confidence)
+    assert len(arrivals) == 4 and arrivals[0] < 0.2 and arrivals[-1] > 0.35
+    assert [round(c, 2) for c in confidences] == [0.9, 0.8, 0.8, 0.8]  # Running mean of avg_logprob
+    assert stream.result.text == StandInWhisperModel.text()
+    assert abs(stream.result.confidence - 0.8) < 1e-9
+    assert provider.pending == 0
+
+    # Closing after the first segment stops the decode after its current segment
+    model.decoded = 0
+    model.finished.clear()
+    stream = provider.transcribe_stream(wav)
+    async for segment in stream:
+        break
+    await stream.aclose()
+    assert segment.text == "Hello there." and stream.result is None
+    await asyncio.get_event_loop().run_in_executor(None, model.finished.wait, 2.0)
+    assert model.decoded <= 2
+    assert provider.pending == 0
+
+
+def test_local_whisper_decode():
+    """Test _decode confidence and the incremental _stream_segments of LocalWhisperProvider"""
+    faster_whisper = types.ModuleType("faster_whisper")
+    faster_whisper.WhisperModel = StandInWhisperModel
+    with mock.patch.dict(sys.modules, {"faster_whisper": faster_whisper}):
+        provider = local_whisper_provider()
+
+        # _decode consumes the segment generator once and keeps its confidence
+        audio = np.zeros(16000, dtype=np.float32)
+        segments = []
+        result = provider._decode(audio, 1.0, 'tiny', 5, on_segment=segments.append)
+        assert result.text == StandInWhisperModel.text()
+        assert abs(result.confidence - 0.8) < 1e-9  # mean avg_logprob -2.0 -> 0.8, not 0
+        assert result.model == 'tiny' and provider.model_usage['tiny'] == 1
+        assert [s.text for s in segments] == ["Hello there.", "That's all.", "And more.", "The end."]
+
+        # A stop event set mid-decode ends it after the current segment
+        stop = threading.Event()
+        result = provider._decode(audio, 1.0, 'tiny', 5, on_segment=lambda s: stop.set(), stop=stop)
+        assert result.text == "Hello there." and abs(result.confidence - 0.9) < 1e-9
+
+        asyncio.run(run_local_whisper_stream(provider))
+
+
+def test_stt_streaming():
+    """Test segment streams and early stopping"""
+    asyncio.run(run_streams())
+
+
+def test_wrapper_streaming():
+    """Test that wrappers forward segment streams"""
+    asyncio.run(run_wrapper_streams())
+
+
+if __name__ == "__main__":
+    test_stt_streaming()
+    test_wrapper_streaming()
+    test_local_whisper_decode()
+    print("✓ STT streaming test passed")
@@ -0,0 +1,266 @@
+"""
+Test script for the TTS phrase cache
+Checks the byte-bounded LRU, the disk tier, voice-dependent keys,
+sentence-level reuse, streaming through the cache, that mp3 from
+synthesize() and streamed PCM are cached separately, that mixed formats
+don't re-synthesize the whole response and that fallback audio is never
+cached
+"""
+
+import asyncio
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio.wav import float32_to_wav, wav_to_float32
+from tts.base import TTSChunk, TTSProvider, TTSResult
+from tts.cache import TTSCache, make_cache_key
+from tts.providers.cached_tts import CachedTTSProvider, split_sentences
+
+
+class CountingTTSProvider(TTSProvider):
+    """Stand-in provider: renders len(text) * 10ms of a constant tone, counts calls"""
+
+    def __init__(self, served_by=None):
+        super().__init__({})
+        self.calls = []
+        self.served_by = served_by
+
+    async def synthesize(self, text: str) -> TTSResult:
+        self.calls.append(text)
+        await asyncio.sleep(0.01)
+        samples = np.full(len(text) * 160, 0.1, dtype=np.float32)
+        return TTSResult(
+            audio_bytes=float32_to_wav(samples, 16000),
+            format='wav',
+            sample_rate=16000,
+            duration=len(samples) / 16000,
+            provider=self.served_by
+        )
+
+
+class StreamingTTSProvider(CountingTTSProvider):
+    """Stand-in streaming provider: emits each phrase as two PCM chunks"""
+
+    supports_streaming = True
+
+    def __init__(self):
+        super().__init__()
+        self.streamed = []
+
+    async def synthesize_stream(self, text: str):
+        self.streamed.append(text)
+        pcm = (np.full(len(text) * 160, 1000, dtype=np.int16)).tobytes()
+        half = len(pcm) // 4 * 2
+        for part in (pcm[:half], pcm[half:]):
+            await asyncio.sleep(0.005)
+            yield TTSChunk(audio_bytes=part, format='pcm', sample_rate=16000)
+
+
+class Mp3StreamingTTSProvider(StreamingTTSProvider):
+    """Stand-in OpenAI: mp3 from synthesize(), PCM from the stream; `fallback` serves misses as WAV"""
+
+    def __init__(self):
+        super().__init__()
+        self.fallback = False
+
+    async def synthesize(self, text: str) -> TTSResult:
+        if self.fallback:
+            self.served_by = "piper_tts"
+            return await super().synthesize(text)
+        self.calls.append(text)
+        return TTSResult(audio_bytes=b'ID3' + text.encode(), format='mp3', sample_rate=24000, duration=1.0)
+
+
+def _result(size: int) -> TTSResult:
+    return TTSResult(audio_bytes=b'\x01' * size, format='pcm', sample_rate=16000)
+
+
+def test_memory_lru_and_keys():
+    """Test byte-bounded eviction and voice-dependent keys"""
+    cache = TTSCache(memory_max_bytes=1000)
+    for i in range(3):
+        cache.put(f"k{i}", _result(400))
+
+    # 1200 bytes > 1000: the least recently used entry is gone
+    assert cache.get("k0") is None
+    assert cache.get("k2") is not None
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1 and stats['memory_entries'] == 2
+    assert stats['memory_hits'] == 1 and stats['misses'] == 1
+
+    # Touching k1 makes k2 the eviction victim
+    cache.get("k1")
+    cache.put("k3", _result(400))
+    assert cache.get("k2") is None and cache.get("k1") is not None
+
+    # Normalized text shares a key; voice/speed changes don't
+    base = make_cache_key("openai_tts", {'voice': 'nova', 'speed': 1.0}, "Hello  there.")
+    assert base == make_cache_key("openai_tts", {'speed': 1.0, 'voice': 'nova'}, " Hello there. ")
+    assert base != make_cache_key("openai_tts", {'voice': 'alloy', 'speed': 1.0}, "Hello there.")
+    assert base != make_cache_key("openai_tts", {'voice': 'nova', 'speed': 1.25}, "Hello there.")
+    assert base != make_cache_key("piper_tts", {'voice': 'nova', 'speed': 1.0}, "Hello there.")
+
+
+def test_disk_tier():
+    """Test disk persistence, promotion to memory and disk trimming"""
+    with tempfile.TemporaryDirectory() as disk_dir:
+        cache = TTSCache(memory_max_bytes=10_000, disk_dir=disk_dir, disk_max_bytes=2000)
+        cache.put("a", _result(800))
+
+        # A new cache (e.g., after restart) finds it on disk
+        restarted = TTSCache(memory_max_bytes=10_000, disk_dir=disk_dir, disk_max_bytes=2000)
+        assert restarted.get_memory("a") is None
+        hit = restarted.get_disk("a")
+        assert hit is not None and len(hit.audio_bytes) == 800 and hit.sample_rate == 16000
+        assert restarted.get_memory("a") is not None  # Promoted
+        assert restarted.get_stats()['disk_hits'] == 1
+
+        # Over disk budget: oldest entries are removed
+        for key in ["b", "c", "d"]:
+            restarted.put(key, _result(800))
+        assert restarted.disk_bytes <= 2000
+        assert len(list(Path(disk_dir).glob("*.audio"))) == 2
+
+    # Concurrent writes from executor threads keep disk_bytes equal to what's on disk
+    with tempfile.TemporaryDirectory() as disk_dir:
+        cache = TTSCache(disk_dir=disk_dir, disk_max_bytes=20_000)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: cache.put(f"k{i}", _result(500)), range(200)))
+        on_disk = sum(path.stat().st_size for path in Path(disk_dir).glob("*.audio"))
+        assert cache.disk_bytes == on_disk and on_disk <= 20_000
+
+
+def test_sentence_level_reuse():
+    """Test that only new sentences are synthesized and audio is joined in order"""
+    async def run():
+        inner = CountingTTSProvider()
+        provider = CachedTTSProvider(
+            inner, TTSCache(), {'sentence_level': True},
+            provider_name="piper_tts", voice_params={'length_scale': 1.0}
+        )
+
+        assert split_sentences("Okay Warren. Lights are on! Anything else?") == [
+            "Okay Warren.", "Lights are on!", "Anything else?"
+        ]
+
+        first = await provider.synthesize("Okay Warren. Lights are on.")
+        assert first.cache_hits == 0 and first.cache_misses == 2
+        assert len(inner.calls) == 2
+
+        second = await provider.synthesize("Okay Warren. The door is locked.")
+        assert second.cache_hits == 1 and second.cache_misses == 1
+        assert inner.calls[-1] == "The door is locked."
+
+        # Joined audio = sentence audio back to back
+        audio, sample_rate = wav_to_float32(second.audio_bytes)
+        expected = len("Okay Warren.") * 160 + len("The door is locked.") * 160
+        assert sample_rate == 16000 and len(audio) == expected
+        assert abs(second.duration - expected / 16000) < 1e-6
+
+        third = await provider.synthesize("Okay Warren. Lights are on.")
+        assert third.cache_hits == 2 and third.cache_misses == 0
+        assert len(inner.calls) == 3
+        assert third.audio_bytes == first.audio_bytes
+
+        stats = provider.get_stats()['cache']
+        print(f"Cache stats: {stats}")
+        assert stats['hit_rate'] == 0.5
+
+    asyncio.run(run())
+
+
+def test_fallback_audio_not_cached():
+    """Test that audio served by another provider isn't stored under the primary key"""
+    async def run():
+        inner = CountingTTSProvider(served_by="piper_tts")
+        provider = CachedTTSProvider(inner, TTSCache(), {}, provider_name="openai_tts")
+
+        await provider.synthesize("Hello.")
+        await provider.synthesize("Hello.")
+        assert len(inner.calls) == 2
+        assert provider.cache.get_stats()['memory_entries'] == 0
+
+    asyncio.run(run())
+
+
+def test_streaming_through_cache():
+    """Test that the cache keeps streaming on and serves cached sentences as chunks"""
+    async def run():
+        inner = StreamingTTSProvider()
+        provider = CachedTTSProvider(inner, TTSCache(), {'sentence_level': True}, provider_name="xtts")
+        assert provider.supports_streaming
+        assert not CachedTTSProvider(CountingTTSProvider(), TTSCache(), {}, provider_name="x").supports_streaming
+
+        first = [chunk async for chunk in provider.synthesize_stream("Okay Warren. Lights are on.")]
+        assert len(first) == 4 and inner.streamed == ["Okay Warren.", "Lights are on."]
+
+        # Cached sentences come back as one PCM chunk each; only the new one streams
+        second = [chunk async for chunk in provider.synthesize_stream("Okay Warren. The door is locked.")]
+        assert inner.streamed[-1] == "The door is locked." and len(inner.streamed) == 3
+        assert len(second) == 3
+        assert second[0].audio_bytes == first[0].audio_bytes + first[1].audio_bytes
+        assert all(chunk.format == 'pcm' and chunk.sample_rate == 16000 for chunk in second)
+
+        # Streamed audio is stored as WAV under its own key: synthesize() has its own entries
+        result = await provider.synthesize("Lights are on.")
+        assert result.cache_misses == 1 and inner.calls == ["Lights are on."]
+        again = [chunk async for chunk in provider.synthesize_stream("Lights are on.")]
+        assert len(again) == 1 and len(inner.streamed) == 3
+        audio, _ = wav_to_float32(provider.cache.get(
+            make_cache_key("xtts", {}, "Lights are on.", 'wav')
+        ).audio_bytes)
+        assert len(audio) == len("Lights are on.") * 160
+
+    asyncio.run(run())
+
+
+def test_stream_and_synthesize_formats():
+    """Test that mp3 entries survive streaming and mixed formats only re-render mismatched hits"""
+    async def run():
+        inner = Mp3StreamingTTSProvider()
+        provider = CachedTTSProvider(inner, TTSCache(), {'sentence_level': True}, provider_name="openai_tts")
+
+        first = await provider.synthesize("Okay Warren. Lights are on.")
+        assert first.format == 'mp3' and first.cache_misses == 2
+
+        # Streaming the same sentences doesn't overwrite the mp3 entries
+        [chunk async for chunk in provider.synthesize_stream("Okay Warren. Lights are on.")]
+        assert len(inner.streamed) == 2
+
+        # Partially cached: hits and the new sentence are all mp3, joined without re-synthesis
+        result = await provider.synthesize("Okay Warren. The door is locked.")
+        assert result.format == 'mp3' and result.cache_hits == 1 and result.cache_misses == 1
+        assert inner.calls[2:] == ["The door is locked."]
+        assert result.audio_bytes == b'ID3Okay Warren.ID3The door is locked.'
+
+        # Fallback serves the miss as WAV: only the mp3 hit is re-rendered, not the whole response
+        inner.fallback = True
+        result = await provider.synthesize("Okay Warren. The garage is open.")
+        assert result.format == 'wav' and result.cache_misses == 2
+        assert inner.calls[3:] == ["The garage is open.", "Okay Warren."]
+        audio, _ = wav_to_float32(result.audio_bytes)
+        assert len(audio) == len("Okay Warren.The garage is open.") * 160
+
+        # The good mp3 entry is kept
+        inner.fallback = False
+        result = await provider.synthesize("Okay Warren.")
+        assert result.format == 'mp3' and result.cache_hits == 1
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    test_memory_lru_and_keys()
+    test_disk_tier()
+    test_sentence_level_reuse()
+    test_fallback_audio_not_cached()
+    test_streaming_through_cache()
+    test_stream_and_synthesize_formats()
+    print("✓ TTS cache test passed")
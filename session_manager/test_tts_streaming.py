@@ -0,0 +1,131 @@
+"""
+Test script for streaming TTS
+Uses a slow chunk generator standing in for XTTS inference_stream (24kHz
+float32 chunks) to check time to first chunk, incremental resampling to
+16kHz, early close, and the default single-chunk stream for other providers
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio.resample import resample
+from audio.wav import float32_to_wav
+from tts.base import TTSProvider, TTSResult
+from tts.streaming import float32_to_pcm16, stream_pcm_chunks
+
+NATIVE_RATE = 24000
+CHUNK_SECONDS = 0.25
+CHUNK_DELAY = 0.05  # Generation time per chunk
+
+
+def _utterance(chunks: int) -> np.ndarray:
+    t = np.arange(int(NATIVE_RATE * CHUNK_SECONDS * chunks)) / NATIVE_RATE
+    return (0.4 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+class ChunkGenerator:
+    """inference_stream() stand-in: yields the utterance in slow chunks"""
+
+    def __init__(self, chunks: int = 8):
+        self.audio = _utterance(chunks)
+        self.produced = 0
+
+    def __call__(self):
+        size = int(NATIVE_RATE * CHUNK_SECONDS)
+        for start in range(0, len(self.audio), size):
+            time.sleep(CHUNK_DELAY)
+            self.produced += 1
+            yield self.audio[start:start + size]
+
+
+def test_first_chunk_before_generation_finishes():
+    """Test that audio is emitted as generated and matches whole-utterance resampling"""
+    async def run():
+        generator = ChunkGenerator(chunks=8)
+        start = time.monotonic()
+        first_chunk_at = None
+        pcm = []
+        async for chunk in stream_pcm_chunks(generator, NATIVE_RATE, 16000):
+            if first_chunk_at is None:
+                first_chunk_at = time.monotonic() - start
+            assert chunk.format == 'pcm' and chunk.sample_rate == 16000
+            pcm.append(chunk.audio_bytes)
+        total = time.monotonic() - start
+
+        print(f"Streaming: first chunk {first_chunk_at * 1000:.0f}ms, total {total * 1000:.0f}ms")
+        assert first_chunk_at < CHUNK_DELAY * 3
+        assert total >= CHUNK_DELAY * 8
+
+        # Same audio as resampling the finished utterance
+        streamed = np.frombuffer(b"".join(pcm), dtype=np.int16)
+        expected = np.frombuffer(float32_to_pcm16(resample(generator.audio, NATIVE_RATE, 16000)), dtype=np.int16)
+        assert len(streamed) == len(expected)
+        assert np.max(np.abs(streamed.astype(np.int32) - expected)) <= 1
+
+    asyncio.run(run())
+
+
+def test_early_close_stops_generation():
+    """Test that closing the stream (e.g., barge-in) stops the generator"""
+    async def run():
+        generator = ChunkGenerator(chunks=20)
+        stream = stream_pcm_chunks(generator, NATIVE_RATE, 16000)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        await asyncio.sleep(CHUNK_DELAY * 4)
+        assert generator.produced < 5
+
+    asyncio.run(run())
+
+
+def test_generator_error_propagates():
+    """Test that a failure in the generation thread reaches the consumer"""
+    def failing():
+        yield np.zeros(1000, dtype=np.float32)
+        raise RuntimeError("CUDA out of memory")
+
+    async def run():
+        try:
+            async for _ in stream_pcm_chunks(failing, NATIVE_RATE, 16000):
+                pass
+        except RuntimeError as e:
+            return str(e)
+
+    assert asyncio.run(run()) == "CUDA out of memory"
+
+
+class WavTTSProvider(TTSProvider):
+    """Non-streaming provider returning WAV"""
+
+    async def synthesize(self, text: str) -> TTSResult:
+        audio = np.full(1600, 0.25, dtype=np.float32)
+        return TTSResult(audio_bytes=float32_to_wav(audio, 16000), format='wav', sample_rate=16000)
+
+
+def test_default_stream_is_single_pcm_chunk():
+    """Test the base synthesize_stream() for providers that can't stream"""
+    async def run():
+        provider = WavTTSProvider({})
+        assert not provider.supports_streaming
+        return [chunk async for chunk in provider.synthesize_stream("Hello.")]
+
+    chunks = asyncio.run(run())
+    assert len(chunks) == 1
+    assert chunks[0].format == 'pcm' and chunks[0].sample_rate == 16000
+    assert len(chunks[0].audio_bytes) == 1600 * 2
+
+
+if __name__ == "__main__":
+    test_first_chunk_before_generation_finishes()
+    test_early_close_stops_generation()
+    test_generator_error_propagates()
+    test_default_stream_is_single_pcm_chunk()
+    print("✓ TTS streaming test passed")
@@ -0,0 +1,57 @@
+"""
+Test script for confidence-gated two-pass STT
+Simulates a fast greedy pass and a slow full pass and checks that only
+low-confidence utterances are re-run and that savings are reported
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stt.base import TranscriptionResult
+from stt.two_pass import TwoPassGate
+
+
+def fake_decode(confidence: float, seconds: float, text: str):
+    """Decode stand-in that takes `seconds` and returns a fixed confidence"""
+    def decode():
+        time.sleep(seconds)
+        return TranscriptionResult(text=text, confidence=confidence, model=text)
+    return decode
+
+
+def test_two_pass_gate():
+    """Test gating, pass-2 rate and savings estimate"""
+    gate = TwoPassGate({'enabled': True, 'confidence_threshold': 0.6})
+
+    # 4 confident short commands, 1 mumbled one (1s of audio each)
+    confidences = [0.9, 0.8, 0.95, 0.7, 0.3]
+    results = [
+        gate.transcribe(
+            1.0,
+            fake_decode(confidence, 0.01, 'fast'),
+            fake_decode(0.9, 0.05, 'full')
+        )
+        for confidence in confidences
+    ]
+
+    assert [r.model for r in results] == ['fast'] * 4 + ['full']
+    assert [r.passes for r in results] == [1, 1, 1, 1, 2]
+
+    stats = gate.get_stats()
+    print(f"Two-pass stats: {stats}")
+    assert stats['pass2_rate'] == 0.2
+    # 4 requests avoided a ~50ms decode at ~10ms each
+    assert 0.1 < stats['estimated_time_saved'] < 0.2
+    assert stats['estimated_net_saved'] < stats['estimated_time_saved']
+
+    # Disabled gate reports nothing
+    assert TwoPassGate().get_stats() == {}
+
+
+if __name__ == "__main__":
+    test_two_pass_gate()
+    print("✓ Two-pass STT test passed")
@@ -0,0 +1,88 @@
+"""
+Test script for compressed STT uploads
+Checks FLAC/Opus encoding of the test WAV and upload-phase timing against a
+local HTTP server
+"""
+
+import asyncio
+import io
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import httpx
+
+from audio.encoding import encode_wav, soundfile
+from utils.http_timing import TimingTransport, track_request_timing
+
+
+class SlowEchoHandler(BaseHTTPRequestHandler):
+    """Reads the upload, 'processes' for 100ms, returns its size"""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        threading.Event().wait(0.1)
+        payload = str(len(body)).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+async def upload(url: str, data: bytes):
+    """Upload data through TimingTransport"""
+    async with httpx.AsyncClient(transport=TimingTransport()) as client:
+        with track_request_timing() as timing:
+            response = await client.post(url, content=data)
+    return response, timing
+
+
+def test_upload_encoding():
+    """Test audio compression and upload timing"""
+    wav_bytes = (Path(__file__).parent / 'test_audio_16k.wav').read_bytes()
+
+    for codec in ('wav', 'flac', 'opus'):
+        encoded = encode_wav(wav_bytes, codec)
+        print(
+            f"{codec:>5}: {len(encoded.data):>7} bytes "
+            f"({encoded.compression_ratio:.1f}x, {encoded.encode_time * 1000:.1f}ms)"
+        )
+        if soundfile is not None and codec != 'wav':
+            assert encoded.format == codec
+            assert encoded.compression_ratio > 1.2
+
+    # FLAC must be lossless
+    if soundfile is not None:
+        flac = encode_wav(wav_bytes, 'flac')
+        decoded, _ = soundfile.read(io.BytesIO(flac.data), dtype='int16')
+        original, _ = soundfile.read(io.BytesIO(wav_bytes), dtype='int16')
+        assert (decoded == original).all()
+
+    # Upload timing separates sending from server processing
+    server = HTTPServer(('127.0.0.1', 0), SlowEchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/upload"
+        response, timing = asyncio.run(upload(url, wav_bytes))
+        assert response.text == str(len(wav_bytes))
+        print(
+            f"Upload: {timing.upload_time * 1000:.1f}ms, "
+            f"server: {timing.server_time * 1000:.1f}ms"
+        )
+        assert timing.upload_time is not None and timing.upload_time < 0.1
+        assert timing.server_time >= 0.09
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_upload_encoding()
+    print("✓ Upload encoding test passed")
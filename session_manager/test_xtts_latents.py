@@ -0,0 +1,127 @@
+"""
+Test script for the XTTS speaker latent cache
+Runs on CPU with a small numpy stand-in for the XTTS model (same
+get_conditioning_latents / inference interface), so no model download or
+GPU is needed
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from audio.wav import float32_to_wav, wav_to_float32
+from tts.xtts_latents import SpeakerLatentCache
+
+TEST_AUDIO = Path(__file__).parent / "test_audio_16k.wav"
+
+
+class StandInXTTS:
+    """Tiny XTTS stand-in: latents are summary statistics of the reference audio"""
+
+    def __init__(self, conditioning_cost: float = 0.2):
+        self.conditioning_cost = conditioning_cost
+        self.conditioning_calls = 0
+
+    def get_conditioning_latents(self, audio_path):
+        self.conditioning_calls += 1
+        time.sleep(self.conditioning_cost)  # Stands in for the reference encoder
+        audio = np.concatenate([wav_to_float32(Path(path).read_bytes())[0] for path in audio_path])
+        frames = audio[:len(audio) // 1024 * 1024].reshape(-1, 1024)
+        gpt_cond_latent = np.abs(np.fft.rfft(frames, axis=1))[:, :32].mean(axis=0, keepdims=True)
+        speaker_embedding = np.array([[frames.std(), np.abs(frames).mean()]], dtype=np.float32)
+        return gpt_cond_latent.astype(np.float32), speaker_embedding
+
+    def inference(self, text, language, gpt_cond_latent, speaker_embedding, speed=1.0):
+        samples = int(len(text) * 0.06 * 24000 / speed)
+        t = np.arange(samples) / 24000
+        pitch = 100 + 1000 * float(speaker_embedding[0, 0])
+        return {'wav': (0.3 * np.sin(2 * np.pi * pitch * t)).astype(np.float32)}
+
+
+def test_latents_computed_once():
+    """Test memory reuse, disk reuse after restart and recompute on file change"""
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = Path(tmp) / "voice.wav"
+        shutil.copy(TEST_AUDIO, reference)
+        disk_dir = Path(tmp) / "latents"
+
+        model = StandInXTTS()
+        cache = SpeakerLatentCache(disk_dir=str(disk_dir))
+
+        start = time.monotonic()
+        first = cache.get(model, str(reference), "xtts_v2")
+        cold = time.monotonic() - start
+
+        start = time.monotonic()
+        for _ in range(10):
+            again = cache.get(model, str(reference), "xtts_v2")
+        warm = (time.monotonic() - start) / 10
+
+        print(f"Latents: cold {cold * 1000:.1f}ms, cached {warm * 1000:.3f}ms")
+        assert model.conditioning_calls == 1
+        assert again is first
+        assert warm < cold / 20
+
+        # Inference with cached latents
+        wav = model.inference("Hello Warren.", "en", *again)['wav']
+        assert len(wav) > 0
+
+        # Restart: a new cache loads from disk (same file content, different name)
+        renamed = Path(tmp) / "voice_copy.wav"
+        shutil.copy(reference, renamed)
+        restarted = SpeakerLatentCache(disk_dir=str(disk_dir))
+        loaded = restarted.get(model, str(renamed), "xtts_v2")
+        assert model.conditioning_calls == 1
+        assert restarted.get_stats()['disk_hits'] == 1
+        assert np.allclose(loaded[0], first[0]) and np.allclose(loaded[1], first[1])
+
+        # Latents are model-specific
+        restarted.get(model, str(renamed), "other_model")
+        assert model.conditioning_calls == 2
+
+        # Replacing the reference audio recomputes
+        audio, sample_rate = wav_to_float32(reference.read_bytes())
+        reference.write_bytes(float32_to_wav(audio * 0.5, sample_rate))
+        changed = cache.get(model, str(reference), "xtts_v2")
+        assert model.conditioning_calls == 3
+        assert not np.allclose(changed[1], first[1])
+
+        stats = cache.get_stats()
+        print(f"Latent cache stats: {stats}")
+        assert stats['computed'] == 2 and stats['memory_hits'] == 10
+
+
+def test_conversion_and_memory_only():
+    """Test to_model conversion on disk loads and the memory-only mode"""
+    with tempfile.TemporaryDirectory() as tmp:
+        model = StandInXTTS(conditioning_cost=0.0)
+        SpeakerLatentCache(disk_dir=tmp).get(model, [str(TEST_AUDIO), str(TEST_AUDIO)])
+
+        converted = []
+
+        def to_model(array):
+            converted.append(array.shape)
+            return array.astype(np.float64)
+
+        loaded = SpeakerLatentCache(disk_dir=tmp, to_model=to_model).get(model, [str(TEST_AUDIO), str(TEST_AUDIO)])
+        assert len(converted) == 2 and loaded[0].dtype == np.float64
+        assert model.conditioning_calls == 1
+
+    memory_only = SpeakerLatentCache()
+    memory_only.get(model, str(TEST_AUDIO))
+    memory_only.get(model, str(TEST_AUDIO))
+    assert model.conditioning_calls == 2
+    assert memory_only.get_stats()['memory_hits'] == 1
+
+
+if __name__ == "__main__":
+    test_latents_computed_once()
+    test_conversion_and_memory_only()
+    print("✓ XTTS latent cache test passed")
@@ -5,7 +5,7 @@ VCA 1.0 - Phase 1
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Dict, Optional
 
 
 @dataclass
@@ -15,11 +15,32 @@ class TTSResult:
     format: str  # e.g., 'mp3', 'wav', 'pcm'
     sample_rate: Optional[int] = None
     duration: Optional[float] = None  # seconds
+    provider: Optional[str] = None  # Provider that produced the audio (set by wrappers)
+    network_time: Optional[float] = None  # Remote providers: request start -> response headers
+    # Phrase cache (CachedTTSProvider): sentences served from / missing in the cache
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+@dataclass
+class TTSChunk:
+    """Piece of audio emitted while synthesis is still running"""
+    audio_bytes: bytes
+    format: str = 'pcm'  # Raw PCM16 mono unless the provider streams an encoded format
+    sample_rate: Optional[int] = None
+    network_time: Optional[float] = None  # Remote providers, first chunk: request start -> response headers
+    provider: Optional[str] = None  # Provider that produced the audio (set by wrappers)
 
 
 class TTSProvider(ABC):
     """Abstract base class for TTS providers"""
 
+    # True for providers that call a network API (eligible for circuit breaking)
+    is_remote = False
+
+    # True for providers whose synthesize_stream() emits audio before synthesis finishes
+    supports_streaming = False
+
     def __init__(self, config: dict):
         """
         Initialize TTS provider.
@@ -45,5 +66,37 @@ class TTSProvider(ABC):
         """
         pass
 
+    async def synthesize_stream(self, text: str) -> AsyncIterator[TTSChunk]:
+        """
+        Synthesize speech, yielding audio chunks as they are generated.
+
+        The default waits for synthesize() and emits the whole result as one
+        chunk (WAV output is unwrapped to raw PCM16); providers that generate
+        incrementally override this and set supports_streaming.
+
+        Args:
+            text: Text to convert to speech
+
+        Yields:
+            TTSChunk objects, in playback order
+        """
+        result = await self.synthesize(text)
+        if result.format == 'wav':
+            from audio.wav import wav_to_int16
+
+            pcm, sample_rate = wav_to_int16(result.audio_bytes)
+            yield TTSChunk(audio_bytes=pcm.tobytes(), format='pcm', sample_rate=sample_rate)
+        else:
+            yield TTSChunk(audio_bytes=result.audio_bytes, format=result.format, sample_rate=result.sample_rate)
+
+    def get_stats(self) -> Dict:
+        """
+        Get provider runtime statistics (for /health and latency reports).
+
+        Returns:
+            Dictionary of statistics (empty for providers without any)
+        """
+        return {}
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -0,0 +1,295 @@
+"""
+TTS phrase cache
+VCA 1.0 - Phase 3
+
+Content-addressed cache of synthesized audio. Keys hash the provider name,
+the voice-affecting settings (voice, speed, sample rate, ...), the normalized
+text and, for providers that render more than one format (e.g., OpenAI: mp3
+from synthesize(), PCM from the stream), the stored format, so any change to
+the voice config misses instead of playing stale audio and one format never
+overwrites another.
+
+Two tiers:
+- Memory: LRU bounded by total audio bytes
+- Disk: one file per entry under disk_dir, bounded by disk_max_mb (oldest
+  entries removed first); disk hits are promoted to memory
+
+Configuration:
+    tts_cache:
+      enabled: true
+      memory_max_mb: 32
+      disk_dir: "data/tts_cache"   # null = memory only
+      disk_max_mb: 512
+      sentence_level: true         # Cache per sentence (see CachedTTSProvider)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+from .base import TTSResult
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_QUOTE_TRANSLATION = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"'})
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys (unicode form, quotes, whitespace)"""
+    text = unicodedata.normalize("NFC", text).translate(_QUOTE_TRANSLATION)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def make_cache_key(provider_name: str, voice_params: Dict, text: str, audio_format: Optional[str] = None) -> str:
+    """
+    Build the content address for one phrase.
+
+    Args:
+        provider_name: TTS provider that renders the audio
+        voice_params: Settings that change the audio (voice, speed, sample_rate, ...)
+        text: Phrase text (normalized here)
+        audio_format: Format of the stored entry (None = the provider's synthesize() output)
+
+    Returns:
+        Hex sha256 key
+    """
+    parts = [provider_name, voice_params, normalize_text(text)]
+    if audio_format is not None:
+        parts.append(audio_format)  # Existing keys (and disk entries) stay valid
+    material = json.dumps(
+        parts,
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    """Byte-bounded in-memory LRU with an optional disk tier"""
+
+    def __init__(
+        self,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 512 * 1024 * 1024
+    ):
+        """
+        Initialize TTS cache.
+
+        Args:
+            memory_max_bytes: Total audio bytes kept in memory
+            disk_dir: Directory for the disk tier (None = memory only)
+            disk_max_bytes: Total bytes kept on disk
+        """
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+
+        self._memory: "OrderedDict[str, TTSResult]" = OrderedDict()
+        self._lock = threading.Lock()  # Disk lookups and writes run in executor threads
+        self._trim_lock = threading.Lock()  # One disk trim at a time
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self.disk_bytes = sum(path.stat().st_size for path in self.disk_dir.glob("*.audio"))
+            logger.info(f"TTS disk cache at {self.disk_dir} ({self.disk_bytes / 1e6:.1f} MB)")
+
+    @property
+    def has_disk_tier(self) -> bool:
+        return self.disk_dir is not None
+
+    def get(self, key: str) -> Optional[TTSResult]:
+        """
+        Look up a phrase (memory first, then disk).
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            Cached TTSResult or None
+        """
+        return self.get_memory(key) or self.get_disk(key)
+
+    def get_memory(self, key: str) -> Optional[TTSResult]:
+        """
+        Look up the memory tier only (fast, safe to call on the event loop).
+
+        A None here is not counted as a miss - follow up with get_disk().
+        """
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+            return result
+
+    def get_disk(self, key: str) -> Optional[TTSResult]:
+        """
+        Look up the disk tier and promote hits to memory (blocking file I/O).
+
+        Returns:
+            Cached TTSResult or None (counted as a miss)
+        """
+        result = self._read_disk(key)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+
+        self._put_memory(key, result)
+        return result
+
+    def put(self, key: str, result: TTSResult):
+        """
+        Store a phrase in memory and on disk (disk write blocks - call from a
+        thread when the disk tier is enabled).
+
+        Args:
+            key: Key from make_cache_key()
+            result: Synthesized audio
+        """
+        stored = TTSResult(
+            audio_bytes=result.audio_bytes,
+            format=result.format,
+            sample_rate=result.sample_rate,
+            duration=result.duration
+        )
+        self._put_memory(key, stored)
+        self._write_disk(key, stored)
+
+    def _put_memory(self, key: str, result: TTSResult):
+        """Insert into the LRU and evict least recently used entries over budget"""
+        size = len(result.audio_bytes)
+        if size > self.memory_max_bytes:
+            return
+
+        with self._lock:
+            if key in self._memory:
+                self.memory_bytes -= len(self._memory.pop(key).audio_bytes)
+
+            self._memory[key] = result
+            self.memory_bytes += size
+
+            while self.memory_bytes > self.memory_max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self.memory_bytes -= len(evicted.audio_bytes)
+                self.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[TTSResult]:
+        """Load an entry from the disk tier"""
+        if self.disk_dir is None:
+            return None
+
+        audio_path = self.disk_dir / f"{key}.audio"
+        meta_path = self.disk_dir / f"{key}.json"
+        try:
+            meta = json.loads(meta_path.read_text())
+            audio_bytes = audio_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+
+        try:
+            os.utime(audio_path)  # Mark as recently used for disk eviction
+        except OSError:
+            pass
+        return TTSResult(
+            audio_bytes=audio_bytes,
+            format=meta['format'],
+            sample_rate=meta.get('sample_rate'),
+            duration=meta.get('duration')
+        )
+
+    def _write_disk(self, key: str, result: TTSResult):
+        """Store an entry in the disk tier and trim it to disk_max_bytes"""
+        if self.disk_dir is None:
+            return
+
+        audio_path = self.disk_dir / f"{key}.audio"
+        if audio_path.exists():
+            return
+
+        try:
+            # Write to a temp name first so readers never see partial audio
+            tmp_path = self.disk_dir / f"{key}.audio.tmp"
+            tmp_path.write_bytes(result.audio_bytes)
+            (self.disk_dir / f"{key}.json").write_text(json.dumps({
+                'format': result.format,
+                'sample_rate': result.sample_rate,
+                'duration': result.duration,
+            }))
+            tmp_path.replace(audio_path)
+        except OSError as e:
+            logger.warning(f"TTS disk cache write failed: {e}")
+            return
+
+        with self._lock:
+            self.disk_bytes += len(result.audio_bytes)
+            over_budget = self.disk_bytes > self.disk_max_bytes
+
+        if over_budget:
+            with self._trim_lock:
+                self._trim_disk()
+
+    def _trim_disk(self):
+        """Remove least recently used disk entries until under budget"""
+        with self._lock:
+            if self.disk_bytes <= self.disk_max_bytes:
+                return  # Another thread already trimmed
+
+        entries = []
+        for audio_path in self.disk_dir.glob("*.audio"):
+            try:
+                entries.append((audio_path.stat().st_mtime, audio_path))
+            except FileNotFoundError:
+                pass
+
+        for _, audio_path in sorted(entries):
+            with self._lock:
+                if self.disk_bytes <= self.disk_max_bytes * 0.9:
+                    break
+            try:
+                size = audio_path.stat().st_size
+                audio_path.unlink()
+            except FileNotFoundError:
+                continue
+            audio_path.with_suffix(".json").unlink(missing_ok=True)
+            with self._lock:
+                self.disk_bytes -= size
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters and tier sizes"""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'memory_mb': self.memory_bytes / 1e6,
+            'disk_mb': self.disk_bytes / 1e6,
+            'evictions': self.evictions,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"TTSCache(memory={self.memory_max_bytes / 1e6:.0f}MB, "
+            f"disk={self.disk_dir or 'off'})"
+        )
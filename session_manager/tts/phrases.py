@@ -0,0 +1,169 @@
+"""
+Pre-rendered system phrases
+VCA 1.0 - Phase 3
+
+Status phrases (fillers, errors, goodbyes) are synthesized once at startup
+through the session's TTS provider and kept in memory, so they can be sent
+the moment they're needed instead of waiting on TTS.
+
+Fillers ("One moment.") are played right after the transcript when the LLM
+response is predicted to be slow, masking the wait.
+
+Configuration:
+    phrases:
+      enabled: true
+      render_concurrency: 2
+      sets:
+        filler: ["One moment.", "Let me check."]
+        error: ["Sorry, something went wrong."]
+        goodbye: ["Goodbye Warren."]
+      filler:
+        enabled: true
+        threshold: 2.0    # Predicted LLM latency (seconds) that triggers a filler
+        min_samples: 5    # Measured LLM calls needed before they replace model_latencies
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .base import TTSProvider, TTSResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RenderedPhrase:
+    """A phrase with its synthesized audio"""
+    text: str
+    audio: TTSResult
+    encoded: Dict[str, List[bytes]] = field(default_factory=dict)  # Output codec -> payloads (encoded once)
+
+
+class PhraseBank:
+    """In-memory set of pre-rendered phrases, grouped by purpose"""
+
+    def __init__(self, phrase_sets: Dict[str, List[str]], render_concurrency: int = 2):
+        """
+        Initialize phrase bank.
+
+        Args:
+            phrase_sets: Purpose (e.g., 'filler', 'error') -> phrase texts
+            render_concurrency: Phrases synthesized at the same time during render()
+        """
+        self.phrase_sets = {name: list(texts) for name, texts in phrase_sets.items()}
+        self.render_concurrency = max(1, render_concurrency)
+
+        self._rendered: Dict[str, List[RenderedPhrase]] = {}
+        self._next: Dict[str, int] = {}  # Round-robin position per set
+
+        # Counters
+        self.render_time = 0.0
+        self.render_failures = 0
+        self.plays: Dict[str, int] = {name: 0 for name in self.phrase_sets}
+
+    async def render(self, provider: TTSProvider):
+        """
+        Synthesize every phrase with the given provider.
+
+        Phrases that fail to render are skipped (logged), so a provider
+        problem at startup never prevents the server from starting.
+
+        Args:
+            provider: TTS provider whose voice the phrases should use
+        """
+        start = time.monotonic()
+        semaphore = asyncio.Semaphore(self.render_concurrency)
+
+        async def render_one(text: str) -> Optional[TTSResult]:
+            async with semaphore:
+                try:
+                    return await provider.synthesize(text)
+                except Exception as e:
+                    logger.warning(f"Could not pre-render phrase '{text}': {e}")
+                    self.render_failures += 1
+                    return None
+
+        for name, texts in self.phrase_sets.items():
+            results = await asyncio.gather(*(render_one(text) for text in texts))
+            self._rendered[name] = [
+                RenderedPhrase(text=text, audio=audio)
+                for text, audio in zip(texts, results) if audio is not None
+            ]
+            self._next[name] = 0
+
+        self.render_time = time.monotonic() - start
+        logger.info(
+            f"Pre-rendered {self.rendered_count} phrases in {self.render_time:.2f}s "
+            f"({self.render_failures} failed)"
+        )
+
+    @property
+    def rendered_count(self) -> int:
+        return sum(len(phrases) for phrases in self._rendered.values())
+
+    def get(self, name: str) -> Optional[RenderedPhrase]:
+        """
+        Get the next phrase of a set (rotates so fillers don't repeat back to back).
+
+        Args:
+            name: Phrase set name (e.g., 'filler')
+
+        Returns:
+            RenderedPhrase, or None if the set is unknown or nothing rendered
+        """
+        phrases = self._rendered.get(name)
+        if not phrases:
+            return None
+
+        index = self._next[name]
+        self._next[name] = (index + 1) % len(phrases)
+        self.plays[name] = self.plays.get(name, 0) + 1
+        return phrases[index]
+
+    def get_stats(self) -> Dict:
+        """Get render timing and play counts"""
+        return {
+            'rendered': self.rendered_count,
+            'render_failures': self.render_failures,
+            'render_time': self.render_time,
+            'memory_mb': sum(
+                len(phrase.audio.audio_bytes)
+                for phrases in self._rendered.values() for phrase in phrases
+            ) / 1e6,
+            'plays': dict(self.plays),
+        }
+
+    def __repr__(self) -> str:
+        return f"PhraseBank(sets={list(self.phrase_sets)}, rendered={self.rendered_count})"
+
+
+def predict_llm_latency(
+    model: str,
+    measured: Dict[str, Dict],
+    model_latencies: Dict[str, Dict],
+    min_samples: int = 5
+) -> Optional[float]:
+    """
+    Predict how long the next LLM call will take.
+
+    Uses the measured mean for the model once enough calls were recorded,
+    otherwise the configured expectation (latency_monitoring.model_latencies).
+
+    Args:
+        model: LLM model variant (e.g., 'gpt-5-mini')
+        measured: LatencyTracker.get_model_comparison() output
+        model_latencies: Configured {model: {'avg': seconds, ...}}
+        min_samples: Measured calls needed before they're trusted
+
+    Returns:
+        Predicted seconds, or None if nothing is known about the model
+    """
+    stats = measured.get(model)
+    if stats and stats.get('sample_count', 0) >= min_samples:
+        return stats['mean']
+
+    expected = model_latencies.get(model) or {}
+    return expected.get('avg')
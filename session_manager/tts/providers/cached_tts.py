@@ -0,0 +1,256 @@
+"""
+Cached TTS Provider
+
+Wraps a TTS provider with the phrase cache in tts/cache.py. With
+sentence_level enabled, responses are split into sentences that are looked
+up individually; only missing sentences are synthesized (concurrently) and
+the audio is joined back in order, so a partially repeated response ("Okay
+Warren. <new content>.") still reuses its cached parts.
+
+Sentence joining supports wav (frames concatenated), mp3 and raw pcm
+(byte concatenation). Other formats are cached as whole responses.
+
+supports_streaming mirrors the inner provider. synthesize_stream() walks the
+sentences in order: cached ones are emitted at once, misses are streamed from
+the inner provider and stored as WAV once complete. Streamed entries are keyed
+separately from synthesize() output (the key includes the stored format), so
+an mp3 entry is never overwritten by WAV and synthesize() only joins audio of
+one format.
+
+If sentences still come back in different formats or sample rates (e.g., the
+fallback provider served a miss), only the cache hits that don't match the
+freshly synthesized audio are re-rendered; the whole response is synthesized
+again only if that doesn't make them joinable.
+
+Audio served by a fallback provider (see fallback_tts.py) is not cached,
+since it doesn't match the voice the key describes.
+
+Not registered in TTSProviderFactory (it wraps provider instances); main.py
+builds it from the tts_cache config section.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from ..base import TTSChunk, TTSProvider, TTSResult
+from ..cache import TTSCache, make_cache_key
+from audio.wav import concat_wav, pcm16_to_wav, wav_to_int16
+
+logger = logging.getLogger(__name__)
+
+# Split after sentence punctuation followed by whitespace
+_SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+_JOINABLE_FORMATS = {'wav', 'mp3', 'pcm'}
+
+# Streamed sentences are stored as WAV under their own keys
+_STREAM_FORMAT = 'wav'
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences (keeps punctuation, drops empty parts)"""
+    return [sentence.strip() for sentence in _SENTENCE_PATTERN.split(text) if sentence.strip()]
+
+
+def joinable(results: List[TTSResult]) -> bool:
+    """True if all sentence audio shares one joinable format and sample rate"""
+    formats = {result.format for result in results}
+    sample_rates = {result.sample_rate for result in results}
+    return len(formats) == 1 and len(sample_rates) == 1 and formats <= _JOINABLE_FORMATS
+
+
+class CachedTTSProvider(TTSProvider):
+    """TTS provider that serves repeated phrases from a memory/disk cache"""
+
+    def __init__(
+        self,
+        inner: TTSProvider,
+        cache: TTSCache,
+        config: dict,
+        provider_name: str,
+        voice_params: Optional[Dict] = None
+    ):
+        """
+        Initialize cached TTS provider.
+
+        Args:
+            inner: Provider that synthesizes cache misses
+            cache: Shared phrase cache
+            config: tts_cache configuration (see tts/cache.py)
+            provider_name: Name of the inner provider (part of the cache key)
+            voice_params: Voice-affecting settings (voice, speed, sample_rate, ...)
+        """
+        super().__init__(config)
+        self.inner = inner
+        self.cache = cache
+        self.provider_name = provider_name
+        self.voice_params = voice_params or {}
+        self.sentence_level = config.get('sentence_level', True)
+        self.supports_streaming = inner.supports_streaming
+
+    async def synthesize(self, text: str) -> TTSResult:
+        """
+        Synthesize text, reusing cached sentences.
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            TTSResult with cache_hits / cache_misses set (counted per sentence)
+        """
+        sentences = split_sentences(text) if self.sentence_level else [text]
+        if len(sentences) <= 1:
+            return await self._synthesize_cached(text)
+
+        results = list(await asyncio.gather(*(
+            self._synthesize_cached(sentence) for sentence in sentences
+        )))
+
+        if not joinable(results):
+            # Mixed output (e.g., fallback served a miss): re-render the cache
+            # hits that don't match what the provider produces right now
+            fresh = {(result.format, result.sample_rate) for result in results if result.cache_misses}
+            if len(fresh) == 1:
+                target = fresh.pop()
+                mismatched = [
+                    i for i, result in enumerate(results)
+                    if result.cache_hits and (result.format, result.sample_rate) != target
+                ]
+                rendered = await asyncio.gather(*(self.inner.synthesize(sentences[i]) for i in mismatched))
+                for i, result in zip(mismatched, rendered):
+                    result.cache_misses = 1
+                    results[i] = result
+
+            if not joinable(results):
+                formats = {(result.format, result.sample_rate) for result in results}
+                logger.debug(f"Cannot join sentence audio ({formats}); synthesizing whole response")
+                return await self._synthesize_cached(text)
+
+        return self._join(results)
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[TTSChunk]:
+        """
+        Stream text sentence by sentence, serving cached sentences immediately.
+
+        Args:
+            text: Text to convert to speech
+
+        Yields:
+            TTSChunk objects, in playback order
+        """
+        sentences = split_sentences(text) if self.sentence_level else [text]
+        for sentence in sentences or [text]:
+            async for chunk in self._stream_cached(sentence):
+                yield chunk
+
+    async def _synthesize_cached(self, text: str) -> TTSResult:
+        """Look up one phrase, synthesizing and storing it on a miss"""
+        key = make_cache_key(self.provider_name, self.voice_params, text)
+
+        cached = await self._lookup(key)
+        if cached is not None:
+            return self._copy(cached, hits=1, misses=0)
+
+        start = time.monotonic()
+        result = await self.inner.synthesize(text)
+        logger.debug(f"TTS cache miss: synthesized {len(text)} chars in {time.monotonic() - start:.2f}s")
+
+        # Only cache audio rendered by the provider the key describes
+        if result.provider in (None, self.provider_name):
+            await self._store(key, result)
+
+        result.cache_misses = 1
+        return result
+
+    async def _stream_cached(self, text: str) -> AsyncIterator[TTSChunk]:
+        """Emit one cached phrase as a chunk, or stream it from the inner provider and store it"""
+        key = make_cache_key(self.provider_name, self.voice_params, text, _STREAM_FORMAT)
+
+        cached = await self._lookup(key)
+        if cached is not None:
+            pcm, sample_rate = wav_to_int16(cached.audio_bytes)
+            yield TTSChunk(audio_bytes=pcm.tobytes(), format='pcm', sample_rate=sample_rate)
+            return
+
+        chunks = []
+        stream = self.inner.synthesize_stream(text)
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            await stream.aclose()
+
+        # Store complete PCM streams from the keyed provider as WAV
+        formats = {(chunk.format, chunk.sample_rate, chunk.provider) for chunk in chunks}
+        if len(formats) == 1:
+            audio_format, sample_rate, provider = formats.pop()
+            if audio_format == 'pcm' and sample_rate and provider in (None, self.provider_name):
+                pcm = b"".join(chunk.audio_bytes for chunk in chunks)
+                await self._store(key, TTSResult(
+                    audio_bytes=pcm16_to_wav(pcm, sample_rate),
+                    format='wav',
+                    sample_rate=sample_rate,
+                    duration=len(pcm) / 2 / sample_rate
+                ))
+
+    async def _lookup(self, key: str) -> Optional[TTSResult]:
+        """Memory, then disk (off the event loop)"""
+        cached = self.cache.get_memory(key)
+        if cached is None and self.cache.has_disk_tier:
+            cached = await asyncio.get_event_loop().run_in_executor(None, self.cache.get_disk, key)
+        elif cached is None:
+            cached = self.cache.get_disk(key)  # Memory only: just counts the miss
+        return cached
+
+    async def _store(self, key: str, result: TTSResult):
+        """Store in memory (and on disk, off the event loop)"""
+        if self.cache.has_disk_tier:
+            await asyncio.get_event_loop().run_in_executor(None, self.cache.put, key, result)
+        else:
+            self.cache.put(key, result)
+
+    @staticmethod
+    def _copy(result: TTSResult, hits: int, misses: int) -> TTSResult:
+        """Return a cache entry as a fresh TTSResult"""
+        return TTSResult(
+            audio_bytes=result.audio_bytes,
+            format=result.format,
+            sample_rate=result.sample_rate,
+            duration=result.duration,
+            cache_hits=hits,
+            cache_misses=misses
+        )
+
+    @staticmethod
+    def _join(results: List[TTSResult]) -> TTSResult:
+        """Concatenate per-sentence audio in order"""
+        audio_format = results[0].format
+        parts = [result.audio_bytes for result in results]
+        audio_bytes = concat_wav(parts) if audio_format == 'wav' else b"".join(parts)
+
+        durations = [result.duration for result in results]
+        providers = {result.provider for result in results if result.provider}
+
+        return TTSResult(
+            audio_bytes=audio_bytes,
+            format=audio_format,
+            sample_rate=results[0].sample_rate,
+            duration=sum(durations) if None not in durations else None,
+            provider=providers.pop() if len(providers) == 1 else None,
+            cache_hits=sum(result.cache_hits for result in results),
+            cache_misses=sum(result.cache_misses for result in results)
+        )
+
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        return {
+            'cache': self.cache.get_stats(),
+            'inner_stats': self.inner.get_stats(),
+        }
+
+    def __repr__(self) -> str:
+        return f"CachedTTSProvider(inner={self.inner}, cache={self.cache}, stream={self.supports_streaming})"
@@ -3,6 +3,15 @@ Coqui TTS Provider (XTTS-v2)
 Local neural TTS with PyTorch CUDA acceleration for GTX 970 (Maxwell).
 Uses FP32 mode for optimal performance on Maxwell architecture.
 VCA 1.0 - Session 11
+
+XTTS models are driven through the model's inference API with speaker
+conditioning latents computed once per voice (see tts/xtts_latents.py)
+instead of TTS.tts(speaker_wav=...), which recomputes them every request.
+Other Coqui models use TTS.tts().
+
+synthesize_stream() uses XTTS's chunked inference_stream(): audio chunks are
+resampled to the target rate as they arrive and emitted as PCM16, so
+playback can start before the whole utterance is generated.
 """
 
 import asyncio
@@ -12,11 +21,14 @@ import wave
 import numpy as np
 import torch
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from TTS.api import TTS
 
 from ..base import TTSProvider, TTSResult
+from ..streaming import float32_to_pcm16, stream_pcm_chunks
+from ..xtts_latents import SpeakerLatentCache
+from audio.resample import resample
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +47,7 @@ class CoquiTTSProvider(TTSProvider):
         self.reference_audio = config.get('reference_audio', None)  # For voice cloning
         self.speaker_id = config.get('speaker_id', None)  # For pre-trained voice selection
         self.sample_rate_target = config.get('sample_rate', 16000)  # VCA expects 16kHz
+        self.stream_chunk_size = config.get('stream_chunk_size', 20)  # XTTS GPT tokens per streamed chunk
 
         logger.info(
             f"Initializing CoquiTTSProvider: model={self.model_name}, "
@@ -68,6 +81,21 @@ class CoquiTTSProvider(TTSProvider):
             logger.error(f"Failed to load Coqui TTS model: {e}")
             raise
 
+        # XTTS: synthesize from cached speaker latents via the inference API
+        model = getattr(getattr(self.tts, 'synthesizer', None), 'tts_model', None)
+        self.xtts_model = model if hasattr(model, 'get_conditioning_latents') else None
+        device = 'cuda' if self.use_gpu else 'cpu'
+        self.latent_cache = SpeakerLatentCache(
+            disk_dir=config.get('latent_cache_dir'),
+            to_model=lambda array: torch.from_numpy(array).to(device)
+        )
+
+        if self.xtts_model is not None and self.reference_audio:
+            # Compute (or load) the reference voice latents now, not on the first request
+            self.latent_cache.get(self.xtts_model, self.reference_audio, self.model_name)
+
+        self.supports_streaming = hasattr(self.xtts_model, 'inference_stream')
+
     async def synthesize(self, text: str) -> TTSResult:
         """
         Synthesize speech from text using Coqui TTS.
@@ -102,40 +130,11 @@ class CoquiTTSProvider(TTSProvider):
             TTSResult with audio bytes and metadata
         """
         try:
-            # Generate audio
-            if self.reference_audio:
-                # Voice cloning mode
-                logger.debug(f"Synthesizing with voice cloning: {self.reference_audio}")
-                audio_np = self.tts.tts(
-                    text=text,
-                    speaker_wav=self.reference_audio,
-                    language=self.language
-                )
-            elif self.speaker_id:
-                # Use pre-trained speaker
-                logger.debug(f"Synthesizing with speaker_id: {self.speaker_id}")
-                audio_np = self.tts.tts(
-                    text=text,
-                    speaker=self.speaker_id,
-                    language=self.language
-                )
-            else:
-                # Use first available speaker from the model
-                logger.debug("Synthesizing with default speaker")
-                # XTTS models have speaker manager with pre-trained voices
-                speaker_id = self.tts.speakers[0] if hasattr(self.tts, 'speakers') and self.tts.speakers else None
-                audio_np = self.tts.tts(
-                    text=text,
-                    speaker=speaker_id,
-                    language=self.language
-                )
-
-            # XTTS native sample rate (typically 24kHz)
-            native_sample_rate = 24000
+            audio_np, native_sample_rate = self._generate(text)
 
             # Resample to target rate if needed (VCA expects 16kHz)
             if native_sample_rate != self.sample_rate_target:
-                audio_np = self._resample(
+                audio_np = resample(
                     audio_np,
                     native_sample_rate,
                     self.sample_rate_target
@@ -166,46 +165,118 @@ class CoquiTTSProvider(TTSProvider):
             logger.error(f"Coqui TTS synthesis failed: {e}")
             raise
 
-    def _resample(
-        self,
-        audio: np.ndarray,
-        orig_sr: int,
-        target_sr: int
-    ) -> np.ndarray:
+    async def synthesize_stream(self, text: str):
         """
-        Resample audio to target sample rate using scipy.
+        Yield PCM16 chunks at the target rate while XTTS is still generating.
+
+        Closing the iterator early stops generation after the current chunk.
 
         Args:
-            audio: Audio array (float32)
-            orig_sr: Original sample rate
-            target_sr: Target sample rate
+            text: Text to convert to speech
 
-        Returns:
-            Resampled audio array
+        Yields:
+            TTSChunk objects (raw PCM16 mono, sample_rate_target)
         """
-        if orig_sr == target_sr:
-            return audio
-
+        latents = self._speaker_latents() if self.supports_streaming else None
+        if latents is None:
+            async for chunk in super().synthesize_stream(text):
+                yield chunk
+            return
+
+        def generate():
+            with torch.inference_mode():
+                for wav_chunk in self.xtts_model.inference_stream(
+                    text,
+                    self.language,
+                    latents[0],
+                    latents[1],
+                    stream_chunk_size=self.stream_chunk_size,
+                    speed=self.speed
+                ):
+                    yield wav_chunk.float().cpu().numpy()
+
+        chunks = stream_pcm_chunks(generate, self._native_sample_rate(), self.sample_rate_target)
         try:
-            from scipy import signal
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            logger.error(f"Coqui TTS streaming failed: {e}")
+            raise
+        finally:
+            await chunks.aclose()
 
-            # Calculate resampling ratio
-            num_samples = int(len(audio) * target_sr / orig_sr)
+    def _generate(self, text: str) -> Tuple[np.ndarray, int]:
+        """
+        Run the model.
 
-            # Use scipy's resample for high-quality resampling
-            resampled = signal.resample(audio, num_samples)
+        Args:
+            text: Text to synthesize
 
-            logger.debug(
-                f"Resampled audio: {orig_sr}Hz → {target_sr}Hz "
-                f"({len(audio)} → {len(resampled)} samples)"
+        Returns:
+            (float32 audio at the model's native rate, native sample rate)
+        """
+        latents = self._speaker_latents() if self.xtts_model is not None else None
+
+        if latents is not None:
+            gpt_cond_latent, speaker_embedding = latents
+            with torch.inference_mode():
+                output = self.xtts_model.inference(
+                    text,
+                    self.language,
+                    gpt_cond_latent,
+                    speaker_embedding,
+                    speed=self.speed
+                )
+            return np.asarray(output['wav'], dtype=np.float32), self._native_sample_rate()
+
+        if self.reference_audio:
+            # Voice cloning mode
+            logger.debug(f"Synthesizing with voice cloning: {self.reference_audio}")
+            audio_np = self.tts.tts(
+                text=text,
+                speaker_wav=self.reference_audio,
+                language=self.language
+            )
+        else:
+            # Use pre-trained speaker (first available speaker from the model by default)
+            speaker_id = self.speaker_id or (
+                self.tts.speakers[0] if hasattr(self.tts, 'speakers') and self.tts.speakers else None
+            )
+            logger.debug(f"Synthesizing with speaker_id: {speaker_id}")
+            audio_np = self.tts.tts(
+                text=text,
+                speaker=speaker_id,
+                language=self.language
             )
 
-            return resampled
+        return np.asarray(audio_np, dtype=np.float32), self._native_sample_rate()
 
-        except Exception as e:
-            logger.error(f"Resampling failed: {e}")
-            # Return original if resampling fails
-            return audio
+    def _speaker_latents(self):
+        """
+        Conditioning latents for the configured voice.
+
+        Returns:
+            (gpt_cond_latent, speaker_embedding), or None to use TTS.tts()
+        """
+        if self.reference_audio:
+            return self.latent_cache.get(self.xtts_model, self.reference_audio, self.model_name)
+
+        # Pre-trained XTTS speakers ship with their latents
+        speakers = getattr(getattr(self.xtts_model, 'speaker_manager', None), 'speakers', None) or {}
+        speaker_id = self.speaker_id or next(iter(speakers), None)
+        speaker = speakers.get(speaker_id)
+        if speaker is None:
+            return None
+        return speaker['gpt_cond_latent'], speaker['speaker_embedding']
+
+    def _native_sample_rate(self) -> int:
+        """Model output rate (XTTS: 24kHz)"""
+        audio_config = getattr(getattr(self.xtts_model, 'config', None), 'audio', None)
+        return getattr(audio_config, 'output_sample_rate', None) or 24000
+
+    def get_stats(self) -> Dict:
+        """Get speaker latent cache statistics"""
+        return {'latent_cache': self.latent_cache.get_stats()}
 
     def _to_wav(self, audio_np: np.ndarray, sample_rate: int) -> bytes:
         """
@@ -218,16 +289,13 @@ class CoquiTTSProvider(TTSProvider):
         Returns:
             WAV file as bytes
         """
-        # Convert float32 (-1.0 to 1.0) to int16 (-32768 to 32767)
-        audio_int16 = (audio_np * 32767).astype(np.int16)
-
         # Create WAV file in memory
         wav_io = io.BytesIO()
         with wave.open(wav_io, 'wb') as wav_file:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
+            wav_file.writeframes(float32_to_pcm16(audio_np))
 
         return wav_io.getvalue()
 
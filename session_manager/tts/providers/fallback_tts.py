@@ -0,0 +1,175 @@
+"""
+Fallback TTS Provider (circuit breaker)
+
+Wraps a remote TTS provider (e.g., openai_tts) with a per-call deadline and
+a circuit breaker. Failed, timed-out or rejected calls are served by a local
+fallback provider (e.g., piper_tts). While the breaker is open, requests
+go straight to the fallback; after reset_timeout a half-open probe checks if
+the remote provider recovered. For streaming primaries the deadline covers
+the first chunk; once audio has been forwarded, errors are not retried.
+
+Not registered in TTSProviderFactory (it wraps provider instances); main.py
+builds it for remote providers from the resilience.tts config section.
+
+Configuration:
+    resilience:
+      enabled: true
+      tts:
+        fallback_provider: "piper_tts"
+        timeout: 6.0              # Per-call deadline (seconds)
+        failure_threshold: 3      # Consecutive bad calls before opening
+        slow_call_threshold: 4.0  # Successful calls slower than this count as bad
+        reset_timeout: 30.0       # Seconds open before a half-open probe
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict
+
+from ..base import TTSChunk, TTSProvider, TTSResult
+from utils.circuit_breaker import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackTTSProvider(TTSProvider):
+    """Remote TTS provider guarded by a deadline, circuit breaker and local fallback"""
+
+    def __init__(
+        self,
+        primary: TTSProvider,
+        fallback: TTSProvider,
+        breaker: CircuitBreaker,
+        config: dict,
+        primary_name: str = "primary",
+        fallback_name: str = "fallback"
+    ):
+        """
+        Initialize fallback TTS provider.
+
+        Args:
+            primary: Remote provider to protect
+            fallback: Local provider used when the primary is unavailable
+            breaker: Circuit breaker tracking the primary
+            config: Resilience configuration (see module docstring)
+            primary_name: Name reported when the primary serves the request
+            fallback_name: Name reported when the fallback serves the request
+        """
+        super().__init__(config)
+        self.primary = primary
+        self.fallback = fallback
+        self.breaker = breaker
+        self.primary_name = primary_name
+        self.fallback_name = fallback_name
+        self.timeout = config.get('timeout', 6.0)
+        self.supports_streaming = primary.supports_streaming
+        self.fallback_calls = 0
+
+    async def synthesize(self, text: str) -> TTSResult:
+        """
+        Synthesize with the primary if the breaker allows it, else the fallback.
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            TTSResult tagged with the provider that served it
+
+        Raises:
+            Exception: If the fallback also fails
+        """
+        if self.breaker.allow_request():
+            start = time.monotonic()
+            try:
+                result = await asyncio.wait_for(
+                    self.primary.synthesize(text),
+                    timeout=self.timeout
+                )
+                self.breaker.record_success(time.monotonic() - start)
+                result.provider = result.provider or self.primary_name
+                return result
+
+            except asyncio.CancelledError:
+                # Caller cancelled (e.g., session ended) - not the provider's fault
+                self.breaker.release()
+                raise
+
+            except Exception as e:
+                self.breaker.record_failure(e)
+                logger.warning(
+                    f"TTS provider '{self.primary_name}' failed ({e!r}), "
+                    f"falling back to '{self.fallback_name}'"
+                )
+
+        self.fallback_calls += 1
+        result = await self.fallback.synthesize(text)
+        result.provider = self.fallback_name
+        return result
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[TTSChunk]:
+        """
+        Stream from the primary if the breaker allows it, else from the fallback.
+
+        Falls back only if the primary fails before its first chunk.
+
+        Args:
+            text: Text to convert to speech
+
+        Yields:
+            TTSChunk objects from whichever provider serves the request
+
+        Raises:
+            Exception: If the fallback fails, or the primary fails mid-stream
+        """
+        if self.breaker.allow_request():
+            start = time.monotonic()
+            stream = self.primary.synthesize_stream(text)
+            try:
+                first = await asyncio.wait_for(stream.__anext__(), timeout=self.timeout)
+                self.breaker.record_success(time.monotonic() - start)
+
+            except asyncio.CancelledError:
+                self.breaker.release()
+                await stream.aclose()
+                raise
+
+            except StopAsyncIteration:
+                self.breaker.record_success(time.monotonic() - start)
+                return
+
+            except Exception as e:
+                self.breaker.record_failure(e)
+                await stream.aclose()
+                logger.warning(
+                    f"TTS provider '{self.primary_name}' stream failed ({e!r}), "
+                    f"falling back to '{self.fallback_name}'"
+                )
+
+            else:
+                try:
+                    yield first
+                    async for chunk in stream:
+                        yield chunk
+                finally:
+                    await stream.aclose()
+                return
+
+        self.fallback_calls += 1
+        async for chunk in self.fallback.synthesize_stream(text):
+            chunk.provider = self.fallback_name
+            yield chunk
+
+    def get_stats(self) -> Dict:
+        """Get breaker state and fallback counters"""
+        return {
+            'breaker_state': self.breaker.state.value,
+            'breaker': self.breaker.get_stats(),
+            'fallback_calls': self.fallback_calls,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"FallbackTTSProvider(primary={self.primary}, fallback={self.fallback}, "
+            f"timeout={self.timeout}s)"
+        )
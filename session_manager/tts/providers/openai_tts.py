@@ -1,15 +1,32 @@
 """
 OpenAI TTS API Provider
 VCA 1.0 - Phase 1
+
+With stream enabled, synthesize_stream() requests raw PCM (24kHz, 16-bit
+mono) and yields it in stream_chunk_size pieces as the response body
+arrives, instead of waiting for the whole MP3.
+
+Configuration:
+    openai:
+      tts:
+        stream: true
+        stream_chunk_size: 9600   # Bytes per forwarded chunk (200ms of audio)
 """
 
-from openai import AsyncOpenAI
-from ..base import TTSProvider, TTSResult
+from typing import AsyncIterator
+
+from ..base import TTSChunk, TTSProvider, TTSResult
+from utils.http_timing import track_request_timing
+from utils.openai_clients import create_openai_client
+
+PCM_SAMPLE_RATE = 24000  # OpenAI 'pcm' response format
 
 
 class OpenAITTSProvider(TTSProvider):
     """OpenAI TTS API text-to-speech provider"""
 
+    is_remote = True
+
     def __init__(self, config: dict):
         super().__init__(config)
 
@@ -17,10 +34,19 @@ class OpenAITTSProvider(TTSProvider):
         if not api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Bound each request so a degraded API fails fast instead of hanging
+        # Shared pool (TimingTransport) reports time to response headers (tts_network)
+        self.client = create_openai_client(
+            api_key,
+            base_url=config.get('base_url'),
+            timeout=config.get('timeout', 30.0),
+            max_retries=config.get('max_retries', 1)
+        )
         self.model = config.get('model', 'tts-1')
         self.voice = config.get('voice', 'nova')
         self.speed = config.get('speed', 1.0)
+        self.supports_streaming = config.get('stream', False)
+        self.stream_chunk_size = config.get('stream_chunk_size', 9600)
 
     async def synthesize(self, text: str) -> TTSResult:
         """
@@ -36,13 +62,14 @@ class OpenAITTSProvider(TTSProvider):
             Exception: If API call fails
         """
         # Call OpenAI TTS API
-        response = await self.client.audio.speech.create(
-            model=self.model,
-            voice=self.voice,
-            input=text,
-            speed=self.speed,
-            response_format="mp3"
-        )
+        with track_request_timing() as timing:
+            response = await self.client.audio.speech.create(
+                model=self.model,
+                voice=self.voice,
+                input=text,
+                speed=self.speed,
+                response_format="mp3"
+            )
 
         # Read audio bytes from response
         audio_bytes = response.content
@@ -50,8 +77,53 @@ class OpenAITTSProvider(TTSProvider):
         return TTSResult(
             audio_bytes=audio_bytes,
             format='mp3',
-            sample_rate=24000  # OpenAI TTS default
+            sample_rate=24000,  # OpenAI TTS default
+            network_time=timing.time_to_first_byte
+        )
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[TTSChunk]:
+        """
+        Stream raw PCM from the API as it downloads.
+
+        Args:
+            text: Text to convert to speech
+
+        Yields:
+            TTSChunk objects (PCM16 mono, 24kHz); the first carries network_time
+
+        Raises:
+            Exception: If API call fails
+        """
+        request = self.client.audio.speech.with_streaming_response.create(
+            model=self.model,
+            voice=self.voice,
+            input=text,
+            speed=self.speed,
+            response_format="pcm"
         )
 
+        # Only the request itself is timed: the body is read across yields,
+        # possibly from another task's context (e.g., under asyncio.wait_for)
+        with track_request_timing() as timing:
+            response = await request.__aenter__()
+
+        try:
+            network_time = timing.time_to_first_byte
+            carry = b""  # Odd trailing byte of a PCM16 sample split across reads
+            async for data in response.iter_bytes(self.stream_chunk_size):
+                data = carry + data
+                usable = len(data) - len(data) % 2
+                carry = data[usable:]
+                if usable:
+                    yield TTSChunk(
+                        audio_bytes=data[:usable],
+                        format='pcm',
+                        sample_rate=PCM_SAMPLE_RATE,
+                        network_time=network_time
+                    )
+                    network_time = None
+        finally:
+            await request.__aexit__(None, None, None)
+
     def __repr__(self) -> str:
-        return f"OpenAITTSProvider(model='{self.model}', voice='{self.voice}')"
+        return f"OpenAITTSProvider(model='{self.model}', voice='{self.voice}', stream={self.supports_streaming})"
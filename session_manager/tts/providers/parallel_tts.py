@@ -0,0 +1,179 @@
+"""
+Parallel Sentence TTS Provider
+
+Splits long responses into sentences and synthesizes up to max_in_flight of
+them concurrently on the wrapped provider (e.g., across Piper's voice pool
+or parallel OpenAI requests). synthesize_stream() emits each sentence's
+audio strictly in order as soon as it and every sentence before it are
+ready, so playback starts after the first sentence instead of the whole
+answer.
+
+Responses with fewer than min_sentences sentences go straight to the
+wrapped provider, so short answers pay no splitting overhead. If the
+sentences of a synthesize() call come back in different formats or sample
+rates (e.g., a fallback provider served some of them), they can't be joined
+and the whole text is synthesized by the wrapped provider instead. Streams
+pass each sentence on as is; main.py announces a format change mid-stream.
+
+Not registered in TTSProviderFactory (it wraps provider instances); main.py
+builds it from the tts_parallel config section.
+
+Configuration:
+    tts_parallel:
+      enabled: true
+      max_in_flight: 3   # Sentences synthesized at once
+      min_sentences: 2
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict, List
+
+from ..base import TTSChunk, TTSProvider, TTSResult
+from .cached_tts import joinable, split_sentences
+from audio.wav import concat_wav, wav_to_int16
+
+logger = logging.getLogger(__name__)
+
+
+class ParallelSentenceTTSProvider(TTSProvider):
+    """Concurrent per-sentence synthesis with in-order delivery"""
+
+    supports_streaming = True
+
+    def __init__(self, inner: TTSProvider, config: dict):
+        """
+        Initialize parallel sentence provider.
+
+        Args:
+            inner: Provider that synthesizes each sentence
+            config: tts_parallel configuration
+        """
+        super().__init__(config)
+        self.inner = inner
+        self.max_in_flight = max(1, config.get('max_in_flight', 3))
+        self.min_sentences = config.get('min_sentences', 2)
+
+        # Counters
+        self.responses = 0
+        self.split_responses = 0
+        self.sentences = 0
+        self.order_wait = 0.0  # Seconds finished sentences were held for earlier ones
+        self.unjoinable_responses = 0  # Mixed formats / sample rates, re-synthesized whole
+
+    async def synthesize(self, text: str) -> TTSResult:
+        """
+        Synthesize text (sentences in parallel, joined in order).
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            TTSResult with the sentences' audio joined in order
+        """
+        self.responses += 1
+        sentences = split_sentences(text)
+        if len(sentences) < self.min_sentences:
+            return await self.inner.synthesize(text)
+
+        results = [result async for result in self._synthesize_ordered(sentences)]
+        if not joinable(results):
+            formats = {(result.format, result.sample_rate) for result in results}
+            logger.warning(f"Cannot join sentence audio ({formats}); synthesizing whole response")
+            self.unjoinable_responses += 1
+            return await self.inner.synthesize(text)
+
+        first = results[0]
+        if first.format == 'wav':
+            audio_bytes = concat_wav([result.audio_bytes for result in results])
+        else:
+            audio_bytes = b"".join(result.audio_bytes for result in results)
+
+        durations = [result.duration for result in results]
+        return TTSResult(
+            audio_bytes=audio_bytes,
+            format=first.format,
+            sample_rate=first.sample_rate,
+            duration=sum(durations) if None not in durations else None,
+            cache_hits=sum(result.cache_hits for result in results),
+            cache_misses=sum(result.cache_misses for result in results)
+        )
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[TTSChunk]:
+        """
+        Yield each sentence's audio in order, synthesizing ahead in parallel.
+
+        Args:
+            text: Text to convert to speech
+
+        Yields:
+            TTSChunk per sentence (WAV output unwrapped to raw PCM16)
+        """
+        self.responses += 1
+        sentences = split_sentences(text)
+        if len(sentences) < self.min_sentences:
+            async for chunk in self.inner.synthesize_stream(text):
+                yield chunk
+            return
+
+        async for result in self._synthesize_ordered(sentences):
+            yield self._to_chunk(result)
+
+    async def _synthesize_ordered(self, sentences: List[str]) -> AsyncIterator[TTSResult]:
+        """
+        Synthesize sentences with up to max_in_flight running, yielding results in order.
+
+        Args:
+            sentences: Sentences to synthesize
+
+        Yields:
+            TTSResult per sentence, in sentence order
+        """
+        self.split_responses += 1
+        self.sentences += len(sentences)
+        tasks: List[asyncio.Task] = []
+        finished_at: Dict[int, float] = {}
+
+        def dispatch():
+            # Keep up to max_in_flight sentences running ahead of playback
+            while len(tasks) < len(sentences) and sum(not task.done() for task in tasks) < self.max_in_flight:
+                index = len(tasks)
+                task = asyncio.ensure_future(self.inner.synthesize(sentences[index]))
+                task.add_done_callback(lambda _, index=index: finished_at.setdefault(index, time.monotonic()))
+                tasks.append(task)
+
+        try:
+            for index in range(len(sentences)):
+                dispatch()
+                await asyncio.wait([tasks[index]])
+                result = tasks[index].result()
+                # Sentences that finished early are held until the ones before them are out
+                self.order_wait += time.monotonic() - finished_at.get(index, time.monotonic())
+                yield result
+        finally:
+            # Stream closed early (barge-in) or a sentence failed
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _to_chunk(result: TTSResult) -> TTSChunk:
+        """Convert one sentence's result to a stream chunk"""
+        if result.format == 'wav':
+            pcm, sample_rate = wav_to_int16(result.audio_bytes)
+            return TTSChunk(audio_bytes=pcm.tobytes(), format='pcm', sample_rate=sample_rate)
+        return TTSChunk(audio_bytes=result.audio_bytes, format=result.format, sample_rate=result.sample_rate)
+
+    def get_stats(self) -> Dict:
+        """Get split counts and ordering wait"""
+        return {
+            'responses': self.responses,
+            'split_responses': self.split_responses,
+            'mean_sentences': self.sentences / self.split_responses if self.split_responses else 0.0,
+            'order_wait': self.order_wait,
+            'unjoinable_responses': self.unjoinable_responses,
+            'inner_stats': self.inner.get_stats(),
+        }
+
+    def __repr__(self) -> str:
+        return f"ParallelSentenceTTSProvider(inner={self.inner}, max_in_flight={self.max_in_flight})"
@@ -2,19 +2,38 @@
 Piper TTS Provider
 Fast, lightweight local TTS using ONNX Runtime (CPU-optimized).
 VCA 1.0 - Session 11
+
+Concurrent sessions: the provider holds a pool of pool_size voices, each with
+its own ONNX Runtime session and explicit thread settings. A synthesis takes
+a voice from the pool for its duration, so requests run in parallel without
+sharing a session, and intra_op_threads (default: cores / pool_size) keeps
+the pool from oversubscribing the CPU.
+
+Configuration:
+    piper_tts:
+      pool_size: 2            # Voices (ONNX sessions) = concurrent syntheses
+      intra_op_threads: null  # Threads per session (null = cores / pool_size)
+      inter_op_threads: 1
 """
 
 import asyncio
+import copy
 import io
 import logging
+import os
+import queue
+import threading
+import time
 import wave
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import numpy as np
 
 from ..base import TTSProvider, TTSResult
+from audio.resample import StreamingResampler
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +52,9 @@ class PiperTTSProvider(TTSProvider):
         self.noise_scale = config.get('noise_scale', 0.667)  # Variability
         self.noise_w = config.get('noise_w', 0.8)  # Phoneme duration variability
         self.sample_rate_target = config.get('sample_rate', 16000)  # VCA expects 16kHz
+        self.pool_size = max(1, config.get('pool_size', 1))
+        self.intra_op_threads = config.get('intra_op_threads') or max(1, (os.cpu_count() or 1) // self.pool_size)
+        self.inter_op_threads = config.get('inter_op_threads', 1)
 
         logger.info(
             f"Initializing PiperTTSProvider: model={self.model_path.name}, "
@@ -67,15 +89,60 @@ class PiperTTSProvider(TTSProvider):
             # Store SynthesisConfig class for later use
             self.SynthesisConfig = SynthesisConfig
 
+            # One voice per concurrent synthesis, each with its own tuned session.
+            # The loaded voice is the first one: its default session is replaced, not kept
+            self.voices: "queue.Queue" = queue.Queue()
+            self.voices.put(self._create_voice(self.voice))
+            for _ in range(self.pool_size - 1):
+                self.voices.put(self._create_voice())
+
             logger.info(
                 f"✓ Piper model loaded: {self.model_path.name} "
-                f"({self.sample_rate_native}Hz native)"
+                f"({self.sample_rate_native}Hz native, {self.pool_size} session(s) x "
+                f"{self.intra_op_threads} intra-op threads)"
             )
 
         except Exception as e:
             logger.error(f"Failed to load Piper model: {e}")
             raise
 
+        # One thread per voice: a synthesis never waits on another's session
+        self.executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="piper")
+
+        # Counters (syntheses / pool_wait_time are updated from pool threads)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.syntheses = 0
+        self.pool_wait_time = 0.0
+        self._stats_lock = threading.Lock()
+
+    def _create_voice(self, voice=None):
+        """
+        Give a voice its own ONNX Runtime session (explicit thread settings).
+
+        Args:
+            voice: Voice to retune in place (default: a copy of the loaded voice)
+
+        Returns:
+            PiperVoice sharing the loaded config, with a dedicated session
+        """
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_threads
+        options.inter_op_num_threads = self.inter_op_threads
+        options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        if voice is None:
+            voice = copy.copy(self.voice)
+        voice.session = onnxruntime.InferenceSession(
+            str(self.model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        return voice
+
     async def synthesize(self, text: str) -> TTSResult:
         """
         Synthesize speech from text using Piper TTS.
@@ -89,26 +156,35 @@ class PiperTTSProvider(TTSProvider):
         Raises:
             Exception: If synthesis fails
         """
-        # Run synthesis in thread pool (Piper uses CPU-intensive operations)
+        # Run synthesis in the provider's thread pool (one thread per pooled voice)
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            self._synthesize_sync,
-            text
-        )
-
-        return result
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await loop.run_in_executor(
+                self.executor,
+                self._synthesize_sync,
+                text,
+                time.monotonic()
+            )
+        finally:
+            self.in_flight -= 1
 
-    def _synthesize_sync(self, text: str) -> TTSResult:
+    def _synthesize_sync(self, text: str, submitted: Optional[float] = None) -> TTSResult:
         """
         Synchronous synthesis (runs in thread pool).
 
         Args:
             text: Text to synthesize
+            submitted: time.monotonic() when the request was queued (for pool wait stats)
 
         Returns:
             TTSResult with audio bytes and metadata
         """
+        voice = self.voices.get()
+        if submitted is not None:
+            with self._stats_lock:
+                self.pool_wait_time += time.monotonic() - submitted
         try:
             # Create synthesis config
             syn_config = self.SynthesisConfig(
@@ -118,26 +194,29 @@ class PiperTTSProvider(TTSProvider):
                 noise_w_scale=self.noise_w  # Note: parameter is noise_w_scale in config
             )
 
+            # Resample chunk by chunk as Piper produces them (native rate -> VCA target rate)
+            resampler = None
+            if self.sample_rate_native != self.sample_rate_target:
+                resampler = StreamingResampler(self.sample_rate_native, self.sample_rate_target)
+
             # Synthesize audio - returns iterable of AudioChunk objects
             audio_chunks = []
-            for audio_chunk in self.voice.synthesize(text, syn_config=syn_config):
+            for audio_chunk in voice.synthesize(text, syn_config=syn_config):
                 # AudioChunk has 'audio_int16_array' attribute containing int16 numpy array
-                audio_chunks.append(audio_chunk.audio_int16_array)
-
-            # Concatenate all chunks
-            audio_np = np.concatenate(audio_chunks)
+                if resampler:
+                    audio_chunks.append(resampler.process(audio_chunk.audio_int16_array))
+                else:
+                    audio_chunks.append(audio_chunk.audio_int16_array)
 
-            # Resample if needed (Piper native rate -> VCA target rate)
-            if self.sample_rate_native != self.sample_rate_target:
-                audio_np = self._resample(
-                    audio_np,
-                    self.sample_rate_native,
-                    self.sample_rate_target
-                )
+            if resampler:
+                audio_chunks.append(resampler.flush())
                 sample_rate = self.sample_rate_target
             else:
                 sample_rate = self.sample_rate_native
 
+            # Concatenate all chunks
+            audio_np = np.concatenate(audio_chunks)
+
             # Convert to PCM16 WAV format
             audio_wav = self._to_wav(audio_np, sample_rate)
 
@@ -160,46 +239,21 @@ class PiperTTSProvider(TTSProvider):
             logger.error(f"Piper TTS synthesis failed: {e}")
             raise
 
-    def _resample(
-        self,
-        audio: np.ndarray,
-        orig_sr: int,
-        target_sr: int
-    ) -> np.ndarray:
-        """
-        Resample audio to target sample rate using scipy.
-
-        Args:
-            audio: Audio array (int16)
-            orig_sr: Original sample rate
-            target_sr: Target sample rate
-
-        Returns:
-            Resampled audio array
-        """
-        if orig_sr == target_sr:
-            return audio
-
-        try:
-            from scipy import signal
-
-            # Calculate resampling ratio
-            num_samples = int(len(audio) * target_sr / orig_sr)
-
-            # Use scipy's resample for high-quality resampling
-            resampled = signal.resample(audio, num_samples)
-
-            logger.debug(
-                f"Resampled audio: {orig_sr}Hz → {target_sr}Hz "
-                f"({len(audio)} → {len(resampled)} samples)"
-            )
-
-            return resampled.astype(np.int16)
-
-        except Exception as e:
-            logger.error(f"Resampling failed: {e}")
-            # Return original if resampling fails
-            return audio
+        finally:
+            self.voices.put(voice)
+            with self._stats_lock:
+                self.syntheses += 1
+
+    def get_stats(self) -> Dict:
+        """Get voice pool usage"""
+        return {
+            'pool_size': self.pool_size,
+            'intra_op_threads': self.intra_op_threads,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'syntheses': self.syntheses,
+            'mean_pool_wait': self.pool_wait_time / self.syntheses if self.syntheses else 0.0,
+        }
 
     def _to_wav(self, audio_np: np.ndarray, sample_rate: int) -> bytes:
         """
@@ -228,5 +282,5 @@ class PiperTTSProvider(TTSProvider):
     def __repr__(self) -> str:
         return (
             f"PiperTTSProvider(model='{self.model_path.name}', "
-            f"speed={self.length_scale}, rate={self.sample_rate_target}Hz)"
+            f"speed={self.length_scale}, rate={self.sample_rate_target}Hz, pool={self.pool_size})"
         )
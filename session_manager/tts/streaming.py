@@ -0,0 +1,82 @@
+"""
+Streaming TTS helpers
+VCA 1.0 - Phase 3
+
+Bridges a blocking, chunk-producing synthesis loop (e.g., XTTS
+inference_stream) to an async iterator of PCM16 TTSChunks:
+- The loop runs in an executor thread, so the event loop stays free
+- Each chunk is resampled incrementally (audio/resample.py) and converted
+  to PCM16 as soon as it is produced
+- Closing the iterator early stops the loop after its current chunk
+"""
+
+import asyncio
+import logging
+import threading
+from typing import AsyncIterator, Callable, Iterable
+
+import numpy as np
+
+from .base import TTSChunk
+from audio.resample import StreamingResampler
+
+logger = logging.getLogger(__name__)
+
+
+def float32_to_pcm16(audio_np: np.ndarray) -> bytes:
+    """Convert float32 (-1.0 to 1.0) audio to PCM16 bytes"""
+    return (np.clip(audio_np, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+
+
+async def stream_pcm_chunks(
+    generate: Callable[[], Iterable[np.ndarray]],
+    native_sample_rate: int,
+    target_sample_rate: int
+) -> AsyncIterator[TTSChunk]:
+    """
+    Run a blocking audio generator in a thread and yield its output as PCM16 chunks.
+
+    Args:
+        generate: Returns an iterable of float32 audio chunks at native_sample_rate
+            (iterated in an executor thread)
+        native_sample_rate: Rate the generator produces
+        target_sample_rate: Rate of the emitted chunks
+
+    Yields:
+        TTSChunk objects (raw PCM16 mono at target_sample_rate), in order
+    """
+    loop = asyncio.get_event_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def emit(item):
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    def produce():
+        try:
+            resampler = StreamingResampler(native_sample_rate, target_sample_rate)
+            for audio_chunk in generate():
+                emit(resampler.process(np.asarray(audio_chunk, dtype=np.float32)))
+                if stop.is_set():
+                    break
+            emit(resampler.flush())
+            emit(None)
+        except Exception as e:
+            emit(e)
+
+    loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if isinstance(item, Exception):
+                raise item
+            if item is None:
+                return
+            if len(item):
+                yield TTSChunk(
+                    audio_bytes=float32_to_pcm16(item),
+                    format='pcm',
+                    sample_rate=target_sample_rate
+                )
+    finally:
+        stop.set()
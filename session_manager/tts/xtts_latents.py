@@ -0,0 +1,185 @@
+"""
+XTTS speaker conditioning latent cache
+VCA 1.0 - Phase 3
+
+XTTS conditions every synthesis on two tensors computed from the reference
+voice WAV: the GPT conditioning latent and the speaker embedding. The
+high-level TTS.tts(speaker_wav=...) call recomputes them on every request;
+this cache computes them once per reference voice and reuses them with the
+model's inference API.
+
+Entries are keyed by model name + sha256 of the reference file contents, so
+editing or replacing the WAV recomputes while renaming it doesn't. Two tiers:
+- Memory: model-native tensors, ready for inference
+- Disk: one .npz per voice under disk_dir, loaded back through `to_model`
+  (e.g., torch.from_numpy(...).to(device)) after a restart
+
+Works with any model exposing XTTS's
+get_conditioning_latents(audio_path=[...]) -> (gpt_cond_latent, speaker_embedding).
+
+Configuration:
+    coqui_tts:
+      latent_cache_dir: "data/xtts_latents"  # null = memory only
+"""
+
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Latents = Tuple[Any, Any]  # (gpt_cond_latent, speaker_embedding), model-native types
+
+
+def _to_numpy(value: Any) -> np.ndarray:
+    """Copy a tensor (or array) to a numpy array for the disk tier"""
+    if hasattr(value, 'detach'):
+        value = value.detach().cpu().numpy()
+    return np.asarray(value)
+
+
+class SpeakerLatentCache:
+    """Memory/disk cache of XTTS conditioning latents per reference voice"""
+
+    def __init__(
+        self,
+        disk_dir: Optional[str] = None,
+        to_model: Optional[Callable[[np.ndarray], Any]] = None
+    ):
+        """
+        Initialize latent cache.
+
+        Args:
+            disk_dir: Directory for the disk tier (None = memory only)
+            to_model: Converts a loaded numpy array to the model's tensor type
+                (default: keep numpy)
+        """
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.to_model = to_model or (lambda array: array)
+
+        self._memory: Dict[Tuple[str, str], Latents] = {}
+        self._file_hashes: Dict[Tuple[str, int, int], str] = {}  # (path, mtime_ns, size) -> sha256
+        self._lock = threading.Lock()  # Synthesis runs in executor threads
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.computed = 0
+        self.compute_time = 0.0
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, model, reference_audio: Union[str, List[str]], model_name: str = "") -> Latents:
+        """
+        Get conditioning latents for a reference voice, computing them at most once.
+
+        Args:
+            model: XTTS model (or stand-in) with get_conditioning_latents()
+            reference_audio: Reference WAV path (or list of paths for one voice)
+            model_name: Model identifier (latents differ between models)
+
+        Returns:
+            (gpt_cond_latent, speaker_embedding) in the model's tensor type
+        """
+        paths = [reference_audio] if isinstance(reference_audio, (str, Path)) else list(reference_audio)
+        key = (model_name, self._hash_files(paths))
+
+        with self._lock:
+            latents = self._memory.get(key)
+            if latents is not None:
+                self.memory_hits += 1
+                return latents
+
+            latents = self._read_disk(key)
+            if latents is not None:
+                self.disk_hits += 1
+            else:
+                start = time.monotonic()
+                latents = model.get_conditioning_latents(audio_path=[str(path) for path in paths])
+                elapsed = time.monotonic() - start
+                self.computed += 1
+                self.compute_time += elapsed
+                logger.info(f"Computed XTTS speaker latents for {paths} in {elapsed:.2f}s")
+                self._write_disk(key, latents)
+
+            latents = (latents[0], latents[1])
+            self._memory[key] = latents
+            return latents
+
+    def _hash_files(self, paths: List[str]) -> str:
+        """sha256 over the reference files' contents (re-hashed only when a file changes)"""
+        digest = hashlib.sha256()
+        for path in paths:
+            stat = os.stat(path)
+            stat_key = (str(path), stat.st_mtime_ns, stat.st_size)
+            file_hash = self._file_hashes.get(stat_key)
+            if file_hash is None:
+                file_digest = hashlib.sha256()
+                with open(path, 'rb') as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        file_digest.update(block)
+                file_hash = file_digest.hexdigest()
+                self._file_hashes[stat_key] = file_hash
+            digest.update(file_hash.encode())
+        return digest.hexdigest()
+
+    def _disk_path(self, key: Tuple[str, str]) -> Path:
+        model_slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", key[0]) or "model"
+        return self.disk_dir / f"{model_slug}-{key[1][:32]}.npz"
+
+    def _read_disk(self, key: Tuple[str, str]) -> Optional[Latents]:
+        """Load latents from the disk tier"""
+        if self.disk_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            with np.load(path) as data:
+                return (
+                    self.to_model(data['gpt_cond_latent']),
+                    self.to_model(data['speaker_embedding'])
+                )
+        except (FileNotFoundError, KeyError, ValueError, OSError):
+            return None
+
+    def _write_disk(self, key: Tuple[str, str], latents: Latents):
+        """Store latents in the disk tier"""
+        if self.disk_dir is None:
+            return
+
+        path = self._disk_path(key)
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            gpt_cond_latent=_to_numpy(latents[0]),
+            speaker_embedding=_to_numpy(latents[1])
+        )
+        try:
+            # Write to a temp name first so readers never see a partial file
+            tmp_path = path.with_suffix(".npz.tmp")
+            tmp_path.write_bytes(buffer.getvalue())
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"XTTS latent cache write failed: {e}")
+
+    def get_stats(self) -> Dict:
+        """Get hit counters and compute time"""
+        return {
+            'voices': len(self._memory),
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'computed': self.computed,
+            'compute_time': self.compute_time,
+        }
+
+    def __repr__(self) -> str:
+        return f"SpeakerLatentCache(disk={self.disk_dir or 'off'}, voices={len(self._memory)})"
@@ -0,0 +1,176 @@
+"""
+Circuit breaker for remote (cloud) providers
+VCA 1.0 - Phase 3
+
+States:
+- CLOSED: requests go to the protected provider; failures are counted
+- OPEN: requests skip the provider (callers use their fallback) until reset_timeout
+- HALF_OPEN: a limited number of probe requests test whether the provider recovered
+
+A call counts against the breaker if it raises, times out, or succeeds slower
+than slow_call_threshold.
+"""
+
+import logging
+import time
+from enum import Enum
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BreakerState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Track provider failures and decide when to bypass it"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        slow_call_threshold: Optional[float] = None,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Name used in logs and stats (e.g., 'stt:openai_whisper')
+            failure_threshold: Consecutive bad calls (errors or slow calls) that trip the breaker
+            slow_call_threshold: Seconds above which a successful call counts as bad (None = off)
+            reset_timeout: Seconds to stay open before allowing half-open probes
+            half_open_max_calls: Concurrent probe requests allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_in_flight = 0
+
+        # Counters
+        self.total_calls = 0
+        self.total_failures = 0
+        self.total_slow_calls = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may go to the protected provider.
+
+        Returns:
+            True if the caller should try the provider, False to use the fallback
+        """
+        if self.state == BreakerState.OPEN:
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self._transition(BreakerState.HALF_OPEN)
+            else:
+                self.rejected_calls += 1
+                return False
+
+        if self.state == BreakerState.HALF_OPEN:
+            if self.half_open_in_flight >= self.half_open_max_calls:
+                self.rejected_calls += 1
+                return False
+            self.half_open_in_flight += 1
+
+        self.total_calls += 1
+        return True
+
+    def record_success(self, latency: float):
+        """
+        Record a completed call.
+
+        Args:
+            latency: Call duration in seconds
+        """
+        if self.slow_call_threshold is not None and latency > self.slow_call_threshold:
+            self.total_slow_calls += 1
+            logger.warning(
+                f"Circuit '{self.name}': slow call {latency:.2f}s "
+                f"(threshold {self.slow_call_threshold:.2f}s)"
+            )
+            self._on_bad_call()
+            return
+
+        self._release_probe()
+        self.consecutive_failures = 0
+
+        if self.state == BreakerState.HALF_OPEN:
+            self._transition(BreakerState.CLOSED)
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        """
+        Record a failed or timed-out call.
+
+        Args:
+            error: Exception raised by the provider (for logging)
+        """
+        self.total_failures += 1
+        logger.warning(f"Circuit '{self.name}': call failed ({error!r})")
+        self._on_bad_call()
+
+    def release(self):
+        """Release a call slot without recording an outcome (caller cancelled)"""
+        self._release_probe()
+
+    def _on_bad_call(self):
+        """Count a bad call and trip the breaker if needed"""
+        self._release_probe()
+        self.consecutive_failures += 1
+
+        if self.state == BreakerState.HALF_OPEN:
+            # Probe failed - back to open for another reset_timeout
+            self._transition(BreakerState.OPEN)
+        elif (
+            self.state == BreakerState.CLOSED
+            and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._transition(BreakerState.OPEN)
+
+    def _release_probe(self):
+        """Free a half-open probe slot"""
+        if self.half_open_in_flight > 0:
+            self.half_open_in_flight -= 1
+
+    def _transition(self, new_state: BreakerState):
+        """Change state and log it"""
+        if new_state == self.state:
+            return
+
+        logger.warning(f"Circuit '{self.name}': {self.state.value} → {new_state.value}")
+        self.state = new_state
+
+        if new_state == BreakerState.OPEN:
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+        elif new_state == BreakerState.CLOSED:
+            self.consecutive_failures = 0
+        elif new_state == BreakerState.HALF_OPEN:
+            self.half_open_in_flight = 0
+
+    def get_stats(self) -> Dict:
+        """Get breaker state and counters"""
+        return {
+            'state': self.state.value,
+            'consecutive_failures': self.consecutive_failures,
+            'total_calls': self.total_calls,
+            'total_failures': self.total_failures,
+            'total_slow_calls': self.total_slow_calls,
+            'rejected_calls': self.rejected_calls,
+            'times_opened': self.times_opened,
+        }
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(name='{self.name}', state={self.state.value})"
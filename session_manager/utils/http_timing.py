@@ -0,0 +1,167 @@
+"""
+HTTP request phase timing for remote providers
+VCA 1.0 - Phase 3
+
+Splits a remote API call into upload time (request body fully sent) and
+server/first-byte time using httpcore trace events, so LatencyMetrics can
+report network upload separately from processing. With a ConnectionStats
+attached, the transport also counts new vs reused connections.
+
+Usage:
+    client = AsyncOpenAI(api_key=..., http_client=httpx.AsyncClient(transport=TimingTransport()))
+
+    with track_request_timing() as timing:
+        await client.audio.transcriptions.create(...)
+
+    print(timing.upload_time, timing.time_to_first_byte)
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+
+@dataclass
+class RequestTiming:
+    """Timestamps (time.monotonic) for the phases of one HTTP request"""
+    start: Optional[float] = None  # Request headers started sending
+    upload_complete: Optional[float] = None  # Request body fully sent
+    first_byte: Optional[float] = None  # Response headers received
+    attempts: int = 0  # Requests sent (> 1 if the SDK retried)
+
+    @property
+    def upload_time(self) -> Optional[float]:
+        """Seconds spent sending the request (headers + body)"""
+        if self.start is None or self.upload_complete is None:
+            return None
+        return self.upload_complete - self.start
+
+    @property
+    def time_to_first_byte(self) -> Optional[float]:
+        """Seconds from request start to response headers"""
+        if self.start is None or self.first_byte is None:
+            return None
+        return self.first_byte - self.start
+
+    @property
+    def server_time(self) -> Optional[float]:
+        """Seconds between upload complete and response headers (server processing)"""
+        if self.upload_complete is None or self.first_byte is None:
+            return None
+        return self.first_byte - self.upload_complete
+
+
+@dataclass
+class ConnectionStats:
+    """Connection setup vs reuse across all requests through a transport"""
+    requests: int = 0
+    new_connections: int = 0  # TCP connects (DNS + TCP handshake)
+    tls_handshakes: int = 0
+    http2_requests: int = 0
+    connect_time: float = 0.0  # Seconds spent in TCP connect + TLS
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of requests served on an already-open connection"""
+        if not self.requests:
+            return 0.0
+        return max(0, self.requests - self.new_connections) / self.requests
+
+    def to_dict(self) -> dict:
+        return {
+            'requests': self.requests,
+            'new_connections': self.new_connections,
+            'tls_handshakes': self.tls_handshakes,
+            'http2_requests': self.http2_requests,
+            'reuse_rate': self.reuse_rate,
+            'mean_connect_time': self.connect_time / self.new_connections if self.new_connections else 0.0,
+        }
+
+
+# Timing for requests made by the current asyncio task (None = not tracking)
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar('request_timing', default=None)
+
+
+@contextmanager
+def track_request_timing():
+    """
+    Record phase timing for HTTP requests made inside the block.
+
+    Yields:
+        RequestTiming filled in by TimingTransport
+    """
+    timing = RequestTiming()
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        _current_timing.reset(token)
+
+
+class TimingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records request phase timestamps via httpcore tracing"""
+
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        stats: Optional[ConnectionStats] = None
+    ):
+        """
+        Initialize timing transport.
+
+        Args:
+            transport: Underlying transport (default: httpx.AsyncHTTPTransport)
+            stats: Optional connection counters updated for every request
+        """
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timing = _current_timing.get()
+        stats = self.stats
+
+        if timing is not None:
+            # Each attempt (including SDK retries) restarts the measurement
+            timing.attempts += 1
+            timing.start = timing.upload_complete = timing.first_byte = None
+
+        if timing is not None or stats is not None:
+            if stats is not None:
+                stats.requests += 1
+            connect_start = None
+
+            async def trace(event_name: str, info: dict):
+                nonlocal connect_start
+                if event_name.endswith("send_request_headers.started"):
+                    if timing is not None:
+                        timing.start = time.monotonic()
+                    if stats is not None and event_name.startswith("http2."):
+                        stats.http2_requests += 1
+                elif event_name.endswith("send_request_body.complete"):
+                    if timing is not None:
+                        timing.upload_complete = time.monotonic()
+                elif event_name.endswith("receive_response_headers.complete"):
+                    if timing is not None:
+                        timing.first_byte = time.monotonic()
+                elif stats is None:
+                    return
+                elif event_name == "connection.connect_tcp.started":
+                    connect_start = time.monotonic()
+                elif event_name == "connection.connect_tcp.complete":
+                    stats.new_connections += 1
+                    stats.connect_time += time.monotonic() - connect_start
+                    connect_start = time.monotonic()
+                elif event_name == "connection.start_tls.complete":
+                    stats.tls_handshakes += 1
+                    stats.connect_time += time.monotonic() - connect_start
+
+            request.extensions["trace"] = trace
+
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
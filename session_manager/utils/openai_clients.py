@@ -0,0 +1,204 @@
+"""
+Shared OpenAI HTTP connection pool
+VCA 1.0 - Phase 3
+
+All OpenAI-backed providers (Whisper STT, TTS, and the LLM client) get their
+AsyncOpenAI client from create_openai_client(), so they share one tuned
+httpx connection pool instead of each opening its own:
+- keep-alive with bounded limits, HTTP/2 when the `h2` package is installed
+- TimingTransport underneath, so phase timing and connection stats work
+- a keep-warm task that pings each API host while sessions are active, so
+  the first request after a pause doesn't pay DNS + TCP + TLS setup again
+
+Configuration:
+    openai:
+      http:
+        max_connections: 20
+        max_keepalive_connections: 10
+        keepalive_expiry: 60.0    # Seconds an idle connection is kept open
+        http2: true
+        keep_warm_interval: 20.0  # Seconds between pings (0 = off); below the server's idle timeout
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Dict, Optional, Set
+
+import httpx
+from openai import AsyncOpenAI
+
+from .http_timing import ConnectionStats, TimingTransport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+
+class OpenAIConnectionPool:
+    """One pooled, keep-warm httpx client shared by all OpenAI clients"""
+
+    def __init__(self, config: dict):
+        """
+        Initialize connection pool.
+
+        Args:
+            config: openai.http configuration (see module docstring)
+        """
+        self.http2 = config.get('http2', True) and importlib.util.find_spec('h2') is not None
+        self.keep_warm_interval = config.get('keep_warm_interval', 20.0)
+        self.limits = httpx.Limits(
+            max_connections=config.get('max_connections', 20),
+            max_keepalive_connections=config.get('max_keepalive_connections', 10),
+            keepalive_expiry=config.get('keepalive_expiry', 60.0)
+        )
+        self.stats = ConnectionStats()
+        self.http_client = httpx.AsyncClient(
+            transport=TimingTransport(
+                httpx.AsyncHTTPTransport(
+                    http2=self.http2,
+                    limits=self.limits,
+                    verify=config.get('verify', True)  # CA bundle path for private endpoints
+                ),
+                stats=self.stats
+            )
+        )
+
+        self.base_urls: Set[str] = set()  # Hosts to keep warm
+        self.active_sessions = 0
+        self._keep_warm_task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.pings = 0
+        self.ping_failures = 0
+
+    def create_client(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: float = 30.0,
+        max_retries: int = 1
+    ) -> AsyncOpenAI:
+        """
+        Create an AsyncOpenAI client on the shared pool.
+
+        Args:
+            api_key: OpenAI API key
+            base_url: API base URL (default: OpenAI)
+            timeout: Per-request timeout (seconds)
+            max_retries: SDK-level retries
+
+        Returns:
+            AsyncOpenAI client (cheap; connections are shared)
+        """
+        base_url = (base_url or DEFAULT_BASE_URL).rstrip('/')
+        self.base_urls.add(base_url)
+        return AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            http_client=self.http_client
+        )
+
+    async def warm(self):
+        """Open (or refresh) a pooled connection to every registered API host"""
+        for base_url in sorted(self.base_urls):
+            self.pings += 1
+            try:
+                # Any response will do - the point is the open connection
+                await self.http_client.head(f"{base_url}/models", timeout=5.0)
+            except Exception as e:
+                self.ping_failures += 1
+                logger.debug(f"Keep-warm ping to {base_url} failed: {e!r}")
+
+    def session_started(self):
+        """Count an active session (keep-warm pings run while any are active)"""
+        self.active_sessions += 1
+
+    def session_ended(self):
+        """Count a finished session"""
+        self.active_sessions = max(0, self.active_sessions - 1)
+
+    def start_keep_warm(self):
+        """Start the background keep-warm task (no-op if disabled or running)"""
+        if self.keep_warm_interval and self._keep_warm_task is None:
+            self._keep_warm_task = asyncio.ensure_future(self._keep_warm_loop())
+
+    async def _keep_warm_loop(self):
+        while True:
+            await asyncio.sleep(self.keep_warm_interval)
+            if self.active_sessions:
+                await self.warm()
+
+    async def aclose(self):
+        """Stop keep-warm pings and close pooled connections"""
+        if self._keep_warm_task is not None:
+            self._keep_warm_task.cancel()
+            self._keep_warm_task = None
+        await self.http_client.aclose()
+
+    def get_stats(self) -> Dict:
+        """Get connection reuse and keep-warm counters"""
+        stats = self.stats.to_dict()
+        stats.update({
+            'http2': self.http2,
+            'hosts': sorted(self.base_urls),
+            'active_sessions': self.active_sessions,
+            'pings': self.pings,
+            'ping_failures': self.ping_failures,
+        })
+        return stats
+
+    def __repr__(self) -> str:
+        return (
+            f"OpenAIConnectionPool(max_connections={self.limits.max_connections}, "
+            f"http2={self.http2}, keep_warm={self.keep_warm_interval}s)"
+        )
+
+
+_pool: Optional[OpenAIConnectionPool] = None
+
+
+def configure_connection_pool(config: dict) -> OpenAIConnectionPool:
+    """
+    Create the shared pool from settings (call before building providers).
+
+    Args:
+        config: openai.http configuration
+
+    Returns:
+        The shared OpenAIConnectionPool
+    """
+    global _pool
+    _pool = OpenAIConnectionPool(config)
+    return _pool
+
+
+def get_connection_pool() -> OpenAIConnectionPool:
+    """Get the shared pool (created with defaults if not configured)"""
+    global _pool
+    if _pool is None:
+        _pool = OpenAIConnectionPool({})
+    return _pool
+
+
+def create_openai_client(
+    api_key: str,
+    base_url: Optional[str] = None,
+    timeout: float = 30.0,
+    max_retries: int = 1
+) -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client on the shared connection pool.
+
+    Args:
+        api_key: OpenAI API key
+        base_url: API base URL (default: OpenAI)
+        timeout: Per-request timeout (seconds)
+        max_retries: SDK-level retries
+
+    Returns:
+        AsyncOpenAI client
+    """
+    return get_connection_pool().create_client(api_key, base_url, timeout, max_retries)